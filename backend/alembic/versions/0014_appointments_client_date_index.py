@@ -0,0 +1,31 @@
+"""Index appointments on (client_id, date) for date-windowed calendar reads.
+
+The booking engine used to load a tenant's entire appointment history to answer
+"is this slot free?" and to build the 90-day booked-slots prompt. It now asks only
+for holding appointments inside the date window it needs
+(db_appointments_holding_in_date_range), which wants this index so the per-turn
+cost stays flat however many years of bookings a tenant has. booked_slots needs
+nothing new: idx_booked_slots_unique already leads with (client_id, date).
+
+Mirrors the same additive DDL applied idempotently in database.init_db().
+
+Revision ID: 0014_appointments_client_date_index
+Revises: 0013_org_price_overrides
+"""
+
+from alembic import op
+
+revision = "0014_appointments_client_date_index"
+down_revision = "0013_org_price_overrides"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_appointments_client_date ON appointments(client_id, date)"
+    )
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS idx_appointments_client_date")
@@ -0,0 +1,29 @@
+"""Index call_log on (client_id, created_at DESC) for windowed per-tenant reads.
+
+The analytics health and summary endpoints now aggregate in SQL
+(db_call_log_health / db_call_log_summary) over "this tenant's last N days" instead of
+loading up to 5,000 rows into Python. Those queries, and the newest-first call list,
+range-scan this index, so their cost follows the window, not the tenant's total history.
+
+Mirrors the same additive DDL applied idempotently in database.init_db().
+
+Revision ID: 0015_call_log_client_created_index
+Revises: 0014_appointments_client_date_index
+"""
+
+from alembic import op
+
+revision = "0015_call_log_client_created_index"
+down_revision = "0014_appointments_client_date_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_call_log_client_created ON call_log(client_id, created_at DESC)"
+    )
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS idx_call_log_client_created")
@@ -0,0 +1,51 @@
+"""Add daily_stats: one pre-aggregated row per tenant per local day.
+
+The org rollup and the dashboards counted calls, bookings and texts by scanning
+call_log / appointments / sms_sessions on every load, so their cost grew with each
+tenant's history. The writers (db_call_log_append, db_appointments_insert/update,
+db_sms_session_upsert) now bump this table in the same transaction, keyed by the day in
+the tenant's business timezone, and readers fetch O(days) rows.
+
+Existing history is not copied here: run `python scripts/backfill_daily_stats.py`
+(database.db_daily_stats_rebuild) once after upgrading.
+
+Mirrors the same additive DDL applied idempotently in database.init_db().
+
+Revision ID: 0016_daily_stats
+Revises: 0015_call_log_client_created_index
+"""
+
+from alembic import op
+
+revision = "0016_daily_stats"
+down_revision = "0015_call_log_client_created_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS daily_stats (
+            client_id TEXT NOT NULL,
+            day DATE NOT NULL,
+            calls INTEGER NOT NULL DEFAULT 0,
+            missed INTEGER NOT NULL DEFAULT 0,
+            answered INTEGER NOT NULL DEFAULT 0,
+            forwarded INTEGER NOT NULL DEFAULT 0,
+            errors INTEGER NOT NULL DEFAULT 0,
+            duration_sec BIGINT NOT NULL DEFAULT 0,
+            bookings INTEGER NOT NULL DEFAULT 0,
+            bookings_by_source JSONB NOT NULL DEFAULT '{}'::jsonb,
+            cancellations INTEGER NOT NULL DEFAULT 0,
+            sms_in INTEGER NOT NULL DEFAULT 0,
+            sms_out INTEGER NOT NULL DEFAULT 0,
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            PRIMARY KEY (client_id, day)
+        )
+        """
+    )
+
+
+def downgrade():
+    op.execute("DROP TABLE IF EXISTS daily_stats")
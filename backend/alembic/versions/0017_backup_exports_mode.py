@@ -0,0 +1,31 @@
+"""Record each snapshot export's mode and window on backup_exports.
+
+db_export_tenant_snapshot now streams one compressed NDJSON file per tenant and can run
+incrementally: the large append-mostly tables (audit_events, call_log, sms_sessions)
+only carry rows since the previous export. The next incremental run keys off
+started_at here, and mode/since say which exports a restore must chain together.
+
+Mirrors the same additive DDL applied idempotently in database.init_db().
+
+Revision ID: 0017_backup_exports_mode
+Revises: 0016_daily_stats
+"""
+
+from alembic import op
+
+revision = "0017_backup_exports_mode"
+down_revision = "0016_daily_stats"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("ALTER TABLE backup_exports ADD COLUMN IF NOT EXISTS mode TEXT NOT NULL DEFAULT 'full'")
+    op.execute("ALTER TABLE backup_exports ADD COLUMN IF NOT EXISTS since TIMESTAMPTZ")
+    op.execute("ALTER TABLE backup_exports ADD COLUMN IF NOT EXISTS started_at TIMESTAMPTZ")
+
+
+def downgrade():
+    op.execute("ALTER TABLE backup_exports DROP COLUMN IF EXISTS started_at")
+    op.execute("ALTER TABLE backup_exports DROP COLUMN IF EXISTS since")
+    op.execute("ALTER TABLE backup_exports DROP COLUMN IF EXISTS mode")
@@ -0,0 +1,103 @@
+"""Optionally range-partition call_log and audit_events by month.
+
+Retention purges these two tables by age, and deleting years of rows row-by-row is the
+slow, WAL-heavy part of db_retention_purge. Partitioned by month, an expired month with
+no legal-held tenant is removed by detaching and dropping its partition in O(1).
+
+Opt-in: this revision only converts the tables when RETENTION_PARTITIONING=1 is set in
+the environment alembic runs in; otherwise it is recorded as applied and changes
+nothing. To convert later, set the variable and re-run it
+(`alembic downgrade 0017_backup_exports_mode && alembic upgrade head`; downgrading an
+unconverted table is a no-op).
+
+The conversion takes an ACCESS EXCLUSIVE lock and scans the table once (ATTACH checks
+the bound) but copies no rows: the existing table becomes the partition for everything
+up to the end of the current month, later months get their own partitions (the
+retention cron keeps creating them ahead), and a default partition catches anything
+outside them. The old table's indexes, including UNIQUE(call_sid), stay on it; new
+partitions share parent-level indexes instead, and call_log writers serialize per
+call_sid with an advisory lock (database._lock_call_sid) because a partitioned table
+can't hold a unique index that omits the partition key.
+
+Revision ID: 0018_partition_call_log_audit_events
+Revises: 0017_backup_exports_mode
+"""
+
+import os
+from datetime import datetime, timezone
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0018_partition_call_log_audit_events"
+down_revision = "0017_backup_exports_mode"
+branch_labels = None
+depends_on = None
+
+# table -> (partition key column, parent-level indexes)
+_TABLES = {
+    "call_log": (
+        "created_at",
+        [
+            "CREATE INDEX IF NOT EXISTS idx_call_log_p_client_created ON call_log(client_id, created_at DESC)",
+            "CREATE INDEX IF NOT EXISTS idx_call_log_p_call_sid ON call_log(call_sid)",
+        ],
+    ),
+    "audit_events": (
+        "occurred_at",
+        ["CREATE INDEX IF NOT EXISTS idx_audit_events_p_client_occurred ON audit_events(client_id, occurred_at)"],
+    ),
+}
+_MONTHS_AHEAD = 3
+
+
+def _month(year: int, month: int, offset: int) -> str:
+    m = year * 12 + month - 1 + offset
+    return f"{m // 12:04d}-{m % 12 + 1:02d}-01"
+
+
+def _relkind(table: str):
+    return op.get_bind().execute(
+        sa.text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:t)"), {"t": table}
+    ).scalar()
+
+
+def _partition(table: str, col: str, indexes) -> None:
+    if _relkind(table) != "r":
+        return  # already partitioned, or missing
+    now = datetime.now(timezone.utc)
+    boundary = _month(now.year, now.month, 1)  # this month's rows are already in the table
+    legacy = f"{table}_legacy"
+    op.execute(f"LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE")
+    op.execute(f"UPDATE {table} SET {col} = NOW() WHERE {col} IS NULL")
+    op.execute(f"ALTER TABLE {table} ALTER COLUMN {col} SET NOT NULL")
+    op.execute(f"ALTER TABLE {table} RENAME TO {legacy}")
+    op.execute(
+        f"CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS) PARTITION BY RANGE ({col})"
+    )
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id")
+    op.execute(f"ALTER TABLE {table} ATTACH PARTITION {legacy} FOR VALUES FROM (MINVALUE) TO ('{boundary} 00:00:00+00')")
+    for i in range(1, _MONTHS_AHEAD + 1):
+        lo, hi = _month(now.year, now.month, i), _month(now.year, now.month, i + 1)
+        op.execute(
+            f"CREATE TABLE {table}_p{lo[:4]}{lo[5:7]} PARTITION OF {table} FOR VALUES FROM ('{lo} 00:00:00+00') TO ('{hi} 00:00:00+00')"
+        )
+    op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+    for ddl in indexes:
+        op.execute(ddl)
+
+
+def upgrade():
+    if (os.getenv("RETENTION_PARTITIONING") or "").strip().lower() not in ("1", "true", "yes"):
+        return
+    for table, (col, indexes) in _TABLES.items():
+        _partition(table, col, indexes)
+
+
+def downgrade():
+    for table in _TABLES:
+        if _relkind(table) == "p":
+            raise RuntimeError(
+                f"{table} is partitioned; merging partitions back is not automated. "
+                "Restore from a snapshot export or rebuild the table by hand."
+            )
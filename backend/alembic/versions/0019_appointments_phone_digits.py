@@ -0,0 +1,41 @@
+"""Add appointments.phone_digits (last 10 digits of phone) with a lookup index.
+
+Every inbound SMS and every voice turn (refresh_caller_memory_for_prompt) looks up the
+caller's appointments by phone, and the lookups compared
+regexp_replace(phone, '[^0-9]', '') against the caller's number: a per-row function
+call no index could serve, so each one scanned the tenant's appointments.
+
+phone_digits is a STORED generated column, so Postgres keeps it current on every insert
+and update however the row is written, and adding it backfills existing rows (the
+ALTER rewrites the table once). Lookups now narrow on phone_digits = right(number, 10)
+through idx_appointments_client_phone_status and recheck the old full-digit match on the
+few rows left, so numbers that differ only in country code still do not match.
+
+Mirrors the same additive DDL applied idempotently in database.init_db().
+
+Revision ID: 0019_appointments_phone_digits
+Revises: 0018_partition_call_log_audit_events
+"""
+
+from alembic import op
+
+revision = "0019_appointments_phone_digits"
+down_revision = "0018_partition_call_log_audit_events"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        "ALTER TABLE appointments ADD COLUMN IF NOT EXISTS phone_digits TEXT GENERATED ALWAYS AS "
+        "(right(regexp_replace(COALESCE(phone, ''), '[^0-9]', '', 'g'), 10)) STORED"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_appointments_client_phone_status "
+        "ON appointments(client_id, phone_digits, status)"
+    )
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS idx_appointments_client_phone_status")
+    op.execute("ALTER TABLE appointments DROP COLUMN IF EXISTS phone_digits")
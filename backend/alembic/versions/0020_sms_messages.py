@@ -0,0 +1,87 @@
+"""Append-only sms_messages table; sms_sessions becomes the thread's summary row.
+
+db_sms_session_upsert rewrote a thread's whole messages JSONB array on every inbound and
+outbound text, and the inbox list and dashboard total ran jsonb_array_length /
+messages->-1 over every session row, so long-lived customer threads made each write
+heavier and bloated the table with dead tuples.
+
+Each text is now one sms_messages row, indexed on (client_id, phone, created_at) so the
+reply path reads just the last N. sms_sessions keeps one small row per thread with
+message_count, the last-message preview and role, and the linked appointment; appends
+bump it in the same transaction. The upgrade moves existing arrays into sms_messages (in
+thread order, stamped with the thread's updated_at; the original per-message times were
+never stored), fills the summary columns and empties the arrays. The messages column
+itself is left in place, unused.
+
+Mirrors the same additive DDL applied idempotently in database.init_db().
+
+Revision ID: 0020_sms_messages
+Revises: 0019_appointments_phone_digits
+"""
+
+from alembic import op
+
+revision = "0020_sms_messages"
+down_revision = "0019_appointments_phone_digits"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("""
+    CREATE TABLE IF NOT EXISTS sms_messages (
+        id BIGSERIAL PRIMARY KEY,
+        client_id TEXT NOT NULL,
+        phone TEXT NOT NULL,
+        role TEXT NOT NULL,
+        content TEXT NOT NULL DEFAULT '',
+        created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+    )
+    """)
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_sms_messages_client_phone_created "
+        "ON sms_messages(client_id, phone, created_at)"
+    )
+    op.execute("ALTER TABLE sms_sessions ADD COLUMN IF NOT EXISTS message_count INTEGER NOT NULL DEFAULT 0")
+    op.execute("ALTER TABLE sms_sessions ADD COLUMN IF NOT EXISTS last_message TEXT")
+    op.execute("ALTER TABLE sms_sessions ADD COLUMN IF NOT EXISTS last_role TEXT")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_sms_sessions_client_updated "
+        "ON sms_sessions(client_id, updated_at DESC)"
+    )
+    op.execute("""
+    INSERT INTO sms_messages (client_id, phone, role, content, created_at)
+    SELECT s.client_id, s.phone, COALESCE(e.m->>'role', ''), COALESCE(e.m->>'content', ''),
+           COALESCE(s.updated_at, NOW())
+    FROM sms_sessions s, jsonb_array_elements(s.messages) WITH ORDINALITY AS e(m, ord)
+    WHERE jsonb_array_length(s.messages) > 0
+    ORDER BY s.client_id, s.phone, e.ord
+    """)
+    op.execute("""
+    UPDATE sms_sessions
+    SET message_count = message_count + jsonb_array_length(messages),
+        last_message = left(COALESCE(messages->-1->>'content', ''), 300),
+        last_role = COALESCE(messages->-1->>'role', ''),
+        messages = '[]'::jsonb
+    WHERE jsonb_array_length(messages) > 0
+    """)
+
+
+def downgrade():
+    # Fold the rows back into the arrays before dropping them.
+    op.execute("""
+    UPDATE sms_sessions s
+    SET messages = t.msgs
+    FROM (
+        SELECT client_id, phone,
+               jsonb_agg(jsonb_build_object('role', role, 'content', content) ORDER BY created_at, id) AS msgs
+        FROM sms_messages
+        GROUP BY client_id, phone
+    ) t
+    WHERE s.client_id = t.client_id AND s.phone = t.phone
+    """)
+    op.execute("DROP INDEX IF EXISTS idx_sms_sessions_client_updated")
+    op.execute("ALTER TABLE sms_sessions DROP COLUMN IF EXISTS last_role")
+    op.execute("ALTER TABLE sms_sessions DROP COLUMN IF EXISTS last_message")
+    op.execute("ALTER TABLE sms_sessions DROP COLUMN IF EXISTS message_count")
+    op.execute("DROP TABLE IF EXISTS sms_messages")
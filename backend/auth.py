@@ -1,9 +1,112 @@
 """Clerk JWT verification and tenant resolution for multi-tenant API auth."""
+import hashlib
 import os
-from typing import Optional, Tuple
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 
 from fastapi import HTTPException, Request, status
 
+# Clerk's signing keys change only on rotation, but a fresh PyJWKClient per request
+# meant every authenticated dashboard call waited on a JWKS round-trip first. Keys are
+# now cached process-wide: refetched after the TTL, or early when a token names a kid
+# we don't hold (rotation). One thread refetches while the rest wait for its result,
+# and kid misses refetch at most once per _JWKS_MISS_REFRESH_SEC so a stream of bogus
+# kids can't turn us into a JWKS load generator.
+_JWKS_TTL_SEC = float((os.getenv("CLERK_JWKS_TTL_SEC") or "600").strip() or 600)
+_JWKS_MISS_REFRESH_SEC = 30.0
+
+
+class _JwksKeyCache:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._url = ""
+        self._keys: Dict[str, Any] = {}
+        self._fetched_at = 0.0
+
+    def get(self, url: str, kid: Optional[str]):
+        """PyJWK for `kid`, fetching the key set only when stale or on an unknown kid."""
+        now = time.monotonic()
+        seen_at = self._fetched_at
+        if self._url == url and now - seen_at < _JWKS_TTL_SEC:
+            key = self._keys.get(kid or "")
+            if key is not None:
+                return key
+            if now - seen_at < _JWKS_MISS_REFRESH_SEC:
+                return None
+        with self._lock:
+            # Single-flight: whoever held the lock may have refreshed already.
+            if self._url == url and self._fetched_at != seen_at:
+                key = self._keys.get(kid or "")
+                if key is not None or time.monotonic() - self._fetched_at < _JWKS_MISS_REFRESH_SEC:
+                    return key
+            self._refresh(url)
+            return self._keys.get(kid or "")
+
+    def _refresh(self, url: str) -> None:
+        from jwt import PyJWKClient
+
+        client = PyJWKClient(url, cache_jwk_set=False)
+        keys = client.get_signing_keys()
+        self._keys = {k.key_id: k for k in keys}
+        self._url = url
+        self._fetched_at = time.monotonic()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._keys = {}
+            self._url = ""
+            self._fetched_at = 0.0
+
+
+_jwks_cache = _JwksKeyCache()
+
+# Already-verified tokens -> (user_id, tenant_id, exp). The dashboard sends the same
+# session token on every request until Clerk rotates it (~60 s), so repeat requests
+# skip the RSA verify. Keyed by a hash so raw bearer tokens are never held in memory,
+# and by the validation config so a changed issuer/audience can't reuse a verdict.
+_VERIFIED_TOKEN_CACHE_MAX = 1024
+_verified_tokens: "OrderedDict[str, Tuple[str, Optional[str], float]]" = OrderedDict()
+_verified_tokens_lock = threading.Lock()
+
+
+def _verified_token_key(token: str, jwks_url: str, issuer: str, audience: str) -> str:
+    return hashlib.sha256(
+        "\0".join((jwks_url, issuer, audience, token)).encode("utf-8")
+    ).hexdigest()
+
+
+def _verified_token_get(key: str) -> Optional[Tuple[str, Optional[str]]]:
+    with _verified_tokens_lock:
+        hit = _verified_tokens.get(key)
+        if hit is None:
+            return None
+        if hit[2] <= time.time():
+            del _verified_tokens[key]
+            return None
+        _verified_tokens.move_to_end(key)
+        return hit[0], hit[1]
+
+
+def _verified_token_put(key: str, user_id: str, tenant_id: Optional[str], exp: Any) -> None:
+    try:
+        exp_f = float(exp)
+    except (TypeError, ValueError):
+        return  # no usable exp claim -> never cache
+    with _verified_tokens_lock:
+        _verified_tokens[key] = (user_id, tenant_id, exp_f)
+        _verified_tokens.move_to_end(key)
+        while len(_verified_tokens) > _VERIFIED_TOKEN_CACHE_MAX:
+            _verified_tokens.popitem(last=False)
+
+
+def clear_auth_caches() -> None:
+    """Drop cached JWKS keys and verified tokens (tests, or after a forced key rotation)."""
+    _jwks_cache.clear()
+    with _verified_tokens_lock:
+        _verified_tokens.clear()
+
 def get_bearer_token(request: Request) -> Optional[str]:
     """Extract Bearer token from Authorization header."""
     auth = request.headers.get("Authorization")
@@ -30,9 +133,14 @@ def verify_clerk_token(token: str) -> Tuple[str, Optional[str]]:
             detail="Clerk token validation not fully configured",
         )
 
+    cache_key = _verified_token_key(token, jwks_url, issuer, audience)
+    cached = _verified_token_get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         import jwt
-        from jwt import PyJWKClient, PyJWKClientError
+        from jwt import PyJWKClientError
         from jwt.exceptions import (
             ExpiredSignatureError,
             ImmatureSignatureError,
@@ -46,10 +154,15 @@ def verify_clerk_token(token: str) -> Tuple[str, Optional[str]]:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="JWT library unavailable")
 
     try:
-        jwks_client = PyJWKClient(jwks_url)
-        signing_key = jwks_client.get_signing_key_from_jwt(token)
+        kid = jwt.get_unverified_header(token).get("kid")
+    except InvalidTokenError:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
+    try:
+        signing_key = _jwks_cache.get(jwks_url, kid)
     except PyJWKClientError:
         raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Auth key service unavailable")
+    if signing_key is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
     try:
         payload = jwt.decode(
@@ -76,4 +189,5 @@ def verify_clerk_token(token: str) -> Tuple[str, Optional[str]]:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
     metadata = payload.get("public_metadata") or {}
     tenant_id = metadata.get("tenant_id")
+    _verified_token_put(cache_key, user_id, tenant_id, payload.get("exp"))
     return (user_id, tenant_id)
@@ -20,8 +20,10 @@ import config_service
 import database
 import runtime
 import json
+import time as _time
 from datetime import datetime, timezone
 from observability import system_debug, system_info
+from slot_index import SlotIndex
 
 logger = logging.getLogger("nuvatra")
 
@@ -283,9 +285,7 @@ def _appointment_email_enabled() -> bool:
 
 # ===== stateful slot/calendar engine (cut 2) =====
 
-_CALENDAR_HOLDING_STATUSES = frozenset(
-    {"accepted", "confirmed", "completed", "pending", "pending_review"}
-)
+_CALENDAR_HOLDING_STATUSES = frozenset(database.CALENDAR_HOLDING_STATUSES)
 
 _booked_slots_cache: dict = {}
 
@@ -323,9 +323,17 @@ def _booked_slot_duration_by_appointment_id() -> dict[int, int]:
         out[aid] = max(5, min(dm, 480))
     return out
 
-def _load_booked_slots() -> List[dict]:
-    """Load booked slots from client data dir. Each entry: {date, time, appointment_id, duration_minutes?}."""
+def _load_booked_slots(
+    date_from: Optional[str] = None, date_to: Optional[str] = None
+) -> List[dict]:
+    """Load booked slots from client data dir. Each entry: {date, time, appointment_id, duration_minutes?}.
+
+    With a date range (DB mode) only holds dated inside it are read; the file-backed dev
+    path always returns everything and leaves filtering to the caller.
+    """
     if runtime.USE_DB:
+        if date_from and date_to:
+            return database.db_booked_slots_in_date_range(date_from, date_to)
         return database.db_booked_slots_load()
     data_dir = config_service.get_client_data_dir()
     if not data_dir:
@@ -362,8 +370,14 @@ def _staff_label_for_slot_key(staff_key: str, id_to_name: dict[str, str]) -> str
         return "Unassigned"
     return id_to_name.get(staff_key, staff_key)
 
-def _appointment_rows_for_calendar_merge() -> List[dict]:
+def _appointment_rows_for_calendar_merge(
+    date_from: Optional[str] = None, date_to: Optional[str] = None
+) -> List[dict]:
+    """Appointment rows the calendar merge reads. With a date range (DB mode) only holding
+    appointments in that window are fetched instead of the tenant's whole history."""
     if runtime.USE_DB:
+        if date_from and date_to:
+            return database.db_appointments_holding_in_date_range(date_from, date_to)
         return database.db_appointments_get_all()
     return list(runtime.appointments)
 
@@ -401,46 +415,165 @@ def _booked_slot_rows_that_hold_calendar(
         kept.append(s)
     return kept
 
-def _get_all_booked_slots_merged() -> List[dict]:
-    """Merge booked_slots table with appointments (accepted/pending) so AI sees all taken times."""
-    apts = _appointment_rows_for_calendar_merge()
+def _appointment_hold_row(a: dict) -> Optional[dict]:
+    """Calendar row an appointment contributes on its own, or None when it holds nothing."""
+    if not a.get("date") or not a.get("time"):
+        return None
+    # pending_customer: details texted to caller; slot is not held until they SMS-confirm (see handle_incoming_sms).
+    if a.get("status") not in _CALENDAR_HOLDING_STATUSES:
+        return None
+    return {
+        "date": a["date"],
+        "time": a["time"],
+        "appointment_id": a.get("id", 0),
+        "duration_minutes": _appointment_duration_minutes(a),
+        "staff_id": a.get("staff_id"),
+    }
+
+
+def _get_all_booked_slots_merged(
+    apts: Optional[List[dict]] = None,
+    *,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+) -> List[dict]:
+    """Merge booked_slots table with appointments (accepted/pending) so AI sees all taken times.
+
+    Pass `apts` when the caller already loaded the appointment rows, to avoid a second read.
+    With date_from/date_to only holds dated inside that inclusive range are returned.
+    """
+    windowed = bool(date_from and date_to)
+    if apts is None:
+        apts = _appointment_rows_for_calendar_merge(date_from, date_to)
     apt_by_id = _appointment_by_id_map(apts)
-    slots = _booked_slot_rows_that_hold_calendar(_load_booked_slots(), apt_by_id)
+    raw = _load_booked_slots(date_from, date_to)
+    if windowed:
+        raw = [s for s in raw if date_from <= (s.get("date") or "") <= date_to]
+    slots = _booked_slot_rows_that_hold_calendar(raw, apt_by_id)
     if runtime.USE_DB:
         seen = {
             (s.get("date"), s.get("time"), _staff_slot_key(s.get("staff_id")))
             for s in slots
         }
         for a in apts:
-            if not a.get("date") or not a.get("time"):
+            row = _appointment_hold_row(a)
+            if row is None or (windowed and not date_from <= row["date"] <= date_to):
                 continue
-            # pending_customer: details texted to caller; slot is not held until they SMS-confirm (see handle_incoming_sms).
-            if a.get("status") in (
-                "accepted",
-                "confirmed",
-                "completed",
-                "pending",
-                "pending_review",
-            ):
-                sk = _staff_slot_key(a.get("staff_id"))
-                k = (a["date"], a["time"], sk)
-                if k not in seen:
-                    slots.append(
-                        {
-                            "date": a["date"],
-                            "time": a["time"],
-                            "appointment_id": a.get("id", 0),
-                            "duration_minutes": _appointment_duration_minutes(a),
-                            "staff_id": a.get("staff_id"),
-                        }
-                    )
-                    seen.add(k)
+            k = (row["date"], row["time"], _staff_slot_key(row.get("staff_id")))
+            if k not in seen:
+                slots.append(row)
+                seen.add(k)
     return slots
 
+
+# Per-tenant SlotIndex over the merged holds: loaded once for the window the receptionist
+# actually talks about (yesterday in UTC, so a US evening's "today" is in, through the
+# prompt horizon), extended a day at a time when a caller asks further out, then kept
+# current in-process by reserve_slot / release_slot / note_appointment_changed. The TTL
+# bounds how long a hold written by ANOTHER worker can go unseen here (same window the
+# prompt cache already had); the unique booked_slots index still rejects a second claim
+# on the exact slot at reserve. Sync handlers and DB executor jobs share one index per
+# tenant, so range loads and check-then-add updates run under index.lock.
+_slot_index_cache: dict = {}
+
+_SLOT_INDEX_TTL_SEC = 10
+_SLOT_INDEX_DAYS_AHEAD = 90
+
+
+def _slot_index_default_window() -> tuple[str, str]:
+    from datetime import timedelta
+
+    today = datetime.now(timezone.utc).date()
+    return (
+        (today - timedelta(days=1)).isoformat(),
+        (today + timedelta(days=_SLOT_INDEX_DAYS_AHEAD)).isoformat(),
+    )
+
+
+def _load_slot_index_range(index: SlotIndex, date_from: str, date_to: str) -> None:
+    apts = _appointment_rows_for_calendar_merge(date_from, date_to)
+    rows = _get_all_booked_slots_merged(apts, date_from=date_from, date_to=date_to)
+    apt_by_id = _appointment_by_id_map(apts)
+    for r in rows:
+        try:
+            aid = int(r.get("appointment_id") or 0)
+        except (TypeError, ValueError):
+            aid = 0
+        index.add(r, apt_by_id.get(aid))
+    index.mark_loaded(date_from, date_to)
+
+
+def _slot_index_for(date_from: str, date_to: Optional[str] = None) -> SlotIndex:
+    """This tenant's index, guaranteed to hold every hold dated in [date_from, date_to]."""
+    date_to = date_to or date_from
+    client_key = database._client_id() or "default"
+    hit = _slot_index_cache.get(client_key)
+    now = _time.monotonic()
+    if hit and hit[1] > now:
+        index = hit[0]
+    else:
+        # Built privately and published whole; a concurrent miss builds its own and the
+        # last one in wins, so nobody sees a half-loaded index.
+        index = SlotIndex(_time_to_minutes, DEFAULT_SLOT_DURATION_MINUTES)
+        lo, hi = _slot_index_default_window()
+        _load_slot_index_range(index, lo, hi)
+        _slot_index_cache[client_key] = (index, now + _SLOT_INDEX_TTL_SEC)
+        system_debug("slot_index_built", client_key=client_key, holds=len(index))
+    # Check and load under one lock so two threads asking about the same unloaded day
+    # don't both load it and add its holds twice.
+    with index.lock:
+        for lo, hi in index.missing_ranges(date_from, date_to):
+            _load_slot_index_range(index, lo, hi)
+    return index
+
+
+def _tenant_slot_index() -> SlotIndex:
+    return _slot_index_for(*_slot_index_default_window())
+
+
+def _loaded_slot_index(date: Optional[str] = None) -> Optional[SlotIndex]:
+    """This tenant's index if one is live (and, given `date`, already covers it) —
+    incremental updates never trigger a load."""
+    hit = _slot_index_cache.get(database._client_id() or "default")
+    if not hit or hit[1] <= _time.monotonic():
+        return None
+    if date is not None and not hit[0].covers(date):
+        return None
+    return hit[0]
+
+
+def note_appointment_changed(apt: Optional[dict]) -> None:
+    """Keep the slot index current after an appointment row is inserted or its status/
+    date/time changes without a reserve/release (e.g. pending_review -> accepted, or an
+    external-calendar request that holds the time on its own)."""
+    index = _loaded_slot_index()
+    if index is None or not apt:
+        return
+    try:
+        aid = int(apt.get("id") or 0)
+    except (TypeError, ValueError):
+        return
+    if not aid:
+        return
+    if (apt.get("status") or "").strip() not in _CALENDAR_HOLDING_STATUSES:
+        index.remove_appointment(aid)
+        return
+    if index.holds_appointment(aid):
+        index.set_appointment(aid, apt)
+        return
+    row = _appointment_hold_row(apt) if runtime.USE_DB else None
+    if row:
+        with index.lock:
+            if index.covers(row["date"]) and not index.has(
+                row["date"], row["time"], row.get("staff_id")
+            ):
+                index.add(row, apt)
+    _booked_slots_cache.clear()
+
+
 def get_booked_slots(date: str) -> List[dict]:
     """Return slots already booked for the given date (YYYY-MM-DD)."""
-    slots = _get_all_booked_slots_merged()
-    return [s for s in slots if s.get("date") == date]
+    return _slot_index_for(date).rows_for_date(date)
 
 def _slot_overlaps(
     start_a: str, duration_a: int, start_b: str, duration_b: int
@@ -459,28 +592,16 @@ def _slot_blocking_details(
     staff_id: Optional[str] = None,
 ) -> List[dict]:
     """Return merged slot rows (with appointment status) that block this window."""
-    want = _staff_slot_key(staff_id)
     norm_time = _normalize_time_to_hhmm(time) or time
-    apt_by_id = _appointment_by_id_map(_appointment_rows_for_calendar_merge())
     out: List[dict] = []
-    for s in _get_all_booked_slots_merged():
-        if s.get("date") != date or _staff_slot_key(s.get("staff_id")) != want:
-            continue
-        slot_time = s.get("time") or ""
-        d = s.get("duration_minutes") or DEFAULT_SLOT_DURATION_MINUTES
-        if not _slot_overlaps(norm_time, duration_minutes, slot_time, d):
-            continue
-        aid = s.get("appointment_id")
-        apt_status = ""
-        if aid is not None:
-            apt = apt_by_id.get(int(aid))
-            if apt:
-                apt_status = (apt.get("status") or "").strip()
+    for s, apt in _slot_index_for(date).overlapping(
+        date, _time_to_minutes(norm_time), duration_minutes, staff_id
+    ):
         out.append(
             {
-                "appointment_id": aid,
-                "time": slot_time,
-                "status": apt_status,
+                "appointment_id": s.get("appointment_id"),
+                "time": s.get("time") or "",
+                "status": ((apt or {}).get("status") or "").strip(),
             }
         )
     return out
@@ -535,7 +656,24 @@ def reserve_slot(
         )
         _save_booked_slots(slots)
         reserved = True
-    _invalidate_booked_slots_cache()
+    # Only a loaded date is updated in place; an unloaded one picks the row up from the
+    # DB the first time it is asked about.
+    index = _loaded_slot_index(date)
+    if reserved and index is not None and not index.has(date, time, staff_id):
+        apt = _appointment_for_index(appointment_id)  # DB read kept outside the lock
+        with index.lock:
+            if not index.has(date, time, staff_id):
+                index.add(
+                    {
+                        "date": date,
+                        "time": time,
+                        "appointment_id": appointment_id,
+                        "duration_minutes": duration_minutes,
+                        "staff_id": staff_id,
+                    },
+                    apt,
+                )
+    _booked_slots_cache.clear()
     system_debug(
         "slot_reserved",
         date=date,
@@ -554,7 +692,10 @@ def release_slot(appointment_id: int) -> None:
         slots = _load_booked_slots()
         slots = [s for s in slots if s.get("appointment_id") != appointment_id]
         _save_booked_slots(slots)
-    _invalidate_booked_slots_cache()
+    index = _loaded_slot_index()
+    if index is not None:
+        index.remove_appointment(appointment_id)
+    _booked_slots_cache.clear()
     system_debug("slot_released", appointment_id=appointment_id)
 
 def _reconcile_sms_appointment_slot_after_detail_change(apt: dict) -> None:
@@ -594,23 +735,14 @@ def _reconcile_booked_slots_orphans() -> int:
 
 def _voice_calendar_holds() -> List[dict]:
     """Slots the AI receptionist treats as unavailable, with linked appointment when one exists."""
-    apts = _appointment_rows_for_calendar_merge()
-    apt_by_id = _appointment_by_id_map(apts)
     holds: List[dict] = []
-    for s in _get_all_booked_slots_merged():
-        aid = s.get("appointment_id")
-        apt = None
-        if aid is not None:
-            try:
-                apt = apt_by_id.get(int(aid))
-            except (TypeError, ValueError):
-                apt = None
+    for s, apt in _tenant_slot_index().items():
         holds.append(
             {
                 "date": s.get("date"),
                 "time": _normalize_time_to_hhmm(s.get("time") or "")
                 or (s.get("time") or ""),
-                "appointment_id": aid,
+                "appointment_id": s.get("appointment_id"),
                 "status": (apt.get("status") if apt else None) or "unknown",
                 "name": (apt.get("name") if apt else None) or "",
                 "phone": (apt.get("phone") if apt else None) or "",
@@ -619,9 +751,19 @@ def _voice_calendar_holds() -> List[dict]:
         )
     return holds
 
+
+def _appointment_for_index(appointment_id: int) -> Optional[dict]:
+    """The appointment a fresh hold belongs to (for blocker status / dashboard holds)."""
+    if runtime.USE_DB:
+        return database.db_appointments_get_by_id(int(appointment_id))
+    return next(
+        (a for a in runtime.appointments if a.get("id") == appointment_id), None
+    )
+
 def _invalidate_booked_slots_cache() -> None:
-    """Clear booked slots cache so next prompt build sees current availability (e.g. after reserve/release)."""
+    """Clear booked slots cache and slot indexes so the next check reloads current availability."""
     _booked_slots_cache.clear()
+    _slot_index_cache.clear()
 
 def get_booked_slots_prompt_text(days_ahead: int = 90, skip_cache: bool = False) -> str:
     """Build booked-slot lines for the system prompt (per-stylist when multi-staff)."""
@@ -640,7 +782,13 @@ def get_booked_slots_prompt_text(days_ahead: int = 90, skip_cache: bool = False)
             )
             return text
         del _booked_slots_cache[cache_key]
-    all_slots = _get_all_booked_slots_merged()
+    window_from = (now.date() - timedelta(days=1)).isoformat()
+    window_to = (now.date() + timedelta(days=days_ahead)).isoformat()
+    all_slots = [
+        row
+        for row, _ in _slot_index_for(window_from, window_to).items()
+        if window_from <= (row.get("date") or "") <= window_to
+    ]
     system_debug(
         "booked_slots_prompt_built",
         client_key=client_key,
@@ -10,13 +10,16 @@ module-qualified (database.X) so they stay patchable in tests.
 
 from __future__ import annotations
 
+import copy
 import json
 import logging
 import os
 import re
+import threading
+import time
 import uuid
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from fastapi import HTTPException
 
@@ -345,6 +348,7 @@ def save_raw_client_config(cid: str, data: dict) -> None:
             raise HTTPException(
                 status_code=500, detail="Failed to save settings to database"
             )
+    invalidate_business_info(client_id=cid)
     config_path = PROJECT_ROOT / "clients" / cid / "config.json"
     try:
         config_path.parent.mkdir(parents=True, exist_ok=True)
@@ -535,33 +539,169 @@ def _default_client_config_data(client_id: str, plan: str = "free") -> dict:
     }
 
 
-def get_business_info() -> dict:
-    """Get business config for current request (multi-tenant) or env CLIENT_ID (single-tenant)."""
+# --- Business-info cache -------------------------------------------------------
+# get_business_info() runs many times per voice turn (prompt, TTS voice/speed, booking
+# validation, greeting...) and each call used to re-read the JSONB config and the
+# tenant row. In DB mode the built dict is cached per client_id until the config or
+# tenant row changes:
+#   - save_raw_client_config and the database tenant mutators (on_tenant_change) bump
+#     a per-client version, so a build that raced a write is never stored;
+#   - with REDIS_URL set, invalidations are published on _CONFIG_CHANNEL and a
+#     listener thread (start_config_invalidation_listener) applies other workers' ones;
+#   - the TTL bounds staleness when pub/sub is down or not configured.
+_CONFIG_CACHE_TTL_SEC = float((os.getenv("BUSINESS_CONFIG_CACHE_TTL_SEC") or "60").strip() or 60)
+_CONFIG_CHANNEL = "nuvatra:business_config:invalidate"
+_config_cache: Dict[str, Tuple[Tuple[int, int], float, Optional[str], dict]] = {}
+_config_versions: Dict[str, int] = {}
+_config_epoch = 0  # bumped when an invalidation can't be pinned to a client_id
+_config_cache_lock = threading.Lock()
+_INSTANCE_ID = uuid.uuid4().hex
+_config_pubsub_thread: Optional[threading.Thread] = None
+_config_publisher = None
+
+
+def _invalidate_business_info_local(
+    client_id: Optional[str] = None, tenant_id: Optional[str] = None
+) -> None:
+    """Drop this worker's cached business info for a tenant (either key), or all of it."""
+    global _config_epoch
+    cid = (client_id or "").strip()
+    tid = (tenant_id or "").strip()
+    with _config_cache_lock:
+        if not cid and not tid:
+            _config_epoch += 1
+            _config_cache.clear()
+            return
+        doomed = {cid} if cid else set()
+        if tid:
+            doomed.update(k for k, v in _config_cache.items() if v[2] == tid)
+            if not cid:
+                # A build in flight for this tenant doesn't know its tenant_id yet.
+                _config_epoch += 1
+        for k in doomed:
+            _config_versions[k] = _config_versions.get(k, 0) + 1
+            _config_cache.pop(k, None)
+
+
+def invalidate_business_info(client_id: Optional[str] = None, tenant_id: Optional[str] = None) -> None:
+    """Invalidate cached business info here and, when Redis is configured, on every worker."""
+    _invalidate_business_info_local(client_id, tenant_id)
+    _publish_config_invalidation(client_id, tenant_id)
+
+
+database.on_tenant_change(invalidate_business_info)
+
+
+def _config_redis_url() -> str:
+    return (os.getenv("REDIS_URL") or "").strip()
+
+
+def _publish_config_invalidation(client_id: Optional[str], tenant_id: Optional[str]) -> None:
+    global _config_publisher
+    url = _config_redis_url()
+    if not url:
+        return
+    try:
+        if _config_publisher is None:
+            from voice.call_session_store import create_redis_client
+
+            _config_publisher = create_redis_client(url)
+        _config_publisher.publish(
+            _CONFIG_CHANNEL,
+            json.dumps({"client_id": client_id, "tenant_id": tenant_id, "origin": _INSTANCE_ID}),
+        )
+    except Exception as e:
+        # The TTL still bounds how long other workers serve the old config.
+        logger.warning("business_config invalidation publish failed: %s", e)
+
+
+def _apply_config_invalidation_message(data) -> None:
+    try:
+        msg = json.loads(data)
+    except (TypeError, ValueError):
+        return
+    if not isinstance(msg, dict) or msg.get("origin") == _INSTANCE_ID:
+        return
+    _invalidate_business_info_local(msg.get("client_id"), msg.get("tenant_id"))
+
+
+def _config_invalidation_loop(url: str) -> None:
+    from voice.call_session_store import create_redis_client
+
+    backoff = 1.0
+    while True:
+        try:
+            pubsub = create_redis_client(url).pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(_CONFIG_CHANNEL)
+            # Anything published while we were disconnected is lost — start clean.
+            _invalidate_business_info_local()
+            backoff = 1.0
+            while True:
+                msg = pubsub.get_message(timeout=1.0)
+                if msg and msg.get("type") == "message":
+                    _apply_config_invalidation_message(msg.get("data"))
+        except Exception as e:
+            logger.warning("business_config invalidation listener reconnecting: %s", e)
+            time.sleep(backoff)
+            backoff = min(backoff * 2, 30.0)
+
+
+def start_config_invalidation_listener() -> bool:
+    """Subscribe this worker to cross-worker config invalidations. No-op without REDIS_URL."""
+    global _config_pubsub_thread
+    url = _config_redis_url()
+    if not url or (_config_pubsub_thread is not None and _config_pubsub_thread.is_alive()):
+        return False
+    _config_pubsub_thread = threading.Thread(
+        target=_config_invalidation_loop, args=(url,), name="business-config-invalidate", daemon=True
+    )
+    _config_pubsub_thread.start()
+    return True
+
+
+def _build_business_info() -> Tuple[dict, Optional[str]]:
+    """get_business_info() uncached. Returns (info, tenant_id or None)."""
+    cid = database._client_id() if runtime.USE_DB else ""
+    # One tenant-row read serves the phone fallback, vertical and name below.
+    t = database.db_tenant_get_by_client_id(cid) if cid else None
     cfg = load_client_config()
     if cfg:
         out = dict(cfg)
-        if not out.get("phone") and runtime.USE_DB:
-            cid = database._client_id()
-            if cid:
-                tenant = database.db_tenant_get_by_client_id(cid)
-                if tenant:
-                    out["phone"] = tenant.get("twilio_phone_number") or ""
+        if not out.get("phone") and t:
+            out["phone"] = t.get("twilio_phone_number") or ""
     else:
         tenant_info = _default_business_info_for_tenant()
         if tenant_info:
             out = dict(tenant_info)
         else:
             out = dict(_DEMO_BUSINESS_INFO)
-    if runtime.USE_DB:
-        cid = database._client_id()
-        if cid:
-            t = database.db_tenant_get_by_client_id(cid)
-            if t:
-                bv = (t.get("business_vertical") or "salon_chair").strip()
-                out["business_vertical"] = bv
-                out["business_vertical_label"] = BUSINESS_VERTICAL_LABELS.get(bv, bv)
-                if not (out.get("name") or "").strip():
-                    out["name"] = (t.get("name") or "").strip()
+    if t:
+        bv = (t.get("business_vertical") or "salon_chair").strip()
+        out["business_vertical"] = bv
+        out["business_vertical_label"] = BUSINESS_VERTICAL_LABELS.get(bv, bv)
+        if not (out.get("name") or "").strip():
+            out["name"] = (t.get("name") or "").strip()
+    return out, (str(t.get("id")) if t and t.get("id") else None)
+
+
+def get_business_info() -> dict:
+    """Get business config for current request (multi-tenant) or env CLIENT_ID (single-tenant).
+
+    Cached per client_id in DB mode; callers get their own copy and may mutate it.
+    """
+    cid = database._client_id() if runtime.USE_DB else ""
+    if not cid or _CONFIG_CACHE_TTL_SEC <= 0:
+        return _build_business_info()[0]
+    now = time.monotonic()
+    with _config_cache_lock:
+        hit = _config_cache.get(cid)
+        if hit is not None and hit[1] > now:
+            return copy.deepcopy(hit[3])
+        version = (_config_epoch, _config_versions.get(cid, 0))
+    out, tenant_id = _build_business_info()
+    with _config_cache_lock:
+        if (_config_epoch, _config_versions.get(cid, 0)) == version:
+            _config_cache[cid] = (version, now + _CONFIG_CACHE_TTL_SEC, tenant_id, copy.deepcopy(out))
     return out
 
 
@@ -598,6 +738,20 @@ def voice_streaming_enabled() -> bool:
     return (os.getenv("VOICE_STREAMING_TTS") or "").strip().lower() in ("1", "true", "yes", "on")
 
 
+def voice_streaming_llm_enabled() -> bool:
+    """Within the bidirectional path, stream the model's reply and start speaking the first
+    sentence while the rest generates. Default ON (the bidi path is itself opt-in); set
+    VOICE_STREAMING_LLM=0 to speak only the finished reply."""
+    return (os.getenv("VOICE_STREAMING_LLM") or "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def voice_tts_audio_streaming_enabled() -> bool:
+    """Gather/<Play> path: /api/phone/tts-audio sends mp3 as OpenAI produces it (chunked)
+    so Twilio starts playing before the whole reply is synthesized. Env-gated + default
+    OFF like the other delivery changes; unset VOICE_TTS_AUDIO_STREAM to roll back."""
+    return (os.getenv("VOICE_TTS_AUDIO_STREAM") or "").strip().lower() in ("1", "true", "yes", "on")
+
+
 # Delivery style passed to steerable TTS (gpt-4o-mini-tts). Keyed by business vertical so
 # each vertical can sound right; only salon_chair is live today (see ALLOWED_BUSINESS_VERTICALS
 # above), so this is one good default plus a hook for future verticals. Ignored by tts-1/hd.
@@ -26,6 +26,8 @@ import llm_provider
 import runtime
 import sms_service
 import voice_service
+from voice.reply_stream import ReplyStream, get_reply_stream
+from voice.speech_segmenter import SpeechSegmenter
 from observability import (
     name_initial_for_log,
     sms_info,
@@ -116,7 +118,8 @@ def _supersede_pending_customer_drafts_for_slot(
     want_staff = booking_service._staff_slot_key(staff_id)
     norm_time = booking_service._normalize_time_to_hhmm(time) or time
     cancelled = 0
-    for apt in booking_service._appointment_rows_for_calendar_merge():
+    # Only this date's active rows (drafts included), not the tenant's whole history.
+    for apt in database.db_appointments_in_date_range(date, date, client_id=cid):
         st = apt.get("status") or ""
         if st not in ("pending_customer", "pending_review"):
             continue
@@ -574,6 +577,88 @@ def _ai_implies_committed_booking(ai_text: str) -> bool:
     )
 
 
+# Directive lines generate_response_async parses out of the full reply. Once one shows
+# up in a streamed reply nothing more may be spoken early — the directive itself must
+# never reach TTS, and whatever the reply becomes is decided after parsing.
+_VOICE_DIRECTIVE_MARKERS = ("BOOKING:", "TRANSFER_TO:", "MESSAGE:")
+
+
+def _voice_reply_safe_to_stream(text_so_far: str) -> bool:
+    """May a streamed reply that reads `text_so_far` (so far) still be spoken early?
+
+    Conservative on purpose: anything the post-processing below might replace — a
+    directive, or wording that claims a booking exists — stops early speech for the
+    rest of the turn and the final ai_text is spoken instead."""
+    up = (text_so_far or "").upper()
+    if any(mark in up for mark in _VOICE_DIRECTIVE_MARKERS):
+        return False
+    return not _ai_implies_committed_booking(text_so_far)
+
+
+def _voice_turn_may_be_substituted(call_data: dict) -> bool:
+    """Could post-processing replace this turn's reply wholesale?
+
+    Booking confirmations, reject recovery, the roster/validation lines, the extraction
+    retry and a mid-call detail change all swap the model's words for a fixed line, and
+    they only happen once the call is in a booking (or the honest no-transfer line is
+    due). Early chunks spoken on such a turn could not be taken back, so it streams
+    nothing early and speaks the final text once."""
+    if call_data.get("forward_unavailable") or call_data.get("appointment_created"):
+        return True
+    if call_data.get("booking_intent"):
+        return True
+    return _conversation_suggests_booking(call_data.get("conversation_history"))
+
+
+async def _stream_voice_reply(messages: list, stream: ReplyStream, call_data: dict) -> str:
+    """Stream the brain's reply, pushing safe chunks to `stream`; return the full text.
+
+    The provider iterator blocks, so it runs on a worker thread and hands deltas back
+    to the loop. The returned text is exactly what llm_provider.chat would have given.
+    """
+    loop = asyncio.get_running_loop()
+    deltas: "asyncio.Queue[object]" = asyncio.Queue()
+
+    def produce() -> None:
+        try:
+            for delta in llm_provider.chat_stream(
+                model=VOICE_LLM_MODEL, messages=messages, temperature=0.8, max_tokens=200
+            ):
+                loop.call_soon_threadsafe(deltas.put_nowait, delta)
+        except Exception as e:
+            loop.call_soon_threadsafe(deltas.put_nowait, e)
+        finally:
+            loop.call_soon_threadsafe(deltas.put_nowait, None)
+
+    producer = asyncio.ensure_future(asyncio.to_thread(produce))
+    segmenter = SpeechSegmenter()
+    parts: List[str] = []
+    speaking = not _voice_turn_may_be_substituted(call_data)
+    try:
+        while True:
+            item = await deltas.get()
+            if item is None:
+                break
+            if isinstance(item, Exception):
+                raise item
+            parts.append(str(item))
+            if not speaking:
+                continue
+            for chunk in segmenter.feed(str(item)):
+                if not _voice_reply_safe_to_stream("".join(parts)):
+                    speaking = False
+                    break
+                stream.push(chunk)
+        if speaking:
+            for chunk in segmenter.flush():
+                if _voice_reply_safe_to_stream("".join(parts)):
+                    stream.push(chunk)
+    finally:
+        stream.close()
+        await producer
+    return "".join(parts)
+
+
 def _should_attempt_voice_booking_extraction(
     conversation_history: Optional[list], ai_text: str
 ) -> bool:
@@ -1248,6 +1333,9 @@ def _create_appointment_from_booking(
     if runtime.USE_DB:
         row = database.db_appointments_insert(appointment_data)
         apt_id = row["id"]
+        if external:
+            # A request holds its time on its own (no booked_slots row to reserve).
+            booking_service.note_appointment_changed(row)
     else:
         apt_id = len(runtime.appointments) + 1
         appointment_data["id"] = apt_id
@@ -1342,7 +1430,7 @@ def _send_booking_confirmation_sms(
         if ok:
             if runtime.USE_DB and cid and apt.get("id"):
                 try:
-                    database.db_sms_session_upsert(
+                    database.db_sms_session_append(
                         to_number_sms,
                         cid,
                         [
@@ -1701,8 +1789,10 @@ async def generate_response_async(
         database.set_request_client_id(call_data.get("client_id") or database._client_id())
         fn_refresh = (call_data.get("from_number") or "").strip()
         if fn_refresh:
-            call_data["caller_memory"] = caller_memory.refresh_caller_memory_for_prompt(
-                fn_refresh, call_data.get("client_id")
+            call_data["caller_memory"] = await database.run_db(
+                caller_memory.refresh_caller_memory_for_prompt,
+                fn_refresh,
+                call_data.get("client_id"),
             )
         voice_info(
             "generate_response_start",
@@ -1742,7 +1832,8 @@ async def generate_response_async(
         messages = [
             {
                 "role": "system",
-                "content": get_system_prompt(
+                "content": await database.run_db(
+                    get_system_prompt,
                     detected_lang,
                     call_data.get("caller_memory"),
                     include_booked_slots=True,
@@ -1772,13 +1863,18 @@ async def generate_response_async(
         # would stall every concurrent call's loop work for the request's
         # duration. (The booking-extraction call below is threaded for the same
         # reason.) A hung request is bounded by the client timeout in runtime.py.
-        ai_text = await asyncio.to_thread(
-            llm_provider.chat,
-            model=VOICE_LLM_MODEL,
-            messages=messages,
-            temperature=0.8,
-            max_tokens=200,
-        )
+        reply_stream = get_reply_stream(call_sid)
+        if reply_stream is not None:
+            # Bidirectional media path: speak the reply while it is still generating.
+            ai_text = await _stream_voice_reply(messages, reply_stream, call_data)
+        else:
+            ai_text = await asyncio.to_thread(
+                llm_provider.chat,
+                model=VOICE_LLM_MODEL,
+                messages=messages,
+                temperature=0.8,
+                max_tokens=200,
+            )
         voice_debug("gpt_reply", call_sid=call_sid, reply_preview=(ai_text or "")[:80])
         # Full AI reply (incl. any BOOKING marker) when OBS_TRACE_TRANSCRIPT=1 — pairs with the
         # caller_said lines so the whole conversation is reconstructable from the logs.
@@ -1912,7 +2008,8 @@ async def generate_response_async(
                     else:
                         if canonical_service:
                             booking["reason"] = canonical_service
-                        apt = _create_appointment_from_booking(
+                        apt = await database.run_db(
+                            _create_appointment_from_booking,
                             booking,
                             client_id_override=cid,
                             reserve_slot_immediately=False,
@@ -1927,7 +2024,7 @@ async def generate_response_async(
                             apt["phone"] = call_data["from_number"]
                             if runtime.USE_DB and apt.get("id"):
                                 try:
-                                    database.db_appointments_update(
+                                    await database.adb.appointments_update(
                                         apt["id"], phone=apt["phone"]
                                     )
                                 except Exception:
@@ -2054,12 +2151,15 @@ async def generate_response_async(
                 )
                 call_data["outcome"] = "forwarded"
                 voice_service.call_log_set_outcome(call_sid, "forwarded")
-                runtime.call_store.response_status[call_sid] = {
-                    "status": "forward",
-                    "audio_url": None,
-                    "ai_text": ai_text,
-                    "forwarding_phone": staff_phone,
-                }
+                await runtime.call_store.aset_response_status(
+                    call_sid,
+                    {
+                        "status": "forward",
+                        "audio_url": None,
+                        "ai_text": ai_text,
+                        "forwarding_phone": staff_phone,
+                    },
+                )
                 return
             voice_warning(
                 "staff_transfer_name_not_found",
@@ -2086,12 +2186,15 @@ async def generate_response_async(
                 )
                 call_data["outcome"] = "forwarded"
                 voice_service.call_log_set_outcome(call_sid, "forwarded")
-                runtime.call_store.response_status[call_sid] = {
-                    "status": "forward",
-                    "audio_url": None,
-                    "ai_text": ai_text,
-                    "forwarding_phone": forwarding_phone,
-                }
+                await runtime.call_store.aset_response_status(
+                    call_sid,
+                    {
+                        "status": "forward",
+                        "audio_url": None,
+                        "ai_text": ai_text,
+                        "forwarding_phone": forwarding_phone,
+                    },
+                )
                 return
             # AI reply implied a transfer but there's no number — speak the honest line.
             ai_text = _NO_TRANSFER_FALLBACK_TEXT
@@ -2101,11 +2204,14 @@ async def generate_response_async(
         tts_audio_url = f"{base_url}/api/phone/tts-audio?text={ai_text_encoded}&voice={config_service.get_tts_voice()}"
 
         # Mark as ready
-        runtime.call_store.response_status[call_sid] = {
-            "status": "ready",
-            "audio_url": tts_audio_url,
-            "ai_text": ai_text,
-        }
+        await runtime.call_store.aset_response_status(
+            call_sid,
+            {
+                "status": "ready",
+                "audio_url": tts_audio_url,
+                "ai_text": ai_text,
+            },
+        )
         voice_call_phase(
             "gpt_response_ready",
             call_sid=call_sid,
@@ -2124,12 +2230,15 @@ async def generate_response_async(
         # Graceful fallback: play fallback message so caller does not get dead air
         fallback_encoded = quote(voice_service.TTS_FALLBACK_TEXT)
         fallback_tts_url = f"{base_url}/api/phone/tts-audio?text={fallback_encoded}&voice={config_service.get_tts_voice()}"
-        runtime.call_store.response_status[call_sid] = {
-            "status": "ready",
-            "audio_url": fallback_tts_url,
-            "ai_text": voice_service.TTS_FALLBACK_TEXT,
-            "error": type(e).__name__,
-        }
+        await runtime.call_store.aset_response_status(
+            call_sid,
+            {
+                "status": "ready",
+                "audio_url": fallback_tts_url,
+                "ai_text": voice_service.TTS_FALLBACK_TEXT,
+                "error": type(e).__name__,
+            },
+        )
         voice_info(
             "gpt_response_fallback_tts",
             call_sid=call_sid,
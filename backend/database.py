@@ -11,7 +11,7 @@ import logging
 import threading
 import time as _time
 from datetime import date, datetime, timedelta, timezone
-from typing import Any, Optional, List, Tuple
+from typing import Any, Iterator, Optional, List, Tuple
 from pathlib import Path
 
 # Request-scoped client_id (set by auth middleware or webhook)
@@ -35,6 +35,51 @@ def clear_request_client_id() -> None:
     except LookupError:
         pass
 
+
+# Write hooks for in-process caches that sit in front of this module.
+#
+# Membership listeners run after any write that can change which tenant a Clerk user
+# resolves to (deps caches that resolution). They get the affected user ids; an empty
+# tuple means "could be anyone" — org/tenant deletes and store moves, which are rare.
+#
+# Tenant listeners run after writes to the tenant row fields business info is built
+# from (business_config, name, Twilio number) and on delete; config_service caches
+# that. They get (client_id, tenant_id), either of which may be None.
+_membership_listeners: List = []
+_tenant_listeners: List = []
+
+
+def on_membership_change(fn) -> None:
+    """Register fn(user_ids: tuple) to run after tenant/org membership writes."""
+    if fn not in _membership_listeners:
+        _membership_listeners.append(fn)
+
+
+def on_tenant_change(fn) -> None:
+    """Register fn(client_id, tenant_id) to run after tenant row / business_config writes."""
+    if fn not in _tenant_listeners:
+        _tenant_listeners.append(fn)
+
+
+def _fire_listeners(listeners: List, kind: str, *args) -> None:
+    for fn in list(listeners):
+        try:
+            fn(*args)
+        except Exception as e:
+            _log.warning("%s listener failed: %s", kind, e)
+
+
+def _notify_membership_changed(*clerk_user_ids: str) -> None:
+    ids = tuple(u for u in clerk_user_ids if u)
+    if clerk_user_ids and not ids:
+        return
+    _fire_listeners(_membership_listeners, "membership", ids)
+
+
+def _notify_tenant_changed(client_id: Optional[str] = None, tenant_id: Optional[str] = None) -> None:
+    _fire_listeners(_tenant_listeners, "tenant", client_id, str(tenant_id) if tenant_id else None)
+
+
 class DatabaseUnavailable(RuntimeError):
     """The query could not run — as distinct from running and finding nothing.
 
@@ -44,6 +89,10 @@ class DatabaseUnavailable(RuntimeError):
     """
 
 
+class ExportsBusy(RuntimeError):
+    """Every streaming-export slot is taken; the caller should retry shortly."""
+
+
 # Connection pool (ThreadedConnectionPool) — one borrowed conn per thread per request
 _pool = None
 _use_db = False
@@ -59,10 +108,167 @@ def _ensure_pool():
         return None
     from psycopg2 import pool
 
+    minconn, maxconn = _pool_bounds()
+    _pool = pool.ThreadedConnectionPool(
+        minconn,
+        maxconn,
+        url,
+        connect_timeout=10,
+        connection_factory=_PooledConnection,
+        cursor_factory=_TimedCursor,
+        **_KEEPALIVES,
+    )
+    return _pool
+
+
+def _pool_bounds() -> Tuple[int, int]:
+    """(DB_POOL_MIN, DB_POOL_MAX), clamped so max >= min >= 1."""
     minconn = max(1, int((os.getenv("DB_POOL_MIN") or "2").strip()))
     maxconn = max(minconn, int((os.getenv("DB_POOL_MAX") or "10").strip()))
-    _pool = pool.ThreadedConnectionPool(minconn, maxconn, url, connect_timeout=10)
-    return _pool
+    return minconn, maxconn
+
+
+# ---------------------------------------------------------------------------
+# Pool and query instrumentation
+# ---------------------------------------------------------------------------
+# Per db_* function (top-level calls; nested ones are part of their caller): calls,
+# errors raised, wall time, time in statements, checkout wait and rows returned. Plus
+# pool-wide checkout counters, pre-ping discards, and a warning for any statement slower
+# than DB_SLOW_QUERY_MS (0 disables). Read by db_metrics_snapshot() for /metrics and the
+# admin self-check; used to size DB_POOL_MAX and find the functions that dominate.
+_SLOW_QUERY_MS = float((os.getenv("DB_SLOW_QUERY_MS") or "500").strip() or 500)
+_metrics_lock = threading.Lock()
+_fn_metrics: dict = {}
+_pool_metrics = {
+    "checkouts": 0,
+    "checkout_wait_seconds": 0.0,
+    "checkout_wait_max_seconds": 0.0,
+    "checkout_timeouts": 0,
+    "preping_discards": 0,
+    "slow_queries": 0,
+}
+
+try:
+    from psycopg2.extensions import TRANSACTION_STATUS_IDLE as _TX_IDLE
+    from psycopg2.extensions import connection as _PgConnection
+    from psycopg2.extensions import cursor as _PgCursor
+except ImportError:  # pragma: no cover
+    _PgConnection = _PgCursor = object  # type: ignore
+    _TX_IDLE = 0
+
+# Checkout validation. A pooled connection used within the last DB_PREPING_IDLE_SECONDS
+# is handed out as is; only one idle longer gets the SELECT 1 pre-ping (Render closes
+# idle server connections after minutes, not seconds). 0 pre-pings every checkout.
+# TCP keepalives let the kernel notice a dead peer between checkouts, so a dropped
+# connection fails fast instead of hanging the first query on it.
+_PREPING_IDLE_SECONDS = float((os.getenv("DB_PREPING_IDLE_SECONDS") or "30").strip() or 30)
+_KEEPALIVES = {"keepalives": 1, "keepalives_idle": 30, "keepalives_interval": 10, "keepalives_count": 3}
+
+
+class _PooledConnection(_PgConnection):
+    """psycopg2 connection that remembers when it last went back to the pool."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.last_used = _time.monotonic()  # just connected: as good as freshly used
+
+    def commit(self):
+        if not _uow_defers("commit"):
+            super().commit()
+
+    def rollback(self):
+        if not _uow_defers("rollback"):
+            super().rollback()
+
+
+def _uow_defers(op: str) -> bool:
+    """Inside unit_of_work(transaction=True) the block's own COMMIT on exit is the only
+    one: a db_* call's commit or rollback is deferred (a rollback fails the unit)."""
+    if not getattr(_thread_local, "uow_tx", False):
+        return False
+    if op == "rollback":
+        _thread_local.uow_rolled_back = True
+    return True
+
+
+def _idle_seconds(conn) -> float:
+    last = getattr(conn, "last_used", None)
+    return _time.monotonic() - last if isinstance(last, float) else float("inf")
+
+
+class _TimedCursor(_PgCursor):
+    """Cursor that reports each statement's time and returned rows to _record_query."""
+
+    def execute(self, query, vars=None):
+        t0 = _time.perf_counter()
+        try:
+            return super().execute(query, vars)
+        finally:
+            rows = self.rowcount if self.description is not None else 0
+            _record_query(query, _time.perf_counter() - t0, rows)
+
+
+def _record_query(sql, seconds: float, rows: int) -> None:
+    tl = _thread_local
+    tl.m_query_seconds = getattr(tl, "m_query_seconds", 0.0) + seconds
+    tl.m_rows = getattr(tl, "m_rows", 0) + max(0, rows or 0)
+    if _SLOW_QUERY_MS > 0 and seconds * 1000 >= _SLOW_QUERY_MS:
+        with _metrics_lock:
+            _pool_metrics["slow_queries"] += 1
+        if isinstance(sql, bytes):
+            sql = sql.decode("utf-8", errors="replace")
+        # Statement text only; parameters (phones, names) never reach the log.
+        _log.warning(
+            "db_slow_query fn=%s ms=%.1f rows=%s sql=%s",
+            getattr(tl, "m_fn", None) or "-", seconds * 1000, rows, " ".join(str(sql).split())[:300],
+        )
+
+
+def _record_checkout(seconds: float, timed_out: bool = False) -> None:
+    _thread_local.m_wait = getattr(_thread_local, "m_wait", 0.0) + seconds
+    with _metrics_lock:
+        if timed_out:
+            _pool_metrics["checkout_timeouts"] += 1
+            return
+        _pool_metrics["checkouts"] += 1
+        _pool_metrics["checkout_wait_seconds"] += seconds
+        _pool_metrics["checkout_wait_max_seconds"] = max(_pool_metrics["checkout_wait_max_seconds"], seconds)
+
+
+def _record_call(name: str, seconds: float, ok: bool) -> None:
+    tl = _thread_local
+    with _metrics_lock:
+        m = _fn_metrics.get(name)
+        if m is None:
+            m = _fn_metrics[name] = {
+                "calls": 0, "errors": 0, "seconds": 0.0, "query_seconds": 0.0,
+                "checkout_wait_seconds": 0.0, "rows": 0,
+            }
+        m["calls"] += 1
+        m["errors"] += 0 if ok else 1
+        m["seconds"] += seconds
+        m["query_seconds"] += getattr(tl, "m_query_seconds", 0.0)
+        m["checkout_wait_seconds"] += getattr(tl, "m_wait", 0.0)
+        m["rows"] += getattr(tl, "m_rows", 0)
+
+
+def db_metrics_snapshot(top: Optional[int] = None) -> dict:
+    """Pool gauges and counters plus per-function totals (the `top` slowest by total
+    time, or all), for GET /metrics and the admin ops self-check."""
+    p = _pool
+    with _metrics_lock:
+        pool_stats = dict(_pool_metrics)
+        fns = {name: dict(m) for name, m in _fn_metrics.items()}
+    pool_stats.update(
+        max=getattr(p, "maxconn", _pool_bounds()[1]),
+        in_use=len(getattr(p, "_used", {}) or {}),
+        idle=len(getattr(p, "_pool", []) or []),
+        slow_query_ms=_SLOW_QUERY_MS,
+    )
+    ranked = sorted(fns.items(), key=lambda kv: kv[1]["seconds"], reverse=True)
+    if top is not None:
+        ranked = ranked[:top]
+    return {"pool": pool_stats, "functions": dict(ranked)}
 
 
 # psycopg2's pool raises the moment it is empty rather than waiting, so a burst of
@@ -74,16 +280,19 @@ _POOL_WAIT_SECONDS = float((os.getenv("DB_POOL_WAIT_SECONDS") or "3").strip() or
 
 def _getconn_waiting(pool):
     """pool.getconn(), retried briefly while the pool is exhausted."""
-    deadline = _time.monotonic() + _POOL_WAIT_SECONDS
+    started = _time.monotonic()
+    deadline = started + _POOL_WAIT_SECONDS
     waited = False
     while True:
         try:
             conn = pool.getconn()
             if waited:
                 _log.info("db_pool_getconn_recovered after_wait=true")
+            _record_checkout(_time.monotonic() - started)
             return conn
         except Exception:
             if _time.monotonic() >= deadline:
+                _record_checkout(_time.monotonic() - started, timed_out=True)
                 raise
             waited = True
             _time.sleep(0.05)
@@ -101,9 +310,10 @@ def _get_conn():
         return None
     # Pool pre-ping: a pooled connection may have been dropped server-side while
     # idle (Render Starter Postgres closes idle conns), and psycopg2's conn.closed
-    # won't catch that. Validate with a cheap SELECT 1 on checkout; if it's dead,
-    # discard and try one more. Runs once per request — the live connection is then
-    # cached in _thread_local for the rest of the request's queries.
+    # won't catch that. Validate one idle past _PREPING_IDLE_SECONDS with a cheap
+    # SELECT 1 on checkout; if it's dead, discard and try one more. A recently used
+    # one skips the round trip. The live connection is then cached in _thread_local
+    # for the rest of the call's queries.
     last_err = None
     for _ in range(2):
         try:
@@ -115,6 +325,9 @@ def _get_conn():
                 len(getattr(pool, "_used", {}) or {}),
             )
             return None
+        if not conn.closed and _idle_seconds(conn) < _PREPING_IDLE_SECONDS:
+            _thread_local.conn = conn
+            return conn
         try:
             cur = conn.cursor()
             cur.execute("SELECT 1")
@@ -123,6 +336,8 @@ def _get_conn():
             return conn
         except Exception as e:
             last_err = e
+            with _metrics_lock:
+                _pool_metrics["preping_discards"] += 1
             try:
                 pool.putconn(conn, close=True)
             except Exception:
@@ -142,6 +357,7 @@ def db_release_thread_connection() -> None:
     pool = _ensure_pool()
     if pool:
         try:
+            conn.last_used = _time.monotonic()
             pool.putconn(conn)
         except Exception as e:
             _log.warning("db_pool_putconn_failed: %s", e)
@@ -192,7 +408,7 @@ def _discard_thread_connection() -> None:
 import functools as _functools
 
 # db_-prefixed names that are NOT query functions and must not be scope-wrapped.
-_SCOPE_EXCLUDE = {"db_release_thread_connection"}
+_SCOPE_EXCLUDE = {"db_release_thread_connection", "db_executor_stats", "db_metrics_snapshot"}
 
 
 def _conn_scope_exit() -> None:
@@ -204,8 +420,11 @@ def _conn_scope_exit() -> None:
         return
     pool = _ensure_pool()
     try:
-        if not conn.closed:
-            conn.rollback()  # committed writes already persisted; clears idle-in-tx reads
+        # Committed writes already persisted; the rollback clears an idle-in-tx read
+        # snapshot or an aborted transaction, so a connection already idle skips it.
+        if not conn.closed and conn.info.transaction_status != _TX_IDLE:
+            conn.rollback()
+        conn.last_used = _time.monotonic()
     except Exception:
         # Connection is unusable — discard it rather than return a poisoned conn.
         try:
@@ -238,18 +457,182 @@ def _scoped(fn):
             return fn(*args, **kwargs)  # in-memory / no-DB path borrows nothing
         depth = getattr(_thread_local, "depth", 0)
         _thread_local.depth = depth + 1
+        if depth == 0:
+            _thread_local.m_fn = fn.__name__
+            _thread_local.m_query_seconds = 0.0
+            _thread_local.m_wait = 0.0
+            _thread_local.m_rows = 0
+            started = _time.perf_counter()
+        ok = False
         try:
-            return fn(*args, **kwargs)
+            result = fn(*args, **kwargs)
+            ok = True
+            return result
         finally:
             new_depth = getattr(_thread_local, "depth", 1) - 1
             _thread_local.depth = max(0, new_depth)
             if new_depth <= 0:
                 _conn_scope_exit()
+                if depth == 0:
+                    _record_call(fn.__name__, _time.perf_counter() - started, ok)
+                _thread_local.m_fn = None
 
     wrapper._db_scoped = True
     return wrapper
 
 
+# ---------------------------------------------------------------------------
+# DB executor: awaitable db_* calls for async handlers
+# ---------------------------------------------------------------------------
+# Per-call scoping made the loop-thread calls correct, but each one still blocks the
+# event loop for its round trips, stalling every concurrent call's audio pacing. Async
+# handlers instead `await adb.<name>(...)` (or `await run_db(fn, ...)` for a sync helper
+# that queries): the call runs on a dedicated executor with one worker per pool
+# connection (more workers would only queue inside _getconn_waiting), in a copy of the
+# caller's context so the request client_id follows it. With no database the call runs
+# inline, as before.
+import asyncio as _asyncio
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
+
+_db_executor: Optional[_ThreadPoolExecutor] = None
+_db_executor_lock = threading.Lock()
+# Queue depth and wait for the admin self-check: calls waiting for a worker right now,
+# the most ever waiting, and time spent waiting.
+_db_executor_stats = {"calls": 0, "queued": 0, "running": 0, "peak_queued": 0, "wait_ms_total": 0.0, "wait_ms_max": 0.0}
+
+
+def _get_db_executor() -> _ThreadPoolExecutor:
+    global _db_executor
+    with _db_executor_lock:
+        if _db_executor is None:
+            _db_executor = _ThreadPoolExecutor(
+                max_workers=_pool_bounds()[1], thread_name_prefix="db"
+            )
+        return _db_executor
+
+
+def _db_executor_job(ctx: contextvars.Context, queued_at: float, fn, args, kwargs):
+    wait_ms = (_time.monotonic() - queued_at) * 1000
+    with _db_executor_lock:
+        st = _db_executor_stats
+        st["queued"] -= 1
+        st["running"] += 1
+        st["wait_ms_total"] += wait_ms
+        st["wait_ms_max"] = max(st["wait_ms_max"], wait_ms)
+    try:
+        return ctx.run(fn, *args, **kwargs)
+    finally:
+        # A helper that used _get_conn() outside a db_* scope leaves the connection on
+        # this worker; hand it back rather than hold it until the thread's next call.
+        db_release_thread_connection()
+        with _db_executor_lock:
+            _db_executor_stats["running"] -= 1
+
+
+async def run_db(fn, *args, **kwargs):
+    """Await sync fn(*args, **kwargs) on the DB executor, off the event loop."""
+    if not _use_db:
+        return fn(*args, **kwargs)
+    with _db_executor_lock:
+        st = _db_executor_stats
+        st["calls"] += 1
+        st["queued"] += 1
+        st["peak_queued"] = max(st["peak_queued"], st["queued"])
+    job = _get_db_executor().submit(
+        _db_executor_job, contextvars.copy_context(), _time.monotonic(), fn, args, kwargs
+    )
+    job.add_done_callback(_db_executor_unqueue_cancelled)
+    return await _asyncio.wrap_future(job)
+
+
+def _db_executor_unqueue_cancelled(job) -> None:
+    # Cancelling the awaiting task cancels a job that has not started yet; it never runs
+    # _db_executor_job, so take it off the queued gauge here. A started job can't be
+    # cancelled, so this never double-counts.
+    if job.cancelled():
+        with _db_executor_lock:
+            _db_executor_stats["queued"] -= 1
+
+
+def db_executor_stats() -> dict:
+    """DB executor size, queue depth and queue wait, for the admin ops self-check."""
+    with _db_executor_lock:
+        st = dict(_db_executor_stats)
+    calls = st.pop("calls")
+    wait_total = st.pop("wait_ms_total")
+    return {
+        "workers": _pool_bounds()[1],
+        "calls": calls,
+        **st,
+        "wait_ms_avg": round(wait_total / calls, 2) if calls else 0.0,
+        "wait_ms_max": round(st["wait_ms_max"], 2),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Unit of work: one connection across several db_* calls in sync code
+# ---------------------------------------------------------------------------
+# A sync handler like get_appointments makes several top-level db_* calls in a row, and
+# per-call scoping borrows, validates and returns a connection for each one. Inside
+# `with unit_of_work():` the scope depth is already 1, so every db_* call (and any helper
+# that uses _get_conn) shares the first connection borrowed, released once on exit.
+# Holding a connection across calls is only safe where nothing can await in between, so
+# it refuses to run on an event-loop thread; async code uses adb / run_db instead.
+import contextlib as _contextlib
+
+
+@_contextlib.contextmanager
+def unit_of_work(transaction: bool = False, name: str = "unit_of_work"):
+    """Hold one pooled connection for the db_* calls in the block.
+
+    transaction=True also makes the block one transaction: commits the db_* functions
+    make are deferred to a single COMMIT on exit, an exception rolls everything back,
+    and a db_* that rolled back its own error fails the unit with RuntimeError. A unit
+    opened inside another (or inside a db_* call) joins the outer one. Metrics record
+    the block as one call under `name`.
+    """
+    try:
+        _asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        raise RuntimeError(
+            "unit_of_work() cannot run on an event-loop thread; use adb / run_db from async code"
+        )
+    if not _use_db:
+        yield
+        return
+    if getattr(_thread_local, "depth", 0):
+        yield
+        return
+    tl = _thread_local
+    tl.depth = 1
+    tl.m_fn = name
+    tl.m_query_seconds = 0.0
+    tl.m_wait = 0.0
+    tl.m_rows = 0
+    tl.uow_tx = transaction
+    tl.uow_rolled_back = False
+    started = _time.perf_counter()
+    ok = False
+    try:
+        yield
+        if transaction:
+            tl.uow_tx = False
+            if tl.uow_rolled_back:
+                raise RuntimeError(f"{name}: a db_* call rolled back inside the transaction")
+            conn = getattr(tl, "conn", None)
+            if conn is not None and not conn.closed:
+                conn.commit()
+        ok = True
+    finally:
+        tl.uow_tx = False
+        tl.depth = 0
+        _conn_scope_exit()  # rolls back whatever was not committed
+        _record_call(name, _time.perf_counter() - started, ok)
+        tl.m_fn = None
+
+
 def db_ping() -> bool:
     """Return True if DB is reachable (for health check).
 
@@ -270,6 +653,30 @@ def db_ping() -> bool:
             _discard_thread_connection()
     return False
 
+
+# Moves messages still held in sms_sessions.messages arrays into sms_messages (in thread
+# order, stamped with the thread's last update) and fills the summary columns. Emptying
+# the array afterwards makes it idempotent, so init_db runs it on every boot.
+_SMS_MESSAGES_BACKFILL = (
+    """
+    INSERT INTO sms_messages (client_id, phone, role, content, created_at)
+    SELECT s.client_id, s.phone, COALESCE(e.m->>'role', ''), COALESCE(e.m->>'content', ''),
+           COALESCE(s.updated_at, NOW())
+    FROM sms_sessions s, jsonb_array_elements(s.messages) WITH ORDINALITY AS e(m, ord)
+    WHERE jsonb_array_length(s.messages) > 0
+    ORDER BY s.client_id, s.phone, e.ord
+    """,
+    """
+    UPDATE sms_sessions
+    SET message_count = message_count + jsonb_array_length(messages),
+        last_message = left(COALESCE(messages->-1->>'content', ''), 300),
+        last_role = COALESCE(messages->-1->>'role', ''),
+        messages = '[]'::jsonb
+    WHERE jsonb_array_length(messages) > 0
+    """,
+)
+
+
 def init_db() -> bool:
     """Initialize database: create tables if not exist. Returns True if DB is used.
 
@@ -614,6 +1021,9 @@ def init_db() -> bool:
             )
         """)
         cur.execute("CREATE INDEX IF NOT EXISTS idx_backup_exports_created ON backup_exports(created_at)")
+        # Streaming snapshot exporter: full vs incremental and its window; see 0017.
+        for col, typ in [("mode", "TEXT NOT NULL DEFAULT 'full'"), ("since", "TIMESTAMPTZ"), ("started_at", "TIMESTAMPTZ")]:
+            cur.execute(f"ALTER TABLE backup_exports ADD COLUMN IF NOT EXISTS {col} {typ}")
         # Plan tier tables
         cur.execute("""
             CREATE TABLE IF NOT EXISTS tenant_usage (
@@ -875,6 +1285,71 @@ def init_db() -> bool:
         except Exception:
             pass
         cur.execute("CREATE INDEX IF NOT EXISTS idx_appointments_status_date ON appointments(client_id, status)")
+        # Date-windowed calendar reads (booking_service slot index); see 0014.
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_appointments_client_date ON appointments(client_id, date)")
+        # Per-tenant windowed call-log reads and SQL-side analytics aggregates; see 0015.
+        cur.execute(
+            "CREATE INDEX IF NOT EXISTS idx_call_log_client_created ON call_log(client_id, created_at DESC)"
+        )
+        # Phone lookups (inbound SMS, caller memory) narrow on the last 10 digits through this
+        # index, then recheck the full digits; a stored generated column keeps it current on
+        # every insert/update; see 0019.
+        cur.execute(
+            "ALTER TABLE appointments ADD COLUMN IF NOT EXISTS phone_digits TEXT GENERATED ALWAYS AS "
+            "(right(regexp_replace(COALESCE(phone, ''), '[^0-9]', '', 'g'), 10)) STORED"
+        )
+        cur.execute(
+            "CREATE INDEX IF NOT EXISTS idx_appointments_client_phone_status "
+            "ON appointments(client_id, phone_digits, status)"
+        )
+        # Per-tenant local-day rollup kept in step by the writers; see 0016.
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS daily_stats (
+                client_id TEXT NOT NULL,
+                day DATE NOT NULL,
+                calls INTEGER NOT NULL DEFAULT 0,
+                missed INTEGER NOT NULL DEFAULT 0,
+                answered INTEGER NOT NULL DEFAULT 0,
+                forwarded INTEGER NOT NULL DEFAULT 0,
+                errors INTEGER NOT NULL DEFAULT 0,
+                duration_sec BIGINT NOT NULL DEFAULT 0,
+                bookings INTEGER NOT NULL DEFAULT 0,
+                bookings_by_source JSONB NOT NULL DEFAULT '{}'::jsonb,
+                cancellations INTEGER NOT NULL DEFAULT 0,
+                sms_in INTEGER NOT NULL DEFAULT 0,
+                sms_out INTEGER NOT NULL DEFAULT 0,
+                updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+                PRIMARY KEY (client_id, day)
+            )
+        """)
+        # SMS threads: append-only message rows plus a small summary on sms_sessions, in
+        # place of the per-thread JSONB array; any arrays still present move over; see 0020.
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS sms_messages (
+                id BIGSERIAL PRIMARY KEY,
+                client_id TEXT NOT NULL,
+                phone TEXT NOT NULL,
+                role TEXT NOT NULL,
+                content TEXT NOT NULL DEFAULT '',
+                created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+            )
+        """)
+        cur.execute(
+            "CREATE INDEX IF NOT EXISTS idx_sms_messages_client_phone_created "
+            "ON sms_messages(client_id, phone, created_at)"
+        )
+        for col, typ in [
+            ("message_count", "INTEGER NOT NULL DEFAULT 0"),
+            ("last_message", "TEXT"),
+            ("last_role", "TEXT"),
+        ]:
+            cur.execute(f"ALTER TABLE sms_sessions ADD COLUMN IF NOT EXISTS {col} {typ}")
+        cur.execute(
+            "CREATE INDEX IF NOT EXISTS idx_sms_sessions_client_updated "
+            "ON sms_sessions(client_id, updated_at DESC)"
+        )
+        for stmt in _SMS_MESSAGES_BACKFILL:
+            cur.execute(stmt)
         conn.commit()
         cur.close()
         conn.close()
@@ -1109,6 +1584,7 @@ def db_tenant_member_assign_owner(clerk_user_id: str, tenant_id: str) -> Optiona
         )
         cur.close()
         conn.commit()
+        _notify_membership_changed(clerk_user_id, *displaced)
         return displaced
     except Exception as e:
         print(f"[DB] Failed to assign tenant owner: {e}")
@@ -1134,6 +1610,8 @@ def db_tenant_member_remove(clerk_user_id: str, tenant_id: str) -> bool:
         deleted = cur.rowcount > 0
         cur.close()
         conn.commit()
+        if deleted:
+            _notify_membership_changed(clerk_user_id)
         return deleted
     except Exception as e:
         print(f"[DB] Failed to remove tenant member: {e}")
@@ -1498,6 +1976,8 @@ def db_org_delete(org_id: str) -> bool:
         ok = cur.rowcount > 0
         conn.commit()
         cur.close()
+        if ok:
+            _notify_membership_changed()
         return ok
     except Exception as e:
         print(f"[DB] Failed to delete org: {e}")
@@ -1536,6 +2016,7 @@ def db_org_member_add(
         )
         conn.commit()
         cur.close()
+        _notify_membership_changed(uid)
         return True
     except Exception as e:
         print(f"[DB] Failed to add org member: {e}")
@@ -1555,6 +2036,8 @@ def db_org_member_remove(clerk_user_id: str, org_id: str) -> bool:
         ok = cur.rowcount > 0
         conn.commit()
         cur.close()
+        if ok:
+            _notify_membership_changed((clerk_user_id or "").strip())
         return ok
     except Exception as e:
         print(f"[DB] Failed to remove org member: {e}")
@@ -1721,6 +2204,8 @@ def db_org_invites_consume_for_emails(clerk_user_id: str, emails: List[str]) ->
             )
         conn.commit()
         cur.close()
+        if joined:
+            _notify_membership_changed(uid)
         return joined
     except Exception as e:
         print(f"[DB] Failed to consume org invites: {e}")
@@ -1747,6 +2232,8 @@ def db_org_attach_tenant(tenant_id: str, org_id: Optional[str]) -> bool:
         ok = cur.rowcount > 0
         conn.commit()
         cur.close()
+        if ok:
+            _notify_membership_changed()
         return ok
     except Exception as e:
         print(f"[DB] Failed to attach tenant to org: {e}")
@@ -1897,11 +2384,13 @@ def db_org_list_all() -> List[dict]:
 def db_org_store_metrics(client_ids: List[str], days: int = 7) -> dict:
     """Headline metrics per store for the oversight rollup, keyed by client_id.
 
-    Aggregated in SQL across all stores at once rather than looping per store, so a
-    franchise with 50 shops is still three queries. Filters use the real created_at
-    timestamp, not call_log.start_iso — that column is TEXT and would be a string
-    comparison. appointments.date is also TEXT, but it's a zero-padded YYYY-MM-DD, so
-    lexicographic order matches date order there.
+    Calls and bookings come from daily_stats: the last `days` local days (today
+    included) in each store's own timezone, and the `days` before that for the trend —
+    one query over at most 2 x days rows per store, however long the stores' history.
+    Upcoming appointments and unread messages are current state, not events, so they're
+    still counted from their tables (aggregated across all stores at once).
+    appointments.date is TEXT, but it's a zero-padded YYYY-MM-DD, so lexicographic
+    order matches date order there.
     """
     cids = [c for c in (client_ids or []) if c]
     if not cids:
@@ -1916,42 +2405,47 @@ def db_org_store_metrics(client_ids: List[str], days: int = 7) -> dict:
         }
         for c in cids
     }
-    window = timedelta(days=max(1, days))
-    since = datetime.now(timezone.utc) - window
-    prev_since = since - window  # same-length window immediately before, for the trend
+    days = max(1, days)
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
     try:
         cur = conn.cursor()
+        now = datetime.now(timezone.utc)
+        local_today = [now.astimezone(_tenant_tz(cur, c)).date() for c in cids]
         cur.execute(
             """
-            SELECT client_id,
-                   COUNT(*) FILTER (WHERE created_at >= %s) AS calls,
-                   COUNT(*) FILTER (WHERE created_at >= %s AND outcome IN ('missed', 'no_answer')) AS missed,
-                   COUNT(*) FILTER (WHERE created_at >= %s AND outcome = 'answered_by_ai') AS answered,
-                   COUNT(*) FILTER (WHERE created_at >= %s AND created_at < %s) AS prev_calls
-            FROM call_log WHERE client_id = ANY(%s) GROUP BY client_id
+            SELECT w.client_id,
+                   SUM(d.calls) FILTER (WHERE d.day > w.today - %(days)s) AS calls,
+                   SUM(d.missed) FILTER (WHERE d.day > w.today - %(days)s) AS missed,
+                   SUM(d.answered) FILTER (WHERE d.day > w.today - %(days)s) AS answered,
+                   SUM(d.calls) FILTER (WHERE d.day <= w.today - %(days)s) AS prev_calls,
+                   SUM(COALESCE((d.bookings_by_source->>'receptionist')::int, 0))
+                       FILTER (WHERE d.day > w.today - %(days)s) AS bookings,
+                   SUM(COALESCE((d.bookings_by_source->>'receptionist')::int, 0))
+                       FILTER (WHERE d.day <= w.today - %(days)s) AS prev_bookings
+            FROM unnest(%(cids)s::text[], %(todays)s::date[]) AS w(client_id, today)
+            JOIN daily_stats d
+              ON d.client_id = w.client_id AND d.day > w.today - 2 * %(days)s AND d.day <= w.today
+            GROUP BY w.client_id
             """,
-            (since, since, since, prev_since, since, cids),
+            {"days": days, "cids": cids, "todays": local_today},
         )
-        for cid, calls, missed, answered, prev_calls in cur.fetchall():
+        for cid, calls, missed, answered, prev_calls, bookings, prev_bookings in cur.fetchall():
             out[cid]["calls"] = calls or 0
             out[cid]["missed"] = missed or 0
             out[cid]["answered"] = answered or 0
             out[cid]["prev_calls"] = prev_calls or 0
+            out[cid]["bookings"] = bookings or 0
+            out[cid]["prev_bookings"] = prev_bookings or 0
         cur.execute(
             """
             SELECT client_id,
-                   COUNT(*) FILTER (WHERE created_at >= %s AND source = 'receptionist') AS bookings,
-                   COUNT(*) FILTER (WHERE date >= %s AND status NOT IN ('cancelled', 'completed')) AS upcoming,
-                   COUNT(*) FILTER (WHERE created_at >= %s AND created_at < %s AND source = 'receptionist') AS prev_bookings
+                   COUNT(*) FILTER (WHERE date >= %s AND status NOT IN ('cancelled', 'completed')) AS upcoming
             FROM appointments WHERE client_id = ANY(%s) GROUP BY client_id
             """,
-            (since, today, prev_since, since, cids),
+            (today, cids),
         )
-        for cid, bookings, upcoming, prev_bookings in cur.fetchall():
-            out[cid]["bookings"] = bookings or 0
+        for cid, upcoming in cur.fetchall():
             out[cid]["upcoming"] = upcoming or 0
-            out[cid]["prev_bookings"] = prev_bookings or 0
         cur.execute(
             """
             SELECT client_id, COUNT(*) FILTER (WHERE status = 'unread') AS unread
@@ -2076,6 +2570,9 @@ def db_tenant_delete(tenant_id: str) -> bool:
         deleted = cur.rowcount > 0
         conn.commit()
         cur.close()
+        if deleted:
+            _notify_membership_changed()
+            _notify_tenant_changed(tenant_id=tenant_id)
         return deleted
     except Exception as e:
         print(f"[DB] Failed to delete tenant: {e}")
@@ -2090,6 +2587,7 @@ _CLIENT_SCOPED_TABLES = (
     "leads",
     "sms_opt_out",
     "sms_sessions",
+    "sms_messages",
     "booked_slots",
     "caller_memory",
     "messages",
@@ -2172,6 +2670,8 @@ def db_archive_purge_and_delete_tenant(
             return None
         conn.commit()
         cur.close()
+        _notify_membership_changed()
+        _notify_tenant_changed(client_id=cid, tenant_id=tid)
         print(f"[DB] Tenant removed archive_id={archive_id} client_id={cid!r}")
         return int(archive_id)
     except Exception as e:
@@ -2270,59 +2770,197 @@ def db_legal_hold_list_active() -> List[dict]:
         return []
 
 
-def db_retention_purge(days: int = 365 * 3) -> dict:
+# Retention: (table, timestamp column, row key for batched deletes, hold predicate).
+# Batches select keys rather than deleting by range so each DELETE is bounded; ctid is
+# fine for sms_sessions (never partitioned), the others use their id. A live thread keeps
+# all its messages: sms_messages rows go only once their expired session has.
+_RETENTION_TABLES = (
+    (
+        "audit_events", "occurred_at", "id",
+        "(t.client_id IS NULL OR t.client_id = '' OR NOT EXISTS ("
+        "SELECT 1 FROM legal_holds h WHERE h.client_id = t.client_id "
+        "AND (h.hold_until IS NULL OR h.hold_until > NOW())))",
+    ),
+    (
+        "call_log", "created_at", "id",
+        "NOT EXISTS (SELECT 1 FROM legal_holds h WHERE h.client_id = t.client_id "
+        "AND (h.hold_until IS NULL OR h.hold_until > NOW()))",
+    ),
+    (
+        "sms_sessions", "updated_at", "ctid",
+        "NOT EXISTS (SELECT 1 FROM legal_holds h WHERE h.client_id = t.client_id "
+        "AND (h.hold_until IS NULL OR h.hold_until > NOW()))",
+    ),
+    (
+        "sms_messages", "created_at", "id",
+        "NOT EXISTS (SELECT 1 FROM sms_sessions s WHERE s.client_id = t.client_id "
+        "AND s.phone = t.phone) AND NOT EXISTS (SELECT 1 FROM legal_holds h "
+        "WHERE h.client_id = t.client_id AND (h.hold_until IS NULL OR h.hold_until > NOW()))",
+    ),
+)
+# Tables that migration 0018 may have range-partitioned by month, and their key column.
+_PARTITIONED_TABLES = {"call_log": "created_at", "audit_events": "occurred_at"}
+
+
+def _month_start(d: date, offset: int = 0) -> date:
+    m = d.year * 12 + d.month - 1 + offset
+    return date(m // 12, m % 12 + 1, 1)
+
+
+def _is_partitioned(cur, table: str) -> bool:
+    cur.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)", (table,))
+    row = cur.fetchone()
+    return bool(row) and row[0] == "p"
+
+
+def _partitions_with_upper_bound(cur, table: str) -> List[Tuple[str, datetime]]:
+    """(partition name, exclusive upper bound) for each bounded range partition of table."""
+    import re
+
+    cur.execute(
+        """
+        SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)
+        FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = to_regclass(%s)
+        """,
+        (table,),
+    )
+    out = []
+    for name, bound in cur.fetchall():
+        m = re.search(r"TO \('([^']+)'\)", bound or "")
+        if not m or not re.fullmatch(r"[a-z0-9_]+", name or ""):
+            continue  # DEFAULT / MAXVALUE, or a name we didn't create
+        try:
+            upper = datetime.fromisoformat(m.group(1))
+        except ValueError:
+            continue
+        out.append((name, upper if upper.tzinfo else upper.replace(tzinfo=timezone.utc)))
+    return out
+
+
+def db_partitions_ensure(months_ahead: int = 3) -> List[str]:
+    """Create the next `months_ahead` monthly partitions for each table that is
+    range-partitioned (migration 0018), so inserts never fall through to the default
+    partition. A no-op on unpartitioned tables. Returns the partitions created."""
+    conn = _get_conn()
+    if not conn:
+        return []
+    created: List[str] = []
+    cur = conn.cursor()
+    try:
+        this_month = _month_start(datetime.now(timezone.utc).date())
+        for table in _PARTITIONED_TABLES:
+            if not _is_partitioned(cur, table):
+                continue
+            for i in range(1, months_ahead + 1):
+                lo, hi = _month_start(this_month, i), _month_start(this_month, i + 1)
+                name = f"{table}_p{lo.strftime('%Y%m')}"
+                cur.execute("SELECT to_regclass(%s)", (name,))
+                if (cur.fetchone() or [None])[0]:
+                    continue
+                cur.execute("SAVEPOINT partition_create")
+                try:
+                    cur.execute(
+                        f"CREATE TABLE {name} PARTITION OF {table} "
+                        "FOR VALUES FROM (%s::timestamptz) TO (%s::timestamptz)",
+                        (lo.isoformat() + "T00:00:00+00:00", hi.isoformat() + "T00:00:00+00:00"),
+                    )
+                    cur.execute("RELEASE SAVEPOINT partition_create")
+                    created.append(name)
+                except Exception as e:
+                    # Usually rows for that month already sit in the default partition.
+                    cur.execute("ROLLBACK TO SAVEPOINT partition_create")
+                    _log.warning("db_partitions_ensure: could not create %s: %s", name, e)
+        conn.commit()
+    except Exception as e:
+        print(f"[DB] Failed to ensure partitions: {e}")
+        conn.rollback()
+    cur.close()
+    return created
+
+
+def _cron_run_progress(cur, run_id: Optional[int], summary: dict) -> None:
+    if run_id:
+        cur.execute("UPDATE cron_runs SET summary = %s WHERE id = %s", (json.dumps(summary), run_id))
+
+
+def _retire_expired_partitions(cur, conn, table: str, keep_days: int, action: str) -> List[str]:
+    """Drop (or just detach) whole monthly partitions that ended before the retention
+    cutoff and hold no rows for a tenant under an active legal hold. Partitions with held
+    rows are left for the row-level purge, which skips exactly the held tenants."""
+    cutoff = datetime.now(timezone.utc) - timedelta(days=keep_days)
+    retired = []
+    for name, upper in _partitions_with_upper_bound(cur, table):
+        if upper > cutoff:
+            continue
+        cur.execute(
+            f"""
+            SELECT 1 FROM legal_holds h
+            WHERE (h.hold_until IS NULL OR h.hold_until > NOW())
+              AND EXISTS (SELECT 1 FROM {name} p WHERE p.client_id = h.client_id)
+            LIMIT 1
+            """
+        )
+        if cur.fetchone():
+            continue
+        cur.execute(f"ALTER TABLE {table} DETACH PARTITION {name}")
+        if action != "detach":
+            cur.execute(f"DROP TABLE {name}")
+        conn.commit()
+        retired.append(name)
+    return retired
+
+
+def db_retention_purge(
+    days: int = 365 * 3,
+    *,
+    batch_size: int = 0,
+    run_id: Optional[int] = None,
+    partition_action: str = "drop",
+) -> dict:
     """
     Purge expired rows while honoring legal holds.
     Returns deleted counts by table.
+
+    batch_size > 0 deletes in chunks of that many rows, committing after each, so no
+    statement holds locks or builds WAL for long; progress is written to the cron_runs
+    row `run_id` as it goes. batch_size 0 keeps the single-transaction purge. On tables
+    range-partitioned by month (0018), expired partitions without held rows are removed
+    whole first (partition_action "drop", or "detach" to keep them as standalone tables);
+    their names are reported under "partitions".
     """
     keep_days = max(1, int(days))
+    out = {"audit_events": 0, "call_log": 0, "sms_sessions": 0, "sms_messages": 0}
     conn = _get_conn()
     if not conn:
-        return {"audit_events": 0, "call_log": 0, "sms_sessions": 0}
-    out = {"audit_events": 0, "call_log": 0, "sms_sessions": 0}
+        return out
+    retired: List[str] = []
+    progress = {"deleted": out, "partitions": retired, "table": None}
     try:
         cur = conn.cursor()
-        cur.execute(
-            """
-            DELETE FROM audit_events a
-            WHERE a.occurred_at < NOW() - make_interval(days => %s::int)
-              AND (
-                a.client_id IS NULL OR a.client_id = '' OR NOT EXISTS (
-                  SELECT 1 FROM legal_holds h
-                  WHERE h.client_id = a.client_id
-                    AND (h.hold_until IS NULL OR h.hold_until > NOW())
+        for table, ts_col, key, keep in _RETENTION_TABLES:
+            progress["table"] = table
+            if table in _PARTITIONED_TABLES and _is_partitioned(cur, table):
+                retired += _retire_expired_partitions(cur, conn, table, keep_days, partition_action)
+                _cron_run_progress(cur, run_id, progress)
+                conn.commit()
+            expired = f"t.{ts_col} < NOW() - make_interval(days => %s::int) AND {keep}"
+            if batch_size <= 0:
+                cur.execute(f"DELETE FROM {table} t WHERE {expired}", (keep_days,))
+                out[table] = int(cur.rowcount or 0)
+                continue
+            while True:
+                cur.execute(
+                    f"DELETE FROM {table} WHERE {key} IN "
+                    f"(SELECT t.{key} FROM {table} t WHERE {expired} LIMIT %s)",
+                    (keep_days, batch_size),
                 )
-              )
-            """,
-            (keep_days,),
-        )
-        out["audit_events"] = int(cur.rowcount or 0)
-        cur.execute(
-            """
-            DELETE FROM call_log c
-            WHERE c.created_at < NOW() - make_interval(days => %s::int)
-              AND NOT EXISTS (
-                SELECT 1 FROM legal_holds h
-                WHERE h.client_id = c.client_id
-                  AND (h.hold_until IS NULL OR h.hold_until > NOW())
-              )
-            """,
-            (keep_days,),
-        )
-        out["call_log"] = int(cur.rowcount or 0)
-        cur.execute(
-            """
-            DELETE FROM sms_sessions s
-            WHERE s.updated_at < NOW() - make_interval(days => %s::int)
-              AND NOT EXISTS (
-                SELECT 1 FROM legal_holds h
-                WHERE h.client_id = s.client_id
-                  AND (h.hold_until IS NULL OR h.hold_until > NOW())
-              )
-            """,
-            (keep_days,),
-        )
-        out["sms_sessions"] = int(cur.rowcount or 0)
+                n = int(cur.rowcount or 0)
+                out[table] += n
+                _cron_run_progress(cur, run_id, progress)
+                conn.commit()
+                if n < batch_size:
+                    break
         conn.commit()
         cur.close()
     except Exception as e:
@@ -2331,57 +2969,212 @@ def db_retention_purge(days: int = 365 * 3) -> dict:
             conn.rollback()
         except Exception:
             pass
+    if retired:
+        out["partitions"] = retired
     return out
 
 
-def db_export_tenant_snapshot(export_root: str, *, include_audit: bool = True) -> Optional[dict]:
+# Snapshot exports: one compressed NDJSON file per tenant ({"table": ..., "row": ...} per
+# line, the tenants row first) plus a manifest.json with each file's sha256, under
+# <export_root>/<export_key>/. Rows stream from server-side cursors straight into the
+# compressor and the hash, so memory stays flat however big the fleet gets.
+_SNAPSHOT_ITERSIZE = 2000
+_SNAPSHOT_WORKERS = max(1, int((os.getenv("EXPORT_SNAPSHOT_WORKERS") or "2").strip() or 2))
+# Incremental exports only narrow these (the large, append-mostly tables, by the same
+# columns retention uses); the rest are small and mutable with no reliable change
+# timestamp, so every export carries them in full.
+_SNAPSHOT_INCREMENTAL_COLUMNS = {
+    "audit_events": "occurred_at",
+    "call_log": "created_at",
+    "sms_sessions": "updated_at",
+    "sms_messages": "created_at",
+}
+# call_log rows are finalized (outcome, duration, recording) a little after insert, so
+# an incremental export re-reads this much before the previous one started.
+_SNAPSHOT_INCREMENTAL_OVERLAP = timedelta(hours=1)
+
+
+class _HashingWriter:
+    """File wrapper that sha256-hashes and counts the bytes written through it."""
+
+    def __init__(self, f):
+        self._f = f
+        self.sha = hashlib.sha256()
+        self.bytes = 0
+
+    def write(self, data) -> int:
+        self.sha.update(data)
+        self.bytes += len(data)
+        return self._f.write(data)
+
+    def flush(self) -> None:
+        self._f.flush()
+
+
+def _snapshot_compression(requested: str) -> str:
+    """'zstd' when asked for and the optional zstandard package is installed, else 'gzip'."""
+    if (requested or "").strip().lower() == "zstd":
+        try:
+            import zstandard  # noqa: F401
+
+            return "zstd"
+        except ImportError:
+            _log.warning("export_snapshot: zstandard not installed; using gzip")
+    return "gzip"
+
+
+def _open_compressed(raw: "_HashingWriter", compression: str):
+    if compression == "zstd":
+        import zstandard
+
+        return zstandard.ZstdCompressor(level=6).stream_writer(raw, closefd=False)
+    import gzip
+
+    return gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6)
+
+
+def _export_tenant_file(
+    pool, tenant: dict, tables: List[str], out_dir: Path, compression: str, since: Optional[datetime]
+) -> dict:
+    """Stream one tenant's rows into <out_dir>/<client_id>.ndjson.<ext>. Runs on an export
+    worker with its own pooled connection and one read-only snapshot of the tenant."""
+    cid = (tenant.get("client_id") or "").strip()
+    safe = "".join(ch if ch.isalnum() or ch in "._-" else "_" for ch in cid) or "_"
+    name = f"{safe}.ndjson.{'zst' if compression == 'zstd' else 'gz'}"
+    tmp = out_dir / f".{name}.part"
+    rows: dict = {}
+    conn = _getconn_waiting(pool)
+    broken = False
+    try:
+        cur = conn.cursor()
+        cur.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY")
+        cur.close()
+        with tmp.open("wb") as f:
+            raw = _HashingWriter(f)
+            with _open_compressed(raw, compression) as z:
+                z.write(json.dumps({"table": "tenants", "row": tenant}, default=str, ensure_ascii=False).encode("utf-8") + b"\n")
+                for table in tables:
+                    if table not in _CLIENT_SCOPED_TABLES:
+                        raise ValueError(f"Invalid table name: {table}")
+                    col = _SNAPSHOT_INCREMENTAL_COLUMNS.get(table) if since else None
+                    cur = conn.cursor(name=f"snapshot_{uuid.uuid4().hex[:12]}")
+                    cur.itersize = _SNAPSHOT_ITERSIZE
+                    if col:
+                        cur.execute(f"SELECT * FROM {table} WHERE client_id = %s AND {col} >= %s", (cid, since))
+                    else:
+                        cur.execute(f"SELECT * FROM {table} WHERE client_id = %s", (cid,))
+                    n = 0
+                    cols = None
+                    for row in cur:
+                        if cols is None:
+                            cols = [d[0] for d in cur.description]
+                        line = {"table": table, "row": {cols[i]: _serialize_cell(row[i]) for i in range(len(cols))}}
+                        z.write(json.dumps(line, default=str, separators=(",", ":"), ensure_ascii=False).encode("utf-8") + b"\n")
+                        n += 1
+                    cur.close()
+                    rows[table] = n
+        tmp.rename(out_dir / name)
+    except Exception:
+        broken = True
+        raise
+    finally:
+        try:
+            if not broken:
+                conn.rollback()
+        except Exception:
+            broken = True
+        try:
+            pool.putconn(conn, close=broken)
+        except Exception as e:
+            _log.warning("db_pool_putconn_failed: %s", e)
+    return {"client_id": cid, "file": name, "sha256": raw.sha.hexdigest(), "bytes": raw.bytes, "rows": rows}
+
+
+def db_export_tenant_snapshot(
+    export_root: str,
+    *,
+    include_audit: bool = True,
+    incremental: bool = False,
+    compression: str = "gzip",
+    workers: Optional[int] = None,
+) -> Optional[dict]:
     """
-    Export tenant-scoped operational data to a local immutable snapshot file.
-    Returns metadata with path + sha256.
+    Export tenant-scoped operational data to an immutable snapshot directory: one
+    compressed NDJSON file per tenant plus manifest.json (per-file sha256, row counts).
+    Tenants are exported in parallel on a bounded worker pool, each worker streaming from
+    its own connection. With `incremental`, the large append-mostly tables only carry
+    rows since the previous export recorded in backup_exports (a full export if none).
+    Returns metadata with path + the manifest's sha256; None (and nothing recorded) if
+    any tenant fails.
     """
     conn = _get_conn()
-    if not conn:
+    pool = _ensure_pool()
+    if not conn or not pool:
         return None
     root = Path(export_root).expanduser()
-    root.mkdir(parents=True, exist_ok=True)
-    ts = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
-    export_key = f"tenant-export-{ts}-{uuid.uuid4().hex[:10]}"
-    out_path = root / f"{export_key}.json"
+    started = datetime.now(timezone.utc)
+    export_key = f"tenant-export-{started.strftime('%Y%m%dT%H%M%SZ')}-{uuid.uuid4().hex[:10]}"
+    out_dir = root / export_key
+    compression = _snapshot_compression(compression)
     try:
         cur = conn.cursor()
+        since = None
+        if incremental:
+            cur.execute("SELECT MAX(COALESCE(started_at, created_at)) FROM backup_exports")
+            row = cur.fetchone()
+            if row and row[0]:
+                since = row[0] - _SNAPSHOT_INCREMENTAL_OVERLAP
         cur.execute(f"SELECT {_tenant_select_cols()} FROM tenants ORDER BY created_at ASC")
-        tenant_rows = cur.fetchall()
-        payload = {
+        tenants = [_row_to_tenant(r) for r in cur.fetchall()]
+        conn.rollback()  # don't sit idle-in-transaction while the workers run
+        tables = [t for t in _CLIENT_SCOPED_TABLES if include_audit or t != "audit_events"]
+        out_dir.mkdir(parents=True, exist_ok=True)
+        # Each worker holds a pooled connection; leave headroom for live traffic.
+        n_workers = max(1, min(workers or _SNAPSHOT_WORKERS, max(1, getattr(pool, "maxconn", 2) // 2)))
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=n_workers, thread_name_prefix="export") as ex:
+            files = list(
+                ex.map(lambda t: _export_tenant_file(pool, t, tables, out_dir, compression, since), tenants)
+            )
+        manifest = {
             "export_key": export_key,
-            "created_at": datetime.utcnow().isoformat() + "Z",
-            "tenants": [],
+            "created_at": started.isoformat().replace("+00:00", "Z"),
+            "format": "ndjson",
+            "compression": compression,
+            "mode": "incremental" if since else "full",
+            "since": since.isoformat() if since else None,
+            "incremental_tables": sorted(_SNAPSHOT_INCREMENTAL_COLUMNS) if since else [],
             "schema_tables": list(_CLIENT_SCOPED_TABLES),
+            "tenants": files,
         }
-        scoped_tables = [t for t in _CLIENT_SCOPED_TABLES if include_audit or t != "audit_events"]
-        for row in tenant_rows:
-            tenant = _row_to_tenant(row)
-            cid = (tenant.get("client_id") or "").strip()
-            scoped_data = {}
-            for table in scoped_tables:
-                scoped_data[table] = _fetch_all_rows_for_client(cur, table, cid)
-            payload["tenants"].append({"tenant": tenant, "tables": scoped_data})
-        encoded = json.dumps(payload, default=str, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        encoded = json.dumps(manifest, indent=1, ensure_ascii=False).encode("utf-8")
         sha = hashlib.sha256(encoded).hexdigest()
-        with out_path.open("wb") as f:
-            f.write(encoded)
+        (out_dir / "manifest.json").write_bytes(encoded)
         cur.execute(
             """
-            INSERT INTO backup_exports (export_key, destination_path, sha256)
-            VALUES (%s, %s, %s)
+            INSERT INTO backup_exports (export_key, destination_path, sha256, mode, since, started_at)
+            VALUES (%s, %s, %s, %s, %s, %s)
             ON CONFLICT (export_key) DO NOTHING
             """,
-            (export_key, str(out_path), sha),
+            (export_key, str(out_dir), sha, manifest["mode"], since, started),
         )
         conn.commit()
         cur.close()
-        return {"export_key": export_key, "path": str(out_path), "sha256": sha, "tenants": len(payload["tenants"])}
+        return {
+            "export_key": export_key,
+            "path": str(out_dir),
+            "sha256": sha,
+            "tenants": len(files),
+            "mode": manifest["mode"],
+            "rows": sum(sum(f["rows"].values()) for f in files),
+            "bytes": sum(f["bytes"] for f in files),
+        }
     except Exception as e:
         print(f"[DB] tenant snapshot export failed: {e}")
+        import shutil
+
+        shutil.rmtree(out_dir, ignore_errors=True)
         return None
 
 def db_tenant_list_all() -> List[dict]:
@@ -2441,6 +3234,7 @@ def db_tenant_update_subscription(
         cur.execute(f"UPDATE tenants SET {', '.join(updates)} WHERE id = %s", params)
         conn.commit()
         cur.close()
+        _notify_tenant_changed(tenant_id=tenant_id)
         return True
     except Exception as e:
         print(f"[DB] Failed to update tenant subscription: {e}")
@@ -2475,6 +3269,7 @@ def db_tenant_set_name(tenant_id: str, name: str) -> bool:
         cur.execute("UPDATE tenants SET name = %s WHERE id = %s", (clean[:120], tenant_id))
         conn.commit()
         cur.close()
+        _notify_tenant_changed(tenant_id=tenant_id)
         return True
     except Exception as e:
         print(f"[DB] Failed to set tenant name: {e}")
@@ -2509,6 +3304,7 @@ _DEMO_SEEDED_TABLES = (
     "caller_memory",
     "leads",
     "sms_sessions",
+    "sms_messages",
     "sms_automations",
     "tenant_usage",
     "conversational_sms_period_usage",
@@ -2571,6 +3367,8 @@ def db_tenant_deactivate_demo(
                 print(f"[DB] demo purge skipped {table}: {e}")
         conn.commit()
         cur.close()
+        if replacement_config is not None:
+            _notify_tenant_changed(client_id=cid, tenant_id=tenant_id)
         return {"client_id": cid, "deleted": deleted}
     except Exception as e:
         print(f"[DB] Failed to deactivate demo tenant: {e}")
@@ -2599,6 +3397,8 @@ def db_tenant_set_twilio_phone(tenant_id: str, twilio_phone_number: str) -> bool
         ok = cur.rowcount > 0
         conn.commit()
         cur.close()
+        if ok:
+            _notify_tenant_changed(tenant_id=tenant_id)
         return ok
     except Exception as e:
         print(f"[DB] Failed to set tenant Twilio phone: {e}")
@@ -2669,6 +3469,8 @@ def db_tenant_clear_twilio(tenant_id: str) -> bool:
         ok = cur.rowcount > 0
         conn.commit()
         cur.close()
+        if ok:
+            _notify_tenant_changed(tenant_id=tenant_id)
         return ok
     except Exception as e:
         print(f"[DB] Failed to clear tenant Twilio: {e}")
@@ -2776,6 +3578,8 @@ def db_tenant_set_business_config(client_id: str, config: dict) -> bool:
         ok = cur.rowcount > 0
         conn.commit()
         cur.close()
+        if ok:
+            _notify_tenant_changed(client_id=cid)
         return ok
     except Exception as e:
         print(f"[DB] Failed to set business_config for {cid}: {e}")
@@ -2995,6 +3799,7 @@ def db_appointments_insert(data: dict) -> dict:
         data.get("staff_id"),
     ))
     row = cur.fetchone()
+    _daily_stats_bump(cur, cid, row[1], {"bookings": 1}, source=data.get("source", "manual"))
     conn.commit()
     cur.close()
     apt_id = row[0]
@@ -3023,12 +3828,24 @@ def db_appointments_update(
     cid = (client_id or "").strip() or _client_id()
     vals.append(cid)
     cur = conn.cursor()
-    cur.execute(
-        f"UPDATE appointments SET {', '.join(updates)} WHERE id = %s AND client_id = %s "
-        "RETURNING id, name, email, phone, date, time, reason, status, source, created_at, staff_id, owner_decline_reason, confirmation_sms_failed",
-        vals,
-    )
+    cols = "id, name, email, phone, date, time, reason, status, source, created_at, staff_id, owner_decline_reason, confirmation_sms_failed"
+    if "status" in kwargs and kwargs["status"] is not None:
+        # Join the pre-update row so a cancellation is counted once, on the day it happens.
+        cur.execute(
+            f"UPDATE appointments a SET {', '.join(updates)} "
+            "FROM (SELECT id, status FROM appointments WHERE id = %s AND client_id = %s FOR UPDATE) prev "
+            f"WHERE a.id = prev.id RETURNING {', '.join('a.' + c for c in cols.split(', '))}, prev.status",
+            vals,
+        )
+    else:
+        cur.execute(
+            f"UPDATE appointments SET {', '.join(updates)} WHERE id = %s AND client_id = %s RETURNING {cols}",
+            vals,
+        )
     row = cur.fetchone()
+    if row and len(row) > 13:
+        cancelled = int(row[7] == "cancelled") - int(row[13] == "cancelled")
+        _daily_stats_bump(cur, cid, None, {"cancellations": cancelled})
     conn.commit()
     cur.close()
     if not row:
@@ -3190,6 +4007,66 @@ def db_appointments_in_date_range(
     ]
 
 
+# Statuses whose appointment holds its calendar time (mirrors booking_service).
+CALENDAR_HOLDING_STATUSES = ("accepted", "confirmed", "completed", "pending", "pending_review")
+
+
+def db_appointments_holding_in_date_range(
+    date_from: str,
+    date_to: str,
+    *,
+    client_id: Optional[str] = None,
+) -> List[dict]:
+    """Calendar-holding appointments for the slot engine (inclusive date range).
+
+    Also returns a holding appointment dated outside the range when one of its
+    booked_slots rows falls inside it (a hold that was not moved with the booking),
+    so the caller can still tell that row is live. Cost tracks the window, not the
+    tenant's whole booking history.
+    """
+    conn = _get_conn()
+    if not conn:
+        return []
+    cid = (client_id or "").strip() or _client_id()
+    cur = conn.cursor()
+    cur.execute(
+        """
+        SELECT id, name, email, phone, date, time, reason, status, source, created_at, staff_id, owner_decline_reason, confirmation_sms_failed
+        FROM appointments
+        WHERE client_id = %s AND status = ANY(%s)
+          AND (
+            (date >= %s AND date <= %s)
+            OR id IN (
+              SELECT appointment_id FROM booked_slots
+              WHERE client_id = %s AND date >= %s AND date <= %s
+            )
+          )
+        ORDER BY date, time
+        """,
+        (cid, list(CALENDAR_HOLDING_STATUSES), date_from, date_to, cid, date_from, date_to),
+    )
+    rows = cur.fetchall()
+    cur.close()
+    return [
+        {
+            "id": r[0],
+            "name": r[1],
+            "email": r[2] or "",
+            "phone": r[3] or "",
+            "date": r[4],
+            "time": r[5] or "",
+            "reason": r[6] or "",
+            "status": r[7],
+            "source": r[8] or "manual",
+            "created_at": r[9].isoformat() if r[9] else "",
+            "staff_id": r[10] if len(r) > 10 else None,
+            "owner_decline_reason": r[11] if len(r) > 11 else None,
+            "confirmation_sms_failed": bool(r[12]) if len(r) > 12 else False,
+        }
+        for r in rows
+    ]
+
+
 def db_appointments_get_accepted_for_date(client_id: str, date: str) -> List[dict]:
     """Get accepted appointments for client_id and date (YYYY-MM-DD) with reminder_sent_at IS NULL."""
     if not client_id or not date:
@@ -3244,11 +4121,12 @@ def db_appointments_get_pending_by_phone(phone: str) -> Optional[dict]:
         SELECT id, name, email, phone, date, time, reason, status, source, created_at
         FROM appointments
         WHERE client_id = %s AND status = 'pending_review'
+          AND phone_digits = right(%s, 10)
           AND (regexp_replace(COALESCE(phone,''), '[^0-9]', '', 'g') = %s
                OR regexp_replace(COALESCE(phone,''), '[^0-9]', '', 'g') = right(%s, 10))
         ORDER BY created_at DESC
         LIMIT 1
-    """, (_client_id(), norm, norm))
+    """, (_client_id(), norm, norm, norm))
     row = cur.fetchone()
     cur.close()
     if not row:
@@ -3273,11 +4151,12 @@ def db_appointments_get_by_phone_for_sms(
         SELECT id, name, email, phone, date, time, reason, status, source, created_at
         FROM appointments
         WHERE client_id = %s AND status IN ('pending_customer', 'pending_review')
+          AND phone_digits = right(%s, 10)
           AND (regexp_replace(COALESCE(phone,''), '[^0-9]', '', 'g') = %s
                OR regexp_replace(COALESCE(phone,''), '[^0-9]', '', 'g') = right(%s, 10))
         ORDER BY created_at DESC
         LIMIT 1
-    """, (cid, norm, norm))
+    """, (cid, norm, norm, norm))
     row = cur.fetchone()
     cur.close()
     if not row:
@@ -3309,12 +4188,13 @@ def db_appointments_get_active_for_sms_context(
         FROM appointments
         WHERE client_id = %s
           AND status IN ('pending_customer', 'pending_review', 'accepted')
+          AND phone_digits = right(%s, 10)
           AND (regexp_replace(COALESCE(phone,''), '[^0-9]', '', 'g') = %s
                OR regexp_replace(COALESCE(phone,''), '[^0-9]', '', 'g') = right(%s, 10))
         ORDER BY date ASC, time ASC, created_at DESC
         LIMIT %s
         """,
-        (cid, norm, norm, max(1, int(limit))),
+        (cid, norm, norm, norm, max(1, int(limit))),
     )
     rows = cur.fetchall()
     cur.close()
@@ -3360,10 +4240,11 @@ def db_appointments_update_active_name_by_phone(
             WHERE client_id = %s
               AND status IN ('pending_customer', 'pending_review', 'accepted')
               AND id <> %s
+              AND phone_digits = right(%s, 10)
               AND (regexp_replace(COALESCE(phone,''), '[^0-9]', '', 'g') = %s
                    OR regexp_replace(COALESCE(phone,''), '[^0-9]', '', 'g') = right(%s, 10))
             """,
-            (nm, cid, int(exclude_appointment_id), norm, norm),
+            (nm, cid, int(exclude_appointment_id), norm, norm, norm),
         )
     else:
         cur.execute(
@@ -3372,10 +4253,11 @@ def db_appointments_update_active_name_by_phone(
             SET name = %s
             WHERE client_id = %s
               AND status IN ('pending_customer', 'pending_review', 'accepted')
+              AND phone_digits = right(%s, 10)
               AND (regexp_replace(COALESCE(phone,''), '[^0-9]', '', 'g') = %s
                    OR regexp_replace(COALESCE(phone,''), '[^0-9]', '', 'g') = right(%s, 10))
             """,
-            (nm, cid, norm, norm),
+            (nm, cid, norm, norm, norm),
         )
     count = cur.rowcount or 0
     conn.commit()
@@ -3404,12 +4286,13 @@ def db_appointments_latest_identity_for_phone(
         WHERE client_id = %s
           AND COALESCE(NULLIF(TRIM(name), ''), '') <> ''
           AND status NOT IN ('cancelled', 'rejected')
+          AND phone_digits = right(%s, 10)
           AND (regexp_replace(COALESCE(phone,''), '[^0-9]', '', 'g') = %s
                OR regexp_replace(COALESCE(phone,''), '[^0-9]', '', 'g') = right(%s, 10))
         ORDER BY created_at DESC
         LIMIT 1
         """,
-        (cid, norm, norm),
+        (cid, norm, norm, norm),
     )
     row = cur.fetchone()
     cur.close()
@@ -3451,8 +4334,15 @@ def db_appointments_resolve_for_sms(
 
 
 # --- SMS Sessions ---
-def db_sms_session_get(phone: str, client_id: str) -> Optional[dict]:
-    """Get SMS session for phone+client. Returns {messages, appointment_id} or None."""
+# A thread is its sms_messages rows (append-only) plus one sms_sessions summary row
+# carrying the count, last-message preview and linked appointment.
+_SMS_PREVIEW_CHARS = 300
+
+
+def db_sms_session_get(phone: str, client_id: str, limit: Optional[int] = None) -> Optional[dict]:
+    """Get SMS session for phone+client. Returns {messages, message_count, appointment_id,
+    updated_at} or None. `limit` returns only the last N messages (oldest first), which is
+    all the reply path needs; message_count is always the thread total."""
     conn = _get_conn()
     if not conn:
         return None
@@ -3461,33 +4351,69 @@ def db_sms_session_get(phone: str, client_id: str) -> Optional[dict]:
         return None
     cur = conn.cursor()
     cur.execute(
-        "SELECT messages, appointment_id, updated_at FROM sms_sessions WHERE phone = %s AND client_id = %s",
+        "SELECT appointment_id, updated_at, message_count FROM sms_sessions WHERE phone = %s AND client_id = %s",
         (norm, client_id)
     )
     row = cur.fetchone()
-    cur.close()
     if not row:
+        cur.close()
         return None
-    msgs = row[0] if isinstance(row[0], list) else (json.loads(row[0]) if row[0] else [])
-    return {"messages": msgs, "appointment_id": row[1], "updated_at": row[2]}
+    cur.execute(
+        """
+        SELECT role, content FROM (
+            SELECT id, role, content, created_at FROM sms_messages
+            WHERE client_id = %s AND phone = %s
+            ORDER BY created_at DESC, id DESC
+            LIMIT %s
+        ) t ORDER BY created_at, id
+        """,
+        (client_id, norm, limit),
+    )
+    msgs = [{"role": r[0], "content": r[1]} for r in cur.fetchall()]
+    cur.close()
+    return {"messages": msgs, "message_count": row[2] or 0, "appointment_id": row[0], "updated_at": row[1]}
 
-def db_sms_session_upsert(phone: str, client_id: str, messages: list, appointment_id: Optional[int] = None) -> None:
-    """Insert or update SMS session."""
+def db_sms_session_append(phone: str, client_id: str, messages: list, appointment_id: Optional[int] = None) -> None:
+    """Append new messages to an SMS thread (creating it if needed) and link
+    appointment_id if given. Only the new messages are written, so the cost doesn't grow
+    with the thread."""
     conn = _get_conn()
     if not conn:
         return
     norm = _normalize_phone(phone or "")
     if not norm:
         return
+    added = [m for m in messages if isinstance(m, dict)]
     cur = conn.cursor()
+    if added:
+        cur.execute(
+            "INSERT INTO sms_messages (client_id, phone, role, content) VALUES "
+            + ", ".join(["(%s, %s, %s, %s)"] * len(added)),
+            tuple(
+                v
+                for m in added
+                for v in (client_id, norm, m.get("role") or "", m.get("content") or "")
+            ),
+        )
+    last = added[-1] if added else {}
     cur.execute("""
-        INSERT INTO sms_sessions (phone, client_id, messages, appointment_id, updated_at)
-        VALUES (%s, %s, %s::jsonb, %s, NOW())
+        INSERT INTO sms_sessions (phone, client_id, appointment_id, message_count, last_message, last_role, updated_at)
+        VALUES (%s, %s, %s, %s, %s, %s, NOW())
         ON CONFLICT (phone, client_id) DO UPDATE SET
-            messages = EXCLUDED.messages,
             appointment_id = COALESCE(EXCLUDED.appointment_id, sms_sessions.appointment_id),
+            message_count = sms_sessions.message_count + EXCLUDED.message_count,
+            last_message = COALESCE(EXCLUDED.last_message, sms_sessions.last_message),
+            last_role = COALESCE(EXCLUDED.last_role, sms_sessions.last_role),
             updated_at = NOW()
-    """, (norm, client_id, json.dumps(messages), appointment_id))
+    """, (
+        norm, client_id, appointment_id, len(added),
+        (last.get("content") or "")[:_SMS_PREVIEW_CHARS] if added else None,
+        (last.get("role") or "") if added else None,
+    ))
+    roles = [m.get("role") for m in added]
+    _daily_stats_bump(
+        cur, client_id, None, {"sms_in": roles.count("user"), "sms_out": roles.count("assistant")}
+    )
     conn.commit()
     cur.close()
 
@@ -3501,7 +4427,7 @@ def db_sms_threads_list(client_id: str, search: Optional[str] = None, limit: int
         return []
     cur = conn.cursor()
     params: list = [client_id]
-    where = "client_id = %s AND jsonb_array_length(messages) > 0"
+    where = "client_id = %s AND message_count > 0"
     norm_search = "".join(ch for ch in (search or "") if ch.isdigit())
     if norm_search:
         where += " AND phone LIKE %s"
@@ -3509,11 +4435,7 @@ def db_sms_threads_list(client_id: str, search: Optional[str] = None, limit: int
     params.append(limit)
     cur.execute(
         f"""
-        SELECT phone,
-               jsonb_array_length(messages) AS msg_count,
-               messages->-1 AS last_msg,
-               appointment_id,
-               updated_at
+        SELECT phone, message_count, last_message, last_role, appointment_id, updated_at
         FROM sms_sessions
         WHERE {where}
         ORDER BY updated_at DESC
@@ -3523,25 +4445,17 @@ def db_sms_threads_list(client_id: str, search: Optional[str] = None, limit: int
     )
     rows = cur.fetchall()
     cur.close()
-    out = []
-    for r in rows:
-        last = r[2]
-        if isinstance(last, str):
-            try:
-                last = json.loads(last)
-            except Exception:
-                last = {}
-        if not isinstance(last, dict):
-            last = {}
-        out.append({
+    return [
+        {
             "phone": r[0],
             "message_count": r[1] or 0,
-            "last_message": (last.get("content") or "")[:300],
-            "last_role": last.get("role") or "",
-            "appointment_id": r[3],
-            "updated_at": r[4].isoformat() if r[4] else "",
-        })
-    return out
+            "last_message": r[2] or "",
+            "last_role": r[3] or "",
+            "appointment_id": r[4],
+            "updated_at": r[5].isoformat() if r[5] else "",
+        }
+        for r in rows
+    ]
 
 
 def db_sms_messages_total(client_id: str) -> int:
@@ -3552,7 +4466,7 @@ def db_sms_messages_total(client_id: str) -> int:
         return 0
     cur = conn.cursor()
     cur.execute(
-        "SELECT COALESCE(SUM(jsonb_array_length(messages)), 0)::int FROM sms_sessions WHERE client_id = %s",
+        "SELECT COALESCE(SUM(message_count), 0)::int FROM sms_sessions WHERE client_id = %s",
         (client_id,),
     )
     row = cur.fetchone()
@@ -4589,33 +5503,283 @@ def db_failed_event_resolve(event_id: int) -> bool:
         print(f"[DB] Failed to resolve failed_event: {e}")
         return False
 
+# --- Daily stats rollup ---
+# One row per (client_id, local day) in the tenant's business timezone, bumped in the
+# same transaction as the call / booking / SMS write it counts, so dashboards and the
+# org rollup read O(days) rows instead of scanning call_log and appointments. A bump
+# that fails rolls back to its savepoint and is logged: it never costs the write it
+# was counting, and db_daily_stats_rebuild() recomputes the rows from source.
+DAILY_STATS_COUNTERS = (
+    "calls", "missed", "answered", "forwarded", "errors", "duration_sec",
+    "bookings", "cancellations", "sms_in", "sms_out",
+)
+_tenant_tz_cache: dict = {}
+
+
+def _forget_tenant_tz(client_id: Optional[str], tenant_id: Optional[str]) -> None:
+    if client_id:
+        _tenant_tz_cache.pop(client_id, None)
+    else:
+        _tenant_tz_cache.clear()
+
+
+on_tenant_change(_forget_tenant_tz)
+
+
+def _tenant_tz(cur, client_id: str):
+    """The tenant's business timezone (business_config.timezone, else the env default)."""
+    tz = _tenant_tz_cache.get(client_id)
+    if tz is None:
+        from business_hours import business_timezone
+
+        cur.execute(
+            "SELECT business_config->>'timezone' FROM tenants WHERE client_id = %s LIMIT 1",
+            (client_id,),
+        )
+        row = cur.fetchone()
+        name = row[0] if row and isinstance(row[0], str) else ""
+        tz = _tenant_tz_cache[client_id] = business_timezone({"timezone": name})
+    return tz
+
+
+def _call_stats(outcome: Optional[str], duration_sec) -> dict:
+    """daily_stats contribution of one call_log row."""
+    return {
+        "calls": 1,
+        "missed": int(outcome in ("missed", "no_answer")),
+        "answered": int(outcome == "answered_by_ai"),
+        "forwarded": int(outcome == "forwarded"),
+        "errors": int(outcome == "error"),
+        "duration_sec": int(duration_sec or 0),
+    }
+
+
+def _daily_stats_bump(
+    cur, client_id: str, at: Optional[datetime], deltas: dict, source: Optional[str] = None
+) -> None:
+    """Add `deltas` to the tenant's row for the local day of `at` (now if None), inside
+    the caller's transaction. A `bookings` delta is also added under `source` in
+    bookings_by_source."""
+    deltas = {k: int(v) for k, v in deltas.items() if k in DAILY_STATS_COUNTERS and v}
+    if not client_id or not deltas:
+        return
+    cur.execute("SAVEPOINT daily_stats")
+    try:
+        tz = _tenant_tz(cur, client_id)
+        if not isinstance(at, datetime):
+            at = datetime.now(timezone.utc)
+        day = (at if at.tzinfo else at.replace(tzinfo=timezone.utc)).astimezone(tz).date()
+        cols = list(deltas)
+        by_source_insert = "'{}'::jsonb"
+        by_source_update = ""
+        params: list = [client_id, day, *deltas.values()]
+        if source and deltas.get("bookings"):
+            by_source_insert = "jsonb_build_object(%s::text, %s::int)"
+            by_source_update = (
+                ", bookings_by_source = jsonb_set(daily_stats.bookings_by_source, ARRAY[%s::text], "
+                "to_jsonb(COALESCE((daily_stats.bookings_by_source->>%s)::int, 0) + %s::int))"
+            )
+            params += [source, deltas["bookings"], source, source, deltas["bookings"]]
+        cur.execute(
+            f"""
+            INSERT INTO daily_stats (client_id, day, {', '.join(cols)}, bookings_by_source)
+            VALUES (%s, %s, {', '.join(['%s'] * len(cols))}, {by_source_insert})
+            ON CONFLICT (client_id, day) DO UPDATE SET
+                {', '.join(f'{c} = daily_stats.{c} + EXCLUDED.{c}' for c in cols)}{by_source_update},
+                updated_at = NOW()
+            """,
+            params,
+        )
+        cur.execute("RELEASE SAVEPOINT daily_stats")
+    except Exception as e:
+        print(f"[DB] Failed to update daily_stats for {client_id}: {e}")
+        cur.execute("ROLLBACK TO SAVEPOINT daily_stats")
+
+
+def db_daily_stats_range(
+    client_ids: List[str], start_day: date, end_day: Optional[date] = None
+) -> List[dict]:
+    """daily_stats rows for `client_ids` with start_day <= day <= end_day (all later days
+    if end_day is None), oldest first. Days with no activity have no row."""
+    cids = [c for c in (client_ids or []) if c]
+    if not cids:
+        return []
+    conn = _get_conn()
+    if not conn:
+        return []
+    cur = conn.cursor()
+    cur.execute(
+        f"""
+        SELECT client_id, day, {', '.join(DAILY_STATS_COUNTERS)}, bookings_by_source
+        FROM daily_stats
+        WHERE client_id = ANY(%s) AND day >= %s AND (%s::date IS NULL OR day <= %s::date)
+        ORDER BY day, client_id
+        """,
+        (cids, start_day, end_day, end_day),
+    )
+    rows = cur.fetchall()
+    cur.close()
+    out = []
+    for r in rows:
+        entry = {"client_id": r[0], "day": r[1].isoformat() if r[1] else ""}
+        entry.update({c: int(v or 0) for c, v in zip(DAILY_STATS_COUNTERS, r[2:])})
+        by_source = r[2 + len(DAILY_STATS_COUNTERS)]
+        if isinstance(by_source, str):
+            by_source = json.loads(by_source)
+        entry["bookings_by_source"] = by_source or {}
+        out.append(entry)
+    return out
+
+
+def db_daily_stats_rebuild(client_id: Optional[str] = None, since: Optional[date] = None) -> dict:
+    """Recompute daily_stats from call_log, appointments and sms_messages: for one tenant,
+    or every tenant with activity when client_id is None; from `since` (a local day), or
+    all history. Idempotent, one transaction per tenant. Returns {client_id: rows written}.
+
+    Source rows don't record when every event happened, so a rebuild approximates two
+    counters that live bumps date exactly: cancellations land on the cancelled booking's
+    creation day, and messages backfilled from the old sms_sessions arrays (0020) on
+    their thread's last update day.
+    """
+    conn = _get_conn()
+    if not conn:
+        return {}
+    cur = conn.cursor()
+    if client_id:
+        cids = [client_id]
+    else:
+        cur.execute(
+            "SELECT client_id FROM call_log UNION SELECT client_id FROM appointments "
+            "UNION SELECT client_id FROM sms_messages"
+        )
+        cids = sorted(r[0] for r in cur.fetchall() if r[0])
+    written: dict = {}
+    for cid in cids:
+        try:
+            tz = _tenant_tz(cur, cid)
+            since_ts = (
+                datetime.combine(since, datetime.min.time(), tzinfo=tz) if since else None
+            )
+            params = {"cid": cid, "tz": str(tz), "since": since_ts}
+            cur.execute(
+                "DELETE FROM daily_stats WHERE client_id = %(cid)s "
+                "AND (%(since)s::timestamptz IS NULL OR day >= (%(since)s::timestamptz AT TIME ZONE %(tz)s)::date)",
+                params,
+            )
+            cur.execute(
+                """
+                INSERT INTO daily_stats (client_id, day, calls, missed, answered, forwarded, errors,
+                    duration_sec, bookings, cancellations, sms_in, sms_out, bookings_by_source)
+                SELECT %(cid)s, day, SUM(calls), SUM(missed), SUM(answered), SUM(forwarded),
+                       SUM(errors), SUM(duration_sec), SUM(bookings), SUM(cancellations),
+                       SUM(sms_in), SUM(sms_out),
+                       COALESCE(jsonb_object_agg(source, n) FILTER (WHERE source IS NOT NULL), '{}'::jsonb)
+                FROM (
+                    SELECT day, SUM(calls) AS calls, SUM(missed) AS missed, SUM(answered) AS answered,
+                           SUM(forwarded) AS forwarded, SUM(errors) AS errors,
+                           SUM(duration_sec) AS duration_sec, SUM(bookings) AS bookings,
+                           SUM(cancellations) AS cancellations, SUM(sms_in) AS sms_in,
+                           SUM(sms_out) AS sms_out, source, SUM(bookings) AS n
+                    FROM (
+                        SELECT (created_at AT TIME ZONE %(tz)s)::date AS day, 1 AS calls,
+                               (outcome IN ('missed', 'no_answer'))::int AS missed,
+                               (outcome = 'answered_by_ai')::int AS answered,
+                               (outcome = 'forwarded')::int AS forwarded,
+                               (outcome = 'error')::int AS errors,
+                               COALESCE(duration_sec, 0) AS duration_sec,
+                               0 AS bookings, 0 AS cancellations, 0 AS sms_in, 0 AS sms_out,
+                               NULL::text AS source
+                        FROM call_log
+                        WHERE client_id = %(cid)s
+                          AND (%(since)s::timestamptz IS NULL OR created_at >= %(since)s::timestamptz)
+                        UNION ALL
+                        SELECT (created_at AT TIME ZONE %(tz)s)::date, 0, 0, 0, 0, 0, 0, 1,
+                               (status = 'cancelled')::int, 0, 0, COALESCE(source, 'manual')
+                        FROM appointments
+                        WHERE client_id = %(cid)s
+                          AND (%(since)s::timestamptz IS NULL OR created_at >= %(since)s::timestamptz)
+                        UNION ALL
+                        SELECT (created_at AT TIME ZONE %(tz)s)::date, 0, 0, 0, 0, 0, 0, 0, 0,
+                               (role = 'user')::int, (role = 'assistant')::int, NULL
+                        FROM sms_messages
+                        WHERE client_id = %(cid)s
+                          AND (%(since)s::timestamptz IS NULL OR created_at >= %(since)s::timestamptz)
+                    ) events
+                    GROUP BY day, source
+                ) per_source
+                GROUP BY day
+                """,
+                params,
+            )
+            written[cid] = cur.rowcount
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            print(f"[DB] Failed to rebuild daily_stats for {cid}: {e}")
+    cur.close()
+    return written
+
+
 # --- Call log ---
+def _lock_call_sid(cur, call_sid) -> None:
+    """Serialize writers of one call_sid for the rest of the transaction. Stands in for
+    ON CONFLICT (call_sid): once call_log is range-partitioned (see 0018) it can't carry
+    a unique index on call_sid alone."""
+    cur.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", (call_sid or "",))
+
+
 def db_call_log_append(entry: dict) -> None:
     conn = _get_conn()
     if not conn:
         return
     try:
         cur = conn.cursor()
-        cur.execute("""
-            INSERT INTO call_log (client_id, call_sid, from_number, to_number, start_iso, end_iso, outcome, duration_sec, category,
-                recording_sid, recording_url, recording_duration_sec, recording_status, call_summary)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (call_sid) DO UPDATE SET
-                end_iso = EXCLUDED.end_iso,
-                outcome = COALESCE(EXCLUDED.outcome, call_log.outcome),
-                duration_sec = EXCLUDED.duration_sec,
-                recording_sid = COALESCE(EXCLUDED.recording_sid, call_log.recording_sid),
-                recording_url = COALESCE(EXCLUDED.recording_url, call_log.recording_url),
-                recording_duration_sec = COALESCE(EXCLUDED.recording_duration_sec, call_log.recording_duration_sec),
-                recording_status = COALESCE(EXCLUDED.recording_status, call_log.recording_status),
-                call_summary = COALESCE(EXCLUDED.call_summary, call_log.call_summary)
-        """, (
-            _client_id(), entry.get("call_sid"), entry.get("from_number"), entry.get("to_number"),
-            entry.get("start_iso"), entry.get("end_iso"), entry.get("outcome"),
-            entry.get("duration_sec"), entry.get("category"),
-            entry.get("recording_sid"), entry.get("recording_url"), entry.get("recording_duration_sec"),
-            entry.get("recording_status"), entry.get("call_summary"),
-        ))
+        _lock_call_sid(cur, entry.get("call_sid"))
+        # Status callbacks re-append the same call_sid with a final outcome/duration, so
+        # the rollup gets the difference from what this row already contributed.
+        cur.execute(
+            "SELECT outcome, duration_sec FROM call_log WHERE call_sid = %s",
+            (entry.get("call_sid"),),
+        )
+        old = cur.fetchone()
+        if old:
+            cur.execute("""
+                UPDATE call_log SET
+                    end_iso = %s,
+                    outcome = COALESCE(%s, outcome),
+                    duration_sec = %s,
+                    recording_sid = COALESCE(%s, recording_sid),
+                    recording_url = COALESCE(%s, recording_url),
+                    recording_duration_sec = COALESCE(%s, recording_duration_sec),
+                    recording_status = COALESCE(%s, recording_status),
+                    call_summary = COALESCE(%s, call_summary)
+                WHERE call_sid = %s
+                RETURNING client_id, outcome, duration_sec, created_at
+            """, (
+                entry.get("end_iso"), entry.get("outcome"), entry.get("duration_sec"),
+                entry.get("recording_sid"), entry.get("recording_url"), entry.get("recording_duration_sec"),
+                entry.get("recording_status"), entry.get("call_summary"), entry.get("call_sid"),
+            ))
+        else:
+            cur.execute("""
+                INSERT INTO call_log (client_id, call_sid, from_number, to_number, start_iso, end_iso, outcome, duration_sec, category,
+                    recording_sid, recording_url, recording_duration_sec, recording_status, call_summary)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                RETURNING client_id, outcome, duration_sec, created_at
+            """, (
+                _client_id(), entry.get("call_sid"), entry.get("from_number"), entry.get("to_number"),
+                entry.get("start_iso"), entry.get("end_iso"), entry.get("outcome"),
+                entry.get("duration_sec"), entry.get("category"),
+                entry.get("recording_sid"), entry.get("recording_url"), entry.get("recording_duration_sec"),
+                entry.get("recording_status"), entry.get("call_summary"),
+            ))
+        row = cur.fetchone()
+        if row:
+            new_stats = _call_stats(row[1], row[2])
+            old_stats = _call_stats(old[0], old[1]) if old else {}
+            _daily_stats_bump(
+                cur, row[0], row[3], {k: v - old_stats.get(k, 0) for k, v in new_stats.items()}
+            )
         conn.commit()
         cur.close()
     except Exception as e:
@@ -4644,18 +5808,220 @@ def db_call_log_load(limit: int = 5000, days: Optional[int] = None) -> List[dict
         """, (cid, limit))
     rows = cur.fetchall()
     cur.close()
-    def _row(r):
-        return {
-            "call_sid": r[0], "from_number": r[1], "to_number": r[2], "start_iso": r[3], "end_iso": r[4],
-            "outcome": r[5], "duration_sec": r[6], "category": r[7],
-            "created_at": r[8].isoformat() if len(r) > 8 and r[8] else None,
-            "recording_sid": r[9] if len(r) > 9 else None,
-            "recording_url": r[10] if len(r) > 10 else None,
-            "recording_duration_sec": r[11] if len(r) > 11 else None,
-            "recording_status": r[12] if len(r) > 12 else None,
-            "call_summary": r[13] if len(r) > 13 else None,
-        }
-    return [_row(r) for r in rows]
+    return [_call_log_row(r) for r in rows]
+
+
+_CALL_LOG_COLS = """call_sid, from_number, to_number, start_iso, end_iso, outcome, duration_sec, category, created_at,
+        recording_sid, recording_url, recording_duration_sec, recording_status, call_summary"""
+
+
+def _call_log_row(r) -> dict:
+    return {
+        "call_sid": r[0], "from_number": r[1], "to_number": r[2], "start_iso": r[3], "end_iso": r[4],
+        "outcome": r[5], "duration_sec": r[6], "category": r[7],
+        "created_at": r[8].isoformat() if len(r) > 8 and r[8] else None,
+        "recording_sid": r[9] if len(r) > 9 else None,
+        "recording_url": r[10] if len(r) > 10 else None,
+        "recording_duration_sec": r[11] if len(r) > 11 else None,
+        "recording_status": r[12] if len(r) > 12 else None,
+        "call_summary": r[13] if len(r) > 13 else None,
+    }
+
+
+# A streamed export holds a pooled connection for as long as the client takes to read
+# it, so only this many run at once; the rest are refused (ExportsBusy) rather than
+# allowed to drain the pool the voice and SMS handlers need.
+_EXPORT_STREAM_SLOTS = threading.BoundedSemaphore(
+    max(1, int((os.getenv("DB_EXPORT_STREAMS") or "2").strip() or 2))
+)
+
+
+def db_call_log_stream(
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    *,
+    itersize: int = 2000,
+) -> Iterator[dict]:
+    """Every call_log row for this tenant with since <= created_at < until, newest first,
+    fetched `itersize` rows at a time through a server-side cursor — for exports of any
+    size in constant memory.
+
+    Rows are pulled lazily, possibly from other threads (StreamingResponse iterates in
+    the threadpool) and long after this returns, so the stream borrows its own pooled
+    connection for its lifetime instead of the per-call thread-local one, and gives it
+    back when exhausted or closed. The tenant is resolved now, at call time.
+
+    Raises ExportsBusy when DB_EXPORT_STREAMS exports are already streaming.
+    """
+    if not _use_db:
+        return iter(())
+    pool = _ensure_pool()
+    if not pool:
+        return iter(())
+    if not _EXPORT_STREAM_SLOTS.acquire(blocking=False):
+        raise ExportsBusy("too many exports in progress")
+    stream = _call_log_stream(pool, _client_id(), since, until, itersize)
+    next(stream)  # started, so closing or collecting it always releases the slot
+    return stream
+
+
+def _call_log_stream(pool, cid: str, since, until, itersize: int) -> Iterator[dict]:
+    try:
+        yield None  # consumed by db_call_log_stream
+        yield from _call_log_rows(pool, cid, since, until, itersize)
+    finally:
+        _EXPORT_STREAM_SLOTS.release()
+
+
+def _call_log_rows(pool, cid: str, since, until, itersize: int) -> Iterator[dict]:
+    conn = _getconn_waiting(pool)
+    broken = False
+    try:
+        cur = conn.cursor(name=f"call_log_stream_{uuid.uuid4().hex[:12]}")
+        cur.itersize = max(1, itersize)
+        cur.execute(
+            f"""
+            SELECT {_CALL_LOG_COLS}
+            FROM call_log
+            WHERE client_id = %s
+              AND (%s::timestamptz IS NULL OR created_at >= %s::timestamptz)
+              AND (%s::timestamptz IS NULL OR created_at < %s::timestamptz)
+            ORDER BY created_at DESC
+            """,
+            (cid, since, since, until, until),
+        )
+        for r in cur:
+            yield _call_log_row(r)
+    except GeneratorExit:
+        raise  # the consumer stopped early (client went away); the connection is fine
+    except Exception:
+        broken = True
+        raise
+    finally:
+        try:
+            if not broken:
+                conn.rollback()  # ends the read transaction, closing the server-side cursor
+        except Exception:
+            broken = True
+        try:
+            pool.putconn(conn, close=broken)
+        except Exception as e:
+            _log.warning("db_pool_putconn_failed: %s", e)
+
+
+# Call start as a timestamptz, or NULL when start_iso isn't an ISO timestamp (the Python
+# report skipped those rows too). Naive strings are UTC: callers SET LOCAL TIME ZONE 'UTC'.
+_CALL_START_TS = (
+    "(CASE WHEN start_iso ~ '^\\d{4}-\\d{2}-\\d{2}[T ]\\d{2}:\\d{2}' "
+    "THEN start_iso::timestamptz END)"
+)
+
+
+def db_call_log_health(days: int) -> dict:
+    """Call-health aggregates over the last `days` days, computed in SQL (exact, no row cap).
+
+    Returns {"calls_total", "by_outcome", "avg_duration_sec", "p50_duration_sec",
+    "p90_duration_sec", "booking_signals"}; durations are over rows that have one.
+    """
+    out = {
+        "calls_total": 0,
+        "by_outcome": {},
+        "avg_duration_sec": 0,
+        "p50_duration_sec": 0,
+        "p90_duration_sec": 0,
+        "booking_signals": 0,
+    }
+    conn = _get_conn()
+    if not conn:
+        return out
+    cur = conn.cursor()
+    # One pass over the tenant's window (idx_call_log_client_created): per-outcome counts
+    # via GROUPING SETS plus an all-rows row (outcome IS NULL, grouping bit set) carrying
+    # the duration stats that need the whole window.
+    cur.execute(
+        """
+        SELECT GROUPING(o) AS total_row, o, COUNT(*),
+               AVG(duration_sec),
+               percentile_cont(0.5) WITHIN GROUP (ORDER BY duration_sec),
+               percentile_cont(0.9) WITHIN GROUP (ORDER BY duration_sec),
+               COUNT(*) FILTER (WHERE COALESCE(call_summary, '') <> '' OR category = 'booking')
+        FROM (
+            SELECT COALESCE(NULLIF(outcome, ''), 'unknown') AS o, duration_sec, call_summary, category
+            FROM call_log
+            WHERE client_id = %s AND created_at >= NOW() - make_interval(days => %s::int)
+        ) w
+        GROUP BY GROUPING SETS ((o), ())
+        """,
+        (_client_id(), days),
+    )
+    for total_row, outcome, n, avg, p50, p90, booking in cur.fetchall():
+        if not total_row:
+            out["by_outcome"][outcome] = int(n)
+            continue
+        out["calls_total"] = int(n)
+        out["avg_duration_sec"] = round(float(avg), 1) if avg is not None else 0
+        out["p50_duration_sec"] = round(float(p50), 1) if p50 is not None else 0
+        out["p90_duration_sec"] = round(float(p90), 1) if p90 is not None else 0
+        out["booking_signals"] = int(booking or 0)
+    cur.close()
+    return out
+
+
+def db_call_log_summary(
+    days: Optional[int], tz_name: str, week_start: datetime, week_end: datetime
+) -> dict:
+    """Peak-times report over the last `days` days (all history if None), in SQL.
+
+    by_hour buckets call start by local hour in `tz_name`; by_day_of_week (Sun=0) counts
+    only calls starting in [week_start, week_end). Returns {"total_calls", "by_outcome",
+    "by_hour", "by_day_of_week"} with every hour/weekday present.
+    """
+    out = {
+        "total_calls": 0,
+        "by_outcome": {},
+        "by_hour": {str(h): 0 for h in range(24)},
+        "by_day_of_week": {str(d): 0 for d in range(7)},
+    }
+    conn = _get_conn()
+    if not conn:
+        return out
+    cur = conn.cursor()
+    cur.execute("SET LOCAL TIME ZONE 'UTC'")
+    params = {"cid": _client_id(), "tz": tz_name, "week_start": week_start, "week_end": week_end}
+    window = ""
+    if days is not None and days > 0:
+        window = "AND created_at >= NOW() - make_interval(days => %(days)s::int)"
+        params["days"] = days
+    # Rows are (kind, key, count): 'o' outcome, 'h' local hour, 'd' weekday this week.
+    cur.execute(
+        f"""
+        WITH w AS (
+            SELECT COALESCE(NULLIF(outcome, ''), 'unknown') AS o, {_CALL_START_TS} AS ts
+            FROM call_log
+            WHERE client_id = %(cid)s {window}
+        ), l AS (
+            SELECT o, ts, ts AT TIME ZONE %(tz)s AS local_ts FROM w
+        )
+        SELECT 'o', o, COUNT(*) FROM l GROUP BY o
+        UNION ALL
+        SELECT 'h', EXTRACT(HOUR FROM local_ts)::int::text, COUNT(*)
+        FROM l WHERE ts IS NOT NULL GROUP BY 2
+        UNION ALL
+        SELECT 'd', EXTRACT(DOW FROM local_ts)::int::text, COUNT(*)
+        FROM l WHERE ts >= %(week_start)s AND ts < %(week_end)s GROUP BY 2
+        """,
+        params,
+    )
+    for kind, key, n in cur.fetchall():
+        if kind == "o":
+            out["by_outcome"][key] = int(n)
+            out["total_calls"] += int(n)
+        elif kind == "h":
+            out["by_hour"][key] = int(n)
+        else:
+            out["by_day_of_week"][key] = int(n)
+    cur.close()
+    return out
 
 
 def db_call_log_update_recording(
@@ -4672,15 +6038,26 @@ def db_call_log_update_recording(
         return False
     try:
         cur = conn.cursor()
+        _lock_call_sid(cur, call_sid)
         cur.execute("""
-            INSERT INTO call_log (client_id, call_sid, recording_sid, recording_url, recording_duration_sec, recording_status)
-            VALUES (%s, %s, %s, %s, %s, %s)
-            ON CONFLICT (call_sid) DO UPDATE SET
-                recording_sid = COALESCE(EXCLUDED.recording_sid, call_log.recording_sid),
-                recording_url = COALESCE(EXCLUDED.recording_url, call_log.recording_url),
-                recording_duration_sec = COALESCE(EXCLUDED.recording_duration_sec, call_log.recording_duration_sec),
-                recording_status = COALESCE(EXCLUDED.recording_status, call_log.recording_status)
-        """, (client_id, call_sid, recording_sid, recording_url, recording_duration_sec, recording_status))
+            UPDATE call_log SET
+                recording_sid = COALESCE(%s, recording_sid),
+                recording_url = COALESCE(%s, recording_url),
+                recording_duration_sec = COALESCE(%s, recording_duration_sec),
+                recording_status = COALESCE(%s, recording_status)
+            WHERE call_sid = %s
+            RETURNING created_at
+        """, (recording_sid, recording_url, recording_duration_sec, recording_status, call_sid))
+        if cur.fetchone() is None:
+            cur.execute("""
+                INSERT INTO call_log (client_id, call_sid, recording_sid, recording_url, recording_duration_sec, recording_status)
+                VALUES (%s, %s, %s, %s, %s, %s)
+                RETURNING created_at
+            """, (client_id, call_sid, recording_sid, recording_url, recording_duration_sec, recording_status))
+            row = cur.fetchone()
+            # The callback beat call_log_end: count the call now; the final append adds
+            # its outcome and duration as a delta against this row.
+            _daily_stats_bump(cur, client_id, row[0] if row else None, _call_stats(None, None))
         conn.commit()
         cur.close()
         return True
@@ -4871,6 +6248,31 @@ def db_booked_slots_load() -> List[dict]:
         for r in rows
     ]
 
+def db_booked_slots_in_date_range(date_from: str, date_to: str) -> List[dict]:
+    """Calendar holds dated within the inclusive range (served by idx_booked_slots_unique,
+    whose leading columns are client_id, date)."""
+    conn = _get_conn()
+    if not conn:
+        return []
+    cur = conn.cursor()
+    cur.execute(
+        "SELECT date, time, appointment_id, duration_minutes, staff_id FROM booked_slots "
+        "WHERE client_id = %s AND date >= %s AND date <= %s",
+        (_client_id(), date_from, date_to),
+    )
+    rows = cur.fetchall()
+    cur.close()
+    return [
+        {
+            "date": r[0],
+            "time": r[1],
+            "appointment_id": r[2],
+            "duration_minutes": r[3] or 30,
+            "staff_id": r[4] if len(r) > 4 else None,
+        }
+        for r in rows
+    ]
+
 def db_booked_slots_save(slots: List[dict]) -> None:
     """Bulk rewrite of a tenant's calendar holds (used by reconcile). ON CONFLICT DO
     NOTHING keeps it safe against the unique slot index. Prefer the incremental
@@ -5380,3 +6782,29 @@ for _name, _obj in list(globals().items()):
     ):
         globals()[_name] = _scoped(_obj)
 del _name, _obj
+
+
+class AsyncDB:
+    """Awaitable twin of every scoped db_* function: `await adb.tenant_get_by_phone(n)`
+    runs db_tenant_get_by_phone(n) through run_db. The methods are generated below; each
+    looks its function up at call time, so a monkeypatched database.db_* is honoured."""
+
+    __slots__ = ()
+
+
+def _adb_method(db_name: str):
+    async def method(self, *args, **kwargs):
+        return await run_db(globals()[db_name], *args, **kwargs)
+
+    method.__name__ = db_name[3:]
+    method.__qualname__ = f"AsyncDB.{db_name[3:]}"
+    method.__doc__ = globals()[db_name].__doc__
+    return method
+
+
+for _name, _obj in list(globals().items()):
+    if _name.startswith("db_") and getattr(_obj, "_db_scoped", False):
+        setattr(AsyncDB, _name[3:], _adb_method(_name))
+del _name, _obj
+
+adb = AsyncDB()
@@ -386,7 +386,7 @@ def seed_demo_tenant(
     # the usage meter shows dozens of texts sent — which makes the demo look broken.
     for _cust_name, cust_n, thread in _SMS_THREADS:
         try:
-            database.db_sms_session_upsert(_fake_phone(cust_n), cid, thread)
+            database.db_sms_session_append(_fake_phone(cust_n), cid, thread)
             counts["texts"] += len(thread)
         except Exception as e:
             logger.warning("demo_seed sms thread failed cid=%s: %s", cid, e)
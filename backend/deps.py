@@ -17,8 +17,10 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import threading
 import time
-from typing import Any, List, Optional
+from collections import OrderedDict
+from typing import Any, List, Optional, Tuple
 from urllib.parse import urlparse
 
 from fastapi import Depends, HTTPException, Request
@@ -375,9 +377,17 @@ def _resolve_org_store(request: Request, user_id: str):
     db_org_store_for_user validates membership inside the fetch query, so there is no
     window where an unauthorized store is loaded and then checked.
     """
+    return _resolve_org_store_grant(request, user_id)[0]
+
+
+def _resolve_org_store_grant(request: Request, user_id: str):
+    """_resolve_org_store plus how the store was granted: (tenant, role, cacheable).
+
+    Admin support access is never cacheable — it is audited on every request.
+    """
     store_ref = (request.headers.get(STORE_HEADER) or "").strip()
     if not store_ref or not runtime.USE_DB or not user_id:
-        return None
+        return None, None, False
     scoped = database.db_org_store_for_user(user_id, store_ref)
     if not scoped and is_admin_user(user_id):
         # Support access: an admin can open any store's dashboard to set it up or see
@@ -403,7 +413,7 @@ def _resolve_org_store(request: Request, user_id: str):
                 request=request,
             )
             database.set_request_client_id(tenant["client_id"])
-            return tenant
+            return tenant, None, False
     if not scoped:
         # Miss. Distinguish the two reasons, because they deserve opposite answers:
         # an overseer reaching for a store outside their org is a real 403, but a
@@ -429,14 +439,93 @@ def _resolve_org_store(request: Request, user_id: str):
                     "message": "You do not have access to that store.",
                 },
             )
-        return None  # not an overseer — ignore the header, resolve them normally
+        return None, None, False  # not an overseer — ignore the header, resolve them normally
+    role = scoped.get("role") or "viewer"
     _enforce_org_write_role(
         request,
-        scoped.get("role") or "viewer",
+        role,
         user_id,
         (scoped.get("tenant") or {}).get("client_id"),
     )
-    return scoped.get("tenant")
+    return scoped.get("tenant"), role, True
+
+
+# Resolved-tenant cache: (user_id, X-Store-Id, JWT tenant_id) -> how that user was
+# granted a tenant. Without it every dashboard request re-ran the resolution below —
+# membership queries, often a Clerk API round-trip, sometimes a metadata PATCH. A hit
+# costs one tenants-by-id read, so plan/subscription changes show up immediately and
+# a deleted tenant falls through to full resolution. Membership writes in this
+# process invalidate via database.on_membership_change; other workers converge
+# within the TTL.
+_TENANT_CACHE_TTL_SEC = float((os.getenv("TENANT_RESOLVE_CACHE_TTL_SEC") or "30").strip() or 30)
+_TENANT_CACHE_MAX = 4096
+_tenant_cache: "OrderedDict[Tuple[str, str, str], tuple]" = OrderedDict()
+_tenant_cache_lock = threading.Lock()
+_tenant_cache_gen = 0  # bumped on every invalidation; a resolution that raced one isn't stored
+
+
+def _tenant_cache_get(key: Tuple[str, str, str]) -> Optional[tuple]:
+    """(tenant_id, org_role, extra_fields) for a live entry, else None."""
+    with _tenant_cache_lock:
+        hit = _tenant_cache.get(key)
+        if hit is None:
+            return None
+        if hit[0] <= time.monotonic():
+            del _tenant_cache[key]
+            return None
+        _tenant_cache.move_to_end(key)
+        return hit[1:]
+
+
+def _tenant_cache_put(
+    key: Tuple[str, str, str], gen: int, tenant: dict, org_role: Optional[str]
+) -> None:
+    if _TENANT_CACHE_TTL_SEC <= 0:
+        return
+    tid = str(tenant.get("id") or "").strip()
+    if not tid:
+        return
+    extras = {k: tenant[k] for k in ("org_name", "org_role") if k in tenant}
+    with _tenant_cache_lock:
+        if gen != _tenant_cache_gen:
+            return
+        _tenant_cache[key] = (time.monotonic() + _TENANT_CACHE_TTL_SEC, tid, org_role, extras)
+        _tenant_cache.move_to_end(key)
+        while len(_tenant_cache) > _TENANT_CACHE_MAX:
+            _tenant_cache.popitem(last=False)
+
+
+def invalidate_tenant_cache(user_ids: Tuple[str, ...] = ()) -> None:
+    """Drop cached resolutions for these Clerk users, or for everyone when empty."""
+    global _tenant_cache_gen
+    with _tenant_cache_lock:
+        _tenant_cache_gen += 1
+        if not user_ids:
+            _tenant_cache.clear()
+            return
+        wanted = set(user_ids)
+        for key in [k for k in _tenant_cache if k[0] in wanted]:
+            del _tenant_cache[key]
+
+
+database.on_membership_change(invalidate_tenant_cache)
+
+
+def _cached_tenant(request: Request, key: Tuple[str, str, str]) -> Optional[dict]:
+    """Replay a cached resolution: re-read the tenant row and re-apply the org role gate."""
+    hit = _tenant_cache_get(key)
+    if hit is None:
+        return None
+    tid, org_role, extras = hit
+    tenant = database.db_tenant_get_by_id(tid)
+    if not tenant:
+        invalidate_tenant_cache((key[0],))
+        return None
+    if extras:
+        tenant = {**tenant, **extras}
+    if org_role is not None:
+        _enforce_org_write_role(request, org_role, key[0], tenant.get("client_id"))
+    return tenant
 
 
 def require_tenant(request: Request):
@@ -455,11 +544,25 @@ def require_tenant(request: Request):
         raise HTTPException(status_code=401, detail="Authorization required")
     user_id, tenant_id_from_meta = verify_clerk_token(token)
     _ensure_db_ready()
+    cache_key = None
+    if runtime.USE_DB and user_id:
+        cache_key = (
+            user_id,
+            (request.headers.get(STORE_HEADER) or "").strip(),
+            str(tenant_id_from_meta or "").strip(),
+        )
+        cached = _cached_tenant(request, cache_key)
+        if cached:
+            database.set_request_client_id(cached["client_id"])
+            return cached
+    cache_gen = _tenant_cache_gen
     # Multi-store overseer picking a store. Checked first and returned early: their
     # access comes from org membership, so none of the tenant_members resolution
     # (or its one-tenant-per-user collapsing) below should run for them.
-    org_store = _resolve_org_store(request, user_id)
+    org_store, org_role, cacheable = _resolve_org_store_grant(request, user_id)
     if org_store:
+        if cache_key and cacheable:
+            _tenant_cache_put(cache_key, cache_gen, org_store, org_role)
         database.set_request_client_id(org_store["client_id"])
         return org_store
     tenant = None
@@ -515,6 +618,7 @@ def require_tenant(request: Request):
         meta_tid = str(tenant_id_from_meta or "").strip()
         if tid and meta_tid != tid:
             _clerk_patch_user_tenant_metadata(user_id, tid)
+    org_role = None
     if not tenant and runtime.USE_DB and user_id:
         # Last resort: an org member who isn't a tenant_member of anything — e.g. a
         # manager whose stores were all created through the org. With exactly one
@@ -525,12 +629,13 @@ def require_tenant(request: Request):
         org_stores = database.db_org_stores_for_user(user_id)
         if len(org_stores) == 1:
             tenant = org_stores[0]
+            org_role = tenant.get("org_role") or "viewer"
             # This path skips _resolve_org_store, so it applies the same role gate —
             # otherwise a read-only viewer with exactly one store gets write access
             # simply by not sending the store header.
             _enforce_org_write_role(
                 request,
-                tenant.get("org_role") or "viewer",
+                org_role,
                 user_id,
                 tenant.get("client_id"),
             )
@@ -552,6 +657,8 @@ def require_tenant(request: Request):
                 "or ask your administrator to resend the invite using the exact email you use to sign in."
             ),
         )
+    if cache_key:
+        _tenant_cache_put(cache_key, cache_gen, tenant, org_role)
     database.set_request_client_id(tenant["client_id"])
     return tenant
 
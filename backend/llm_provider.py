@@ -15,7 +15,7 @@ so a hung request fails fast into the graceful TTS fallback instead.
 from __future__ import annotations
 
 import os
-from typing import Optional
+from typing import Iterator, Optional
 
 import runtime
 
@@ -106,3 +106,39 @@ def chat(
         kwargs["temperature"] = temperature
     resp = runtime.client.chat.completions.create(**kwargs)
     return resp.choices[0].message.content or ""
+
+
+def chat_stream(
+    model: str,
+    messages: list[dict],
+    *,
+    max_tokens: int,
+    temperature: Optional[float] = None,
+) -> Iterator[str]:
+    """Streaming twin of chat(): yield reply text deltas as the provider produces them.
+
+    Same routing and request shape as chat(); joining the deltas gives what chat()
+    would have returned. Blocking iterator — run it on a worker thread."""
+    if is_anthropic_model(model):
+        system, conv = _split_for_anthropic(messages)
+        kwargs: dict = {"model": model, "max_tokens": max_tokens, "messages": conv}
+        if system:
+            kwargs["system"] = system
+        if temperature is not None:
+            kwargs["temperature"] = temperature
+        with _anthropic().messages.stream(**kwargs) as stream:
+            for text in stream.text_stream:
+                if text:
+                    yield text
+        return
+
+    kwargs = {"model": model, "messages": messages, "max_tokens": max_tokens, "stream": True}
+    if temperature is not None:
+        kwargs["temperature"] = temperature
+    for chunk in runtime.client.chat.completions.create(**kwargs):
+        choices = getattr(chunk, "choices", None) or []
+        if not choices:
+            continue
+        delta = getattr(choices[0].delta, "content", None)
+        if delta:
+            yield delta
@@ -369,6 +369,8 @@ async def lifespan(app: FastAPI):
         logger.info("email_config %s", email_notify.config_status())
     except Exception:
         pass
+    # Other workers' settings saves drop this worker's cached business info (REDIS_URL only).
+    start_config_invalidation_listener()
     # Init DB first (in thread so it doesn't block the event loop), then pre-warm OpenAI
     db_task = create_tracked_task(
         asyncio.to_thread(_init_db_background), name="init_db_background"
@@ -751,7 +753,7 @@ try:
         db_overage_processed_insert,
         db_audit_append,
         db_sms_session_get,
-        db_sms_session_upsert,
+        db_sms_session_append,
         db_sms_opt_out_is_blocked,
         db_sms_opt_out_set,
         db_sms_opt_out_clear,
@@ -866,6 +868,7 @@ from voice_service import (  # noqa: E402,F401
     _conversation_prefers_english_stt,
     # call-session context (cut 4)
     _persist_call_session,
+    _apersist_call_session,
     _merge_call_session,
     _call_sid_from_form,
     _restore_call_context,
@@ -951,6 +954,7 @@ from config_service import (  # noqa: E402,F401
     business_info_for_dashboard,
     _default_client_config_data,
     get_business_info,
+    start_config_invalidation_listener,
     get_tts_voice,
     get_tts_speed,
     get_client_data_dir,
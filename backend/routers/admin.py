@@ -805,6 +805,9 @@ def admin_bulk_create_tenants(_admin: str = Depends(deps.require_admin)):
 def admin_ops_self_check(_: str = Depends(deps.require_admin)):
     """Production safety checks for webhook and auth hardening."""
     from voice.redis_ops_health import redis_ops_health
+    from voice.sentence_audio_cache import sentence_cache_stats
+    from voice.tts_cache import tts_cache_stats
+    from voice_service import PROJECT_ROOT
 
     cron_secret_set = bool((os.getenv("CRON_SECRET") or "").strip())
     twilio_auth_token_set = bool((os.getenv("TWILIO_AUTH_TOKEN") or "").strip())
@@ -832,6 +835,10 @@ def admin_ops_self_check(_: str = Depends(deps.require_admin)):
         "last_cron_runs": last_cron_runs,
         "stale_cron_jobs": stale_cron_jobs,
         "cron_jobs_healthy": len(stale_cron_jobs) == 0,
+        "sentence_audio_cache": sentence_cache_stats(),
+        "voice_clip_cache": tts_cache_stats(PROJECT_ROOT),
+        "db_executor": database.db_executor_stats(),
+        "db_metrics": database.db_metrics_snapshot(top=10),
     }
 
 
@@ -11,16 +11,19 @@ import csv
 import io
 import json
 import os
+import zlib
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import StreamingResponse
 
 import config_service
 import database
 import deps
 import runtime
 import voice_service
+from business_hours import business_timezone
 from observability import system_info
 
 try:
@@ -91,14 +94,17 @@ def _call_log_days(tenant: Optional[dict]) -> int:
     return get_plan_limits(tenant).get("call_log_days", 30) if get_plan_limits else 9999
 
 
-def _analytics_iso_week_bounds_utc(now: Optional[datetime] = None) -> tuple:
-    """Current ISO week: Monday 00:00 UTC (inclusive) through next Monday 00:00 UTC (exclusive)."""
+def _analytics_iso_week_bounds(now: Optional[datetime] = None, tz=timezone.utc) -> tuple:
+    """Current ISO week: Monday 00:00 through next Monday 00:00 (exclusive) in `tz`
+    (UTC by default), returned as aware datetimes."""
     now = now or datetime.now(timezone.utc)
     if now.tzinfo is None:
         now = now.replace(tzinfo=timezone.utc)
-    monday = now - timedelta(days=now.weekday())
-    week_start = monday.replace(hour=0, minute=0, second=0, microsecond=0)
-    week_end_excl = week_start + timedelta(days=7)
+    local = now.astimezone(tz)
+    monday = (local - timedelta(days=local.weekday())).date()
+    week_start = datetime(monday.year, monday.month, monday.day, tzinfo=tz)
+    nxt = monday + timedelta(days=7)
+    week_end_excl = datetime(nxt.year, nxt.month, nxt.day, tzinfo=tz)
     return week_start, week_end_excl
 
 
@@ -107,6 +113,66 @@ def _weekday_sun_zero(dt: datetime) -> int:
     return (dt.weekday() + 1) % 7
 
 
+def _call_health_from_log(log: List[dict]) -> dict:
+    """db_call_log_health's numbers from an in-memory call log (no-DB mode)."""
+    by_outcome: dict[str, int] = {}
+    durations: list[int] = []
+    booking_signals = 0
+    for entry in log:
+        o = entry.get("outcome") or "unknown"
+        by_outcome[o] = by_outcome.get(o, 0) + 1
+        ds = entry.get("duration_sec")
+        if ds is not None:
+            try:
+                durations.append(int(ds))
+            except (TypeError, ValueError):
+                pass
+        if entry.get("call_summary") or entry.get("category") == "booking":
+            booking_signals += 1
+    durations.sort()
+
+    def pct(p: float) -> float:
+        # Linear interpolation, as Postgres percentile_cont.
+        if not durations:
+            return 0
+        k = (len(durations) - 1) * p
+        lo = int(k)
+        hi = min(lo + 1, len(durations) - 1)
+        return round(durations[lo] + (durations[hi] - durations[lo]) * (k - lo), 1)
+
+    return {
+        "calls_total": len(log),
+        "by_outcome": by_outcome,
+        "avg_duration_sec": round(sum(durations) / len(durations), 1) if durations else 0,
+        "p50_duration_sec": pct(0.5),
+        "p90_duration_sec": pct(0.9),
+        "booking_signals": booking_signals,
+    }
+
+
+def _call_summary_from_log(log: List[dict], tz, week_start: datetime, week_end_excl: datetime) -> dict:
+    """db_call_log_summary's numbers from an in-memory call log (no-DB mode)."""
+    by_outcome: dict[str, int] = {}
+    by_hour = {str(h): 0 for h in range(24)}
+    by_day = {str(d): 0 for d in range(7)}
+    for entry in log:
+        o = entry.get("outcome") or "unknown"
+        by_outcome[o] = by_outcome.get(o, 0) + 1
+        start_iso = entry.get("start_iso")
+        if start_iso:
+            try:
+                dt = datetime.fromisoformat(start_iso.replace("Z", "+00:00"))
+                if dt.tzinfo is None:
+                    dt = dt.replace(tzinfo=timezone.utc)
+                local = dt.astimezone(tz)
+                by_hour[str(local.hour)] += 1
+                if week_start <= dt < week_end_excl:
+                    by_day[str(_weekday_sun_zero(local))] += 1
+            except Exception:
+                pass
+    return {"total_calls": len(log), "by_outcome": by_outcome, "by_hour": by_hour, "by_day_of_week": by_day}
+
+
 @router.get("/api/analytics/health")
 def get_analytics_health(
     tenant: Optional[dict] = Depends(deps.require_tenant),
@@ -116,18 +182,19 @@ def get_analytics_health(
     raw_cid_before_bind = database._client_id() if runtime.USE_DB else None  # DIAGNOSTIC
     cid = deps._bind_tenant_db_context(tenant)  # contextvar from the dep doesn't reach this sync handler
     period_days = 7
-    log = _load_call_log(days=period_days)
     if runtime.USE_DB:
-        all_cid_calls = database.db_call_log_load(limit=5000, days=None)
+        # Aggregated in SQL: exact for any call volume, one indexed query.
+        stats = database.db_call_log_health(period_days)
         system_info(
             "dashboard_callhealth_debug",
             tenant_client_id=cid,
             contextvar_before_bind=raw_cid_before_bind,
             bind_changed_cid=(raw_cid_before_bind != cid),
-            calls_last_7d=len(log),
-            calls_all_time_this_tenant=len(all_cid_calls),
+            calls_last_7d=stats["calls_total"],
         )
-    total = len(log)
+    else:
+        stats = _call_health_from_log(_load_call_log(days=period_days))
+    total = stats["calls_total"]
     if total == 0:
         return {
             "period_days": period_days,
@@ -137,22 +204,12 @@ def get_analytics_health(
             "missed_rate": 0.0,
             "booking_completion_rate": 0.0,
             "avg_duration_sec": 0,
+            "p50_duration_sec": 0,
+            "p90_duration_sec": 0,
             "by_outcome": {},
         }
-    by_outcome: dict[str, int] = {}
-    durations: list[int] = []
-    booking_signals = 0
-    for entry in log:
-        o = entry.get("outcome") or "unknown"
-        by_outcome[o] = by_outcome.get(o, 0) + 1
-        ds = entry.get("duration_sec")
-        if ds is not None:
-            try:
-                durations.append(int(ds))
-            except (TypeError, ValueError):
-                pass
-        if entry.get("call_summary") or entry.get("category") == "booking":
-            booking_signals += 1
+    by_outcome = stats["by_outcome"]
+    booking_signals = stats["booking_signals"]
     forwarded = by_outcome.get("forwarded", 0)
     errors = by_outcome.get("error", 0)
     missed = by_outcome.get("missed", 0) + by_outcome.get("no_answer", 0)
@@ -168,9 +225,9 @@ def get_analytics_health(
             if booking_signals
             else round(answered / total, 3)
         ),
-        "avg_duration_sec": (
-            round(sum(durations) / len(durations), 1) if durations else 0
-        ),
+        "avg_duration_sec": stats["avg_duration_sec"],
+        "p50_duration_sec": stats["p50_duration_sec"],
+        "p90_duration_sec": stats["p90_duration_sec"],
         "by_outcome": by_outcome,
     }
 
@@ -181,56 +238,86 @@ def get_analytics_summary(
     _: None = Depends(deps.require_active_subscription),
 ):
     """Pro: Peak call times, outcomes, total calls. Filtered by plan (call_log_days).
-    by_day_of_week counts only the current ISO week (UTC); full history stays in DB/export.
+    by_hour and by_day_of_week are in the business's timezone; by_day_of_week counts only
+    the current ISO week there. Full history stays in DB/export.
     """
     deps._bind_tenant_db_context(tenant)  # contextvar from the dep doesn't reach this sync handler
     days = _call_log_days(tenant)
-    log = _load_call_log(days=days)
-    week_start, week_end_excl = _analytics_iso_week_bounds_utc()
-    week_period = {
-        "by_day_of_week_period_start": week_start.date().isoformat(),
-        "by_day_of_week_period_end": (week_end_excl - timedelta(days=1))
-        .date()
-        .isoformat(),
-        "by_day_of_week_timezone": "UTC",
-    }
-    if not log:
-        return {
-            "total_calls": 0,
-            "by_outcome": {},
-            "by_hour": {str(h): 0 for h in range(24)},
-            "by_day_of_week": {str(d): 0 for d in range(7)},
-            "client_id": database._client_id() or None,
-            **week_period,
-        }
-    by_outcome = {}
-    by_hour = {str(h): 0 for h in range(24)}
-    by_day = {str(d): 0 for d in range(7)}
-    for entry in log:
-        o = entry.get("outcome") or "unknown"
-        by_outcome[o] = by_outcome.get(o, 0) + 1
-        start_iso = entry.get("start_iso")
-        if start_iso:
-            try:
-                dt = datetime.fromisoformat(start_iso.replace("Z", "+00:00"))
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=timezone.utc)
-                by_hour[str(dt.hour)] = by_hour.get(str(dt.hour), 0) + 1
-                if week_start <= dt < week_end_excl:
-                    wd = _weekday_sun_zero(dt)
-                    by_day[str(wd)] = by_day.get(str(wd), 0) + 1
-            except Exception:
-                pass
+    tz = business_timezone(config_service.get_business_info())
+    week_start, week_end_excl = _analytics_iso_week_bounds(tz=tz)
+    if runtime.USE_DB:
+        stats = database.db_call_log_summary(days, str(tz), week_start, week_end_excl)
+    else:
+        stats = _call_summary_from_log(_load_call_log(days=days), tz, week_start, week_end_excl)
     return {
-        "total_calls": len(log),
-        "by_outcome": by_outcome,
-        "by_hour": by_hour,
-        "by_day_of_week": by_day,
+        **stats,
         "client_id": database._client_id() or None,
-        **week_period,
+        "by_day_of_week_period_start": week_start.date().isoformat(),
+        "by_day_of_week_period_end": (week_end_excl - timedelta(days=1)).date().isoformat(),
+        "by_day_of_week_timezone": str(tz),
     }
 
 
+def _daily_from_log(log: List[dict], tz) -> dict:
+    """Call counters per local day from an in-memory call log (no-DB mode: no daily_stats,
+    and bookings / SMS aren't in the file log)."""
+    out: dict = {}
+    for entry in log:
+        try:
+            dt = datetime.fromisoformat((entry.get("start_iso") or "").replace("Z", "+00:00"))
+        except ValueError:
+            continue
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        row = out.setdefault(dt.astimezone(tz).date().isoformat(), {})
+        o = entry.get("outcome") or ""
+        for key, hit in (
+            ("calls", True),
+            ("missed", o in ("missed", "no_answer")),
+            ("answered", o == "answered_by_ai"),
+            ("forwarded", o == "forwarded"),
+            ("errors", o == "error"),
+        ):
+            row[key] = row.get(key, 0) + int(hit)
+        try:
+            row["duration_sec"] = row.get("duration_sec", 0) + int(entry.get("duration_sec") or 0)
+        except (TypeError, ValueError):
+            pass
+    return out
+
+
+@router.get("/api/analytics/daily")
+def get_analytics_daily(
+    days: int = 30,
+    tenant: Optional[dict] = Depends(deps.require_tenant),
+    _: None = Depends(deps.require_active_subscription),
+):
+    """Pro: per-day calls, outcomes, bookings and texts for dashboard charts, oldest first,
+    over the last `days` days in the business's timezone (capped by plan call_log_days).
+    Reads the daily_stats rollup: one row per day, however busy the tenant."""
+    deps._bind_tenant_db_context(tenant)  # contextvar from the dep doesn't reach this sync handler
+    days = max(1, min(days, _call_log_days(tenant), 366))
+    tz = business_timezone(config_service.get_business_info())
+    today = datetime.now(tz).date()
+    start = today - timedelta(days=days - 1)
+    if runtime.USE_DB:
+        by_day = {
+            r["day"]: r for r in database.db_daily_stats_range([database._client_id()], start, today)
+        }
+    else:
+        by_day = _daily_from_log(_load_call_log(days=days), tz)
+    series = []
+    for i in range(days):
+        day = (start + timedelta(days=i)).isoformat()
+        row = by_day.get(day) or {}
+        series.append({
+            "day": day,
+            **{c: row.get(c, 0) for c in database.DAILY_STATS_COUNTERS},
+            "bookings_by_source": row.get("bookings_by_source") or {},
+        })
+    return {"days": series, "timezone": str(tz), "client_id": database._client_id() or None}
+
+
 @router.get("/api/analytics/calls")
 def get_analytics_calls(
     limit: int = 50,
@@ -247,12 +334,91 @@ def get_analytics_calls(
     return {"calls": log[:limit], "client_id": database._client_id() or None}
 
 
+_EXPORT_COLUMNS = [
+    "call_sid",
+    "from_number",
+    "to_number",
+    "start_iso",
+    "end_iso",
+    "outcome",
+    "duration_sec",
+    "category",
+    "created_at",
+    "recording_sid",
+    "recording_duration_sec",
+    "recording_status",
+    "call_summary",
+]
+# CSV is handed to the response in chunks of about this size (before compression).
+_EXPORT_CHUNK_BYTES = 64 * 1024
+
+
+def _export_csv_chunks(rows: Iterable[dict], compress: bool = False) -> Iterator[bytes]:
+    """CSV (optionally gzip) bytes for `rows`, produced as rows arrive. The header goes
+    out on its own first so the download starts before the first database page lands."""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    gz = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None  # wbits 31: gzip framing
+
+    def drain(mode: Optional[int] = None) -> bytes:
+        data = buf.getvalue().encode("utf-8")
+        buf.seek(0)
+        buf.truncate()
+        if gz is None:
+            return data
+        out = gz.compress(data)
+        return out + gz.flush(mode) if mode is not None else out
+
+    writer.writerow(_EXPORT_COLUMNS)
+    yield drain(zlib.Z_SYNC_FLUSH)
+    for e in rows:
+        writer.writerow([e.get(c, "") for c in _EXPORT_COLUMNS])
+        if buf.tell() >= _EXPORT_CHUNK_BYTES:
+            chunk = drain()
+            if chunk:
+                yield chunk
+    chunk = drain(zlib.Z_FINISH)
+    if chunk:
+        yield chunk
+
+
+def _export_day(value: Optional[str], name: str):
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"{name} must be YYYY-MM-DD")
+
+
+def _log_rows_between(log: List[dict], since: datetime, until: Optional[datetime]) -> Iterator[dict]:
+    """No-DB mode: the file call log filtered to since <= start < until."""
+    for e in log:
+        try:
+            dt = datetime.fromisoformat((e.get("start_iso") or "").replace("Z", "+00:00"))
+        except ValueError:
+            continue
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        if dt >= since and (until is None or dt < until):
+            yield e
+
+
 @router.get("/api/analytics/export")
 def get_analytics_export(
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    gzip: bool = False,
     tenant: Optional[dict] = Depends(deps.require_tenant),
     _: None = Depends(deps.require_active_subscription),
 ):
-    """Export call log as CSV. Growth/Pro only."""
+    """Export call log as CSV. Growth/Pro only.
+
+    Optional `start` / `end` (YYYY-MM-DD, inclusive, in the business's timezone) narrow
+    the range inside the plan's call_log_days window; `gzip=true` returns call_log.csv.gz.
+    Rows are streamed from a server-side cursor, so there is no row cap and memory stays
+    flat however much history is exported.
+    """
     if (
         not tenant
         or not get_plan_limits
@@ -263,49 +429,34 @@ def get_analytics_export(
         )
     deps._bind_tenant_db_context(tenant)  # contextvar from the dep doesn't reach this sync handler
     days = _call_log_days(tenant)
-    log = _load_call_log(days=days)
-
-    buf = io.StringIO()
-    writer = csv.writer(buf)
-    writer.writerow(
-        [
-            "call_sid",
-            "from_number",
-            "to_number",
-            "start_iso",
-            "end_iso",
-            "outcome",
-            "duration_sec",
-            "category",
-            "created_at",
-            "recording_sid",
-            "recording_duration_sec",
-            "recording_status",
-            "call_summary",
-        ]
+    tz = business_timezone(config_service.get_business_info())
+    start_day, end_day = _export_day(start, "start"), _export_day(end, "end")
+    if start_day and end_day and end_day < start_day:
+        raise HTTPException(status_code=400, detail="end must not be before start")
+    since = datetime.now(timezone.utc) - timedelta(days=days)
+    if start_day:
+        since = max(since, datetime.combine(start_day, datetime.min.time(), tzinfo=tz))
+    until = (
+        datetime.combine(end_day + timedelta(days=1), datetime.min.time(), tzinfo=tz)
+        if end_day
+        else None
     )
-    for e in log:
-        writer.writerow(
-            [
-                e.get("call_sid", ""),
-                e.get("from_number", ""),
-                e.get("to_number", ""),
-                e.get("start_iso", ""),
-                e.get("end_iso", ""),
-                e.get("outcome", ""),
-                e.get("duration_sec", ""),
-                e.get("category", ""),
-                e.get("created_at", ""),
-                e.get("recording_sid", ""),
-                e.get("recording_duration_sec", ""),
-                e.get("recording_status", ""),
-                e.get("call_summary", ""),
-            ]
-        )
-    return Response(
-        content=buf.getvalue(),
-        media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=call_log.csv"},
+    if runtime.USE_DB:
+        try:
+            rows = database.db_call_log_stream(since, until)
+        except database.ExportsBusy:
+            raise HTTPException(
+                status_code=429,
+                detail="Too many exports are running. Try again in a minute.",
+                headers={"Retry-After": "30"},
+            )
+    else:
+        rows = _log_rows_between(_load_call_log(days=days), since, until)
+    filename = "call_log.csv.gz" if gzip else "call_log.csv"
+    return StreamingResponse(
+        _export_csv_chunks(rows, compress=gzip),
+        media_type="application/gzip" if gzip else "text/csv",
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
     )
 
 
@@ -246,6 +246,8 @@ def import_appointments_commit(
             created += 1
         except Exception:
             skipped += 1
+    if created or updated:
+        booking_service._invalidate_booked_slots_cache()
     system_info(
         "appointment_import_commit",
         client_id=cid,
@@ -346,13 +348,17 @@ def get_appointments(
     tenant: Optional[dict] = Depends(deps.require_active_subscription),
 ):
     cid = deps._bind_tenant_db_context(tenant)
-    orphans_removed = booking_service._reconcile_booked_slots_orphans() if runtime.USE_DB else 0
-    lst = database.db_appointments_get_all(client_id=cid) if runtime.USE_DB else runtime.appointments
+    # One connection for the reconcile, list, business info, holds and diagnostics reads.
+    with database.unit_of_work(name="get_appointments"):
+        orphans_removed = booking_service._reconcile_booked_slots_orphans() if runtime.USE_DB else 0
+        lst = database.db_appointments_get_all(client_id=cid) if runtime.USE_DB else runtime.appointments
+        _biz = config_service.get_business_info()
+        holds = booking_service._voice_calendar_holds() if runtime.USE_DB else []
+        diag = database.db_appointments_diagnostics(cid) if runtime.USE_DB else {}
     # Tag appointments that fall on a shop closure or the stylist's time-off / off day so the
     # dashboard can highlight them. Build the lookup once (O(staff)), then O(1) per appointment.
     import staff_schedule
 
-    _biz = config_service.get_business_info()
     _closures = _biz.get("closures") or []
     _staff_by_id = {
         str(s.get("id")): s for s in (_biz.get("staff") or []) if s.get("id")
@@ -368,8 +374,6 @@ def get_appointments(
         )
         if conflict:
             a["schedule_conflict"] = conflict
-    holds = booking_service._voice_calendar_holds() if runtime.USE_DB else []
-    diag = database.db_appointments_diagnostics(cid) if runtime.USE_DB else {}
     twilio_on_tenant = ((tenant or {}).get("twilio_phone_number") or "").strip() or None
     system_info(
         "appointments_list_loaded",
@@ -406,8 +410,9 @@ def get_appointments_diagnostics(
 ):
     """Tenant-scoped appointment debug snapshot (for dashboard troubleshooting)."""
     cid = deps._bind_tenant_db_context(tenant)
-    holds = booking_service._voice_calendar_holds() if runtime.USE_DB else []
-    diag = database.db_appointments_diagnostics(cid) if runtime.USE_DB else {}
+    with database.unit_of_work(name="get_appointments_diagnostics"):
+        holds = booking_service._voice_calendar_holds() if runtime.USE_DB else []
+        diag = database.db_appointments_diagnostics(cid) if runtime.USE_DB else {}
     return {
         "client_id": cid,
         "twilio_phone_number": ((tenant or {}).get("twilio_phone_number") or "").strip()
@@ -428,9 +433,10 @@ def appointments_calendar(
     if not runtime.USE_DB:
         return {"events": []}
     cid = deps._bind_tenant_db_context(tenant)
-    events = database.db_appointments_in_date_range(date_from, date_to, staff_id, client_id=cid)
-    slots_by_apt = booking_service._booked_slot_duration_by_appointment_id()
-    services = config_service.get_business_info().get("services") or []
+    with database.unit_of_work(name="appointments_calendar"):
+        events = database.db_appointments_in_date_range(date_from, date_to, staff_id, client_id=cid)
+        slots_by_apt = booking_service._booked_slot_duration_by_appointment_id()
+        services = config_service.get_business_info().get("services") or []
     enriched = []
     for apt in events:
         dm = booking_service._duration_minutes_for_appointment(apt, slots_by_apt, services)
@@ -464,11 +470,14 @@ def update_appointment(
     if runtime.USE_DB and kwargs:
         apt = database.db_appointments_update(appointment_id, client_id=cid, **kwargs)
         if apt:
+            # Status/date/time edits can add, move or drop a hold outside reserve/release.
+            booking_service._invalidate_booked_slots_cache()
             return {"success": True, "appointment": apt}
     else:
         for i, apt in enumerate(runtime.appointments):
             if apt["id"] == appointment_id:
                 apt.update(kwargs)
+                booking_service._invalidate_booked_slots_cache()
                 return {"success": True, "appointment": apt}
     raise HTTPException(status_code=404, detail="Appointment not found")
 
@@ -527,6 +536,7 @@ def accept_appointment(
         )
     else:
         apt["status"] = "accepted"
+    booking_service.note_appointment_changed(apt)
     deps.audit_log(
         "user",
         "appointment_accepted",
@@ -66,7 +66,7 @@ async def cron_appointment_reminders(request: Request):
     """Day-before SMS reminders for accepted appointments. Requires X-Cron-Secret. Idempotent."""
     if not _verify_cron_secret(request):
         raise HTTPException(status_code=401, detail="Unauthorized")
-    run_id = database.db_cron_run_start("appointment-reminders") if runtime.USE_DB else None
+    run_id = await database.adb.cron_run_start("appointment-reminders") if runtime.USE_DB else None
     if not runtime.USE_DB:
         result = {
             "ok": True,
@@ -86,7 +86,7 @@ async def cron_appointment_reminders(request: Request):
     tomorrow_local = (datetime.now(tz) + timedelta(days=1)).strftime("%Y-%m-%d")
     skipped = 0
     tenants_processed = 0
-    tenants = database.db_tenant_list_all()
+    tenants = await database.adb.tenant_list_all()
     # Phase 1: walk tenants/appointments, mark reminders (idempotency guard), and
     # collect the sends. Config is loaded once per tenant, not per appointment.
     sends: List[tuple] = []
@@ -99,7 +99,7 @@ async def cron_appointment_reminders(request: Request):
         twilio_num = t.get("twilio_phone_number")
         if not cid or not twilio_num:
             continue
-        appointments = database.db_appointments_get_accepted_for_date(cid, tomorrow_local)
+        appointments = await database.adb.appointments_get_accepted_for_date(cid, tomorrow_local)
         if not appointments:
             continue
         cfg = config_service.load_client_config(cid)
@@ -111,7 +111,7 @@ async def cron_appointment_reminders(request: Request):
             if not phone:
                 skipped += 1
                 continue
-            if not database.db_appointments_mark_reminder_sent(apt.get("id"), cid):
+            if not await database.adb.appointments_mark_reminder_sent(apt.get("id"), cid):
                 skipped += 1
                 continue
             time_str = apt.get("time", "")
@@ -136,7 +136,7 @@ async def cron_appointment_reminders(request: Request):
         "skipped": skipped,
         "tenants_processed": tenants_processed,
     }
-    database.db_cron_run_finish(run_id, "success", result)
+    await database.adb.cron_run_finish(run_id, "success", result)
     return result
 
 
@@ -244,19 +244,30 @@ def cron_process_overage(request: Request):
 
 @router.post("/api/cron/retention-purge")
 def cron_retention_purge(request: Request):
-    """Purge expired rows (default 3 years) while honoring active legal holds."""
+    """Purge expired rows (default 3 years) while honoring active legal holds.
+
+    Deletes in RETENTION_PURGE_BATCH-row chunks (default 5000; 0 = one transaction),
+    reporting progress on this run's cron_runs row. On month-partitioned tables, expired
+    partitions are dropped whole (RETENTION_PARTITION_ACTION=detach keeps them) and the
+    next months' partitions are created ahead of time.
+    """
     if not _verify_cron_secret(request):
         raise HTTPException(status_code=401, detail="Unauthorized")
     run_id = database.db_cron_run_start("retention-purge") if runtime.USE_DB else None
     if not runtime.USE_DB:
         result = {
             "ok": True,
-            "deleted": {"audit_events": 0, "call_log": 0, "sms_sessions": 0},
+            "deleted": {"audit_events": 0, "call_log": 0, "sms_sessions": 0, "sms_messages": 0},
             "days": 0,
         }
         return result
     days = max(1, int((os.getenv("RETENTION_DAYS") or str(365 * 3)).strip()))
-    deleted = database.db_retention_purge(days=days)
+    batch = max(0, int((os.getenv("RETENTION_PURGE_BATCH") or "5000").strip() or 5000))
+    action = (os.getenv("RETENTION_PARTITION_ACTION") or "drop").strip().lower()
+    database.db_partitions_ensure()
+    deleted = database.db_retention_purge(
+        days=days, batch_size=batch, run_id=run_id, partition_action=action
+    )
     result = {"ok": True, "deleted": deleted, "days": days}
     database.db_cron_run_finish(run_id, "success", result)
     return result
@@ -264,7 +275,11 @@ def cron_retention_purge(request: Request):
 
 @router.post("/api/cron/export-snapshot")
 def cron_export_snapshot(request: Request):
-    """Daily tenant-scoped JSON snapshot export with SHA256 manifest."""
+    """Daily tenant-scoped snapshot export: compressed NDJSON per tenant + SHA256 manifest.
+
+    EXPORT_SNAPSHOT_MODE=incremental exports only new audit/call/SMS rows since the last
+    run; EXPORT_COMPRESSION=zstd uses zstandard when installed (gzip otherwise).
+    """
     if not _verify_cron_secret(request):
         raise HTTPException(status_code=401, detail="Unauthorized")
     run_id = database.db_cron_run_start("export-snapshot") if runtime.USE_DB else None
@@ -276,7 +291,13 @@ def cron_export_snapshot(request: Request):
     include_audit = (
         os.getenv("EXPORT_INCLUDE_AUDIT_EVENTS") or "1"
     ).strip().lower() in ("1", "true", "yes")
-    result = database.db_export_tenant_snapshot(export_root, include_audit=include_audit)
+    incremental = (os.getenv("EXPORT_SNAPSHOT_MODE") or "full").strip().lower() == "incremental"
+    result = database.db_export_tenant_snapshot(
+        export_root,
+        include_audit=include_audit,
+        incremental=incremental,
+        compression=(os.getenv("EXPORT_COMPRESSION") or "gzip"),
+    )
     if not result:
         out = {"ok": False, "exported": False}
         database.db_cron_run_finish(run_id, "error", out)
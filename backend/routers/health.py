@@ -6,7 +6,7 @@ import os
 import secrets
 
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 import database
 import email_notify
@@ -37,6 +37,72 @@ def health():
     return {"status": "ok", "database": db_ok}
 
 
+def _metrics_allowed(request: Request) -> bool:
+    """/metrics lists every db_* function's load; serve it only to a scraper holding
+    METRICS_TOKEN (Authorization: Bearer), and not at all while the token is unset."""
+    token = (os.getenv("METRICS_TOKEN") or "").strip()
+    got = (request.headers.get("Authorization") or "").strip()
+    if not token or not got.startswith("Bearer "):
+        return False
+    return secrets.compare_digest(token, got[len("Bearer "):].strip())
+
+
+def _prometheus_text(db: dict, executor: dict) -> str:
+    """Render DB metrics in the Prometheus text exposition format."""
+    out: list = []
+
+    def family(name: str, kind: str, help_text: str, samples) -> None:
+        out.append(f"# HELP nuvatra_{name} {help_text}")
+        out.append(f"# TYPE nuvatra_{name} {kind}")
+        for labels, value in samples:
+            out.append(f"nuvatra_{name}{labels} {value}")
+
+    pool = db["pool"]
+    family("db_pool_connections", "gauge", "Pooled connections by state.", [
+        ('{state="in_use"}', pool["in_use"]), ('{state="idle"}', pool["idle"]),
+    ])
+    family("db_pool_max_connections", "gauge", "DB_POOL_MAX.", [("", pool["max"])])
+    family("db_checkouts_total", "counter", "Connections checked out of the pool.", [("", pool["checkouts"])])
+    family("db_checkout_wait_seconds_total", "counter", "Time spent waiting for a pooled connection.",
+           [("", round(pool["checkout_wait_seconds"], 6))])
+    family("db_checkout_wait_max_seconds", "gauge", "Longest single checkout wait.",
+           [("", round(pool["checkout_wait_max_seconds"], 6))])
+    family("db_checkout_timeouts_total", "counter", "Checkouts that gave up after DB_POOL_WAIT_SECONDS.",
+           [("", pool["checkout_timeouts"])])
+    family("db_preping_discards_total", "counter", "Dead connections discarded by the checkout pre-ping.",
+           [("", pool["preping_discards"])])
+    family("db_slow_queries_total", "counter", "Statements slower than DB_SLOW_QUERY_MS.", [("", pool["slow_queries"])])
+    fns = sorted(db["functions"].items())
+    for key, name, kind, help_text in (
+        ("calls", "db_calls_total", "counter", "Top-level db_* calls."),
+        ("errors", "db_call_errors_total", "counter", "db_* calls that raised."),
+        ("seconds", "db_call_seconds_total", "counter", "Wall time in db_* calls."),
+        ("query_seconds", "db_query_seconds_total", "counter", "Time in SQL statements per db_* call."),
+        ("checkout_wait_seconds", "db_call_checkout_wait_seconds_total", "counter",
+         "Pool checkout wait per db_* call."),
+        ("rows", "db_rows_total", "counter", "Rows returned per db_* call."),
+    ):
+        family(name, kind, help_text, [
+            (f'{{fn="{fn}"}}', round(m[key], 6) if isinstance(m[key], float) else m[key]) for fn, m in fns
+        ])
+    family("db_executor_queued", "gauge", "Async DB calls waiting for an executor worker.", [("", executor["queued"])])
+    family("db_executor_running", "gauge", "Async DB calls running on the executor.", [("", executor["running"])])
+    family("db_executor_peak_queued", "gauge", "Most async DB calls ever waiting at once.",
+           [("", executor["peak_queued"])])
+    return "\n".join(out) + "\n"
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics(request: Request):
+    """Prometheus scrape endpoint: DB pool, per-function query load and executor queue."""
+    if not _metrics_allowed(request):
+        raise HTTPException(status_code=404, detail="Not Found")
+    return PlainTextResponse(
+        _prometheus_text(database.db_metrics_snapshot(), database.db_executor_stats()),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
 @router.get("/api/health/email")
 def health_email():
     """Read-only: is transactional email configured on the backend? Booleans only, no secret
@@ -42,6 +42,7 @@ from observability import (
     voice_warning,
 )
 from voice_preview import add_sentence_pauses
+from voice.sentence_audio_cache import aiter_reply_mp3, reply_mp3
 
 try:
     from twilio.twiml.voice_response import VoiceResponse
@@ -426,41 +427,125 @@ def get_tts_audio_hd_for_phone(text: str, voice: str = "fable"):
         raise deps._server_error("HD TTS generation failed", e)
 
 
+_MP3_STREAM_CHUNK = 4096
+
+
+def _tts_audio_response(data: bytes) -> Response:
+    return Response(
+        content=data,
+        media_type="audio/mpeg",
+        headers={
+            "Content-Disposition": "inline; filename=speech.mp3",
+            "Cache-Control": "public, max-age=3600",
+            "Content-Length": str(len(data)),
+        },
+    )
+
+
+async def _stream_tts_audio(text: str, voice: str, speed: float, cache_key: tuple) -> StreamingResponse:
+    """Chunked mp3 relayed from OpenAI's streaming response as it is synthesized, teed into
+    the sentence cache and, once the whole reply has been sent, the full-text cache.
+
+    The first chunk is awaited here so a provider failure before any audio still takes the
+    endpoint's fallback path; a failure mid-stream just ends the clip early (uncached)."""
+    _gen_start = time.time()
+
+    async def synth(sentence: str):
+        async with runtime.async_client.audio.speech.with_streaming_response.create(
+            model="tts-1",
+            voice=voice,
+            input=add_sentence_pauses(sentence),
+            speed=speed,
+        ) as response:
+            async for chunk in response.iter_bytes(chunk_size=_MP3_STREAM_CHUNK):
+                yield chunk
+
+    chunks = aiter_reply_mp3(
+        text, synth, voice=voice, speed=speed, model="tts-1", tenant=database._client_id() or "default"
+    )
+    try:
+        first = await chunks.__anext__()
+    except StopAsyncIteration:
+        raise RuntimeError("TTS stream produced no audio")
+    first_ms = int((time.time() - _gen_start) * 1000)
+
+    async def body():
+        parts = [first]
+        yield first
+        try:
+            async for chunk in chunks:
+                parts.append(chunk)
+                yield chunk
+        except Exception as e:
+            voice_warning("tts_audio_stream_failed", text_prefix=text[:40], error=str(e)[:200])
+            return
+        data = b"".join(parts)
+        _tts_audio_cache_put(cache_key, data)
+        voice_info(
+            "tts_audio_generated",
+            text_prefix=text[:40],
+            voice=voice,
+            model="tts-1",
+            streamed=True,
+            first_chunk_ms=first_ms,
+            gen_ms=int((time.time() - _gen_start) * 1000),
+            bytes=len(data),
+        )
+
+    return StreamingResponse(
+        body(),
+        media_type="audio/mpeg",
+        headers={
+            "Content-Disposition": "inline; filename=speech.mp3",
+            "Cache-Control": "public, max-age=3600",
+        },
+    )
+
+
 @router.get("/api/phone/tts-audio")
-def get_tts_audio_for_phone(text: str, voice: str = "fable"):
+async def get_tts_audio_for_phone(text: str, voice: str = "fable"):
     """
     Generate TTS audio for phone calls.
     This endpoint is called by Twilio to play OpenAI TTS audio.
     """
     # Bound unauthenticated input (see tts-audio-hd note) before paying for TTS.
     text = (text or "")[:TTS_MAX_INPUT_CHARS]
-    speed = config_service.get_tts_speed()
+    # get_tts_speed reads business info from the DB when its cache is cold; keep that off
+    # the event loop that paces every live call's media stream.
+    speed = await database.run_db(config_service.get_tts_speed)
     cache_key = (text, voice, speed)
     cached = _tts_audio_cache_get(cache_key)
     if cached is not None:
         # DIAGNOSTIC: confirm repeated phrases (greeting etc.) are served from cache.
         voice_info("tts_audio_cache_hit", text_prefix=text[:40], voice=voice, bytes=len(cached))
-        return Response(
-            content=cached,
-            media_type="audio/mpeg",
-            headers={
-                "Content-Disposition": "inline; filename=speech.mp3",
-                "Cache-Control": "public, max-age=3600",
-                "Content-Length": str(len(cached)),
-            },
-        )
+        return _tts_audio_response(cached)
     try:
+        if config_service.voice_tts_audio_streaming_enabled():
+            return await _stream_tts_audio(text, voice, speed, cache_key)
         # Live per-turn path: dynamic reply text is a cache miss every time, so keep the
         # fast tts-1 for low first-byte latency. Tier 1 phase 2 will A/B gpt-4o-mini-tts
         # here with stream_format=sse to hold latency down.
+        # The whole reply is usually new but most of its sentences are not: assemble it from
+        # the shared sentence cache and synthesize only the novel sentences (in parallel).
         _gen_start = time.time()
-        response = runtime.client.audio.speech.create(
-            model="tts-1",  # Faster generation, still high quality
+
+        def _synth(sentence: str) -> bytes:
+            return runtime.client.audio.speech.create(
+                model="tts-1",  # Faster generation, still high quality
+                voice=voice,
+                input=add_sentence_pauses(sentence),
+                speed=speed,
+            ).content
+
+        data, sentence_hits, sentence_misses = await asyncio.to_thread(
+            reply_mp3,
+            text,
+            _synth,
             voice=voice,
-            input=add_sentence_pauses(text),
             speed=speed,
+            model="tts-1",
+            tenant=database._client_id() or "default",
         )
-        data = response.content
         _tts_audio_cache_put(cache_key, data)
         # DIAGNOSTIC: how long OpenAI TTS took on a cache miss (the 14s-greeting symptom).
         voice_info(
@@ -470,21 +555,16 @@ def get_tts_audio_for_phone(text: str, voice: str = "fable"):
             model="tts-1",  # live per-turn path stays on tts-1 (Tier 1 phase 2 will A/B this)
             gen_ms=int((time.time() - _gen_start) * 1000),
             bytes=len(data),
+            sentence_hits=sentence_hits,
+            sentence_misses=sentence_misses,
         )
-        return Response(
-            content=data,
-            media_type="audio/mpeg",
-            headers={
-                "Content-Disposition": "inline; filename=speech.mp3",
-                "Cache-Control": "public, max-age=3600",
-                "Content-Length": str(len(data)),
-            },
-        )
+        return _tts_audio_response(data)
 
     except Exception as e:
         print(f"TTS audio generation error: {e}")
         try:
-            response = runtime.client.audio.speech.create(
+            response = await asyncio.to_thread(
+                runtime.client.audio.speech.create,
                 model="tts-1",
                 voice=voice,
                 input=add_sentence_pauses(voice_service.TTS_FALLBACK_TEXT),
@@ -545,7 +625,7 @@ async def handle_incoming_call(request: Request):
         )
 
         # Multi-tenant: resolve tenant strictly by Twilio destination number.
-        tenant = database.db_tenant_get_by_phone(to_number or "") if runtime.USE_DB else None
+        tenant = await database.adb.tenant_get_by_phone(to_number or "") if runtime.USE_DB else None
         tenant_for_access = tenant
         if tenant:
             database.set_request_client_id(tenant["client_id"])
@@ -590,7 +670,7 @@ async def handle_incoming_call(request: Request):
         if runtime.USE_DB and tenant and get_plan_limits:
             limits = get_plan_limits(tenant)
             month = datetime.now(timezone.utc).strftime("%Y-%m")
-            usage = database.db_usage_get(tenant["client_id"], month)
+            usage = await database.adb.usage_get(tenant["client_id"], month)
             voice_minutes = usage.get("voice_minutes") or 0
             sms_count = usage.get("sms_count") or 0
             voice_cap = limits.get("minutes_cap", 999999)
@@ -619,7 +699,7 @@ async def handle_incoming_call(request: Request):
                 )
 
         # Pro: call log start + customer memory for repeat callers
-        voice_service.call_log_start(call_sid, from_number, to_number)
+        await database.run_db(voice_service.call_log_start, call_sid, from_number, to_number)
         client_id = (tenant or {}).get("client_id") or ""
         if not client_id:
             if runtime.USE_DB:
@@ -627,7 +707,9 @@ async def handle_incoming_call(request: Request):
                     status_code=403, detail="Unknown destination number"
                 )
             client_id = CLIENT_ID or "default"
-        caller_memory = refresh_caller_memory_for_prompt(from_number, client_id)
+        caller_memory = await database.run_db(
+            refresh_caller_memory_for_prompt, from_number, client_id
+        )
 
         # Create a new session for this call (store client_id for downstream handlers)
         session_id = f"phone-{call_sid}"
@@ -693,7 +775,7 @@ async def handle_incoming_call(request: Request):
             "twilio_public_base_url": base_url,
         }
         if runtime.USE_DB and from_number and client_id and client_id != "default":
-            database.db_sms_consent_record(
+            await database.adb.sms_consent_record(
                 from_number,
                 client_id,
                 "inbound_call",
@@ -945,7 +1027,7 @@ async def handle_recording_complete(request: Request):
         if call_sid and call_sid in runtime.call_store.sessions:
             client_id = runtime.call_store.sessions[call_sid].get("client_id")
         if not client_id and runtime.USE_DB:
-            client_id = database.db_call_log_get_client_id_by_call_sid(call_sid)
+            client_id = await database.adb.call_log_get_client_id_by_call_sid(call_sid)
         if not client_id:
             voice_warning(
                 "recording_complete_unresolved_call_sid", call_sid=call_sid or ""
@@ -954,7 +1036,7 @@ async def handle_recording_complete(request: Request):
         database.set_request_client_id(client_id)
 
         tenant_rec = (
-            database.db_tenant_get_by_client_id(client_id) if runtime.USE_DB and client_id else None
+            await database.adb.tenant_get_by_client_id(client_id) if runtime.USE_DB and client_id else None
         )
         if not voice_service._call_recording_enabled_for_tenant(tenant_rec):
             voice_info(
@@ -965,7 +1047,7 @@ async def handle_recording_complete(request: Request):
             return Response(content="OK", status_code=200, media_type="text/plain")
 
         if runtime.USE_DB:
-            database.db_call_log_update_recording(
+            await database.adb.call_log_update_recording(
                 call_sid,
                 client_id,
                 recording_sid=recording_sid,
@@ -1209,8 +1291,8 @@ async def handle_call_status(request: Request):
                     voice_service.call_log_set_outcome(call_sid, outcome)
                 from_number = call_data.get("from_number")
                 if from_number:
-                    update_caller_memory(from_number)
-                voice_service.call_log_end(call_sid)
+                    await database.run_db(update_caller_memory, from_number)
+                await database.run_db(voice_service.call_log_end, call_sid)
                 voice_service.cleanup_call_runtime_state(call_sid or "")
                 voice_call_phase(
                     "call_session_cleaned",
@@ -1224,14 +1306,14 @@ async def handle_call_status(request: Request):
                 voice_service.call_log_set_outcome(
                     call_sid, "missed" if call_status == "completed" else call_status
                 )
-                voice_service.call_log_end(call_sid)
+                await database.run_db(voice_service.call_log_end, call_sid)
                 voice_service.cleanup_call_runtime_state(call_sid or "")
             # Quick-hangup path: the session is already gone from call_store.sessions and
             # call_log_entries carries no client_id field, so resolve it from the call_log
             # row we just persisted. Without this, abandoned calls (caller hangs up right
             # away) never capture as leads even though that's exactly the lead we want.
             if not client_id_before and runtime.USE_DB and call_sid:
-                client_id_before = database.db_call_log_get_client_id_by_call_sid(call_sid)
+                client_id_before = await database.adb.call_log_get_client_id_by_call_sid(call_sid)
                 if not from_number_before:
                     from_number_before = (form_data.get("From") or "").strip() or None
                 system_info(
@@ -1249,7 +1331,7 @@ async def handle_call_status(request: Request):
                 and get_plan_limits
             ):
                 try:
-                    tenant = database.db_tenant_get_by_client_id(client_id_before)
+                    tenant = await database.adb.tenant_get_by_client_id(client_id_before)
                     _has_lead = bool(tenant and get_plan_limits(tenant).get("has_lead_capture"))
                     # DIAGNOSTIC: why a lead is/ isn't captured for a non-booking call.
                     system_info(
@@ -1265,7 +1347,7 @@ async def handle_call_status(request: Request):
                         and _has_lead
                         and not appointment_created
                     ):
-                        lead_id = database.db_leads_insert(
+                        lead_id = await database.adb.leads_insert(
                             client_id_before,
                             None,
                             from_number_before,
@@ -1312,7 +1394,7 @@ async def handle_call_status(request: Request):
                 try:
                     minutes = max(0, math.ceil(duration_sec / 60))
                     month = datetime.now(timezone.utc).strftime("%Y-%m")
-                    if not database.db_usage_increment_voice(client_id_before, month, minutes):
+                    if not await database.adb.usage_increment_voice(client_id_before, month, minutes):
                         logger.error(
                             "usage_increment_failed",
                             extra={
@@ -1435,6 +1517,10 @@ async def handle_no_speech(request: Request):
 
 
 MAX_RESPOND_POLLS = 6  # ~10-12s of waiting before we stop looping and hand off
+# How long one /respond request holds for a pending reply before falling back to the
+# filler + redirect loop. The wait is woken by the status write, so a reply that lands
+# in this window plays at once instead of after the next filler/redirect round trip.
+RESPOND_HOLD_SEC = float((_os.getenv("VOICE_RESPOND_HOLD_SEC") or "2").strip() or 2)
 
 
 def _append_pending_filler(response, base_url: str, call_sid: Optional[str]) -> None:
@@ -1517,6 +1603,11 @@ async def respond_with_audio(request: Request):
 
         status_data = runtime.call_store.response_status[call_sid]
         status = status_data.get("status", "pending")
+        if status == "pending" and RESPOND_HOLD_SEC > 0:
+            settled = await runtime.call_store.wait_response_status(call_sid, RESPOND_HOLD_SEC)
+            if settled is not None:
+                status_data = settled
+                status = status_data.get("status", "pending")
         response = VoiceResponse()
 
         if status == "ready":
@@ -54,6 +54,10 @@ logger = logging.getLogger("nuvatra")
 
 router = APIRouter()
 
+# Thread messages loaded per inbound text: the reply prompt uses the last 10 and the
+# detail parser the last 8 customer texts, so older history is never read here.
+_SMS_HISTORY_MESSAGES = 20
+
 
 def _is_sms_confirmation(body: str) -> bool:
     """True if the message looks like the customer confirming their appointment (yes, looks good, etc.)."""
@@ -254,7 +258,9 @@ def _maybe_handle_staff_sms_approval(
     business_name = config_service.get_business_info().get("name", "your shop")
     if verb in ("YES", "APPROVE", "OK", "ACCEPT"):
         if runtime.USE_DB:
-            database.db_appointments_update(apt_id, status="accepted")
+            booking_service.note_appointment_changed(
+                database.db_appointments_update(apt_id, status="accepted")
+            )
         deps.audit_log(
             "staff_sms",
             "appointment_accepted",
@@ -397,7 +403,7 @@ async def handle_incoming_sms(request: Request):
                 content='<?xml version="1.0" encoding="UTF-8"?><Response></Response>',
                 media_type="application/xml",
             )
-        tenant = database.db_tenant_get_by_phone(to_number)
+        tenant = await database.adb.tenant_get_by_phone(to_number)
         if not tenant:
             sms_info(
                 "inbound_skipped",
@@ -444,7 +450,7 @@ async def handle_incoming_sms(request: Request):
             )
             cid = tenant["client_id"]
             if kw == "stop":
-                database.db_sms_opt_out_set(from_number, cid)
+                await database.adb.sms_opt_out_set(from_number, cid)
                 sms_service.send_sms(
                     from_number,
                     "You've opted out and won't get more texts from this number. Reply START to get messages again. Msg and data rates may apply.",
@@ -452,8 +458,8 @@ async def handle_incoming_sms(request: Request):
                     force=True,
                 )
             elif kw == "start":
-                database.db_sms_opt_out_clear(from_number, cid)
-                database.db_sms_consent_record(
+                await database.adb.sms_opt_out_clear(from_number, cid)
+                await database.adb.sms_consent_record(
                     from_number,
                     cid,
                     "sms_start",
@@ -479,7 +485,7 @@ async def handle_incoming_sms(request: Request):
                 content='<?xml version="1.0" encoding="UTF-8"?><Response></Response>',
                 media_type="application/xml",
             )
-        if runtime.USE_DB and database.db_sms_opt_out_is_blocked(from_number, tenant["client_id"]):
+        if runtime.USE_DB and await database.adb.sms_opt_out_is_blocked(from_number, tenant["client_id"]):
             sms_info(
                 "inbound_blocked_opt_out",
                 client_id=tenant["client_id"],
@@ -496,7 +502,7 @@ async def handle_incoming_sms(request: Request):
                 media_type="application/xml",
             )
         if runtime.USE_DB and from_number and tenant.get("client_id"):
-            database.db_sms_consent_record(
+            await database.adb.sms_consent_record(
                 from_number,
                 tenant["client_id"],
                 "inbound_sms",
@@ -536,7 +542,7 @@ async def handle_incoming_sms(request: Request):
         if get_plan_limits:
             limits = get_plan_limits(tenant)
             month = datetime.now(timezone.utc).strftime("%Y-%m")
-            usage = database.db_usage_get(tenant["client_id"], month)
+            usage = await database.adb.usage_get(tenant["client_id"], month)
             voice_minutes = usage.get("voice_minutes") or 0
             sms_count = usage.get("sms_count") or 0
             sms_cap = limits.get("sms_cap", 999999)
@@ -571,7 +577,7 @@ async def handle_incoming_sms(request: Request):
         apt = None
         resolve_via = "none"
         if runtime.USE_DB:
-            apt, resolve_via = database.db_appointments_resolve_for_sms(
+            apt, resolve_via = await database.adb.appointments_resolve_for_sms(
                 from_number, tenant["client_id"]
             )
         sms_info(
@@ -613,10 +619,17 @@ async def handle_incoming_sms(request: Request):
                 "inbound_no_appointment_for_number", request_id=rid, body_len=len(body)
             )
         session = (
-            database.db_sms_session_get(from_number, tenant["client_id"]) if runtime.USE_DB else None
+            await database.adb.sms_session_get(
+                from_number, tenant["client_id"], limit=_SMS_HISTORY_MESSAGES
+            )
+            if runtime.USE_DB
+            else None
         )
-        messages = (session["messages"] if session else []) if session else []
+        messages = session["messages"] if session else []
+        # prior_turns indexes the loaded tail (capped at _SMS_HISTORY_MESSAGES) so only this
+        # request's turns are appended; thread_turns is the whole thread for tracing.
         prior_turns = len(messages)
+        thread_turns = session["message_count"] if session else 0
         # Persist name/email from this text and recent inbound SMS (e.g. "my name is Raj" then "Yes")
         if (
             apt
@@ -704,8 +717,11 @@ async def handle_incoming_sms(request: Request):
                 messages.append({"role": "user", "content": body})
                 messages.append({"role": "assistant", "content": reject_msg})
                 try:
-                    database.db_sms_session_upsert(
-                        from_number, tenant["client_id"], messages, apt.get("id") if apt else None
+                    await database.adb.sms_session_append(
+                        from_number,
+                        tenant["client_id"],
+                        messages[prior_turns:],
+                        apt.get("id") if apt else None,
                     )
                 except Exception:
                     pass
@@ -719,7 +735,7 @@ async def handle_incoming_sms(request: Request):
         sms_trace(
             "inbound_session_loaded",
             request_id=rid,
-            prior_turns=prior_turns,
+            prior_turns=thread_turns,
             session_existed=session is not None,
         )
         # After detail changes, text full summary so customer can verify before YES/CONFIRM
@@ -742,8 +758,8 @@ async def handle_incoming_sms(request: Request):
             )
             messages.append({"role": "assistant", "content": summary_sms})
             try:
-                database.db_sms_session_upsert(
-                    from_number, tenant["client_id"], messages, apt["id"]
+                await database.adb.sms_session_append(
+                    from_number, tenant["client_id"], messages[prior_turns:], apt["id"]
                 )
             except Exception as upsert_err:
                 sms_info(
@@ -754,7 +770,7 @@ async def handle_incoming_sms(request: Request):
                     phase="detail_summary_reply",
                 )
                 logger.warning(
-                    "database.db_sms_session_upsert failed (detail summary): %s",
+                    "database.db_sms_session_append failed (detail summary): %s",
                     upsert_err,
                     exc_info=True,
                 )
@@ -777,7 +793,7 @@ async def handle_incoming_sms(request: Request):
             apt_after = apt
             if runtime.USE_DB and apt.get("id"):
                 aid = int(apt["id"])
-                apt_full = database.db_appointments_get_by_id(aid) or apt
+                apt_full = await database.adb.appointments_get_by_id(aid) or apt
                 date = (apt_full.get("date") or "").strip()
                 time_raw = (apt_full.get("time") or "").strip()
                 time_hhmm = booking_service._normalize_time_to_hhmm(time_raw) or time_raw
@@ -820,8 +836,8 @@ async def handle_incoming_sms(request: Request):
                     )
                     messages.append({"role": "assistant", "content": sorry})
                     try:
-                        database.db_sms_session_upsert(
-                            from_number, tenant["client_id"], messages, apt["id"]
+                        await database.adb.sms_session_append(
+                            from_number, tenant["client_id"], messages[prior_turns:], apt["id"]
                         )
                     except Exception as upsert_err:
                         sms_info(
@@ -832,7 +848,7 @@ async def handle_incoming_sms(request: Request):
                             phase="pending_customer_confirm_slot_taken",
                         )
                         logger.warning(
-                            "database.db_sms_session_upsert failed (slot taken path): %s",
+                            "database.db_sms_session_append failed (slot taken path): %s",
                             upsert_err,
                             exc_info=True,
                         )
@@ -841,13 +857,14 @@ async def handle_incoming_sms(request: Request):
                         media_type="application/xml",
                     )
                 # Slot already claimed atomically in the guard above.
-                database.db_appointments_update(
+                await database.adb.appointments_update(
                     aid, status="pending_review", client_id=tenant["client_id"]
                 )
                 apt_after = (
-                    database.db_appointments_get_by_id(aid, client_id=tenant["client_id"])
+                    await database.adb.appointments_get_by_id(aid, client_id=tenant["client_id"])
                     or apt_full
                 )
+                booking_service.note_appointment_changed(apt_after)
             try:
                 em_conf = (apt_after.get("email") or "").strip()
                 mem_patch: dict = {"last_pending_review_apt_id": apt.get("id")}
@@ -888,8 +905,8 @@ async def handle_incoming_sms(request: Request):
             )
             messages.append({"role": "assistant", "content": reply})
             try:
-                database.db_sms_session_upsert(
-                    from_number, tenant["client_id"], messages, apt["id"]
+                await database.adb.sms_session_append(
+                    from_number, tenant["client_id"], messages[prior_turns:], apt["id"]
                 )
             except Exception as upsert_err:
                 sms_info(
@@ -900,7 +917,7 @@ async def handle_incoming_sms(request: Request):
                     phase="pending_customer_confirm",
                 )
                 logger.warning(
-                    "database.db_sms_session_upsert failed (pending_customer path): %s",
+                    "database.db_sms_session_append failed (pending_customer path): %s",
                     upsert_err,
                     exc_info=True,
                 )
@@ -932,7 +949,7 @@ async def handle_incoming_sms(request: Request):
         sms_context_apts: list[dict] = []
         if runtime.USE_DB:
             try:
-                sms_context_apts = database.db_appointments_get_active_for_sms_context(
+                sms_context_apts = await database.adb.appointments_get_active_for_sms_context(
                     from_number, client_id=tenant["client_id"], limit=5
                 )
             except Exception as context_err:
@@ -1084,8 +1101,8 @@ Respond naturally. If they confirm it's correct, say we'll text when the busines
             )
         messages.append({"role": "assistant", "content": reply})
         try:
-            database.db_sms_session_upsert(
-                from_number, tenant["client_id"], messages, apt["id"] if apt else None
+            await database.adb.sms_session_append(
+                from_number, tenant["client_id"], messages[prior_turns:], apt["id"] if apt else None
             )
             sms_trace(
                 "inbound_session_persist_ok",
@@ -1102,7 +1119,7 @@ Respond naturally. If they confirm it's correct, say we'll text when the busines
                 phase="ai_reply_path",
             )
             logger.warning(
-                "database.db_sms_session_upsert failed (AI path): %s", upsert_err, exc_info=True
+                "database.db_sms_session_append failed (AI path): %s", upsert_err, exc_info=True
             )
         # Lead capture: when no pending appointment and plan allows, treat as inquiry
         if (
@@ -1121,7 +1138,7 @@ Respond naturally. If they confirm it's correct, say we'll text when the busines
             ):
                 lead_inserted = False
                 try:
-                    database.db_leads_insert(
+                    await database.adb.leads_insert(
                         tenant["client_id"],
                         None,
                         from_number,
@@ -1147,7 +1164,7 @@ Respond naturally. If they confirm it's correct, say we'll text when the busines
                 )
                 # SMS automation: after_inquiry - send template to customer
                 if runtime.USE_DB:
-                    automations = database.db_sms_automations_get_by_trigger(
+                    automations = await database.adb.sms_automations_get_by_trigger(
                         tenant["client_id"], "after_inquiry"
                     )
                     sms_trace(
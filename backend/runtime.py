@@ -82,6 +82,28 @@ class _LazyOpenAIClient:
 client = _LazyOpenAIClient()
 
 
+# Async twin for endpoints that stream provider output back to the caller (tts-audio
+# streaming mode): awaiting it holds no threadpool worker. Same timeout/retry budget.
+_async_openai_client = None
+
+
+class _LazyAsyncOpenAIClient:
+    """Proxy that creates the real AsyncOpenAI client on first attribute access."""
+
+    def __getattr__(self, name):
+        global _async_openai_client
+        if _async_openai_client is None:
+            _async_openai_client = openai.AsyncOpenAI(
+                api_key=os.getenv("OPENAI_API_KEY"),
+                timeout=float(os.getenv("OPENAI_TIMEOUT_SECONDS", "12")),
+                max_retries=int(os.getenv("OPENAI_MAX_RETRIES", "1")),
+            )
+        return getattr(_async_openai_client, name)
+
+
+async_client = _LazyAsyncOpenAIClient()
+
+
 def _ensure_openai_client():
     """Eagerly create the client if not yet initialized."""
     global _openai_client
@@ -0,0 +1,46 @@
+"""Rebuild the daily_stats rollup from call_log, appointments and sms_messages.
+
+Run once after migration 0016 to fill in history, or any time the rollup is suspected
+to have drifted (a bump that failed is logged and skipped, never retried). Rows are
+recomputed, not added to, so re-running is safe.
+
+Usage (from backend/):
+    python scripts/backfill_daily_stats.py                      # every tenant, all history
+    python scripts/backfill_daily_stats.py --client-id acme-salon
+    python scripts/backfill_daily_stats.py --since 2026-01-01   # only days from then on
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from datetime import date
+from pathlib import Path
+
+_BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_BACKEND_DIR))
+
+from dotenv import load_dotenv  # noqa: E402
+
+load_dotenv(_BACKEND_DIR / ".env", override=True)
+
+import database  # noqa: E402
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--client-id", default=None, help="one tenant (default: all with activity)")
+    ap.add_argument("--since", type=date.fromisoformat, default=None, help="first local day, YYYY-MM-DD")
+    args = ap.parse_args()
+    if not database.init_db():
+        print("DATABASE_URL is not set or the database is unreachable.", file=sys.stderr)
+        return 1
+    written = database.db_daily_stats_rebuild(client_id=args.client_id, since=args.since)
+    for cid, rows in written.items():
+        print(f"{cid}: {rows} day(s)")
+    print(f"rebuilt {len(written)} tenant(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""Database round trips per request, with the old every-checkout pre-ping vs the idle-age one.
+
+A request here is what a typical dashboard or webhook does: several top-level db_*
+reads, each borrowing and returning its own pooled connection, then a couple of writes
+that commit. "before" runs it with DB_PREPING_IDLE_SECONDS=0 (SELECT 1 on every
+checkout, as _get_conn used to); "after" uses the configured threshold, so a connection
+that went back to the pool moments ago is reused without a ping.
+
+Without DATABASE_URL the pool is simulated: a fake connection counts round trips the way
+psycopg2 spends them (BEGIN on the first statement outside a transaction, one per
+statement, one per COMMIT/ROLLBACK of an open transaction; rollback() on an idle
+connection is client-side only). With DATABASE_URL set it drives the real pool, reports
+wall time per request and counts the pre-pings.
+
+Usage (from backend/):
+    python scripts/bench_db_round_trips.py
+    python scripts/bench_db_round_trips.py --requests 500 --reads 12 --writes 3
+    DATABASE_URL=postgres://... python scripts/bench_db_round_trips.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+_BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_BACKEND_DIR))
+
+import database  # noqa: E402
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE, TRANSACTION_STATUS_INTRANS  # noqa: E402
+
+
+class _Counter:
+    round_trips = 0
+    pings = 0
+
+
+class _FakeInfo:
+    def __init__(self) -> None:
+        self.transaction_status = TRANSACTION_STATUS_IDLE
+
+
+class _FakeCursor:
+    def __init__(self, conn: "_FakeConn") -> None:
+        self._conn = conn
+
+    def execute(self, sql, params=None) -> None:
+        if self._conn.info.transaction_status == TRANSACTION_STATUS_IDLE:
+            _Counter.round_trips += 1  # implicit BEGIN
+            self._conn.info.transaction_status = TRANSACTION_STATUS_INTRANS
+        _Counter.round_trips += 1
+        if sql == "SELECT 1":
+            _Counter.pings += 1
+
+    def fetchone(self):
+        return (1,)
+
+    def close(self) -> None:
+        pass
+
+
+class _FakeConn:
+    closed = 0
+
+    def __init__(self) -> None:
+        self.info = _FakeInfo()
+        self.last_used = time.monotonic()
+
+    def cursor(self) -> _FakeCursor:
+        return _FakeCursor(self)
+
+    def _end(self) -> None:
+        if self.info.transaction_status != TRANSACTION_STATUS_IDLE:
+            _Counter.round_trips += 1
+            self.info.transaction_status = TRANSACTION_STATUS_IDLE
+
+    commit = rollback = _end
+
+
+class _FakePool:
+    """Just enough of ThreadedConnectionPool for _get_conn and _conn_scope_exit."""
+
+    maxconn = 4
+
+    def __init__(self) -> None:
+        self._pool = [_FakeConn() for _ in range(self.maxconn)]
+        self._used: dict = {}
+
+    def getconn(self) -> _FakeConn:
+        conn = self._pool.pop()
+        self._used[id(conn)] = conn
+        return conn
+
+    def putconn(self, conn: _FakeConn, close: bool = False) -> None:
+        self._used.pop(id(conn), None)
+        conn.rollback()  # psycopg2's pool rolls back a connection left in a transaction
+        self._pool.append(conn)
+
+
+@database._scoped
+def db_bench_read(n: int):
+    conn = database._get_conn()
+    cur = conn.cursor()
+    cur.execute("SELECT %s", (n,))
+    row = cur.fetchone()
+    cur.close()
+    return row
+
+
+@database._scoped
+def db_bench_write(n: int):
+    conn = database._get_conn()
+    cur = conn.cursor()
+    cur.execute("SELECT %s", (n,))  # stands in for an INSERT/UPDATE; nothing is written
+    cur.close()
+    conn.commit()
+
+
+def _request(reads: int, writes: int) -> None:
+    for i in range(reads):
+        db_bench_read(i)
+    for i in range(writes):
+        db_bench_write(i)
+
+
+def _run(label: str, threshold: float, args: argparse.Namespace) -> None:
+    database._PREPING_IDLE_SECONDS = threshold
+    _Counter.round_trips = _Counter.pings = 0
+    _request(args.reads, args.writes)  # warm the pool
+    _Counter.round_trips = _Counter.pings = 0
+    started = time.perf_counter()
+    for _ in range(args.requests):
+        _request(args.reads, args.writes)
+    elapsed = time.perf_counter() - started
+    line = f"{label:<7} pre-ping idle>{threshold:g}s  pings/request={_Counter.pings / args.requests:6.2f}"
+    if args.real:
+        line += f"  ms/request={elapsed * 1000 / args.requests:8.2f}"
+    else:
+        line += f"  round trips/request={_Counter.round_trips / args.requests:6.2f}"
+    print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--reads", type=int, default=8, help="top-level db_* reads per request")
+    parser.add_argument("--writes", type=int, default=2, help="committing db_* writes per request")
+    parser.add_argument("--threshold", type=float, default=None, help="idle seconds for 'after'")
+    args = parser.parse_args()
+    after = database._PREPING_IDLE_SECONDS if args.threshold is None else args.threshold
+
+    args.real = bool(os.getenv("DATABASE_URL"))
+    database._use_db = True
+    if args.real:
+        record_query = database._record_query
+
+        def counting(query, seconds, rows):
+            if query in ("SELECT 1", b"SELECT 1"):
+                _Counter.pings += 1
+            record_query(query, seconds, rows)
+
+        database._record_query = counting
+        print("mode: real pool (DATABASE_URL)")
+    else:
+        fake = _FakePool()
+        database._ensure_pool = lambda: fake
+        print("mode: simulated pool (set DATABASE_URL to measure a real server)")
+    print(f"request: {args.reads} reads + {args.writes} committed writes, x{args.requests}")
+    _run("before", 0.0, args)
+    _run("after", after, args)
+
+
+if __name__ == "__main__":
+    main()
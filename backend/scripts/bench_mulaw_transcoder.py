@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""24 kHz PCM → 8 kHz μ-law transcoder throughput, in input samples/sec on one core.
+
+Compares the original per-sample loop (int.from_bytes decode, nested FIR loop,
+per-sample G.711 encode) with Pcm24kToMulaw8k's pure-Python path and, when NumPy is
+installed, its NumPy path. All three are checked for identical output first. A live
+call needs 24,000 samples/sec, so samples/sec ÷ 24,000 is roughly the number of
+concurrent streams one core can feed.
+
+Usage (from backend/):
+    python scripts/bench_mulaw_transcoder.py
+    python scripts/bench_mulaw_transcoder.py --seconds 30 --chunk 4096
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import struct
+import sys
+import time
+from pathlib import Path
+
+_BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_BACKEND_DIR))
+
+from voice import streaming_audio  # noqa: E402
+from voice.streaming_audio import _LPF, Pcm24kToMulaw8k, linear16_to_ulaw  # noqa: E402
+
+
+class _Reference:
+    """The pre-optimization feed() loop, verbatim."""
+
+    def __init__(self) -> None:
+        self._byte_rem = b""
+        self._hist = [0] * (len(_LPF) - 1)
+        self._pos = 0
+
+    def feed(self, pcm: bytes) -> bytes:
+        data = self._byte_rem + pcm
+        ns = len(data) // 2
+        if ns == 0:
+            self._byte_rem = data
+            return b""
+        new = [int.from_bytes(data[2 * i : 2 * i + 2], "little", signed=True) for i in range(ns)]
+        self._byte_rem = data[2 * ns :]
+        buf = self._hist + new
+        hlen = len(self._hist)
+        taps = _LPF
+        n = len(_LPF)
+        out = bytearray()
+        base = self._pos
+        for i in range(ns):
+            if (base + i) % 3 == 0:
+                bi = hlen + i
+                acc = 0.0
+                w = buf[bi - n + 1 : bi + 1]
+                for k in range(n):
+                    acc += taps[k] * w[k]
+                out.append(linear16_to_ulaw(int(round(acc))))
+        self._pos = base + ns
+        self._hist = buf[-(n - 1) :]
+        return bytes(out)
+
+
+def _speechy_pcm(seconds: float) -> bytes:
+    rng = random.Random(11)
+    n = int(24000 * seconds)
+    samples = [
+        max(-32768, min(32767, int(9000 * math.sin(2 * math.pi * 180 * i / 24000)
+                                   + 4000 * math.sin(2 * math.pi * 2300 * i / 24000)
+                                   + rng.gauss(0, 900))))
+        for i in range(n)
+    ]
+    return struct.pack(f"<{n}h", *samples)
+
+
+def _run(make, pcm: bytes, chunk: int) -> tuple[bytes, float]:
+    tc = make()
+    parts = []
+    t0 = time.perf_counter()
+    for i in range(0, len(pcm), chunk):
+        parts.append(tc.feed(pcm[i : i + chunk]))
+    return b"".join(parts), time.perf_counter() - t0
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--seconds", type=float, default=10.0, help="seconds of 24 kHz audio")
+    ap.add_argument("--chunk", type=int, default=4800, help="PCM bytes per feed() (OpenAI streams ~4-8 KB)")
+    args = ap.parse_args()
+    pcm = _speechy_pcm(args.seconds)
+    samples = len(pcm) // 2
+    engines = [("reference", _Reference), ("pure", lambda: Pcm24kToMulaw8k(use_numpy=False))]
+    if streaming_audio._np is not None:
+        engines.append(("numpy", lambda: Pcm24kToMulaw8k(use_numpy=True)))
+    else:
+        print("numpy not installed: skipping the NumPy path")
+    print(f"audio={args.seconds:.0f}s samples={samples} chunk={args.chunk}B")
+    print(f"{'engine':>10} {'samples/s':>12} {'x realtime':>11} {'vs ref':>8} {'identical':>10}")
+    ref_out, ref_dt = None, None
+    for name, make in engines:
+        out, dt = _run(make, pcm, args.chunk)
+        if ref_out is None:
+            ref_out, ref_dt = out, dt
+        rate = samples / dt
+        print(f"{name:>10} {rate:>12,.0f} {rate / 24000:>11.1f} {ref_dt / dt:>7.1f}x {str(out == ref_out):>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""Audio frame-pacing jitter with N concurrent calls doing session I/O on Redis.
+
+Each simulated call runs a 20 ms frame pacer (what the bidi media stream does while
+speaking) next to a turn loop doing the per-turn session traffic: read the session,
+merge an update, publish and pop a response status. "sync" drives the store's sync
+methods from the event loop (every round-trip blocks the loop); "async" uses the
+redis.asyncio-backed a*-methods. Reported: how late each frame tick fired.
+
+Redis stand-in: --redis-url / REDIS_URL for a local server, else fakeredis[lua] if it
+is installed (the store saves and merges via Lua). --rtt-ms adds a per-command delay to
+model a Redis that is not on localhost.
+
+Usage (from backend/):
+    python scripts/bench_redis_jitter.py --calls 50 --seconds 5
+    REDIS_URL=redis://localhost:6379/15 python scripts/bench_redis_jitter.py --rtt-ms 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import inspect
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+_BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_BACKEND_DIR))
+
+import voice.call_session_store as css  # noqa: E402
+
+_FRAME_SEC = 0.02
+_TURN_SEC = 0.1
+
+
+class _SlowSync:
+    def __init__(self, inner, rtt: float):
+        self._inner, self._rtt = inner, rtt
+
+    def __getattr__(self, name):
+        fn = getattr(self._inner, name)
+        if name == "pipeline":
+            return lambda *a, **kw: _SlowSyncPipe(fn(*a, **kw), self._rtt)
+        if name == "register_script":
+            # Bind the script to this wrapper so EVALSHA pays the RTT too.
+            return lambda src: type(fn(src))(self, src)
+
+        def call(*a, **kw):
+            time.sleep(self._rtt)
+            return fn(*a, **kw)
+
+        return call
+
+
+class _SlowSyncPipe:
+    def __init__(self, pipe, rtt: float):
+        self._pipe, self._rtt = pipe, rtt
+
+    def __getattr__(self, name):
+        return getattr(self._pipe, name)
+
+    def execute(self):
+        time.sleep(self._rtt)
+        return self._pipe.execute()
+
+
+class _SlowAsync:
+    def __init__(self, inner, rtt: float):
+        self._inner, self._rtt = inner, rtt
+
+    def __getattr__(self, name):
+        fn = getattr(self._inner, name)
+        if name == "pipeline":
+            return lambda *a, **kw: _SlowAsyncPipe(fn(*a, **kw), self._rtt)
+        if name == "register_script":
+            # Bind the script to this wrapper so EVALSHA pays the RTT too.
+            return lambda src: type(fn(src))(self, src)
+        if not inspect.iscoroutinefunction(fn):
+            return fn
+
+        async def call(*a, **kw):
+            await asyncio.sleep(self._rtt)
+            return await fn(*a, **kw)
+
+        return call
+
+
+class _SlowAsyncPipe:
+    def __init__(self, pipe, rtt: float):
+        self._pipe, self._rtt = pipe, rtt
+
+    def __getattr__(self, name):
+        return getattr(self._pipe, name)
+
+    async def execute(self):
+        await asyncio.sleep(self._rtt)
+        return await self._pipe.execute()
+
+
+def _install_clients(redis_url: str, rtt: float) -> str:
+    if redis_url:
+        make_sync, make_async = css.create_redis_client, css.create_async_redis_client
+        label = redis_url
+    else:
+        try:
+            import fakeredis
+            import fakeredis.aioredis
+        except ImportError:
+            sys.exit("Need a Redis stand-in: set --redis-url/REDIS_URL or pip install 'fakeredis[lua]'")
+        server = fakeredis.FakeServer()
+        make_sync = lambda _url: fakeredis.FakeRedis(server=server, decode_responses=True)  # noqa: E731
+        make_async = lambda _url: fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)  # noqa: E731
+        label = "fakeredis"
+    if rtt > 0:
+        css.create_redis_client = lambda url: _SlowSync(make_sync(url), rtt)
+        css.create_async_redis_client = lambda url: _SlowAsync(make_async(url), rtt)
+    else:
+        css.create_redis_client, css.create_async_redis_client = make_sync, make_async
+    return label
+
+
+async def _pacer(lateness: list[float], stop: float) -> None:
+    loop = asyncio.get_running_loop()
+    due = loop.time()
+    while due < stop:
+        due += _FRAME_SEC
+        await asyncio.sleep(max(0.0, due - loop.time()))
+        lateness.append(max(0.0, loop.time() - due))
+
+
+async def _turns(store, sid: str, mode: str, stop: float) -> int:
+    loop = asyncio.get_running_loop()
+    n = 0
+    while loop.time() < stop:
+        if mode == "async":
+            await store.aget(sid)
+            await store.amerge_session(sid, {"respond_poll_count": n})
+            await store.aset_response_status(sid, {"status": "ready", "ai_text": "ok"})
+            await store.apop_response_status(sid)
+        else:
+            store.get(sid)
+            store.merge_session(sid, {"respond_poll_count": n})
+            store.set_response_status(sid, {"status": "ready", "ai_text": "ok"})
+            store.pop_response_status(sid)
+        n += 1
+        await asyncio.sleep(_TURN_SEC)
+    return n
+
+
+async def _run(mode: str, calls: int, seconds: float, redis_url: str) -> tuple[list[float], int]:
+    store = css.RedisCallSessionStore(redis_url or "redis://bench")
+    history = [{"role": "user", "content": "word " * 40}] * 30
+    sids = [f"CA{i:032x}" for i in range(calls)]
+    for sid in sids:
+        store.create(sid, {"client_id": "bench", "conversation_history": history})
+    lateness: list[float] = []
+    stop = asyncio.get_running_loop().time() + seconds
+    results = await asyncio.gather(
+        *[_pacer(lateness, stop) for _ in sids], *[_turns(store, sid, mode, stop) for sid in sids]
+    )
+    for sid in sids:
+        store.cleanup_call(sid)
+    return lateness, sum(r for r in results if r is not None)
+
+
+def _pct(xs: list[float], p: float) -> float:
+    xs = sorted(xs)
+    return xs[min(len(xs) - 1, int(p * len(xs)))] * 1000
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--calls", type=int, default=50)
+    ap.add_argument("--seconds", type=float, default=5.0)
+    ap.add_argument("--rtt-ms", type=float, default=0.0)
+    ap.add_argument("--redis-url", default=(os.getenv("REDIS_URL") or "").strip())
+    args = ap.parse_args()
+    label = _install_clients(args.redis_url, args.rtt_ms / 1000)
+    print(f"redis={label} calls={args.calls} seconds={args.seconds} rtt_ms={args.rtt_ms}")
+    print(f"{'mode':>6} {'turns':>7} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} {'mean ms':>8}")
+    for mode in ("sync", "async"):
+        lateness, turns = asyncio.run(_run(mode, args.calls, args.seconds, args.redis_url))
+        print(
+            f"{mode:>6} {turns:>7} {_pct(lateness, 0.5):>8.2f} {_pct(lateness, 0.99):>8.2f} "
+            f"{max(lateness) * 1000:>8.2f} {statistics.fmean(lateness) * 1000:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
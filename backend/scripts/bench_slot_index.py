@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Slot-availability check latency vs. appointment-history size.
+
+Compares the old path (merge every appointment + booked_slots row, then scan —
+what booking_service did on every is_slot_available) against a warm per-tenant
+SlotIndex. No database: history is synthetic and the loaders are stubbed, so the
+numbers isolate the merge/scan cost (a real DB read on top only widens the gap).
+
+Usage (from backend/):
+    python scripts/bench_slot_index.py
+    python scripts/bench_slot_index.py --sizes 100 1000 10000 --checks 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+_BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_BACKEND_DIR))
+os.environ.setdefault("DATABASE_URL", "")
+os.environ.setdefault("OPENAI_API_KEY", "sk-bench")
+
+import booking_service  # noqa: E402
+import config_service  # noqa: E402
+import runtime  # noqa: E402
+
+_STAFF = ["s1", "s2", "s3", None]
+_STATUSES = ["accepted", "confirmed", "completed", "cancelled", "rejected", "pending_review"]
+
+
+def _history(n: int, rng: random.Random):
+    start = date.today() - timedelta(days=3 * 365)
+    apts, slots = [], []
+    for i in range(1, n + 1):
+        d = (start + timedelta(days=rng.randrange(3 * 365 + 90))).isoformat()
+        t = f"{rng.randrange(9, 18):02d}:{rng.choice(('00', '30'))}"
+        staff = rng.choice(_STAFF)
+        st = rng.choice(_STATUSES)
+        apts.append({"id": i, "date": d, "time": t, "status": st, "staff_id": staff, "reason": ""})
+        if st not in ("cancelled", "rejected") and rng.random() < 0.8:
+            slots.append(
+                {"date": d, "time": t, "appointment_id": i, "duration_minutes": 30, "staff_id": staff}
+            )
+    return apts, slots
+
+
+def _legacy_is_available(d: str, t: str, dur: int, staff) -> bool:
+    # The pre-index path: two full merges and a linear scan per check.
+    want = booking_service._staff_slot_key(staff)
+    booking_service._appointment_by_id_map(booking_service._appointment_rows_for_calendar_merge())
+    for s in booking_service._get_all_booked_slots_merged():
+        if s.get("date") != d or booking_service._staff_slot_key(s.get("staff_id")) != want:
+            continue
+        if booking_service._slot_overlaps(t, dur, s.get("time") or "", s.get("duration_minutes") or 30):
+            return False
+    return True
+
+
+def _time_per_check(fn, queries) -> float:
+    t0 = time.perf_counter()
+    for q in queries:
+        fn(*q)
+    return (time.perf_counter() - t0) / len(queries) * 1e6
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000, 20000])
+    ap.add_argument("--checks", type=int, default=500)
+    args = ap.parse_args()
+
+    rng = random.Random(7)
+    runtime.USE_DB = True
+    config_service.get_business_info = lambda: {"services": []}
+    print(f"{'appointments':>12} {'legacy us/check':>16} {'index us/check':>15} {'speedup':>8}")
+    for n in args.sizes:
+        apts, slots = _history(n, rng)
+        booking_service._appointment_rows_for_calendar_merge = lambda *w, a=apts: a
+        booking_service._load_booked_slots = lambda *w, s=slots: list(s)
+        today = date.today()
+        queries = [
+            (
+                (today + timedelta(days=rng.randrange(30))).isoformat(),
+                f"{rng.randrange(9, 18):02d}:00",
+                30,
+                rng.choice(_STAFF),
+            )
+            for _ in range(args.checks)
+        ]
+        legacy_queries = queries[: max(1, min(len(queries), 20000 // max(1, n) + 5))]
+        legacy = _time_per_check(_legacy_is_available, legacy_queries)
+        booking_service._invalidate_booked_slots_cache()
+        booking_service._tenant_slot_index()  # warm: the load is paid once per TTL
+        indexed = _time_per_check(
+            lambda d, t, dur, st: not booking_service._slot_blocking_details(d, t, dur, st),
+            queries,
+        )
+        print(f"{n:>12} {legacy:>16.1f} {indexed:>15.1f} {legacy / indexed:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""In-process calendar-hold index for one tenant.
+
+booking_service used to answer every "is 2 PM free with Sarah?" by loading the
+tenant's whole appointment history plus every booked_slots row and merging them in
+Python — twice per check. This index is built from that merge once for a date
+window, extended by range when a caller asks about a date outside it, kept current
+by reserve/release/status changes, and answers overlap queries per (date, staff
+column) with a bisect instead of a scan.
+
+Pure data structure: no DB, no config, no runtime state. Times are parsed by the
+caller (booking_service._time_to_minutes) so the salon AM/PM heuristics live in
+one place.
+
+One index is shared by every thread serving the tenant (sync handlers on the
+threadpool, DB executor jobs), so each method runs under the index's RLock. A caller
+that checks then writes (has() then add(), missing_ranges() then a load) holds
+`index.lock` around both steps.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+from datetime import date as _date, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+UNASSIGNED_STAFF_KEY = "__unassigned__"
+
+
+def staff_key(staff_id: Optional[str]) -> str:
+    s = (staff_id or "").strip()
+    return s if s else UNASSIGNED_STAFF_KEY
+
+
+class _Entry:
+    __slots__ = ("start", "end", "seq", "row", "apt")
+
+    def __init__(self, start: int, end: int, seq: int, row: dict, apt: Optional[dict]):
+        self.start = start
+        self.end = end
+        self.seq = seq
+        self.row = row
+        self.apt = apt
+
+
+class _Bucket:
+    """Holds for one (date, staff) column, sorted by start minute."""
+
+    __slots__ = ("starts", "entries", "max_len")
+
+    def __init__(self) -> None:
+        self.starts: List[Tuple[int, int]] = []  # (start, seq) — parallel to entries
+        self.entries: List[_Entry] = []
+        self.max_len = 0
+
+    def add(self, e: _Entry) -> None:
+        key = (e.start, e.seq)
+        i = bisect.bisect_left(self.starts, key)
+        self.starts.insert(i, key)
+        self.entries.insert(i, e)
+        self.max_len = max(self.max_len, e.end - e.start)
+
+    def remove(self, e: _Entry) -> None:
+        i = bisect.bisect_left(self.starts, (e.start, e.seq))
+        if i < len(self.entries) and self.entries[i] is e:
+            del self.starts[i]
+            del self.entries[i]
+
+    def overlapping(self, start: int, end: int) -> List[_Entry]:
+        # Anything overlapping [start, end) begins before `end` and, since no hold in
+        # this bucket is longer than max_len, no earlier than start - max_len.
+        lo = bisect.bisect_left(self.starts, (start - self.max_len, -1))
+        hi = bisect.bisect_left(self.starts, (end, -1))
+        return [e for e in self.entries[lo:hi] if e.end > start]
+
+
+class SlotIndex:
+    """Calendar holds for one tenant, bucketed by (date, staff key).
+
+    Each hold keeps the original merged row (date/time/appointment_id/
+    duration_minutes/staff_id) and the linked appointment dict when known, so
+    callers can rebuild exactly what the old list-based merge returned.
+    """
+
+    def __init__(self, parse_minutes: Callable[[str], int], default_duration: int = 30):
+        self.lock = threading.RLock()
+        self._parse = parse_minutes
+        self._default_duration = default_duration
+        self._buckets: Dict[Tuple[str, str], _Bucket] = {}
+        self._by_date: Dict[str, set] = {}
+        self._by_appointment: Dict[int, List[Tuple[Tuple[str, str], _Entry]]] = {}
+        self._seq = 0
+        self._loaded: List[Tuple[str, str]] = []  # inclusive ISO date ranges already loaded
+
+    def __len__(self) -> int:
+        with self.lock:
+            return sum(len(b.entries) for b in self._buckets.values())
+
+    @classmethod
+    def build(
+        cls,
+        rows: Iterable[dict],
+        apt_by_id: Dict[int, dict],
+        parse_minutes: Callable[[str], int],
+        default_duration: int = 30,
+    ) -> "SlotIndex":
+        idx = cls(parse_minutes, default_duration)
+        with idx.lock:
+            for r in rows:
+                idx.add(r, apt_by_id.get(_int_or_zero(r.get("appointment_id"))))
+        return idx
+
+    def mark_loaded(self, date_from: str, date_to: str) -> None:
+        """Record that every hold dated in [date_from, date_to] has been added."""
+        with self.lock:
+            self._loaded.append((date_from, date_to))
+
+    def covers(self, date: str) -> bool:
+        with self.lock:
+            return any(lo <= date <= hi for lo, hi in self._loaded)
+
+    def missing_ranges(self, date_from: str, date_to: str) -> List[Tuple[str, str]]:
+        """Sub-ranges of [date_from, date_to] not loaded yet, as inclusive ISO pairs.
+
+        A date that is not ISO (a caller passing through whatever the model said) is
+        treated as a one-day range of its own.
+        """
+        try:
+            lo, hi = _date.fromisoformat(date_from), _date.fromisoformat(date_to)
+        except (TypeError, ValueError):
+            return [] if self.covers(date_from) else [(date_from, date_to)]
+        out: List[Tuple[str, str]] = []
+        start: Optional[_date] = None
+        d = lo
+        with self.lock:
+            while d <= hi:
+                if self.covers(d.isoformat()):
+                    if start is not None:
+                        out.append((start.isoformat(), (d - timedelta(days=1)).isoformat()))
+                        start = None
+                elif start is None:
+                    start = d
+                d += timedelta(days=1)
+        if start is not None:
+            out.append((start.isoformat(), hi.isoformat()))
+        return out
+
+    def add(self, row: dict, apt: Optional[dict] = None) -> None:
+        date = (row.get("date") or "").strip()
+        if not date:
+            return
+        try:
+            dur = int(row.get("duration_minutes") or self._default_duration)
+        except (TypeError, ValueError):
+            dur = self._default_duration
+        start = self._parse(row.get("time") or "")
+        key = (date, staff_key(row.get("staff_id")))
+        aid = _int_or_zero(row.get("appointment_id"))
+        with self.lock:
+            self._seq += 1
+            e = _Entry(start, start + dur, self._seq, row, apt)
+            self._buckets.setdefault(key, _Bucket()).add(e)
+            self._by_date.setdefault(date, set()).add(key[1])
+            if aid:
+                self._by_appointment.setdefault(aid, []).append((key, e))
+
+    def has(self, date: str, time: str, staff_id: Optional[str]) -> bool:
+        """True when a hold already starts at exactly this date/time/staff."""
+        start = self._parse(time or "")
+        with self.lock:
+            b = self._buckets.get((date, staff_key(staff_id)))
+            if not b:
+                return False
+            i = bisect.bisect_left(b.starts, (start, -1))
+            return i < len(b.starts) and b.starts[i][0] == start
+
+    def holds_appointment(self, appointment_id: int) -> bool:
+        with self.lock:
+            return bool(self._by_appointment.get(_int_or_zero(appointment_id)))
+
+    def remove_appointment(self, appointment_id: int) -> int:
+        """Drop every hold linked to this appointment. Returns how many were removed."""
+        with self.lock:
+            refs = self._by_appointment.pop(_int_or_zero(appointment_id), [])
+            for key, e in refs:
+                b = self._buckets.get(key)
+                if b is None:
+                    continue
+                b.remove(e)
+                if not b.entries:
+                    del self._buckets[key]
+                    staff = self._by_date.get(key[0])
+                    if staff is not None:
+                        staff.discard(key[1])
+                        if not staff:
+                            del self._by_date[key[0]]
+        return len(refs)
+
+    def set_appointment(self, appointment_id: int, apt: dict) -> None:
+        """Refresh the appointment dict attached to this appointment's holds."""
+        with self.lock:
+            for _, e in self._by_appointment.get(_int_or_zero(appointment_id), []):
+                e.apt = apt
+
+    def overlapping(
+        self, date: str, start_minutes: int, duration_minutes: int, staff_id: Optional[str]
+    ) -> List[Tuple[dict, Optional[dict]]]:
+        """(row, appointment) for every hold in this staff column overlapping the window."""
+        with self.lock:
+            b = self._buckets.get((date, staff_key(staff_id)))
+            if not b:
+                return []
+            return [
+                (e.row, e.apt)
+                for e in b.overlapping(start_minutes, start_minutes + duration_minutes)
+            ]
+
+    def rows_for_date(self, date: str) -> List[dict]:
+        entries: List[_Entry] = []
+        with self.lock:
+            for sk in self._by_date.get(date, ()):
+                entries.extend(self._buckets[(date, sk)].entries)
+        entries.sort(key=lambda e: e.seq)
+        return [e.row for e in entries]
+
+    def items(self) -> List[Tuple[dict, Optional[dict]]]:
+        """Every hold as (row, appointment), in insertion order."""
+        with self.lock:
+            entries = [e for b in self._buckets.values() for e in b.entries]
+        entries.sort(key=lambda e: e.seq)
+        return [(e.row, e.apt) for e in entries]
+
+
+def _int_or_zero(v) -> int:
+    try:
+        return int(v or 0)
+    except (TypeError, ValueError):
+        return 0
@@ -82,3 +82,23 @@ def _db_clean_slate():
     cur.close()
     conn.close()
     yield
+
+
+@pytest.fixture(autouse=True)
+def _fresh_business_info_cache():
+    """get_business_info caches per client_id; tests that patch its DB/config sources
+    must not see a dict another test built."""
+    import config_service
+
+    config_service._invalidate_business_info_local()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def _fresh_sentence_audio_cache():
+    """Sentence audio is cached process-wide; a test's fake TTS must not be skipped because
+    an earlier test already cached the same sentence."""
+    from voice.sentence_audio_cache import clear_sentence_cache
+
+    clear_sentence_cache()
+    yield
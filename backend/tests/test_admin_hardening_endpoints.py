@@ -40,6 +40,8 @@ def test_admin_ops_self_check_includes_redis_fields():
         body = resp.json()
         for key in fake_redis:
             assert body[key] == fake_redis[key]
+        assert {"workers", "queued", "peak_queued", "wait_ms_max"} <= set(body["db_executor"])
+        assert {"in_use", "idle", "checkout_timeouts", "preping_discards"} <= set(body["db_metrics"]["pool"])
     finally:
         app.dependency_overrides.clear()
 
@@ -0,0 +1,85 @@
+"""Analytics health/summary aggregate in SQL (exact, no 5,000-row load) and report peak
+times in the business's timezone."""
+from datetime import datetime, timezone
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+
+import database
+import runtime
+from routers import analytics
+
+
+def test_db_call_log_health_reads_grouping_rows():
+    with patch.object(database, "_get_conn") as mock_conn:
+        cur = mock_conn.return_value.cursor.return_value
+        cur.fetchall.return_value = [
+            (0, "answered_by_ai", 8, 60.0, 55.0, 90.0, 3),
+            (0, "forwarded", 2, 30.0, 30.0, 30.0, 0),
+            (1, None, 10, 54.0, 52.5, 88.25, 3),
+        ]
+        out = database.db_call_log_health(7)
+        sql, params = cur.execute.call_args[0]
+    assert "GROUPING SETS" in sql and "LIMIT" not in sql
+    assert params[1] == 7
+    assert out == {
+        "calls_total": 10,
+        "by_outcome": {"answered_by_ai": 8, "forwarded": 2},
+        "avg_duration_sec": 54.0,
+        "p50_duration_sec": 52.5,
+        "p90_duration_sec": 88.2,
+        "booking_signals": 3,
+    }
+
+
+def test_db_call_log_summary_fills_every_bucket():
+    ws = datetime(2026, 10, 12, tzinfo=ZoneInfo("America/Chicago"))
+    we = datetime(2026, 10, 19, tzinfo=ZoneInfo("America/Chicago"))
+    with patch.object(database, "_get_conn") as mock_conn:
+        cur = mock_conn.return_value.cursor.return_value
+        cur.fetchall.return_value = [("o", "missed", 4), ("o", "answered_by_ai", 6), ("h", "9", 7), ("d", "1", 2)]
+        out = database.db_call_log_summary(30, "America/Chicago", ws, we)
+        sql, params = cur.execute.call_args[0]
+    assert "AT TIME ZONE %(tz)s" in sql
+    assert params["tz"] == "America/Chicago" and params["days"] == 30
+    assert out["total_calls"] == 10
+    assert out["by_hour"]["9"] == 7 and len(out["by_hour"]) == 24
+    assert out["by_day_of_week"] == {"0": 0, "1": 2, "2": 0, "3": 0, "4": 0, "5": 0, "6": 0}
+
+
+def test_health_endpoint_uses_sql_aggregate(monkeypatch):
+    monkeypatch.setattr(runtime, "USE_DB", True)
+    monkeypatch.setattr(analytics, "system_info", lambda *a, **k: None)
+    monkeypatch.setattr(
+        database, "db_call_log_load", lambda **kw: (_ for _ in ()).throw(AssertionError("no row load"))
+    )
+    monkeypatch.setattr(
+        database,
+        "db_call_log_health",
+        lambda days: {
+            "calls_total": 20000,
+            "by_outcome": {"forwarded": 5000, "answered_by_ai": 15000},
+            "avg_duration_sec": 41.5,
+            "p50_duration_sec": 38.0,
+            "p90_duration_sec": 80.0,
+            "booking_signals": 0,
+        },
+    )
+    out = analytics.get_analytics_health(tenant={"client_id": "salon"}, _=None)
+    assert out["calls_total"] == 20000  # exact, not capped at 5,000
+    assert out["forward_rate"] == 0.25
+    assert out["booking_completion_rate"] == 0.75
+    assert out["p90_duration_sec"] == 80.0
+
+
+def test_in_memory_summary_buckets_in_business_timezone():
+    tz = ZoneInfo("America/Los_Angeles")
+    ws, we = analytics._analytics_iso_week_bounds(datetime(2026, 10, 19, 3, tzinfo=timezone.utc), tz=tz)
+    assert ws.isoformat() == "2026-10-12T00:00:00-07:00"  # still Sunday evening in LA
+    log = [
+        {"outcome": "missed", "start_iso": "2026-10-18T01:00:00Z"},  # Sat 18:00 local
+        {"outcome": "", "start_iso": "not a date"},
+    ]
+    out = analytics._call_summary_from_log(log, tz, ws, we)
+    assert out["by_outcome"] == {"missed": 1, "unknown": 1}
+    assert out["by_hour"]["18"] == 1
+    assert out["by_day_of_week"]["6"] == 1
@@ -55,3 +55,125 @@ def test_analytics_export_pro_returns_csv(client):
             assert "text/csv" in resp.headers.get("content-type", "")
         finally:
             app.dependency_overrides.pop(require_tenant, None)
+
+
+def test_analytics_export_returns_429_when_exports_are_busy(client, monkeypatch):
+    import database
+    from main import require_tenant
+
+    def busy(since, until):
+        raise database.ExportsBusy("too many exports in progress")
+
+    monkeypatch.setattr("runtime.USE_DB", True)
+    monkeypatch.setattr(database, "db_call_log_stream", busy)
+    app.dependency_overrides[require_tenant] = _tenant_growth
+    try:
+        resp = client.get("/api/analytics/export")
+    finally:
+        app.dependency_overrides.pop(require_tenant, None)
+    assert resp.status_code == 429 and resp.headers["retry-after"] == "30"
+
+
+def _log_entries():
+    return [
+        {"call_sid": "CA3", "start_iso": "2026-10-16T15:00:00+00:00", "outcome": "answered_by_ai"},
+        {"call_sid": "CA2", "start_iso": "2026-10-15T15:00:00+00:00", "outcome": "missed"},
+        {"call_sid": "CA1", "start_iso": "2026-10-10T15:00:00+00:00", "outcome": "forwarded"},
+    ]
+
+
+def test_analytics_export_gzip_and_date_range(client, monkeypatch):
+    """Date range is inclusive; gzip=true streams a .csv.gz of the same CSV."""
+    import csv
+    import gzip
+    import io
+
+    import runtime
+    from main import require_tenant
+    from routers import analytics
+
+    monkeypatch.setattr(runtime, "USE_DB", False)
+    monkeypatch.setattr(analytics, "_call_log_days", lambda t: 9999)
+    monkeypatch.setattr(analytics.config_service, "get_business_info", lambda: {"timezone": "UTC"})
+    app.dependency_overrides[require_tenant] = _tenant_pro
+    with patch("routers.analytics._load_call_log", return_value=_log_entries()):
+        try:
+            resp = client.get("/api/analytics/export?start=2026-10-15&end=2026-10-16&gzip=true")
+            bad = client.get("/api/analytics/export?start=10/15/2026")
+        finally:
+            app.dependency_overrides.pop(require_tenant, None)
+    assert resp.status_code == 200
+    assert "call_log.csv.gz" in resp.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(gzip.decompress(resp.content).decode("utf-8"))))
+    assert [r["call_sid"] for r in rows] == ["CA3", "CA2"]
+    assert bad.status_code == 400
+
+
+def test_export_chunks_flush_as_rows_arrive(monkeypatch):
+    from routers import analytics
+
+    monkeypatch.setattr(analytics, "_EXPORT_CHUNK_BYTES", 100)
+    pulled = []
+
+    def rows():
+        for i in range(10):
+            pulled.append(i)
+            yield {"call_sid": f"CA{i}", "call_summary": "x" * 40}
+
+    chunks = analytics._export_csv_chunks(rows())
+    head = next(chunks)
+    assert head.startswith(b"call_sid,") and pulled == []  # header before any row
+    first = next(chunks)
+    assert len(pulled) < 10  # later rows not yet read from the cursor
+    body = head + first + b"".join(chunks)
+    assert body.count(b"\nCA") == 10
+
+
+def test_db_call_log_stream_uses_named_cursor_and_returns_conn(monkeypatch):
+    from datetime import datetime, timezone
+    from unittest.mock import MagicMock
+
+    import database
+
+    pool = MagicMock()
+    conn = pool.getconn.return_value
+    cur = conn.cursor.return_value
+    cur.__iter__.return_value = iter([("CA1",) + (None,) * 13])
+    monkeypatch.setattr(database, "_use_db", True)
+    monkeypatch.setattr(database, "_ensure_pool", lambda: pool)
+    database.set_request_client_id("t-stream")
+    since = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    rows = database.db_call_log_stream(since, None, itersize=500)
+    pool.getconn.assert_not_called()  # nothing borrowed until the consumer pulls
+    assert [r["call_sid"] for r in rows] == ["CA1"]
+    assert conn.cursor.call_args.kwargs["name"].startswith("call_log_stream_")
+    assert cur.itersize == 500
+    assert cur.execute.call_args[0][1][:3] == ("t-stream", since, since)
+    conn.rollback.assert_called_once()
+    pool.putconn.assert_called_once_with(conn, close=False)
+
+
+def test_call_log_streams_are_capped_and_release_their_slot(monkeypatch):
+    import threading
+    from unittest.mock import MagicMock
+
+    import pytest
+
+    import database
+
+    pool = MagicMock()
+    pool.getconn.return_value.cursor.return_value.__iter__.return_value = iter([])
+    monkeypatch.setattr(database, "_use_db", True)
+    monkeypatch.setattr(database, "_ensure_pool", lambda: pool)
+    monkeypatch.setattr(database, "_EXPORT_STREAM_SLOTS", threading.BoundedSemaphore(2))
+
+    first = database.db_call_log_stream(None, None)
+    second = database.db_call_log_stream(None, None)
+    with pytest.raises(database.ExportsBusy):
+        database.db_call_log_stream(None, None)
+    assert list(first) == []  # exhausted: slot back
+    second.close()  # client went away before reading: slot back, nothing borrowed
+    assert pool.getconn.call_count == 1
+    for _ in range(2):
+        database.db_call_log_stream(None, None).close()
@@ -0,0 +1,132 @@
+"""verify_clerk_token caches Clerk's JWKS process-wide and remembers verified tokens
+until they expire, so a dashboard request doesn't pay a JWKS round-trip + RSA verify."""
+import json
+import threading
+import time
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+import auth
+
+ISS = "https://clerk.example.test"
+AUD = "nuvatra-test"
+JWKS_URL = "https://clerk.example.test/.well-known/jwks.json"
+
+
+def _keypair(kid):
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(RSAAlgorithm.to_jwk(key.public_key()))
+    jwk.update({"kid": kid, "use": "sig", "alg": "RS256"})
+    return key, jwk
+
+
+def _token(key, kid, sub="user_1", exp_in=60, tenant="t-1"):
+    now = int(time.time())
+    return jwt.encode(
+        {
+            "sub": sub,
+            "iss": ISS,
+            "aud": AUD,
+            "iat": now,
+            "exp": now + exp_in,
+            "public_metadata": {"tenant_id": tenant},
+        },
+        key,
+        algorithm="RS256",
+        headers={"kid": kid},
+    )
+
+
+@pytest.fixture
+def jwks(monkeypatch):
+    monkeypatch.setenv("CLERK_JWKS_URL", JWKS_URL)
+    monkeypatch.setenv("CLERK_ISSUER", ISS)
+    monkeypatch.setenv("CLERK_AUDIENCE", AUD)
+    state = {"keys": [], "fetches": 0, "delay": 0.0}
+
+    def fake_fetch(self):
+        state["fetches"] += 1
+        if state["delay"]:
+            time.sleep(state["delay"])
+        return {"keys": list(state["keys"])}
+
+    monkeypatch.setattr(jwt.PyJWKClient, "fetch_data", fake_fetch)
+    auth.clear_auth_caches()
+    yield state
+    auth.clear_auth_caches()
+
+
+def test_key_set_fetched_once_across_tokens(jwks):
+    key, jwk = _keypair("k1")
+    jwks["keys"] = [jwk]
+    assert auth.verify_clerk_token(_token(key, "k1", sub="user_a")) == ("user_a", "t-1")
+    assert auth.verify_clerk_token(_token(key, "k1", sub="user_b")) == ("user_b", "t-1")
+    assert jwks["fetches"] == 1
+
+
+def test_verified_token_reused_without_decoding(jwks, monkeypatch):
+    key, jwk = _keypair("k1")
+    jwks["keys"] = [jwk]
+    tok = _token(key, "k1")
+    auth.verify_clerk_token(tok)
+    monkeypatch.setattr(jwt, "decode", lambda *a, **k: pytest.fail("re-verified a cached token"))
+    assert auth.verify_clerk_token(tok) == ("user_1", "t-1")
+
+
+def test_expired_cache_entry_is_not_served(jwks, monkeypatch):
+    key, jwk = _keypair("k1")
+    jwks["keys"] = [jwk]
+    tok = _token(key, "k1", exp_in=30)
+    auth.verify_clerk_token(tok)
+    real_time = time.time
+    # PyJWT checks exp against datetime.now, so only our cache sees the clock move —
+    # the point is that the stale verdict is dropped and the token goes back to decode.
+    monkeypatch.setattr(auth.time, "time", lambda: real_time() + 120)
+    decodes = []
+    real_decode = jwt.decode
+    monkeypatch.setattr(jwt, "decode", lambda *a, **k: decodes.append(1) or real_decode(*a, **k))
+    auth.verify_clerk_token(tok)
+    assert decodes == [1]
+
+
+def test_unknown_kid_refreshes_key_set_for_rotation(jwks):
+    old_key, old_jwk = _keypair("old")
+    new_key, new_jwk = _keypair("new")
+    jwks["keys"] = [old_jwk]
+    auth.verify_clerk_token(_token(old_key, "old"))
+    jwks["keys"] = [old_jwk, new_jwk]
+    auth._jwks_cache._fetched_at -= auth._JWKS_MISS_REFRESH_SEC  # past the miss throttle
+    assert auth.verify_clerk_token(_token(new_key, "new", sub="user_n")) == ("user_n", "t-1")
+    assert jwks["fetches"] == 2
+
+
+def test_bogus_kids_do_not_stampede_jwks(jwks):
+    key, jwk = _keypair("k1")
+    jwks["keys"] = [jwk]
+    auth.verify_clerk_token(_token(key, "k1"))
+    for i in range(5):
+        with pytest.raises(Exception) as exc:
+            auth.verify_clerk_token(_token(key, f"nope-{i}"))
+        assert getattr(exc.value, "status_code", None) == 401
+    assert jwks["fetches"] == 1
+
+
+def test_concurrent_cold_start_fetches_once(jwks):
+    key, jwk = _keypair("k1")
+    jwks["keys"] = [jwk]
+    jwks["delay"] = 0.05
+    tokens = [_token(key, "k1", sub=f"user_{i}") for i in range(8)]
+    results = []
+    threads = [
+        threading.Thread(target=lambda t=t: results.append(auth.verify_clerk_token(t)))
+        for t in tokens
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(results) == 8
+    assert jwks["fetches"] == 1
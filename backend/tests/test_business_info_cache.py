@@ -0,0 +1,114 @@
+"""get_business_info is cached per client_id and invalidated by config/tenant writes,
+locally and across workers via Redis pub/sub."""
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+import config_service
+import database
+
+RAW = {"business_name": "Shear Genius", "voice": "nova", "services": [{"name": "Cut"}]}
+TENANT = {"id": "tid-1", "client_id": "c1", "name": "Shear Genius", "business_vertical": "salon_chair"}
+
+
+@pytest.fixture
+def db(monkeypatch, tmp_path):
+    reads = {"config": 0, "tenant": 0}
+    state = {"raw": dict(RAW)}
+
+    def get_config(cid):
+        reads["config"] += 1
+        return dict(state["raw"])
+
+    def get_tenant(cid):
+        reads["tenant"] += 1
+        return dict(TENANT)
+
+    monkeypatch.setattr("runtime.USE_DB", True)
+    monkeypatch.setattr(config_service, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(database, "db_tenant_get_business_config", get_config)
+    monkeypatch.setattr(database, "db_tenant_get_by_client_id", get_tenant)
+    monkeypatch.delenv("REDIS_URL", raising=False)
+    database.set_request_client_id("c1")
+    yield {"reads": reads, "state": state}
+    database.set_request_client_id(None)
+
+
+def test_repeat_calls_read_config_once(db):
+    for _ in range(10):
+        assert config_service.get_business_info()["voice"] == "nova"
+    assert db["reads"] == {"config": 1, "tenant": 1}
+
+
+def test_callers_get_their_own_copy(db):
+    info = config_service.get_business_info()
+    info["voice"] = "alloy"
+    info["services"].append({"name": "Color"})
+    again = config_service.get_business_info()
+    assert again["voice"] == "nova"
+    assert [s["name"] for s in again["services"]] == ["Cut"]
+
+
+def test_save_invalidates(db, monkeypatch):
+    monkeypatch.setattr(database, "db_tenant_set_business_config", lambda cid, data: True)
+    config_service.get_business_info()
+    db["state"]["raw"] = {**RAW, "voice": "shimmer"}
+    config_service.save_raw_client_config("c1", db["state"]["raw"])
+    assert config_service.get_business_info()["voice"] == "shimmer"
+    assert db["reads"]["config"] == 2
+
+
+def test_tenant_row_change_by_id_invalidates(db):
+    config_service.get_business_info()
+    database._notify_tenant_changed(tenant_id="tid-other")
+    config_service.get_business_info()
+    assert db["reads"]["config"] == 1
+    database._notify_tenant_changed(tenant_id="tid-1")
+    config_service.get_business_info()
+    assert db["reads"]["config"] == 2
+
+
+def test_build_that_raced_a_write_is_not_stored(db, monkeypatch):
+    def get_config(cid):
+        db["reads"]["config"] += 1
+        # A settings save lands while this build is reading the old row.
+        config_service._invalidate_business_info_local(client_id="c1")
+        return dict(RAW)
+
+    monkeypatch.setattr(database, "db_tenant_get_business_config", get_config)
+    config_service.get_business_info()
+    config_service.get_business_info()
+    assert db["reads"]["config"] == 2
+
+
+def test_other_workers_invalidations_apply_and_ours_are_ignored(db):
+    config_service.get_business_info()
+    own = json.dumps({"client_id": "c1", "origin": config_service._INSTANCE_ID})
+    config_service._apply_config_invalidation_message(own)
+    config_service.get_business_info()
+    assert db["reads"]["config"] == 1
+    other = json.dumps({"client_id": "c1", "origin": "another-worker"})
+    config_service._apply_config_invalidation_message(other)
+    config_service.get_business_info()
+    assert db["reads"]["config"] == 2
+
+
+def test_invalidation_is_published_when_redis_configured(db, monkeypatch):
+    pub = MagicMock()
+    monkeypatch.setenv("REDIS_URL", "redis://localhost:6379/0")
+    monkeypatch.setattr(config_service, "_config_publisher", pub)
+    config_service.invalidate_business_info(client_id="c1")
+    channel, payload = pub.publish.call_args[0]
+    assert channel == config_service._CONFIG_CHANNEL
+    assert json.loads(payload)["client_id"] == "c1"
+
+
+def test_subscription_update_notifies_tenant_listeners(monkeypatch):
+    seen = []
+    monkeypatch.setattr(database, "_notify_tenant_changed", lambda **kw: seen.append(kw))
+    monkeypatch.setattr(database, "_get_conn", MagicMock())
+    assert database.db_tenant_update_subscription("tid-1", plan="growth", subscription_status="active")
+    assert seen == [{"tenant_id": "tid-1"}]
+    assert database.db_tenant_update_subscription("tid-1")  # nothing to write, nothing to notify
+    assert len(seen) == 1
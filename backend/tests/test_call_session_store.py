@@ -171,3 +171,58 @@ def test_redis_roundtrip():
     assert store.get(sid).get("booking_intent") is True
     store.cleanup_call(sid)
     assert not store.exists(sid)
+
+
+@pytest.mark.asyncio
+async def test_memory_async_api_matches_sync():
+    store = MemoryCallSessionStore()
+    store.create(SID_A, {"client_id": "t1"})
+    assert await store.aexists(SID_A)
+    assert await store.amerge_session(SID_A, {"booking_intent": True})
+    assert (await store.aget(SID_A))["booking_intent"] is True
+    assert await store.aincr_media_stream_gen(SID_A) == 1
+    assert await store.aget_media_stream_max_gen(SID_A) == 1
+    await store.aset_response_status(SID_A, {"status": "ready"})
+    assert (await store.apop_response_status(SID_A))["status"] == "ready"
+    assert await store.aget_response_status(SID_A) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not __import__("os").getenv("REDIS_URL"), reason="REDIS_URL not set")
+async def test_redis_async_roundtrip():
+    import os
+
+    store = RedisCallSessionStore(os.environ["REDIS_URL"])
+    sid = SID_REDIS
+    store.cleanup_call(sid)
+    store.create(sid, {"client_id": "redis-test", "conversation_history": []})
+    assert await store.aexists(sid)
+    assert await store.amerge_session(sid, {"booking_intent": True})
+    assert store.get(sid)["booking_intent"] is True
+    assert await store.aincr_media_stream_gen(sid) == 1
+    assert await store.aget_media_stream_max_gen(sid) == 1
+    async with store.utterance_lock(sid):
+        await store.aset_response_status(sid, {"status": "ready", "ai_text": "hi"})
+    assert (await store.wait_response_status(sid, 1.0))["ai_text"] == "hi"
+    assert (await store.apop_response_status(sid))["status"] == "ready"
+    store.cleanup_call(sid)
+    assert not await store.aexists(sid)
+
+
+@pytest.mark.asyncio
+async def test_async_persist_never_uses_the_blocking_api(monkeypatch):
+    from unittest.mock import AsyncMock, MagicMock
+
+    import runtime
+    import voice_service
+
+    store = MagicMock(spec=RedisCallSessionStore)
+    store.aexists = AsyncMock(return_value=True)
+    store.aget = AsyncMock(return_value={"client_id": "t1"})
+    store.asave = AsyncMock()
+    monkeypatch.setattr(runtime, "call_store", store)
+    await voice_service._apersist_call_session(SID_A)
+    store.asave.assert_awaited_once_with(SID_A, {"client_id": "t1"})
+    store.exists.assert_not_called()
+    store.get.assert_not_called()
+    store.save.assert_not_called()
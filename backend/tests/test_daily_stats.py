@@ -0,0 +1,131 @@
+"""daily_stats rollup: writers bump it in their own transaction, readers use O(days) rows."""
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+
+import pytest
+
+import database
+import runtime
+from routers import analytics
+
+
+@pytest.fixture(autouse=True)
+def _fresh_tz_cache(monkeypatch):
+    monkeypatch.setattr(database, "_tenant_tz_cache", {})
+
+
+def _rollup_call(cur):
+    for call in cur.execute.call_args_list:
+        if "INSERT INTO daily_stats" in call[0][0]:
+            return call[0]
+    return None
+
+
+def test_call_log_reappend_bumps_only_the_difference():
+    created = datetime(2026, 10, 17, 2, 30, tzinfo=timezone.utc)  # still the 16th in New York
+    with patch.object(database, "_get_conn") as mock_conn:
+        cur = mock_conn.return_value.cursor.return_value
+        cur.fetchone.side_effect = [
+            ("missed", 5),  # what the row already contributed
+            ("t1", "answered_by_ai", 60, created),
+            ("America/New_York",),
+        ]
+        database.db_call_log_append({"call_sid": "CA1", "outcome": "answered_by_ai", "duration_sec": 60})
+        sql, params = _rollup_call(cur)
+    assert "calls" not in sql.split("VALUES")[0]  # unchanged counters aren't touched
+    cols = sql.split("(client_id, day, ")[1].split(", bookings_by_source")[0].split(", ")
+    assert params[:2] == ["t1", date(2026, 10, 16)]
+    assert dict(zip(cols, params[2:])) == {"missed": -1, "answered": 1, "duration_sec": 55}
+    mock_conn.return_value.commit.assert_called_once()
+
+
+def test_rollup_failure_keeps_the_write():
+    with patch.object(database, "_get_conn") as mock_conn:
+        cur = mock_conn.return_value.cursor.return_value
+        cur.fetchone.side_effect = [(7, datetime.now(timezone.utc)), RuntimeError("tz lookup failed")]
+        out = database.db_appointments_insert(
+            {"client_id": "t1", "name": "Ana", "date": "2026-10-20", "source": "receptionist"}
+        )
+        stmts = [c[0][0] for c in cur.execute.call_args_list]
+    assert out["id"] == 7
+    assert "ROLLBACK TO SAVEPOINT daily_stats" in stmts
+    mock_conn.return_value.commit.assert_called_once()
+
+
+def test_booking_is_counted_under_its_source():
+    with patch.object(database, "_get_conn") as mock_conn:
+        cur = mock_conn.return_value.cursor.return_value
+        cur.fetchone.side_effect = [(7, datetime(2026, 10, 17, 18, tzinfo=timezone.utc)), ("UTC",)]
+        database.db_appointments_insert(
+            {"client_id": "t1", "name": "Ana", "date": "2026-10-20", "source": "receptionist"}
+        )
+        sql, params = _rollup_call(cur)
+    assert "jsonb_build_object" in sql and "jsonb_set" in sql
+    assert params == ["t1", date(2026, 10, 17), 1, "receptionist", 1, "receptionist", "receptionist", 1]
+
+
+def test_sms_append_counts_appended_messages():
+    added = [
+        {"role": "user", "content": "book me"},
+        {"role": "assistant", "content": "done"},
+        {"role": "assistant", "content": "see you"},
+    ]
+    with patch.object(database, "_get_conn") as mock_conn:
+        cur = mock_conn.return_value.cursor.return_value
+        cur.fetchone.side_effect = [("UTC",)]
+        database.db_sms_session_append("+14155550100", "t1", added)
+        sql, params = _rollup_call(cur)
+    cols = sql.split("(client_id, day, ")[1].split(", bookings_by_source")[0].split(", ")
+    assert dict(zip(cols, params[2:])) == {"sms_in": 1, "sms_out": 2}
+
+
+def test_org_metrics_read_rollup_not_call_log():
+    with patch.object(database, "_get_conn") as mock_conn:
+        cur = mock_conn.return_value.cursor.return_value
+        cur.fetchone.side_effect = [("America/Chicago",), ("UTC",)]
+        cur.fetchall.side_effect = [
+            [("a", 10, 2, 7, 8, 3, 1)],
+            [("a", 4)],
+            [("b", 2)],
+        ]
+        m = database.db_org_store_metrics(["a", "b"], days=7)
+        sql, params = cur.execute.call_args_list[2][0]
+    assert "FROM call_log" not in sql and "daily_stats" in sql
+    assert params["cids"] == ["a", "b"] and len(params["todays"]) == 2
+    assert m["a"] == {
+        "calls": 10, "missed": 2, "answered": 7, "bookings": 3,
+        "upcoming": 4, "unread_messages": 0, "prev_calls": 8, "prev_bookings": 1,
+    }
+    assert m["b"]["unread_messages"] == 2 and m["b"]["calls"] == 0
+
+
+def test_daily_endpoint_fills_quiet_days(monkeypatch):
+    monkeypatch.setattr(runtime, "USE_DB", True)
+    monkeypatch.setattr(analytics.deps, "_bind_tenant_db_context", lambda t: "t1")
+    monkeypatch.setattr(analytics.config_service, "get_business_info", lambda: {"timezone": "America/Denver"})
+    monkeypatch.setattr(analytics, "get_plan_limits", lambda t: {"call_log_days": 30})
+    today = datetime.now(ZoneInfo("America/Denver")).date()
+    seen = {}
+
+    def fake_range(cids, start, end):
+        seen.update(cids=cids, start=start, end=end)
+        return [{"client_id": "t1", "day": today.isoformat(), "calls": 4, "bookings": 1,
+                 "bookings_by_source": {"receptionist": 1}}]
+
+    monkeypatch.setattr(database, "db_daily_stats_range", fake_range)
+    out = analytics.get_analytics_daily(days=90, tenant={"client_id": "t1"})
+    assert seen["start"] == today - timedelta(days=29) and seen["end"] == today
+    assert len(out["days"]) == 30 and out["timezone"] == "America/Denver"
+    assert out["days"][0]["calls"] == 0 and out["days"][0]["bookings_by_source"] == {}
+    assert out["days"][-1]["calls"] == 4 and out["days"][-1]["bookings_by_source"] == {"receptionist": 1}
+
+
+def test_recording_callback_before_call_end_counts_the_call():
+    with patch.object(database, "_get_conn") as mock_conn:
+        cur = mock_conn.return_value.cursor.return_value
+        cur.fetchone.side_effect = [None, (datetime(2026, 10, 17, 12, tzinfo=timezone.utc),), ("UTC",)]
+        assert database.db_call_log_update_recording("CA9", "t1", recording_sid="RE1") is True
+        sql, params = _rollup_call(cur)
+    cols = sql.split("(client_id, day, ")[1].split(", bookings_by_source")[0].split(", ")
+    assert dict(zip(cols, params[2:])) == {"calls": 1}
@@ -0,0 +1,105 @@
+"""adb: awaitable db_* calls run on the bounded DB executor, off the event loop."""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import database
+
+
+@pytest.fixture
+def executor(monkeypatch):
+    ex = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db")
+    monkeypatch.setattr(database, "_use_db", True)
+    monkeypatch.setattr(database, "_db_executor", ex)
+    monkeypatch.setattr(
+        database,
+        "_db_executor_stats",
+        {"calls": 0, "queued": 0, "running": 0, "peak_queued": 0, "wait_ms_total": 0.0, "wait_ms_max": 0.0},
+    )
+    yield ex
+    ex.shutdown(wait=True)
+
+
+def test_adb_mirrors_every_scoped_db_function():
+    scoped = {n[3:] for n, o in vars(database).items() if n.startswith("db_") and getattr(o, "_db_scoped", False)}
+    exposed = {n for n in vars(database.AsyncDB) if not n.startswith("_")}
+    assert scoped == exposed
+    assert "tenant_get_by_phone" in exposed and "release_thread_connection" not in exposed
+    assert database.AsyncDB.tenant_get_by_phone.__doc__ == database.db_tenant_get_by_phone.__doc__
+
+
+def test_adb_call_runs_on_db_thread_with_the_callers_client_id(executor, monkeypatch):
+    seen = {}
+
+    def fake_total(client_id):
+        seen["thread"] = threading.current_thread().name
+        seen["ctx"] = database._client_id()
+        return 7
+
+    monkeypatch.setattr(database, "db_sms_messages_total", fake_total)
+
+    async def handler():
+        database.set_request_client_id("salon-a")
+        return await database.adb.sms_messages_total("salon-a")
+
+    assert asyncio.run(handler()) == 7
+    assert seen["ctx"] == "salon-a"
+    assert seen["thread"].startswith("db") and seen["thread"] != threading.current_thread().name
+    stats = database.db_executor_stats()
+    assert stats["calls"] == 1 and stats["queued"] == 0 and stats["running"] == 0
+
+
+def test_queue_depth_is_tracked_when_workers_are_busy(executor):
+    gate = threading.Event()
+
+    async def burst():
+        calls = [asyncio.ensure_future(database.run_db(gate.wait, 5)) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        during = database.db_executor_stats()
+        gate.set()
+        await asyncio.gather(*calls)
+        return during
+
+    during = asyncio.run(burst())
+    assert during["running"] == 1 and during["queued"] == 2
+    after = database.db_executor_stats()
+    assert after["peak_queued"] >= 2 and after["queued"] == 0 and after["wait_ms_max"] > 0
+
+
+def test_cancelling_a_queued_call_takes_it_off_the_queue(executor):
+    gate = threading.Event()
+    ran = []
+
+    async def cancel_one():
+        busy = asyncio.ensure_future(database.run_db(gate.wait, 5))
+        waiting = asyncio.ensure_future(database.run_db(ran.append, 1))
+        await asyncio.sleep(0.05)
+        waiting.cancel()
+        await asyncio.sleep(0)
+        during = database.db_executor_stats()
+        gate.set()
+        await busy
+        return during
+
+    during = asyncio.run(cancel_one())
+    assert during["queued"] == 0 and during["running"] == 1
+    assert ran == []
+    assert database.db_executor_stats()["queued"] == 0
+
+
+def test_errors_propagate_to_the_awaiting_handler(executor):
+    def boom():
+        raise ValueError("bad row")
+
+    with pytest.raises(ValueError, match="bad row"):
+        asyncio.run(database.run_db(boom))
+    assert database.db_executor_stats()["running"] == 0
+
+
+def test_no_database_runs_inline(monkeypatch):
+    monkeypatch.setattr(database, "_use_db", False)
+    monkeypatch.setattr(database, "_db_executor", None)
+    assert asyncio.run(database.run_db(threading.current_thread)) is threading.current_thread()
+    assert database._db_executor is None
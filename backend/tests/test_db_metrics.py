@@ -0,0 +1,100 @@
+"""DB instrumentation: per-function timings from _scoped, pool counters, slow-query log, /metrics."""
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+import database
+from main import app
+
+
+@pytest.fixture(autouse=True)
+def _fresh_metrics(monkeypatch):
+    monkeypatch.setattr(database, "_fn_metrics", {})
+    monkeypatch.setattr(database, "_pool_metrics", {k: 0 for k in database._pool_metrics})
+
+
+def test_scoped_call_records_wait_query_time_and_rows(monkeypatch):
+    monkeypatch.setattr(database, "_use_db", True)
+
+    def db_fake_lookup(boom=False):
+        database._record_checkout(0.02)
+        database._record_query("SELECT 1", 0.005, 3)
+        database._record_query("UPDATE x SET y = 1", 0.001, 0)
+        if boom:
+            raise RuntimeError("down")
+        return "ok"
+
+    fn = database._scoped(db_fake_lookup)
+    assert fn() == "ok"
+    with pytest.raises(RuntimeError):
+        fn(boom=True)
+    m = database.db_metrics_snapshot()["functions"]["db_fake_lookup"]
+    assert m["calls"] == 2 and m["errors"] == 1 and m["rows"] == 6
+    assert m["checkout_wait_seconds"] == pytest.approx(0.04)
+    assert m["query_seconds"] == pytest.approx(0.012)
+    assert m["seconds"] >= 0
+
+
+def test_nested_calls_count_toward_the_outermost_function(monkeypatch):
+    monkeypatch.setattr(database, "_use_db", True)
+    inner = database._scoped(lambda: database._record_query("SELECT 1", 0.001, 1))
+
+    def db_outer():
+        inner()
+        inner()
+
+    database._scoped(db_outer)()
+    fns = database.db_metrics_snapshot()["functions"]
+    assert list(fns) == ["db_outer"] and fns["db_outer"]["rows"] == 2
+
+
+def test_slow_query_is_logged_without_parameters(monkeypatch, caplog):
+    monkeypatch.setattr(database, "_SLOW_QUERY_MS", 100.0)
+    with caplog.at_level(logging.WARNING, logger="nuvatra"):
+        database._record_query(b"SELECT *\n  FROM appointments WHERE phone_digits = %s", 0.25, 1)
+        database._record_query("SELECT 1", 0.01, 1)
+    slow = [r.getMessage() for r in caplog.records if "db_slow_query" in r.getMessage()]
+    assert len(slow) == 1
+    assert "ms=250.0" in slow[0] and "FROM appointments WHERE phone_digits = %s" in slow[0]
+    assert database.db_metrics_snapshot()["pool"]["slow_queries"] == 1
+
+
+def test_checkout_waits_timeouts_and_preping_discards(monkeypatch):
+    dead, live = MagicMock(closed=False), MagicMock(closed=False)
+    dead.cursor.return_value.execute.side_effect = Exception("server closed the connection")
+    pool = MagicMock(maxconn=4, _used={1: live}, _pool=[object(), object()])
+    pool.getconn.side_effect = [dead, live]
+    monkeypatch.setattr(database, "_use_db", True)
+    monkeypatch.setattr(database, "_ensure_pool", lambda: pool)
+    monkeypatch.setattr(database, "_pool", pool)
+    monkeypatch.setattr(database._thread_local, "conn", None, raising=False)
+    assert database._get_conn() is live
+    database._thread_local.conn = None
+
+    empty = MagicMock()
+    empty.getconn.side_effect = Exception("connection pool exhausted")
+    monkeypatch.setattr(database, "_POOL_WAIT_SECONDS", 0)
+    with pytest.raises(Exception):
+        database._getconn_waiting(empty)
+
+    stats = database.db_metrics_snapshot()["pool"]
+    assert stats["checkouts"] == 2 and stats["preping_discards"] == 1 and stats["checkout_timeouts"] == 1
+    assert (stats["max"], stats["in_use"], stats["idle"]) == (4, 1, 2)
+
+
+def test_metrics_endpoint_is_prometheus_text_behind_the_token(monkeypatch):
+    database._record_call("db_tenant_get_by_phone", 0.5, True)
+    client = TestClient(app)
+    monkeypatch.delenv("METRICS_TOKEN", raising=False)
+    assert client.get("/metrics", headers={"Authorization": "Bearer x"}).status_code == 404
+    monkeypatch.setenv("METRICS_TOKEN", "scrape-secret")
+    assert client.get("/metrics", headers={"Authorization": "Bearer nope"}).status_code == 404
+    resp = client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+    assert resp.status_code == 200 and resp.headers["content-type"].startswith("text/plain")
+    body = resp.text
+    assert "# TYPE nuvatra_db_calls_total counter" in body
+    assert 'nuvatra_db_calls_total{fn="db_tenant_get_by_phone"} 1' in body
+    assert 'nuvatra_db_pool_connections{state="in_use"}' in body
+    assert "nuvatra_db_executor_queued 0" in body
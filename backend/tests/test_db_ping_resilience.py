@@ -75,3 +75,51 @@ def test_get_conn_returns_none_when_all_pool_connections_stale(monkeypatch):
         assert database._get_conn() is None
     finally:
         database._thread_local.conn = None
+
+
+def test_get_conn_skips_preping_for_a_recently_used_connection(monkeypatch):
+    recent = MagicMock(closed=False, last_used=database._time.monotonic())
+    pool = MagicMock()
+    pool.getconn.return_value = recent
+
+    monkeypatch.setattr(database, "_use_db", True)
+    monkeypatch.setattr(database, "_ensure_pool", lambda: pool)
+    monkeypatch.setattr(database, "_PREPING_IDLE_SECONDS", 30.0)
+    database._thread_local.conn = None
+    try:
+        assert database._get_conn() is recent
+        recent.cursor.assert_not_called()
+    finally:
+        database._thread_local.conn = None
+
+
+def test_get_conn_prepings_a_connection_idle_past_the_threshold(monkeypatch):
+    idle = MagicMock(closed=False, last_used=database._time.monotonic() - 60)
+    pool = MagicMock()
+    pool.getconn.return_value = idle
+
+    monkeypatch.setattr(database, "_use_db", True)
+    monkeypatch.setattr(database, "_ensure_pool", lambda: pool)
+    monkeypatch.setattr(database, "_PREPING_IDLE_SECONDS", 30.0)
+    database._thread_local.conn = None
+    try:
+        assert database._get_conn() is idle
+        idle.cursor.return_value.execute.assert_called_once_with("SELECT 1")
+    finally:
+        database._thread_local.conn = None
+
+
+def test_scope_exit_skips_rollback_on_an_idle_connection_and_stamps_it(monkeypatch):
+    from psycopg2.extensions import TRANSACTION_STATUS_IDLE, TRANSACTION_STATUS_INTRANS
+
+    pool = MagicMock()
+    monkeypatch.setattr(database, "_ensure_pool", lambda: pool)
+    for status, rolled_back in ((TRANSACTION_STATUS_IDLE, False), (TRANSACTION_STATUS_INTRANS, True)):
+        conn = MagicMock(closed=False)
+        conn.info.transaction_status = status
+        database._thread_local.conn = conn
+        database._conn_scope_exit()
+        assert conn.rollback.called is rolled_back
+        assert isinstance(conn.last_used, float)
+        pool.putconn.assert_called_with(conn)
+    assert database._thread_local.conn is None
@@ -90,3 +90,46 @@ def test_chat_routes_gpt_to_openai(monkeypatch):
     assert kwargs["model"] == "gpt-4o"
     assert kwargs["max_tokens"] == 120
     assert kwargs["temperature"] == 0
+
+
+def test_chat_stream_openai_yields_deltas(monkeypatch):
+    def chunk(text):
+        return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+
+    fake_client = MagicMock()
+    fake_client.chat.completions.create.return_value = iter(
+        [chunk("Sure"), chunk(None), SimpleNamespace(choices=[]), chunk(", one sec.")]
+    )
+    monkeypatch.setattr(llm_provider.runtime, "client", fake_client)
+
+    out = list(
+        llm_provider.chat_stream(
+            model="gpt-4o-mini", messages=[{"role": "user", "content": "hi"}], max_tokens=200
+        )
+    )
+    assert out == ["Sure", ", one sec."]
+    assert fake_client.chat.completions.create.call_args[1]["stream"] is True
+
+
+def test_chat_stream_routes_claude_to_anthropic_text_stream(monkeypatch):
+    stream = MagicMock()
+    stream.__enter__.return_value = SimpleNamespace(text_stream=iter(["Our hours ", "are 9 to 5."]))
+    fake_client = MagicMock()
+    fake_client.messages.stream.return_value = stream
+    monkeypatch.setattr(llm_provider, "_anthropic_client", fake_client)
+    monkeypatch.setattr(
+        llm_provider.runtime, "client", MagicMock(side_effect=AssertionError)
+    )
+
+    out = "".join(
+        llm_provider.chat_stream(
+            model="claude-haiku-4-5",
+            messages=[{"role": "system", "content": "sys"}, {"role": "user", "content": "hours?"}],
+            max_tokens=200,
+            temperature=0.8,
+        )
+    )
+    assert out == "Our hours are 9 to 5."
+    kwargs = fake_client.messages.stream.call_args[1]
+    assert kwargs["system"] == "sys"
+    assert kwargs["messages"] == [{"role": "user", "content": "hours?"}]
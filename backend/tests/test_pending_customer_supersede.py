@@ -23,8 +23,8 @@ def test_supersede_cancels_pending_customer_same_slot():
     updated = []
 
     with patch("runtime.USE_DB", True), patch.object(
-        booking_service, "_appointment_rows_for_calendar_merge", return_value=rows
-    ), patch.object(database, "db_appointments_update", side_effect=lambda aid, **kw: updated.append((aid, kw))), patch.object(
+        database, "db_appointments_in_date_range", return_value=rows
+    ) as in_range, patch.object(database, "db_appointments_update", side_effect=lambda aid, **kw: updated.append((aid, kw))), patch.object(
         booking_service, "release_slot"
     ), patch.object(database, "_client_id", return_value="test"):
         n = main._supersede_pending_customer_drafts_for_slot(
@@ -35,6 +35,7 @@ def test_supersede_cancels_pending_customer_same_slot():
             phone="+15551110000",
         )
     assert n == 1
+    in_range.assert_called_once_with("2026-06-01", "2026-06-01", client_id="test")
     assert updated[0][0] == 9
     assert updated[0][1]["status"] == "cancelled"
 
@@ -53,8 +54,8 @@ def test_supersede_cancels_pending_review_receptionist_same_caller():
     ]
     updated = []
     with patch("runtime.USE_DB", True), patch.object(
-        booking_service, "_appointment_rows_for_calendar_merge", return_value=rows
-    ), patch.object(database, "db_appointments_update", side_effect=lambda aid, **kw: updated.append((aid, kw))), patch.object(
+        database, "db_appointments_in_date_range", return_value=rows
+    ) as in_range, patch.object(database, "db_appointments_update", side_effect=lambda aid, **kw: updated.append((aid, kw))), patch.object(
         booking_service, "release_slot"
     ), patch.object(database, "_client_id", return_value="test"):
         n = main._supersede_pending_customer_drafts_for_slot(
@@ -81,8 +82,8 @@ def test_supersede_skips_manual_pending_review():
         }
     ]
     with patch("runtime.USE_DB", True), patch.object(
-        booking_service, "_appointment_rows_for_calendar_merge", return_value=rows
-    ), patch.object(database, "db_appointments_update") as upd:
+        database, "db_appointments_in_date_range", return_value=rows
+    ) as in_range, patch.object(database, "db_appointments_update") as upd:
         n = main._supersede_pending_customer_drafts_for_slot(
             "2026-06-01",
             "14:00",
@@ -0,0 +1,52 @@
+"""Appointment phone lookups narrow through the indexed phone_digits column, then recheck
+the full digits so numbers that differ only in country code do not match."""
+import re
+from unittest.mock import patch
+
+import pytest
+
+import database
+
+LOOKUPS = [
+    lambda: database.db_appointments_get_pending_by_phone("+1 (415) 555-0100"),
+    lambda: database.db_appointments_get_by_phone_for_sms("+1 (415) 555-0100", client_id="t1"),
+    lambda: database.db_appointments_get_active_for_sms_context("+1 (415) 555-0100", client_id="t1"),
+    lambda: database.db_appointments_latest_identity_for_phone("+1 (415) 555-0100", client_id="t1"),
+    lambda: database.db_appointments_update_active_name_by_phone("+1 (415) 555-0100", client_id="t1", name="Ana"),
+]
+
+
+def _stored_matches(stored_phone: str, caller_digits: str) -> bool:
+    """Python mirror of the lookup predicate (prefilter plus full-digit recheck)."""
+    digits = re.sub(r"[^0-9]", "", stored_phone or "")
+    if digits[-10:] != caller_digits[-10:]:
+        return False
+    return digits == caller_digits or digits == caller_digits[-10:]
+
+
+@pytest.mark.parametrize("lookup", LOOKUPS)
+def test_phone_lookup_narrows_on_phone_digits_then_rechecks_full_digits(lookup):
+    with patch.object(database, "_get_conn") as mock_conn:
+        cur = mock_conn.return_value.cursor.return_value
+        cur.fetchone.return_value = None
+        cur.fetchall.return_value = []
+        cur.rowcount = 0
+        lookup()
+        sql, params = cur.execute.call_args[0]
+    assert "phone_digits = right(%s, 10)" in sql
+    assert "regexp_replace(COALESCE(phone,''), '[^0-9]', '', 'g') = %s" in sql
+    assert "regexp_replace(COALESCE(phone,''), '[^0-9]', '', 'g') = right(%s, 10)" in sql
+    assert params.count("14155550100") == 3
+
+
+@pytest.mark.parametrize(
+    "stored, caller, expected",
+    [
+        ("+1 415 555 0100", "14155550100", True),
+        ("(415) 555-0100", "14155550100", True),
+        ("+44 415 555 0100", "14155550100", False),
+        ("+1 415 555 0100", "444155550100", False),
+    ],
+)
+def test_numbers_differing_only_in_country_code_do_not_match(stored, caller, expected):
+    assert _stored_matches(stored, caller) is expected
@@ -0,0 +1,102 @@
+"""Redis sessions as hash + history list: saves send only what changed since this worker
+last synced the call, and merges are a single atomic script."""
+import json
+import os
+from collections import OrderedDict
+
+import pytest
+
+import voice.call_session_store as css
+from voice.call_sid import SAMPLE_CALL_SID
+
+SID = SAMPLE_CALL_SID
+HIST = [{"role": "user", "content": "hi"}, {"role": "assistant", "content": "Hello!"}]
+
+
+def _planner():
+    store = css.RedisCallSessionStore.__new__(css.RedisCallSessionStore)
+    store._synced = OrderedDict()
+    return store
+
+
+def _synced_from(store, data):
+    fields = css._encode_fields(data)
+    hist = [json.dumps(m) for m in data["conversation_history"]]
+    store._decode_and_remember(SID, fields, hist)
+
+
+def test_fields_round_trip_and_empty_history_is_kept():
+    data = {"client_id": "t1", "forward_unavailable": False, "conversation_history": []}
+    fields = css._encode_fields(data)
+    assert css._decode_session(fields, []) == data
+    assert css._decode_session(css._encode_fields({}), []) == {}
+    assert css._decode_session({}, []) is None
+
+
+def test_save_after_a_turn_sends_only_the_delta():
+    store = _planner()
+    before = {"client_id": "t1", "respond_poll_count": 2, "conversation_history": list(HIST)}
+    _synced_from(store, before)
+    after = {
+        "client_id": "t1",
+        "respond_poll_count": 0,
+        "conversation_history": HIST + [{"role": "user", "content": "Book me in"}],
+    }
+    args, state = store._plan_save(SID, after)
+    ttl, mode, expected_len, expected_last, n_set, n_del, *rest = args
+    assert (mode, expected_len, expected_last) == ("append", 2, json.dumps(HIST[-1]))
+    assert (n_set, n_del) == (1, 0)
+    assert rest == ["respond_poll_count", "0", json.dumps(after["conversation_history"][-1])]
+    assert state.hist_len == 3
+
+
+def test_rewritten_history_or_unknown_call_goes_full():
+    store = _planner()
+    args, _ = store._plan_save(SID, {"conversation_history": list(HIST)})
+    assert args[1] == "full"
+    _synced_from(store, {"conversation_history": list(HIST)})
+    args, _ = store._plan_save(SID, {"conversation_history": [{"role": "user", "content": "new"}]})
+    assert args[1] == "full"
+
+
+def test_removed_field_is_deleted_in_the_delta():
+    store = _planner()
+    _synced_from(store, {"client_id": "t1", "pending_booking": {"x": 1}, "conversation_history": []})
+    args, _ = store._plan_save(SID, {"client_id": "t1", "conversation_history": []})
+    assert args[1] == "append"
+    assert args[4:] == [0, 1, "pending_booking"]
+
+
+def test_oversize_save_is_rejected():
+    store = _planner()
+    big = [{"role": "user", "content": "x" * 1000}] * (css.MAX_SESSION_JSON_BYTES // 1000)
+    with pytest.raises(ValueError):
+        store._plan_save(SID, {"conversation_history": big})
+
+
+@pytest.mark.skipif(not os.getenv("REDIS_URL"), reason="REDIS_URL not set")
+def test_redis_hash_layout_merge_and_legacy_conversion():
+    store = css.RedisCallSessionStore(os.environ["REDIS_URL"])
+    store.cleanup_call(SID)
+    store.create(SID, {"client_id": "t1", "conversation_history": list(HIST)})
+    assert store._redis.type(f"call:{SID}") == "hash"
+    assert store._redis.llen(f"call:{SID}:hist") == 2
+    assert store.merge_session(SID, {"booking_intent": True})
+    assert store.incr_media_stream_gen(SID) == 1
+    data = store.get(SID)
+    assert data == {
+        "client_id": "t1",
+        "booking_intent": True,
+        "media_stream_gen": 1,
+        "conversation_history": HIST,
+    }
+    store.cleanup_call(SID)
+    assert not store.merge_session(SID, {"x": 1})
+
+    # A session written by the previous (JSON string) layout is read and converted.
+    store._redis.set(f"call:{SID}", json.dumps({"client_id": "old"}), ex=60)
+    assert store.get(SID) == {"client_id": "old"}
+    assert store.merge_session(SID, {"x": 1})
+    assert store._redis.type(f"call:{SID}") == "hash"
+    assert store.get(SID) == {"client_id": "old", "x": 1}
+    store.cleanup_call(SID)
@@ -0,0 +1,206 @@
+"""wait_response_status wakes on the status write itself (no polling) — memory store via
+per-call events, Redis via a per-call ready token — for the bidi reply wait and /respond."""
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+import config_service
+import deps
+import runtime
+import voice_service
+from voice.call_sid import SAMPLE_CALL_SID
+from voice.call_session_store import (
+    MemoryCallSessionStore,
+    RedisCallSessionStore,
+    reset_call_session_store_for_tests,
+)
+
+SID = SAMPLE_CALL_SID
+
+
+@pytest.fixture(autouse=True)
+def _fresh_memory_store():
+    reset_call_session_store_for_tests(MemoryCallSessionStore())
+    yield
+
+
+@pytest.mark.asyncio
+async def test_memory_wait_wakes_on_ready_write():
+    store = MemoryCallSessionStore()
+    store.response_status[SID] = {"status": "pending"}
+
+    async def brain():
+        await asyncio.sleep(0.01)
+        store.response_status[SID] = {"status": "pending"}  # not final: keep waiting
+        await asyncio.sleep(0.01)
+        store.response_status[SID] = {"status": "ready", "ai_text": "Hi!"}
+
+    task = asyncio.create_task(brain())
+    started = time.monotonic()
+    st = await store.wait_response_status(SID, 5.0)
+    assert st == {"status": "ready", "ai_text": "Hi!"}
+    assert time.monotonic() - started < 1.0
+    await task
+    assert not store._status_waiters._by_sid
+
+
+@pytest.mark.asyncio
+async def test_memory_wait_times_out_and_honours_statuses():
+    store = MemoryCallSessionStore()
+    store.set_response_status(SID, {"status": "error"})
+    assert await store.wait_response_status(SID, 0.05, statuses=frozenset({"ready"})) is None
+    assert (await store.wait_response_status(SID, 0.05))["status"] == "error"
+
+
+@pytest.mark.asyncio
+async def test_memory_wait_wakes_on_write_from_another_thread():
+    store = MemoryCallSessionStore()
+    timer = threading.Timer(0.02, store.set_response_status, (SID, {"status": "forward"}))
+    timer.start()
+    st = await store.wait_response_status(SID, 5.0)
+    timer.join()
+    assert st["status"] == "forward"
+
+
+class _FakeRedis:
+    """Just enough of redis-py for the response-status keys (blocking BLPOP included)."""
+
+    def __init__(self):
+        self.kv = {}
+        self.lists = {}
+        self.blpops = 0
+        self._cond = threading.Condition()
+
+    def get(self, key):
+        return self.kv.get(key)
+
+    def set(self, key, value, ex=None):
+        self.kv[key] = value
+
+    def expire(self, key, ttl):
+        pass
+
+    def delete(self, *keys):
+        with self._cond:
+            for k in keys:
+                self.kv.pop(k, None)
+                self.lists.pop(k, None)
+
+    def rpush(self, key, value):
+        with self._cond:
+            self.lists.setdefault(key, []).append(value)
+            self._cond.notify_all()
+
+    def blpop(self, keys, timeout=0):
+        self.blpops += 1
+        with self._cond:
+            self._cond.wait_for(lambda: any(self.lists.get(k) for k in keys), timeout=timeout)
+            for k in keys:
+                if self.lists.get(k):
+                    return k, self.lists[k].pop(0)
+        return None
+
+    def pipeline(self):
+        redis = self
+
+        class _Pipe:
+            def __init__(self):
+                self.ops = []
+
+            def __getattr__(self, name):
+                return lambda *a, **kw: self.ops.append((name, a, kw))
+
+            def execute(self):
+                return [getattr(redis, n)(*a, **kw) for n, a, kw in self.ops]
+
+        return _Pipe()
+
+
+class _FakeAsyncRedis:
+    """redis.asyncio face of the same fake: awaitable commands, BLPOP off the loop."""
+
+    def __init__(self, sync: _FakeRedis):
+        self._sync = sync
+
+    def __getattr__(self, name):
+        fn = getattr(self._sync, name)
+
+        async def call(*a, **kw):
+            if name == "blpop":
+                return await asyncio.to_thread(fn, *a, **kw)
+            return fn(*a, **kw)
+
+        return call
+
+    def pipeline(self, transaction=True):
+        pipe = self._sync.pipeline()
+        run = pipe.execute
+
+        async def execute():
+            return run()
+
+        pipe.__dict__["execute"] = execute
+        return pipe
+
+
+def _redis_store():
+    store = RedisCallSessionStore.__new__(RedisCallSessionStore)
+    store._redis = _FakeRedis()
+    store._aredis = _FakeAsyncRedis(store._redis)
+    store._aredis_loop = None
+    store._async_client = lambda: store._aredis
+    return store
+
+
+@pytest.mark.asyncio
+async def test_redis_wait_wakes_on_ready_token():
+    store = _redis_store()
+    store.set_response_status(SID, {"status": "pending"})
+    assert not store._redis.lists  # pending writes leave no token
+
+    loop = asyncio.get_running_loop()
+    loop.call_later(0.05, store.set_response_status, SID, {"status": "ready", "ai_text": "Yes"})
+    started = time.monotonic()
+    st = await store.wait_response_status(SID, 5.0)
+    assert st["ai_text"] == "Yes"
+    assert time.monotonic() - started < 0.9  # well inside one BLPOP slice
+    store.pop_response_status(SID)
+    assert not store._redis.lists.get(store._resp_ready_key(SID))
+
+
+@pytest.mark.asyncio
+async def test_redis_wait_returns_immediately_when_already_settled():
+    store = _redis_store()
+    store.set_response_status(SID, {"status": "forward", "forwarding_phone": "+15550100"})
+    st = await store.wait_response_status(SID, 5.0)
+    assert st["status"] == "forward"
+    assert store._redis.blpops == 0
+
+
+def test_respond_holds_a_pending_reply_until_it_is_ready(monkeypatch):
+    monkeypatch.delenv("TWILIO_AUTH_TOKEN", raising=False)
+    import main
+
+    monkeypatch.setattr(deps, "_validate_twilio_webhook", lambda _r, _d: True)
+    monkeypatch.setattr(voice_service, "_voice_stt_use_deepgram", lambda: False)
+    monkeypatch.setattr(config_service, "get_business_info", lambda: {"forwarding_phone": ""})
+    main.active_calls[SID] = {"client_id": "default", "conversation_history": [], "detected_language": "English"}
+    main.response_status[SID] = {"status": "pending"}
+    ready = {"status": "ready", "audio_url": "https://voice.example.test/reply.mp3"}
+
+    store = runtime.call_store
+    original = store.wait_response_status
+
+    async def wait_and_deliver(call_sid, timeout, **kw):
+        asyncio.get_running_loop().call_later(0.02, store.response_status.__setitem__, call_sid, ready)
+        return await original(call_sid, timeout, **kw)
+
+    monkeypatch.setattr(store, "wait_response_status", wait_and_deliver)
+    resp = TestClient(main.app).post("/api/phone/respond", data={"CallSid": SID})
+    assert resp.status_code == 200
+    assert "https://voice.example.test/reply.mp3" in resp.text
+    assert "filler-audio" not in resp.text
+    assert SID not in main.response_status
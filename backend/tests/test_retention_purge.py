@@ -0,0 +1,72 @@
+"""Retention purge: bounded batches with progress in cron_runs, and whole-partition drops."""
+import json
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import database
+
+
+def _statements(cur):
+    return [c[0][0] for c in cur.execute.call_args_list]
+
+
+def test_batched_purge_commits_each_chunk_and_reports_progress():
+    with patch.object(database, "_get_conn") as mock_conn:
+        conn = mock_conn.return_value
+        cur = conn.cursor.return_value
+        cur.fetchone.return_value = ("r",)  # no table is partitioned
+        # audit_events: two full batches then an empty one; call_log: short; sms_*: none.
+        type(cur).rowcount = PropertyMock(side_effect=[100, 100, 0, 40, 0, 0])
+        out = database.db_retention_purge(days=30, batch_size=100, run_id=7)
+    assert out == {"audit_events": 200, "call_log": 40, "sms_sessions": 0, "sms_messages": 0}
+    deletes = [s for s in _statements(cur) if s.startswith("DELETE")]
+    assert len(deletes) == 6 and all("LIMIT %s" in s for s in deletes)
+    assert "ctid IN" in deletes[-2] and "id IN" in deletes[0]
+    # A live thread's messages stay; only those whose session has gone are purged.
+    assert "FROM sms_sessions s" in deletes[-1]
+    progress = [c[0][1] for c in cur.execute.call_args_list if c[0][0].startswith("UPDATE cron_runs")]
+    assert len(progress) == 6 and progress[0][1] == 7
+    assert json.loads(progress[-1][0])["deleted"]["audit_events"] == 200
+    assert conn.commit.call_count >= 5
+
+
+def test_unbatched_purge_is_one_statement_per_table():
+    with patch.object(database, "_get_conn") as mock_conn:
+        cur = mock_conn.return_value.cursor.return_value
+        cur.fetchone.return_value = ("r",)
+        type(cur).rowcount = PropertyMock(return_value=3)
+        out = database.db_retention_purge(days=30)
+    deletes = [s for s in _statements(cur) if s.startswith("DELETE")]
+    assert len(deletes) == 4 and not any("LIMIT" in s for s in deletes)
+    assert out == {"audit_events": 3, "call_log": 3, "sms_sessions": 3, "sms_messages": 3}
+
+
+def test_expired_unheld_partitions_are_dropped_whole():
+    cur = MagicMock()
+    type(cur).rowcount = PropertyMock(return_value=0)
+    bounds = [
+        ("call_log_legacy", "FOR VALUES FROM (MINVALUE) TO ('2020-02-01 00:00:00+00')"),
+        ("call_log_p202003", "FOR VALUES FROM ('2020-03-01 00:00:00+00') TO ('2020-04-01 00:00:00+00')"),
+        ("call_log_p209901", "FOR VALUES FROM ('2099-01-01 00:00:00+00') TO ('2099-02-01 00:00:00+00')"),
+        ("call_log_default", "DEFAULT"),
+    ]
+
+    def fetchone():
+        sql = cur.execute.call_args[0][0]
+        if "relkind" in sql:
+            table = cur.execute.call_args[0][1][0]
+            return ("p",) if table == "call_log" else ("r",)
+        if "legal_holds" in sql:
+            return (1,) if "call_log_p202003" in sql else None  # a held tenant has rows there
+        return None
+
+    cur.fetchone.side_effect = fetchone
+    cur.fetchall.return_value = bounds
+    with patch.object(database, "_get_conn") as mock_conn:
+        mock_conn.return_value.cursor.return_value = cur
+        out = database.db_retention_purge(days=365, batch_size=500)
+    stmts = _statements(cur)
+    assert "ALTER TABLE call_log DETACH PARTITION call_log_legacy" in stmts
+    assert "DROP TABLE call_log_legacy" in stmts
+    assert not any("call_log_p202003" in s and "DETACH" in s for s in stmts)
+    assert not any("call_log_p209901" in s and "DETACH" in s for s in stmts)
+    assert out["partitions"] == ["call_log_legacy"]
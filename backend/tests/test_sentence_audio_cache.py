@@ -0,0 +1,184 @@
+"""Sentence-level TTS audio cache: replies reuse audio for sentences already synthesized,
+on both the mp3 (<Play>) and μ-law (bidi stream) paths, with per-tenant hit counters."""
+from voice import sentence_audio_cache as sac
+from voice.speech_segmenter import split_sentences
+from voice.streaming_audio import MULAW_FRAME_BYTES
+
+
+def _fake_synth(calls):
+    def synth(sentence):
+        calls.append(sentence)
+        return b"ID3\x03\x00\x00\x00\x00\x00\x02ab" + sentence.encode()
+
+    return synth
+
+
+def test_split_sentences_keeps_whole_sentences():
+    assert split_sentences("Hi there! What time works best for you?") == [
+        "Hi there!",
+        "What time works best for you?",
+    ]
+    assert split_sentences("   ") == []
+
+
+def test_key_normalizes_whitespace_and_separates_voice_speed_instructions():
+    k = sac.sentence_key("What  time\nworks?", "fable", 1.0, "tts-1")
+    assert k == sac.sentence_key("What time works?", "fable", 1.0, "tts-1")
+    assert k != sac.sentence_key("What time works?", "nova", 1.0, "tts-1")
+    assert k != sac.sentence_key("What time works?", "fable", 1.1, "tts-1")
+    assert k != sac.sentence_key("What time works?", "fable", 1.0, "tts-1", "warm tone")
+
+
+def test_reply_mp3_synthesizes_only_novel_sentences_and_strips_inner_id3():
+    calls = []
+    synth = _fake_synth(calls)
+    audio, hits, misses = sac.reply_mp3(
+        "Thanks for calling. How can I help?", synth, voice="fable", speed=1.0, model="tts-1", tenant="t1"
+    )
+    assert (hits, misses) == (0, 2)
+    # Only the first part keeps its ID3 tag, so the parts play as one mp3 stream.
+    assert audio == b"ID3\x03\x00\x00\x00\x00\x00\x02abThanks for calling.How can I help?"
+
+    calls.clear()
+    audio2, hits, misses = sac.reply_mp3(
+        "Sure thing. How can I help?", synth, voice="fable", speed=1.0, model="tts-1", tenant="t2"
+    )
+    assert calls == ["Sure thing."]
+    assert (hits, misses) == (1, 1)
+    assert audio2.endswith(b"Sure thing.How can I help?")
+
+    stats = sac.sentence_cache_stats()
+    assert stats["entries"] == 3
+    assert stats["tenants"]["t1"]["hit_rate"] == 0.0
+    assert stats["tenants"]["t2"]["hits"] == 1
+    assert stats["tenants"]["t2"]["hit_rate"] == 0.5
+
+
+def test_ulaw_frames_replay_from_cache_and_skip_interrupted_sentences():
+    streamed = []
+
+    def stream(sentence, voice, *, model, speed):
+        streamed.append(sentence)
+        for _ in range(3):
+            yield bytes([len(streamed)]) * MULAW_FRAME_BYTES
+
+    text = "One moment. Let me check."
+    first = list(sac.iter_reply_ulaw_frames(text, stream, voice="fable", speed=1.0, model="tts-1"))
+    assert len(first) == 6 and streamed == ["One moment.", "Let me check."]
+
+    again = list(sac.iter_reply_ulaw_frames(text, stream, voice="fable", speed=1.0, model="tts-1"))
+    assert again == first and len(streamed) == 2
+    assert all(len(f) == MULAW_FRAME_BYTES for f in again)
+
+    # Barge-in: the consumer stops mid-sentence, so that partial audio is never cached.
+    gen = sac.iter_reply_ulaw_frames("Brand new sentence.", stream, voice="fable", speed=1.0, model="tts-1")
+    next(gen)
+    gen.close()
+    assert sac.get_ulaw(sac.sentence_key("Brand new sentence.", "fable", 1.0, "tts-1")) is None
+
+
+def test_cache_is_byte_bounded(monkeypatch):
+    monkeypatch.setattr(sac, "_MAX_BYTES", 100)
+    for i in range(5):
+        sac.put_mp3(sac.sentence_key(f"s{i}.", "fable", 1.0, "tts-1"), b"x" * 40)
+    stats = sac.sentence_cache_stats()
+    assert stats["bytes"] <= 100 and stats["entries"] == 2 and stats["evictions"] == 3
+    assert sac.get_mp3(sac.sentence_key("s4.", "fable", 1.0, "tts-1")) is not None
+    assert sac.get_mp3(sac.sentence_key("s0.", "fable", 1.0, "tts-1")) is None
+
+
+def test_strip_id3_leaves_malformed_headers_alone():
+    assert sac._strip_id3(b"ID3\x03\x00\x00\x80\x00\x00\x00rest") == b"ID3\x03\x00\x00\x80\x00\x00\x00rest"
+    assert sac._strip_id3(b"\xff\xfbframe") == b"\xff\xfbframe"
+
+
+def test_streamed_tts_audio_relays_chunks_and_tees_into_both_caches(monkeypatch):
+    from unittest.mock import MagicMock, patch
+
+    from fastapi.testclient import TestClient
+
+    import runtime
+    from main import app
+    from routers import phone as phone_router
+
+    requested = []
+
+    class _Streamed:
+        def __init__(self, text):
+            self._text = text
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        async def iter_bytes(self, chunk_size=None):
+            yield b"ID3\x03\x00\x00\x00\x00\x00\x00"
+            yield self._text.encode()
+
+    def create(*, model, voice, input, speed):
+        requested.append(input)
+        return _Streamed(input)
+
+    fake = MagicMock()
+    fake.audio.speech.with_streaming_response.create = create
+    monkeypatch.setenv("VOICE_TTS_AUDIO_STREAM", "1")
+    monkeypatch.setattr(runtime, "async_client", fake)
+    phone_router._TTS_AUDIO_CACHE.clear()
+    client = TestClient(app)
+    with patch("runtime.client") as sync_client:
+        resp = client.get("/api/phone/tts-audio", params={"text": "Hi there. See you soon.", "voice": "fable"})
+        assert not sync_client.audio.speech.create.called
+    assert resp.status_code == 200
+    assert "content-length" not in resp.headers  # chunked, not buffered
+    assert len(requested) == 2
+    # One leading ID3 tag; the second sentence's tag is dropped mid-stream.
+    assert resp.content.count(b"ID3") == 1
+    assert resp.content.startswith(b"ID3") and resp.content.endswith(requested[1].encode())
+
+    key = sac.sentence_key("See you soon.", "fable", phone_router.config_service.get_tts_speed(), "tts-1")
+    assert sac.get_mp3(key) is not None
+    requested.clear()
+    again = client.get("/api/phone/tts-audio", params={"text": "Hi there. See you soon.", "voice": "fable"})
+    assert again.content == resp.content and requested == []
+
+
+def test_id3_skipper_handles_tags_split_across_chunks():
+    tag = b"ID3\x03\x00\x00\x00\x00\x00\x04" + b"meta"
+    skipper = sac._Id3Skipper()
+    out = b"".join(skipper.feed(c) for c in (tag[:3], tag[3:12], tag[12:] + b"\xff\xfbaudio", b"more"))
+    assert out == b"\xff\xfbaudiomore"
+    plain = sac._Id3Skipper()
+    assert b"".join(plain.feed(c) for c in (b"\xff\xfb", b"12345678", b"9")) == b"\xff\xfb123456789"
+
+
+def test_tts_audio_resolves_speed_off_the_event_loop(monkeypatch):
+    import asyncio
+    import threading
+
+    from fastapi.testclient import TestClient
+
+    import database
+    from main import app
+    from routers import phone as phone_router
+
+    loop_thread = {}
+    seen = {}
+
+    def fake_speed():
+        seen["thread"] = threading.get_ident()
+        return 1.0
+
+    async def fake_run_db(fn, *args, **kwargs):
+        loop_thread["id"] = threading.get_ident()
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    monkeypatch.setattr(phone_router.config_service, "get_tts_speed", fake_speed)
+    monkeypatch.setattr(database, "run_db", fake_run_db)
+    phone_router._TTS_AUDIO_CACHE.clear()
+    phone_router._tts_audio_cache_put(("Hello.", "fable", 1.0), b"ID3cached")
+    resp = TestClient(app).get("/api/phone/tts-audio", params={"text": "Hello.", "voice": "fable"})
+    assert resp.status_code == 200 and resp.content == b"ID3cached"
+    assert seen["thread"] != loop_thread["id"]
+    phone_router._TTS_AUDIO_CACHE.clear()
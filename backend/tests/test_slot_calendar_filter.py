@@ -52,7 +52,7 @@ def test_booked_slot_pending_review_kept():
 
 def test_is_slot_available_ignores_stale_row_for_pending_customer():
     with patch("booking_service._load_booked_slots") as load, patch("runtime.USE_DB", True), patch(
-        "database.db_appointments_get_all"
+        "database.db_appointments_holding_in_date_range"
     ) as ga:
         load.return_value = [
             {
@@ -78,7 +78,7 @@ def test_is_slot_available_ignores_stale_row_for_pending_customer():
 
 def test_is_slot_available_orphan_booked_slot_ignored():
     with patch("booking_service._load_booked_slots") as load, patch("runtime.USE_DB", True), patch(
-        "database.db_appointments_get_all"
+        "database.db_appointments_holding_in_date_range"
     ) as ga:
         load.return_value = [
             {
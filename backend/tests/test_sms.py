@@ -114,3 +114,34 @@ def test_is_sms_confirmation_plain_yes(monkeypatch):
 
     assert _is_sms_confirmation("yes")
     assert _is_sms_confirmation("Sounds good")
+
+
+def test_sms_inbound_trace_reports_the_whole_thread_not_the_loaded_tail(client, monkeypatch):
+    monkeypatch.setattr("runtime.USE_DB", True)
+    monkeypatch.setattr("deps._validate_twilio_webhook", lambda r, d: True)
+    monkeypatch.setattr(
+        "database.db_tenant_get_by_phone",
+        lambda num: {"client_id": "test-spa", "name": "Test Biz"},
+    )
+    monkeypatch.setattr("database.db_sms_opt_out_is_blocked", lambda phone, cid: False)
+    monkeypatch.setattr("database.db_usage_get", lambda cid, month: {})
+    monkeypatch.setattr(
+        "database.db_sms_session_get",
+        lambda phone, cid, limit=20: {
+            "messages": [{"role": "user", "content": "hi"}] * limit,
+            "message_count": 57,
+            "appointment_id": None,
+            "updated_at": None,
+        },
+    )
+    traces = []
+    monkeypatch.setattr(
+        "routers.sms.sms_trace", lambda event, **kw: traces.append((event, kw))
+    )
+    monkeypatch.setattr("sms_service.send_sms", lambda *a, **k: True)
+    client.post(
+        "/api/sms/incoming",
+        data={"From": "+15551110000", "To": "+15552220000", "Body": "Hello there"},
+    )
+    loaded = [kw for event, kw in traces if event == "inbound_session_loaded"]
+    assert loaded and loaded[0]["prior_turns"] == 57
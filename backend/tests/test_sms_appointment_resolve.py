@@ -16,8 +16,8 @@ def test_inbound_sms_uses_resolve_not_phone_only(monkeypatch):
     import inspect
 
     source = inspect.getsource(main.handle_incoming_sms)
-    assert "db_appointments_resolve_for_sms" in source
-    assert "db_appointments_get_by_phone_for_sms(from_number)" not in source
+    assert "adb.appointments_resolve_for_sms" in source
+    assert "appointments_get_by_phone_for_sms(from_number)" not in source
 
 
 def test_post_booking_links_sms_session(monkeypatch):
@@ -45,7 +45,7 @@ def test_post_booking_links_sms_session(monkeypatch):
     monkeypatch.setattr(sms_service, "send_sms", lambda *a, **k: True)
     monkeypatch.setattr(
         database,
-        "db_sms_session_upsert",
+        "db_sms_session_append",
         lambda phone, cid, messages, appointment_id=None: linked.append(
             (phone, cid, appointment_id)
         ),
@@ -0,0 +1,83 @@
+"""SMS threads: append-only sms_messages rows plus the sms_sessions summary row."""
+from unittest.mock import patch
+
+import pytest
+
+import database
+
+
+@pytest.fixture(autouse=True)
+def _fresh_tz_cache(monkeypatch):
+    monkeypatch.setattr(database, "_tenant_tz_cache", {"t1": database.timezone.utc})
+
+
+def _calls(cur):
+    return [c[0] for c in cur.execute.call_args_list]
+
+
+def test_append_inserts_only_the_new_messages_and_bumps_the_summary():
+    added = [{"role": "user", "content": "book me"}, {"role": "assistant", "content": "x" * 400}]
+    with patch.object(database, "_get_conn") as mock_conn:
+        cur = mock_conn.return_value.cursor.return_value
+        database.db_sms_session_append("+1 (415) 555-0100", "t1", added, 9)
+    calls = _calls(cur)
+    insert_sql, insert_params = calls[0]
+    assert insert_sql.startswith("INSERT INTO sms_messages") and insert_sql.count("(%s, %s, %s, %s)") == 2
+    assert insert_params == ("t1", "14155550100", "user", "book me", "t1", "14155550100", "assistant", "x" * 400)
+    summary_sql, summary_params = calls[1]
+    assert "message_count = sms_sessions.message_count + EXCLUDED.message_count" in summary_sql
+    assert "messages" not in summary_sql.replace("message_count", "").replace("last_message", "")
+    assert summary_params == ("14155550100", "t1", 9, 2, "x" * 300, "assistant")
+    mock_conn.return_value.commit.assert_called_once()
+
+
+def test_linking_an_appointment_keeps_the_preview():
+    with patch.object(database, "_get_conn") as mock_conn:
+        cur = mock_conn.return_value.cursor.return_value
+        database.db_sms_session_append("+14155550100", "t1", [], 12)
+    (sql, params), = [c for c in _calls(cur) if "sms_sessions" in c[0]]
+    assert not any("sms_messages" in c[0] for c in _calls(cur))
+    assert "COALESCE(EXCLUDED.last_message, sms_sessions.last_message)" in sql
+    assert params == ("14155550100", "t1", 12, 0, None, None)
+
+
+def test_session_get_reads_only_the_last_n_oldest_first():
+    with patch.object(database, "_get_conn") as mock_conn:
+        cur = mock_conn.return_value.cursor.return_value
+        cur.fetchone.return_value = (4, None, 57)
+        cur.fetchall.return_value = [("user", "hi"), ("assistant", "hello")]
+        sess = database.db_sms_session_get("+14155550100", "t1", limit=20)
+    sql, params = _calls(cur)[1]
+    assert "ORDER BY created_at DESC, id DESC" in sql and "LIMIT %s" in sql
+    assert params == ("t1", "14155550100", 20)
+    assert sess == {
+        "messages": [{"role": "user", "content": "hi"}, {"role": "assistant", "content": "hello"}],
+        "message_count": 57,
+        "appointment_id": 4,
+        "updated_at": None,
+    }
+
+
+def test_session_get_missing_thread_skips_the_message_read():
+    with patch.object(database, "_get_conn") as mock_conn:
+        cur = mock_conn.return_value.cursor.return_value
+        cur.fetchone.return_value = None
+        assert database.db_sms_session_get("+14155550100", "t1") is None
+    assert len(_calls(cur)) == 1
+
+
+def test_threads_list_and_total_read_the_summary_row():
+    with patch.object(database, "_get_conn") as mock_conn:
+        cur = mock_conn.return_value.cursor.return_value
+        cur.fetchall.return_value = [("14155550100", 3, "See you then!", "assistant", 7, None)]
+        cur.fetchone.return_value = (41,)
+        threads = database.db_sms_threads_list("t1", search="415")
+        total = database.db_sms_messages_total("t1")
+    sqls = [c[0] for c in _calls(cur)]
+    assert not any("jsonb" in s for s in sqls)
+    assert "SUM(message_count)" in sqls[1]
+    assert threads == [{
+        "phone": "14155550100", "message_count": 3, "last_message": "See you then!",
+        "last_role": "assistant", "appointment_id": 7, "updated_at": "",
+    }]
+    assert total == 41
@@ -0,0 +1,119 @@
+"""Streaming per-tenant snapshot export: NDJSON files, sha256 manifest, incremental mode."""
+import gzip
+import hashlib
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import database
+
+
+class _Cursor:
+    def __init__(self, data):
+        self._data = data
+        self.description = None
+        self.executed = []
+
+    def execute(self, sql, params=None):
+        self.executed.append((sql, params))
+        table = sql.split(" FROM ")[1].split()[0] if " FROM " in sql else ""
+        rows = self._data.get((table, params[0] if params else None), [])
+        self._rows = [r[1] for r in rows]
+        self.description = [(c,) for c in rows[0][0]] if rows else [("id",)]
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def close(self):
+        pass
+
+
+class _Pool:
+    maxconn = 10
+
+    def __init__(self, data):
+        self.data = data
+        self.cursors = []
+        self.returned = []
+
+    def getconn(self):
+        conn = MagicMock()
+
+        def cursor(name=None):
+            c = _Cursor(self.data)
+            c.name = name
+            self.cursors.append(c)
+            return c
+
+        conn.cursor.side_effect = cursor
+        return conn
+
+    def putconn(self, conn, close=False):
+        self.returned.append(close)
+
+
+def _run(monkeypatch, tmp_path, data, last_export=None, **kw):
+    pool = _Pool(data)
+    main = MagicMock()
+    cur = main.cursor.return_value
+    cur.fetchone.return_value = (last_export,)
+    cur.fetchall.return_value = [("t-a",), ("t-b",)]
+    monkeypatch.setattr(database, "_get_conn", lambda: main)
+    monkeypatch.setattr(database, "_ensure_pool", lambda: pool)
+    monkeypatch.setattr(database, "_row_to_tenant", lambda r: {"client_id": r[0]})
+    out = database.db_export_tenant_snapshot(str(tmp_path), **kw)
+    return out, pool, cur
+
+
+def test_snapshot_streams_one_file_per_tenant_with_manifest_hashes(monkeypatch, tmp_path):
+    data = {
+        ("call_log", "t-a"): [(("id", "call_sid"), (1, "CA1")), (("id", "call_sid"), (2, "CA2"))],
+        ("appointments", "t-b"): [(("id", "created_at"), (9, datetime(2026, 10, 1, tzinfo=timezone.utc)))],
+    }
+    out, pool, main_cur = _run(monkeypatch, tmp_path, data, include_audit=False)
+    assert out["tenants"] == 2 and out["rows"] == 3 and out["mode"] == "full"
+    export_dir = tmp_path / out["export_key"]
+    manifest_bytes = (export_dir / "manifest.json").read_bytes()
+    assert hashlib.sha256(manifest_bytes).hexdigest() == out["sha256"]
+    manifest = json.loads(manifest_bytes)
+    for entry in manifest["tenants"]:
+        blob = (export_dir / entry["file"]).read_bytes()
+        assert hashlib.sha256(blob).hexdigest() == entry["sha256"] and len(blob) == entry["bytes"]
+    a = [json.loads(l) for l in gzip.decompress((export_dir / "t-a.ndjson.gz").read_bytes()).splitlines()]
+    assert a[0] == {"table": "tenants", "row": {"client_id": "t-a"}}
+    assert [l["row"]["call_sid"] for l in a if l["table"] == "call_log"] == ["CA1", "CA2"]
+    b = [json.loads(l) for l in gzip.decompress((export_dir / "t-b.ndjson.gz").read_bytes()).splitlines()]
+    assert b[1]["row"]["created_at"] == "2026-10-01T00:00:00+00:00"
+    assert not any("audit_events" in c.executed[0][0] for c in pool.cursors if c.executed)
+    assert all(c.name for c in pool.cursors if c.executed and "SELECT *" in c.executed[0][0])
+    assert pool.returned == [False, False]
+    insert_sql, insert_params = main_cur.execute.call_args[0]
+    assert "INSERT INTO backup_exports" in insert_sql and insert_params[3] == "full"
+
+
+def test_incremental_narrows_large_tables_since_last_export(monkeypatch, tmp_path):
+    last = datetime(2026, 10, 16, 3, tzinfo=timezone.utc)
+    out, pool, _ = _run(monkeypatch, tmp_path, {}, last_export=last, incremental=True)
+    since = last - timedelta(hours=1)
+    assert out["mode"] == "incremental"
+    selects = {
+        c.executed[0][0].split(" FROM ")[1].split()[0]: c.executed[0]
+        for c in pool.cursors
+        if c.executed and "SELECT *" in c.executed[0][0]
+    }
+    assert "created_at >= %s" in selects["call_log"][0] and selects["call_log"][1][1] == since
+    assert "occurred_at >= %s" in selects["audit_events"][0]
+    assert ">=" not in selects["appointments"][0]  # small mutable tables go in full
+    manifest = json.loads((tmp_path / out["export_key"] / "manifest.json").read_text())
+    assert manifest["since"] == since.isoformat()
+
+
+def test_failed_tenant_records_nothing(monkeypatch, tmp_path):
+    def boom(*a, **k):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(database, "_export_tenant_file", boom)
+    out, _, main_cur = _run(monkeypatch, tmp_path, {})
+    assert out is None
+    assert not any("INSERT INTO backup_exports" in c[0][0] for c in main_cur.execute.call_args_list)
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,49 @@
+"""SpeechSegmenter turns streamed LLM deltas into speakable TTS chunks."""
+from voice.speech_segmenter import SpeechSegmenter
+
+
+def _run(deltas, **kw):
+    seg = SpeechSegmenter(**kw)
+    out = []
+    for d in deltas:
+        out.extend(seg.feed(d))
+    return out, seg.flush()
+
+
+def test_sentences_emit_as_soon_as_complete():
+    seg = SpeechSegmenter()
+    assert seg.feed("Sure thing") == []
+    assert seg.feed("! We're open ") == ["Sure thing!"]
+    assert seg.feed("until 7 tonight. Anything") == ["We're open until 7 tonight."]
+    assert seg.flush() == ["Anything"]
+
+
+def test_first_chunk_may_break_on_a_long_clause():
+    out, rest = _run(["I can check that for you, ", "what day works best for you"])
+    assert out == ["I can check that for you,"]
+    assert rest == ["what day works best for you"]
+
+
+def test_later_chunks_wait_for_the_sentence():
+    out, _ = _run(["Okay. ", "We have openings at two, ", "three, and four"])
+    assert out == ["Okay."]
+
+
+def test_abbreviations_and_times_do_not_split():
+    out, rest = _run(["Dr. Lee is in at 9 a.m. tomorrow. ", "Want that?"])
+    assert out == ["Dr. Lee is in at 9 a.m. tomorrow."]
+    assert rest == ["Want that?"]
+
+
+def test_run_on_text_is_capped():
+    words = " ".join(["word"] * 80)
+    out, rest = _run([words], max_chunk_chars=60)
+    assert out and all(len(c) <= 60 for c in out)
+    assert " ".join(out + rest) == words
+
+
+def test_newline_is_a_boundary_and_joined_text_is_preserved():
+    deltas = ["Sure.", "\nBOOKING: Ann|||2026-11-02|2 PM|Cut|"]
+    out, rest = _run(deltas)
+    assert out == ["Sure."]
+    assert rest == ["BOOKING: Ann|||2026-11-02|2 PM|Cut|"]
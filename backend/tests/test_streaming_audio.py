@@ -1,9 +1,11 @@
 """Transcoding for outbound Twilio bidirectional media (pure-Python μ-law + 24k→8k)."""
 import math
+import random
 import struct
 
 import pytest
 
+from voice import streaming_audio
 from voice.streaming_audio import (
     _LPF,
     MULAW_FRAME_BYTES,
@@ -84,3 +86,56 @@ def test_frame_mulaw_flush_pads_last_frame_with_silence():
     assert len(frames[0]) == MULAW_FRAME_BYTES
     assert frames[0][40:] == b"\xff" * (MULAW_FRAME_BYTES - 40)  # μ-law silence pad
     assert len(carry) == 0
+
+
+def _reference_feed(state: dict, pcm: bytes) -> bytes:
+    """The original per-sample transcoder loop, kept as the byte-exact oracle."""
+    data = state["rem"] + pcm
+    ns = len(data) // 2
+    new = [int.from_bytes(data[2 * i : 2 * i + 2], "little", signed=True) for i in range(ns)]
+    state["rem"] = data[2 * ns :]
+    buf = state["hist"] + new
+    hlen, n = len(state["hist"]), len(_LPF)
+    out = bytearray()
+    for i in range(ns):
+        if (state["pos"] + i) % 3 == 0:
+            bi = hlen + i
+            acc = 0.0
+            w = buf[bi - n + 1 : bi + 1]
+            for k in range(n):
+                acc += _LPF[k] * w[k]
+            out.append(linear16_to_ulaw(int(round(acc))))
+    state["pos"] += ns
+    state["hist"] = buf[-(n - 1) :]
+    return bytes(out)
+
+
+def _test_pcm(rng: random.Random) -> bytes:
+    tone = [int(12000 * math.sin(2 * math.pi * 440 * i / 24000)) for i in range(2400)]
+    noise = [rng.randint(-32768, 32767) for _ in range(2400)]
+    clipped = [32767 if (i // 17) % 2 else -32768 for i in range(2400)]  # FIR overshoot past int16
+    return struct.pack(f"<{7200}h", *(tone + noise + clipped))
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_fast_paths_match_the_reference_byte_for_byte(use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    rng = random.Random(7)
+    pcm = _test_pcm(rng)
+    ref_state = {"rem": b"", "hist": [0] * (len(_LPF) - 1), "pos": 0}
+    tc = Pcm24kToMulaw8k(use_numpy=use_numpy)
+    ref, ours, i = b"", b"", 0
+    while i < len(pcm):
+        step = rng.choice((1, 2, 3, 7, 160, 481, 4096))
+        ref += _reference_feed(ref_state, pcm[i : i + step])
+        ours += tc.feed(pcm[i : i + step])
+        i += step
+    assert ours == ref
+    assert len(ours) == 7200 // 3
+
+
+def test_ulaw_table_matches_encoder_including_out_of_range():
+    for s in list(range(-40000, 40000, 3)) + [-32768, 32767, -4, -3, -1, 0, 3]:
+        v = min(max(s >> 2, streaming_audio._ULAW_14_MIN), streaming_audio._ULAW_14_MAX)
+        assert streaming_audio._ULAW_14[v - streaming_audio._ULAW_14_MIN] == linear16_to_ulaw(s)
@@ -0,0 +1,130 @@
+"""Streaming reply on the bidirectional media path: the brain releases safe chunks while
+the model is still generating, and the session speaks them, then the unsaid remainder."""
+import asyncio
+
+import conversation_service
+import llm_provider
+import runtime
+import voice.media_ws_stream as mod
+from voice.call_sid import SAMPLE_CALL_SID
+from voice.reply_stream import ReplyStream, get_reply_stream
+from voice.utterance import UtteranceResult
+
+
+def _stream_reply(monkeypatch, deltas, call_data=None):
+    monkeypatch.setattr(llm_provider, "chat_stream", lambda **kw: iter(deltas))
+
+    async def run():
+        stream = ReplyStream()
+        text = await conversation_service._stream_voice_reply([], stream, call_data or {})
+        return text, stream
+
+    return asyncio.run(run())
+
+
+def test_chunks_are_released_before_the_reply_finishes(monkeypatch):
+    text, stream = _stream_reply(
+        monkeypatch, ["We're open ", "until 7 tonight. ", "Want to ", "come in?"]
+    )
+    assert text == "We're open until 7 tonight. Want to come in?"
+    assert stream.pushed == ["We're open until 7 tonight.", "Want to come in?"]
+    assert stream.closed
+
+
+def test_directive_stops_early_speech_but_full_text_is_returned(monkeypatch):
+    text, stream = _stream_reply(
+        monkeypatch, ["Perfect, let me get that in. ", "BOOKING: Ann|||2026-11-02|2 PM|Cut|", "\nThanks."]
+    )
+    assert stream.pushed == ["Perfect, let me get that in."]
+    assert "BOOKING:" in text and text.endswith("Thanks.")
+
+
+def test_false_booking_claim_is_never_spoken_early(monkeypatch):
+    _, stream = _stream_reply(
+        monkeypatch, ["Great. ", "You're all set for Tuesday at 2. ", "See you then!"]
+    )
+    assert stream.pushed == ["Great."]
+
+
+def test_forward_unavailable_turn_speaks_nothing_early(monkeypatch):
+    _, stream = _stream_reply(monkeypatch, ["Sure, one moment. "], {"forward_unavailable": True})
+    assert stream.pushed == []
+
+
+def test_turns_that_can_be_substituted_speak_nothing_early(monkeypatch):
+    booking = [{"role": "user", "content": "Can I book a haircut for Tuesday?"}]
+    for call_data in ({"conversation_history": booking}, {"appointment_created": True}, {"booking_intent": True}):
+        _, stream = _stream_reply(monkeypatch, ["Sure, what time works? ", "We have 2 or 4."], call_data)
+        assert stream.pushed == []
+
+
+def test_remainder_tracks_substitution():
+    s = ReplyStream()
+    s.push("We're open until 7.")
+    assert s.remainder("We're open until 7.  Want to come in?") == "Want to come in?"
+    assert s.remainder("Got it, I've texted you the details.") is None
+    assert ReplyStream().remainder("Hello there.") == "Hello there."
+    s.push("Let me check.")
+    assert s.unsaid("We're open until 7. Sorry, that time is taken.") == "Sorry, that time is taken."
+
+
+def _bidi_turn(monkeypatch, early_chunks, final_text):
+    spoken = []
+
+    def fake_tts(text, voice, *, model="tts-1", speed=1.0):
+        spoken.append(text)
+        yield b"\xff" * 160
+
+    async def fake_apply(call_sid, text, conf, base_url):
+        async def brain():
+            stream = get_reply_stream(call_sid)
+            for c in early_chunks:
+                stream.push(c)
+                await asyncio.sleep(0)
+            stream.close()
+            runtime.call_store.response_status[call_sid] = {"status": "ready", "ai_text": final_text}
+
+        asyncio.get_running_loop().create_task(brain())
+        return UtteranceResult(mode="tail_play_respond")
+
+    monkeypatch.setattr(mod, "stream_tts_ulaw_frames", fake_tts)
+    monkeypatch.setattr(mod, "apply_caller_utterance", fake_apply)
+    monkeypatch.setattr(mod, "_SEND_LEAD_SEC", 10.0)
+
+    async def run():
+        s = mod._BidiSession(websocket=object(), twilio_client=None)
+        s.call_sid = SAMPLE_CALL_SID
+        s._stream_replies = True
+
+        async def send(obj):
+            if obj.get("event") == "mark":
+                s._reply_mark.set()
+
+        s._send = send
+        await s._run_turn("are you open late?", 0.9)
+        assert get_reply_stream(SAMPLE_CALL_SID) is None
+
+    asyncio.run(run())
+    return spoken
+
+
+def test_session_speaks_early_chunks_then_only_the_remainder(monkeypatch):
+    spoken = _bidi_turn(
+        monkeypatch, ["We're open until 7."], "We're open until 7. Want to come in?"
+    )
+    assert spoken == ["We're open until 7.", "Want to come in?"]
+
+
+def test_session_never_repeats_early_chunks_when_reply_was_substituted(monkeypatch):
+    spoken = _bidi_turn(
+        monkeypatch,
+        ["Perfect, let me get that in."],
+        "Perfect, let me get that in. Oh wait — that time was just taken.",
+    )
+    assert spoken == ["Perfect, let me get that in.", "Oh wait — that time was just taken."]
+    spoken = _bidi_turn(
+        monkeypatch,
+        ["Sure thing.", "Let me look."],
+        "Sure thing. You're booked for Tuesday at 2.",
+    )
+    assert spoken == ["Sure thing.", "Let me look.", "You're booked for Tuesday at 2."]
@@ -0,0 +1,111 @@
+"""require_tenant remembers how a user resolved to a tenant, so steady-state dashboard
+traffic skips the membership queries and Clerk API calls — and membership writes
+drop that memory immediately."""
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+import database
+import deps
+
+TENANT = {"id": "tid-1", "client_id": "shop-1", "name": "Shop"}
+
+
+class _Req:
+    def __init__(self, method="GET", store=None):
+        self.method = method
+        self.headers = {"X-Store-Id": store} if store else {}
+        self.client = None
+        self.url = "http://test/api/stats"
+
+
+@pytest.fixture
+def resolver(monkeypatch):
+    calls = {"for_user": 0, "clerk": 0, "by_id": 0, "org_store": 0}
+
+    def for_user(uid, preferred_tenant_id=None):
+        calls["for_user"] += 1
+        return dict(TENANT)
+
+    def by_id(tid):
+        calls["by_id"] += 1
+        return dict(TENANT) if tid == TENANT["id"] else None
+
+    def clerk(uid):
+        calls["clerk"] += 1
+        return {"tenant_id": TENANT["id"], "emails": []}
+
+    monkeypatch.setenv("CLERK_JWKS_URL", "https://clerk.example.test/jwks")
+    monkeypatch.setattr("runtime.USE_DB", True)
+    monkeypatch.setattr(deps, "get_bearer_token", lambda r: "tok")
+    monkeypatch.setattr(deps, "verify_clerk_token", lambda t: ("user_1", None))
+    monkeypatch.setattr(deps, "audit_log", lambda *a, **k: None)
+    monkeypatch.setattr(deps, "_clerk_fetch_user_link", clerk)
+    monkeypatch.setattr(deps, "_clerk_patch_user_tenant_metadata", lambda *a: True)
+    monkeypatch.setattr(database, "db_tenant_get_for_user", for_user)
+    monkeypatch.setattr(database, "db_tenant_get_by_id", by_id)
+    monkeypatch.setattr(database, "db_org_memberships", lambda uid: [])
+    deps.invalidate_tenant_cache()
+    yield calls
+    deps.invalidate_tenant_cache()
+
+
+def test_repeat_requests_skip_membership_and_clerk(resolver):
+    assert deps.require_tenant(_Req())["client_id"] == "shop-1"
+    assert resolver["for_user"] == 1 and resolver["clerk"] == 1
+    for _ in range(5):
+        assert deps.require_tenant(_Req())["client_id"] == "shop-1"
+    assert resolver["for_user"] == 1 and resolver["clerk"] == 1
+    assert resolver["by_id"] == 5  # one tenants read per cached request
+
+
+def test_membership_write_invalidates_that_user(resolver):
+    deps.require_tenant(_Req())
+    conn = MagicMock()
+    conn.cursor.return_value.rowcount = 1
+    with patch.object(database, "_get_conn", return_value=conn):
+        assert database.db_tenant_member_remove("user_1", TENANT["id"]) is True
+    deps.require_tenant(_Req())
+    assert resolver["for_user"] == 2
+
+
+def test_other_users_entries_survive_a_targeted_invalidation(resolver):
+    deps.require_tenant(_Req())
+    database._notify_membership_changed("user_2")
+    deps.require_tenant(_Req())
+    assert resolver["for_user"] == 1
+
+
+def test_deleted_tenant_falls_through_to_full_resolution(resolver, monkeypatch):
+    deps.require_tenant(_Req())
+    monkeypatch.setattr(database, "db_tenant_get_by_id", lambda tid: None)
+    monkeypatch.setattr(database, "db_tenant_get_for_user", lambda uid, preferred_tenant_id=None: None)
+    monkeypatch.setattr(database, "db_org_stores_for_user", lambda uid: [])
+    with pytest.raises(HTTPException) as e:
+        deps.require_tenant(_Req())
+    assert e.value.status_code == 403
+
+
+def test_cached_org_viewer_is_still_blocked_from_writing(resolver, monkeypatch):
+    def org_store(uid, ref):
+        resolver["org_store"] += 1
+        return {"tenant": dict(TENANT), "role": "viewer"}
+
+    monkeypatch.setattr(database, "db_org_store_for_user", org_store)
+    assert deps.require_tenant(_Req(store="shop-1"))["client_id"] == "shop-1"
+    with pytest.raises(HTTPException) as e:
+        deps.require_tenant(_Req(method="POST", store="shop-1"))
+    assert e.value.status_code == 403
+    assert resolver["org_store"] == 1
+
+
+def test_admin_support_access_is_resolved_and_audited_every_time(resolver, monkeypatch):
+    audits = []
+    monkeypatch.setenv("ADMIN_CLERK_USER_IDS", "user_1")
+    monkeypatch.setattr(database, "db_org_store_for_user", lambda uid, ref: None)
+    monkeypatch.setattr(database, "db_tenant_get_by_client_id", lambda ref: dict(TENANT))
+    monkeypatch.setattr(deps, "audit_log", lambda *a, **k: audits.append(a[1]))
+    deps.require_tenant(_Req(store="shop-1"))
+    deps.require_tenant(_Req(store="shop-1"))
+    assert audits == ["admin_store_access", "admin_store_access"]
@@ -1,5 +1,7 @@
 """Disk + memory cache for greeting and got-it voice clips."""
 
+import json
+
 from pathlib import Path
 
 from voice.tts_cache import get_cached, invalidate_client, put_cached
@@ -38,3 +40,112 @@ def test_tts_cache_unknown_kind_degrades_to_miss(tmp_path):
     assert get_cached(tmp_path, "not_a_real_kind", ("t", "x")) is None
     put_cached(tmp_path, "not_a_real_kind", ("t", "x"), b"q")
     assert get_cached(tmp_path, "not_a_real_kind", ("t", "x")) == b"q"
+
+
+def test_ulaw_clip_is_padded_mapped_and_framed(tmp_path):
+    from voice import tts_cache
+
+    key = ("tenant-d", "Hello there", "fable", 1.0)
+    assert tts_cache.get_cached_ulaw(tmp_path, "greeting", key) is None
+    tts_cache.put_cached_ulaw(tmp_path, "greeting", key, b"\x10" * 330)
+    tts_cache.clear_all_memory()
+
+    clip = tts_cache.get_cached_ulaw(tmp_path, "greeting", key)  # from disk, mmap-backed
+    assert isinstance(clip, memoryview) and len(clip) == 480
+    frames = list(tts_cache.iter_frames(clip))
+    assert [len(f) for f in frames] == [160, 160, 160]
+    assert bytes(frames[2]) == b"\x10" * 10 + b"\xff" * 150
+    assert tts_cache.get_cached_ulaw(tmp_path, "greeting", key) is clip
+
+    invalidate_client(tmp_path, "tenant-d")
+    assert tts_cache.get_cached_ulaw(tmp_path, "greeting", key) is None
+    assert not list((tmp_path / "voice_cache" / "blobs").glob("*.ulaw"))
+
+
+def test_identical_renders_share_one_blob_across_tenants(tmp_path):
+    from voice import tts_cache
+
+    a = ("tenant-e", "One moment.", "fable", 1.0, "tts-1-hd", "")
+    b = ("tenant-f",) + a[1:]
+    put_cached(tmp_path, "one_moment", a, b"shared-mp3")
+    shared_before = tts_cache.tts_cache_stats(tmp_path)["shared_hits"]
+    assert get_cached(tmp_path, "one_moment", b) == b"shared-mp3"
+    assert tts_cache.tts_cache_stats(tmp_path)["shared_hits"] == shared_before + 1
+    assert len(list((tmp_path / "voice_cache" / "blobs").iterdir())) == 1
+
+    # Invalidating the tenant that rendered it keeps the blob for the other one.
+    invalidate_client(tmp_path, "tenant-e")
+    assert get_cached(tmp_path, "one_moment", b) == b"shared-mp3"
+    invalidate_client(tmp_path, "tenant-f")
+    assert not list((tmp_path / "voice_cache" / "blobs").iterdir())
+
+
+def test_index_survives_restart_and_legacy_clips_are_adopted(tmp_path):
+    from voice import tts_cache
+
+    key = ("tenant-g", "Hi!", "nova", 1.0)
+    put_cached(tmp_path, "greeting", key, b"v1")
+    tts_cache.flush_indexes()  # what the atexit hook does on shutdown
+    tts_cache._STORES.clear()
+    tts_cache.clear_all_memory()
+    assert get_cached(tmp_path, "greeting", key) == b"v1"
+    index = json.loads((tmp_path / "voice_cache" / "index.json").read_text())
+    assert len(index["blobs"]) == 1
+
+    old = ("tenant-g", "Bye!", "nova", 1.0)
+    legacy = tmp_path / "clients" / "tenant-g" / "voice_cache" / f"greeting_{tts_cache._hash_key(old)}.mp3"
+    legacy.parent.mkdir(parents=True, exist_ok=True)
+    legacy.write_bytes(b"legacy-mp3")
+    assert get_cached(tmp_path, "greeting", old) == b"legacy-mp3"
+    assert not legacy.exists()
+    assert get_cached(tmp_path, "greeting", old) == b"legacy-mp3"
+
+
+def test_memory_is_byte_budgeted_lru_and_disk_is_capped(tmp_path, monkeypatch):
+    from voice import tts_cache
+
+    monkeypatch.setattr(tts_cache, "_MEMORY", tts_cache._MemoryLRU(250))
+    monkeypatch.setattr(tts_cache, "_DISK_BUDGET_BYTES", 350)
+    keys = [("tenant-h", f"phrase {i}", "fable", 1.0) for i in range(4)]
+    put_cached(tmp_path, "filler", keys[0], b"a" * 100)
+    put_cached(tmp_path, "filler", keys[1], b"b" * 100)
+    assert get_cached(tmp_path, "filler", keys[0])  # touch 0: 1 is now least recent
+    put_cached(tmp_path, "filler", keys[2], b"c" * 100)
+    assert tts_cache._MEMORY.bytes <= 250
+    assert tts_cache._MEMORY.get(tmp_path / "voice_cache" / "blobs" / tts_cache._blob_name(keys[1], "mp3")) is None
+    assert tts_cache._MEMORY.get(tmp_path / "voice_cache" / "blobs" / tts_cache._blob_name(keys[0], "mp3"))
+
+    put_cached(tmp_path, "filler", keys[3], b"d" * 100)  # 400 bytes on disk > 350 cap
+    stats = tts_cache.tts_cache_stats(tmp_path)
+    assert stats["disk_bytes"] <= 350 and stats["disk_blobs"] == 3
+    assert get_cached(tmp_path, "filler", keys[1]) is None  # the LRU blob was collected
+    assert get_cached(tmp_path, "filler", keys[3]) == b"d" * 100
+
+
+def test_unreadable_blob_is_forgotten_so_the_next_write_restores_it(tmp_path):
+    from voice import tts_cache
+
+    key = ("tenant-h", "Hello!", "nova", 1.0)
+    put_cached(tmp_path, "greeting", key, b"v1")
+    tts_cache.clear_all_memory()
+    blob = tmp_path / "voice_cache" / "blobs" / tts_cache._blob_name(key, "mp3")
+    blob.unlink()
+    assert get_cached(tmp_path, "greeting", key) is None
+    put_cached(tmp_path, "greeting", key, b"v1")
+    assert blob.read_bytes() == b"v1"
+    tts_cache.clear_all_memory()
+    assert get_cached(tmp_path, "greeting", key) == b"v1"
+
+
+def test_index_writes_are_batched_and_hits_write_nothing(tmp_path):
+    from voice import tts_cache
+
+    index = tmp_path / "voice_cache" / "index.json"
+    for i in range(5):
+        put_cached(tmp_path, "greeting", ("tenant-i", f"Hi {i}!", "nova", 1.0), b"mp3")
+    assert not index.exists()  # pending on the timer, not written by each put
+    tts_cache.flush_indexes()
+    assert len(json.loads(index.read_text())["blobs"]) == 5
+    tts_cache.clear_all_memory()
+    assert get_cached(tmp_path, "greeting", ("tenant-i", "Hi 0!", "nova", 1.0)) == b"mp3"
+    assert tts_cache._store(tmp_path)._save_timer is None
@@ -0,0 +1,107 @@
+"""database.unit_of_work(): one pooled connection (optionally one transaction) per block."""
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE, TRANSACTION_STATUS_INTRANS
+
+import database
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    conn = MagicMock(closed=False, last_used=database._time.monotonic())
+    p = MagicMock()
+    p.getconn.return_value = conn
+    monkeypatch.setattr(database, "_use_db", True)
+    monkeypatch.setattr(database, "_ensure_pool", lambda: p)
+    monkeypatch.setattr(database, "_fn_metrics", {})
+    monkeypatch.setattr(database._thread_local, "conn", None, raising=False)
+    monkeypatch.setattr(database._thread_local, "depth", 0, raising=False)
+    # Like _PooledConnection: a statement opens a transaction; commit/rollback end it
+    # on the server unless the unit defers them.
+    conn.sent = []
+    conn.info.transaction_status = TRANSACTION_STATUS_IDLE
+
+    def send(op):
+        if not database._uow_defers(op.lower()):
+            conn.sent.append(op)
+            conn.info.transaction_status = TRANSACTION_STATUS_IDLE
+
+    conn.cursor.return_value.execute.side_effect = lambda sql: setattr(
+        conn.info, "transaction_status", TRANSACTION_STATUS_INTRANS
+    )
+    conn.commit.side_effect = lambda: send("COMMIT")
+    conn.rollback.side_effect = lambda: send("ROLLBACK")
+    p.conn = conn
+    return p
+
+
+@database._scoped
+def db_fake_read():
+    database._get_conn().cursor().execute("SELECT 2")
+
+
+@database._scoped
+def db_fake_write():
+    conn = database._get_conn()
+    conn.cursor().execute("UPDATE x SET y = 1")
+    conn.commit()
+    db_fake_read()
+
+
+def test_sequential_and_nested_calls_share_one_checkout(pool):
+    with database.unit_of_work(name="dashboard"):
+        db_fake_read()
+        db_fake_write()
+        with database.unit_of_work():
+            db_fake_read()
+        assert database._thread_local.conn is pool.conn
+    assert pool.getconn.call_count == 1
+    pool.putconn.assert_called_once_with(pool.conn)
+    assert pool.conn.sent == ["COMMIT", "ROLLBACK"]  # the write's own commit; release clears the read
+    assert database._thread_local.conn is None and database._thread_local.depth == 0
+    assert pool.conn.cursor.return_value.execute.call_count == 4  # pre-ping skipped: fresh conn
+    assert list(database.db_metrics_snapshot()["functions"]) == ["dashboard"]
+
+
+def test_calls_outside_a_unit_each_borrow_their_own(pool):
+    db_fake_read()
+    db_fake_read()
+    assert pool.getconn.call_count == 2
+
+
+def test_transaction_defers_inner_commits_to_one_on_exit(pool):
+    with database.unit_of_work(transaction=True):
+        db_fake_write()
+        db_fake_write()
+        assert pool.conn.sent == []
+    assert pool.conn.sent == ["COMMIT"]
+
+
+def test_exception_rolls_the_transaction_back(pool):
+    with pytest.raises(ValueError):
+        with database.unit_of_work(transaction=True):
+            db_fake_write()
+            raise ValueError("bad input")
+    assert pool.conn.sent == ["ROLLBACK"]
+    assert database.db_metrics_snapshot()["functions"]["unit_of_work"]["errors"] == 1
+
+
+def test_inner_rollback_fails_the_transaction(pool):
+    with pytest.raises(RuntimeError, match="rolled back"):
+        with database.unit_of_work(transaction=True):
+            db_fake_write()
+            pool.conn.rollback()  # a db_* that caught its own error
+    assert pool.conn.sent == ["ROLLBACK"]
+    assert database._thread_local.uow_tx is False
+
+
+def test_refuses_to_run_on_an_event_loop_thread(pool):
+    async def handler():
+        with database.unit_of_work():
+            pass
+
+    with pytest.raises(RuntimeError, match="event-loop thread"):
+        asyncio.run(handler())
+    pool.getconn.assert_not_called()
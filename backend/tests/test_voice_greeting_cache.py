@@ -50,3 +50,48 @@ def test_ensure_greeting_audio_cached_skips_resynthesis(voice_cache_env, monkeyp
     assert calls["n"] == 1
     assert main._ensure_greeting_audio_cached(cid) is True
     assert calls["n"] == 1
+
+
+def test_streaming_warm_stores_ulaw_clips_and_bidi_greets_from_them(voice_cache_env, monkeypatch):
+    import asyncio
+
+    import voice.media_ws_stream as mod
+    from voice import tts_cache
+
+    cid = voice_cache_env
+    synth_formats = []
+
+    def fake_synthesize(text, *, voice, speed, model=None, instructions=None, response_format=None):
+        synth_formats.append(response_format)
+        return b"\x00\x00" * 2400 if response_format == "pcm" else b"mp3-bytes"
+
+    monkeypatch.setenv("VOICE_STREAMING_TTS", "1")
+    monkeypatch.setattr(voice_service, "_synthesize_tts_clip", fake_synthesize)
+    main.set_request_client_id(cid)
+    voice_service.warm_client_voice_cache(cid)
+    assert synth_formats.count("pcm") == 3  # greeting, got-it, one-moment
+    voice_service.warm_client_voice_cache(cid)
+    assert synth_formats.count("pcm") == 3
+    tts_cache.clear_all_memory()
+
+    def no_tts(*_a, **_kw):
+        raise AssertionError("greeting must not call TTS")
+
+    monkeypatch.setattr(mod, "stream_tts_ulaw_frames", no_tts)
+    sent = []
+
+    async def run():
+        s = mod._BidiSession(websocket=object(), twilio_client=None)
+
+        async def send(obj):
+            sent.append(obj["event"])
+            if obj["event"] == "mark":
+                s._reply_mark.set()
+
+        s._send = send
+        clip, text = s._greeting(cid)
+        assert clip is not None and text
+        await s._speak_clip(clip)
+
+    asyncio.run(run())
+    assert sent.count("media") == 800 // 160 and sent[-1] == "mark"
@@ -6,8 +6,10 @@ import asyncio
 import json
 import logging
 import os
+import threading
 import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 from typing import Any, AsyncIterator, Optional
 
@@ -20,6 +22,11 @@ _log = logging.getLogger("nuvatra")
 SESSION_TTL_SEC = 30 * 60
 UTTERANCE_LOCK_TTL_SEC = 45
 MAX_SESSION_JSON_BYTES = 512_000
+# Statuses that end a wait for the brain's reply ("pending" is the only non-final one).
+SETTLED_RESPONSE_STATUSES = frozenset({"ready", "forward", "error"})
+# Longest single BLPOP on the Redis ready key; stays under the client's 2 s socket timeout.
+_REDIS_WAIT_SLICE_SEC = 1.0
+REDIS_ASYNC_MAX_CONNECTIONS = int((os.getenv("REDIS_ASYNC_MAX_CONNECTIONS") or "64").strip() or 64)
 
 
 class UtteranceLockError(RuntimeError):
@@ -86,13 +93,118 @@ class CallSessionStore(ABC):
     async def utterance_lock(self, call_sid: str) -> AsyncIterator[None]:
         yield
 
+    # ---- async API for event-loop callers (media streams, the brain, utterance handling).
+    # The defaults call the sync methods, which is fine for stores that do no I/O; the
+    # Redis store overrides them so a round-trip never blocks the loop pacing audio.
+
+    async def aexists(self, call_sid: str) -> bool:
+        return self.exists(call_sid)
+
+    async def aget(self, call_sid: str) -> Optional[dict[str, Any]]:
+        return self.get(call_sid)
+
+    async def asave(self, call_sid: str, data: dict[str, Any]) -> None:
+        self.save(call_sid, data)
+
+    async def amerge_session(self, call_sid: str, updates: dict[str, Any]) -> bool:
+        return self.merge_session(call_sid, updates)
+
+    async def aincr_media_stream_gen(self, call_sid: str) -> int:
+        return self.incr_media_stream_gen(call_sid)
+
+    async def aget_media_stream_max_gen(self, call_sid: str) -> int:
+        return self.get_media_stream_max_gen(call_sid)
+
+    async def aget_response_status(self, call_sid: str) -> Optional[dict[str, Any]]:
+        return self.get_response_status(call_sid)
+
+    async def aset_response_status(self, call_sid: str, status: dict[str, Any]) -> None:
+        self.set_response_status(call_sid, status)
+
+    async def apop_response_status(self, call_sid: str) -> Optional[dict[str, Any]]:
+        return self.pop_response_status(call_sid)
+
+    async def wait_response_status(
+        self,
+        call_sid: str,
+        timeout: float,
+        statuses: frozenset[str] = SETTLED_RESPONSE_STATUSES,
+    ) -> Optional[dict[str, Any]]:
+        """Wait up to `timeout` seconds for the call's response status to reach one of
+        `statuses`; return it, or None on timeout. Stores override this to wake on the
+        write itself; the base version polls."""
+        sid = normalize_call_sid(call_sid)
+        if not sid:
+            return None
+        deadline = time.monotonic() + max(0.0, timeout)
+        while True:
+            st = await self.aget_response_status(sid)
+            if st and st.get("status") in statuses:
+                return st
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            await asyncio.sleep(min(remaining, 0.05))
+
+
+class _StatusWaiters:
+    """Per-call asyncio events woken when a response status is written. Writes may come
+    from a worker thread, so each event is set on its own loop."""
+
+    def __init__(self) -> None:
+        self._by_sid: dict[str, set[tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, sid: str) -> tuple[asyncio.AbstractEventLoop, asyncio.Event]:
+        entry = (asyncio.get_running_loop(), asyncio.Event())
+        with self._lock:
+            self._by_sid.setdefault(sid, set()).add(entry)
+        return entry
+
+    def discard(self, sid: str, entry: tuple[asyncio.AbstractEventLoop, asyncio.Event]) -> None:
+        with self._lock:
+            waiters = self._by_sid.get(sid)
+            if waiters is not None:
+                waiters.discard(entry)
+                if not waiters:
+                    self._by_sid.pop(sid, None)
+
+    def wake(self, sid: str) -> None:
+        with self._lock:
+            waiters = list(self._by_sid.get(sid, ()))
+        if not waiters:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        for loop, event in waiters:
+            if loop is running:
+                event.set()
+            elif not loop.is_closed():
+                loop.call_soon_threadsafe(event.set)
+
+
+class _NotifyingStatusDict(dict):
+    """response_status for the memory store: a plain dict whose writes wake waiters
+    (the phone routes and the brain assign into it directly)."""
+
+    def __init__(self, waiters: _StatusWaiters) -> None:
+        super().__init__()
+        self._waiters = waiters
+
+    def __setitem__(self, call_sid: str, status: dict[str, Any]) -> None:
+        super().__setitem__(call_sid, status)
+        self._waiters.wake(call_sid)
+
 
 class MemoryCallSessionStore(CallSessionStore):
     """Process-local store for dev and single-worker deployments."""
 
     def __init__(self) -> None:
         self.sessions: dict[str, dict[str, Any]] = {}
-        self.response_status: dict[str, dict[str, Any]] = {}
+        self._status_waiters = _StatusWaiters()
+        self.response_status: dict[str, dict[str, Any]] = _NotifyingStatusDict(self._status_waiters)
         self._utterance_locks: dict[str, asyncio.Lock] = {}
 
     def exists(self, call_sid: str) -> bool:
@@ -170,6 +282,35 @@ class MemoryCallSessionStore(CallSessionStore):
         self.response_status.pop(sid, None)
         self._utterance_locks.pop(sid, None)
 
+    async def wait_response_status(
+        self,
+        call_sid: str,
+        timeout: float,
+        statuses: frozenset[str] = SETTLED_RESPONSE_STATUSES,
+    ) -> Optional[dict[str, Any]]:
+        sid = normalize_call_sid(call_sid)
+        if not sid:
+            return None
+        deadline = time.monotonic() + max(0.0, timeout)
+        entry = self._status_waiters.add(sid)
+        event = entry[1]
+        try:
+            while True:
+                # Clear before reading so a write landing after the read still wakes us.
+                event.clear()
+                st = self.response_status.get(sid)
+                if st and st.get("status") in statuses:
+                    return st
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                try:
+                    await asyncio.wait_for(event.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._status_waiters.discard(sid, entry)
+
     @asynccontextmanager
     async def utterance_lock(self, call_sid: str) -> AsyncIterator[None]:
         sid = normalize_call_sid(call_sid)
@@ -279,16 +420,184 @@ def create_redis_client(redis_url: str):
     return redis.from_url(redis_url, **kwargs)
 
 
+def create_async_redis_client(redis_url: str):
+    """redis.asyncio twin of create_redis_client (same timeouts and TLS policy); its
+    connection pool is shared by every coroutine on the loop that first uses it."""
+    import redis.asyncio as aioredis
+
+    scheme = (urlparse(redis_url).scheme or "").lower()
+    kwargs: dict[str, Any] = {
+        "decode_responses": True,
+        "socket_connect_timeout": 2,
+        "socket_timeout": 2,
+        "max_connections": REDIS_ASYNC_MAX_CONNECTIONS,
+    }
+    if scheme == "rediss":
+        kwargs["ssl_cert_reqs"] = "required"
+    return aioredis.from_url(redis_url, **kwargs)
+
+
+# Redis session layout: call:{sid} is a hash with one JSON-encoded field per top-level
+# key, and call:{sid}:hist a list with one JSON message per entry. A turn then writes
+# only the fields that changed plus the new history entries (one Lua round-trip), not
+# a re-serialized transcript. Fields starting with NUL are bookkeeping, never session keys.
+_META_FIELD = "\x00v"  # always set, so an empty session still exists
+_HIST_FIELD = "\x00hist"  # set when conversation_history lives in the :hist list
+_HISTORY_KEY = "conversation_history"
+_SYNCED_MAX = 4096
+
+# Write a session. "full" replaces hash and list; "append" HSETs changed fields, HDELs
+# removed ones and RPUSHes new history — only if the stored list is still the one this
+# worker last saw (same length and last entry), else returns 0 and the caller goes full.
+# ARGV: ttl, mode, expected_len, expected_last, n_set, n_del, set pairs..., del..., hist...
+_SAVE_LUA = """
+local ttl = tonumber(ARGV[1])
+local nset = tonumber(ARGV[5])
+local ndel = tonumber(ARGV[6])
+if ARGV[2] == 'append' then
+  if redis.call('TYPE', KEYS[1]).ok ~= 'hash' then return 0 end
+  local n = tonumber(ARGV[3])
+  if redis.call('LLEN', KEYS[2]) ~= n then return 0 end
+  if n > 0 and redis.call('LINDEX', KEYS[2], -1) ~= ARGV[4] then return 0 end
+else
+  redis.call('DEL', KEYS[1], KEYS[2])
+end
+local i = 7
+for _ = 1, nset do
+  redis.call('HSET', KEYS[1], ARGV[i], ARGV[i + 1])
+  i = i + 2
+end
+for _ = 1, ndel do
+  redis.call('HDEL', KEYS[1], ARGV[i])
+  i = i + 1
+end
+while i <= #ARGV do
+  redis.call('RPUSH', KEYS[2], ARGV[i])
+  i = i + 1
+end
+redis.call('EXPIRE', KEYS[1], ttl)
+if redis.call('EXISTS', KEYS[2]) == 1 then redis.call('EXPIRE', KEYS[2], ttl) end
+return 1
+"""
+
+# Merge into an existing session: 0 = no session, -1 = legacy JSON string (caller
+# converts it), 1 = merged. ARGV: ttl, n_set, hist_mode ('' | 'set' | 'drop'),
+# hist_field, set pairs..., hist entries (for 'set').
+_MERGE_LUA = """
+local t = redis.call('TYPE', KEYS[1]).ok
+if t == 'none' then return 0 end
+if t ~= 'hash' then return -1 end
+local ttl = tonumber(ARGV[1])
+local i = 5
+for _ = 1, tonumber(ARGV[2]) do
+  redis.call('HSET', KEYS[1], ARGV[i], ARGV[i + 1])
+  i = i + 2
+end
+if ARGV[3] ~= '' then
+  redis.call('DEL', KEYS[2])
+  if ARGV[3] == 'drop' then redis.call('HDEL', KEYS[1], ARGV[4]) end
+  while i <= #ARGV do
+    redis.call('RPUSH', KEYS[2], ARGV[i])
+    i = i + 1
+  end
+end
+redis.call('EXPIRE', KEYS[1], ttl)
+if redis.call('EXISTS', KEYS[2]) == 1 then redis.call('EXPIRE', KEYS[2], ttl) end
+return 1
+"""
+
+# Bump the media stream generation and mirror it into the session hash.
+# Returns {gen, mirrored}; {0, 0} when the session does not exist.
+_INCR_MGEN_LUA = """
+local t = redis.call('TYPE', KEYS[1]).ok
+if t == 'none' then return {0, 0} end
+local g = redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], tonumber(ARGV[1]))
+if t == 'hash' then
+  redis.call('HSET', KEYS[1], 'media_stream_gen', tostring(g))
+  return {g, 1}
+end
+return {g, 0}
+"""
+
+
+def _fields_size(fields: dict[str, str]) -> int:
+    return sum(len(k) + len(v) for k, v in fields.items())
+
+
+def _encode_fields(data: dict[str, Any]) -> dict[str, str]:
+    fields = {_META_FIELD: "1"}
+    for k, v in data.items():
+        if k == _HISTORY_KEY and isinstance(v, list):
+            fields[_HIST_FIELD] = "1"
+        else:
+            fields[k] = json.dumps(v)
+    return fields
+
+
+def _decode_session(fields: dict[str, str], hist: list[str]) -> Optional[dict[str, Any]]:
+    if not fields:
+        return None
+    size = _fields_size(fields) + sum(len(h) for h in hist)
+    if size > MAX_SESSION_JSON_BYTES:
+        _log.warning("call_session_json_oversize bytes=%s", size)
+        return None
+    data: dict[str, Any] = {}
+    try:
+        for k, v in fields.items():
+            if not k.startswith("\x00"):
+                data[k] = json.loads(v)
+        if _HIST_FIELD in fields:
+            data[_HISTORY_KEY] = [json.loads(h) for h in hist]
+    except json.JSONDecodeError:
+        return None
+    return data
+
+
+class _SyncedSession:
+    """What this worker last read or wrote for a call: the encoded hash fields and the
+    history list's length and last entry, so the next save can send only the delta."""
+
+    __slots__ = ("fields", "hist_len", "hist_last", "size")
+
+    def __init__(
+        self, fields: dict[str, str], hist_len: Optional[int], hist_last: Optional[str], size: int
+    ) -> None:
+        self.fields = fields
+        self.hist_len = hist_len
+        self.hist_last = hist_last
+        self.size = size
+
+
 class RedisCallSessionStore(CallSessionStore):
-    """Redis-backed store for multi-worker voice runtime."""
+    """Redis-backed store for multi-worker voice runtime.
+
+    Two clients share the key layout: the sync one behind the legacy dict proxies and
+    sync methods (webhook handlers), and a redis.asyncio one behind the a*-methods,
+    utterance_lock and wait_response_status, so media streams and the brain never block
+    the event loop on a round-trip.
+
+    Sessions are a hash plus a history list (layout above); merges and saves are Lua
+    scripts, so they are one round-trip and atomic against other workers. Sessions
+    written by an older build as a JSON string are still read, and are converted on
+    their next write.
+    """
 
     def __init__(self, redis_url: str) -> None:
+        self._redis_url = redis_url
         self._redis = create_redis_client(redis_url)
+        self._aredis: Any = None
+        self._aredis_loop: Optional[asyncio.AbstractEventLoop] = None
         # redis-py connects lazily, so constructing a client against a dead server
         # succeeds. Ping here or the fail-closed check in get_call_session_store()
         # never fires and we boot "healthy" onto a Redis that isn't there — the
         # first caller of the day finds out instead of the deploy.
         self._redis.ping()
+        self._save_script = self._redis.register_script(_SAVE_LUA)
+        self._merge_script = self._redis.register_script(_MERGE_LUA)
+        self._incr_mgen_script = self._redis.register_script(_INCR_MGEN_LUA)
+        self._async_scripts: Any = None
+        self._synced: "OrderedDict[str, _SyncedSession]" = OrderedDict()
         self._local_locks: dict[str, asyncio.Lock] = {}
         self.sessions = _SessionsProxy(self)
         self.response_status = _ResponseStatusProxy(self)
@@ -299,6 +608,9 @@ class RedisCallSessionStore(CallSessionStore):
             raise ValueError("invalid call_sid")
         return f"call:{sid}"
 
+    def _hist_key(self, call_sid: str) -> str:
+        return f"{self._session_key(call_sid)}:hist"
+
     def _resp_key(self, call_sid: str) -> str:
         return f"{self._session_key(call_sid)}:resp"
 
@@ -308,19 +620,144 @@ class RedisCallSessionStore(CallSessionStore):
     def _mgen_key(self, call_sid: str) -> str:
         return f"{self._session_key(call_sid)}:mgen"
 
+    def _resp_ready_key(self, call_sid: str) -> str:
+        return f"{self._session_key(call_sid)}:respready"
+
     def _touch(self, key: str) -> None:
         self._redis.expire(key, SESSION_TTL_SEC)
 
+    def _async_client(self) -> Any:
+        # redis.asyncio connections belong to the loop they were opened on; the app runs
+        # one loop, but a fresh loop (tests, scripts) gets its own client.
+        loop = asyncio.get_running_loop()
+        if self._aredis is None or self._aredis_loop is not loop:
+            self._aredis = create_async_redis_client(self._redis_url)
+            self._aredis_loop = loop
+            self._async_scripts = (
+                self._aredis.register_script(_SAVE_LUA),
+                self._aredis.register_script(_MERGE_LUA),
+                self._aredis.register_script(_INCR_MGEN_LUA),
+            )
+        return self._aredis
+
+    # ---- hash/list session encoding, shared by the sync and async paths
+
+    def _remember_synced(self, sid: str, state: Optional[_SyncedSession]) -> None:
+        if state is None:
+            self._synced.pop(sid, None)
+            return
+        self._synced[sid] = state
+        self._synced.move_to_end(sid)
+        while len(self._synced) > _SYNCED_MAX:
+            self._synced.popitem(last=False)
+
+    def _read_pipeline(self, pipe: Any, sid: str) -> None:
+        key, hkey = self._session_key(sid), self._hist_key(sid)
+        pipe.hgetall(key)
+        pipe.lrange(hkey, 0, -1)
+        pipe.expire(key, SESSION_TTL_SEC)
+        pipe.expire(hkey, SESSION_TTL_SEC)
+
+    def _decode_and_remember(
+        self, sid: str, fields: dict[str, str], hist: list[str]
+    ) -> Optional[dict[str, Any]]:
+        data = _decode_session(fields, hist)
+        if data is None:
+            self._remember_synced(sid, None)
+            return None
+        has_hist = _HIST_FIELD in fields
+        self._remember_synced(
+            sid,
+            _SyncedSession(
+                dict(fields),
+                len(hist) if has_hist else None,
+                hist[-1] if has_hist and hist else None,
+                _fields_size(fields) + sum(len(h) for h in hist),
+            ),
+        )
+        return data
+
+    def _plan_save(self, sid: str, data: dict[str, Any]) -> tuple[list[Any], _SyncedSession]:
+        """Script args for _SAVE_LUA — a delta against what this worker last synced when
+        the history only grew, else a full write — and the state to remember after."""
+        fields = _encode_fields(data)
+        raw_hist = data.get(_HISTORY_KEY)
+        hist = raw_hist if isinstance(raw_hist, list) else None
+        prev = self._synced.get(sid)
+        n = prev.hist_len if prev is not None else None
+        if (
+            prev is not None
+            and hist is not None
+            and n is not None
+            and len(hist) >= n
+            and (n == 0 or json.dumps(hist[n - 1]) == prev.hist_last)
+        ):
+            tail = [json.dumps(m) for m in hist[n:]]
+            changed = [(k, v) for k, v in fields.items() if prev.fields.get(k) != v]
+            removed = [k for k in prev.fields if k not in fields]
+            size = prev.size - _fields_size(prev.fields) + _fields_size(fields) + sum(map(len, tail))
+            head = ["append", n, prev.hist_last or ""]
+            new_len: Optional[int] = n + len(tail)
+            last = tail[-1] if tail else prev.hist_last
+        else:
+            tail = [json.dumps(m) for m in hist] if hist is not None else []
+            changed = list(fields.items())
+            removed = []
+            size = _fields_size(fields) + sum(map(len, tail))
+            head = ["full", 0, ""]
+            new_len = len(tail) if hist is not None else None
+            last = tail[-1] if tail else None
+        if size > MAX_SESSION_JSON_BYTES:
+            raise ValueError("session payload too large")
+        args: list[Any] = [SESSION_TTL_SEC, *head, len(changed), len(removed)]
+        for k, v in changed:
+            args += [k, v]
+        args += removed
+        args += tail
+        return args, _SyncedSession(fields, new_len, last, size)
+
+    def _plan_merge(self, updates: dict[str, Any]) -> tuple[list[Any], dict[str, str], str]:
+        pairs: dict[str, str] = {}
+        hist_mode = ""
+        entries: list[str] = []
+        for k, v in updates.items():
+            if k == _HISTORY_KEY and isinstance(v, list):
+                hist_mode = "set"
+                entries = [json.dumps(m) for m in v]
+                pairs[_HIST_FIELD] = "1"
+                continue
+            if k == _HISTORY_KEY:
+                hist_mode = "drop"
+            pairs[k] = json.dumps(v)
+        if _fields_size(pairs) + sum(map(len, entries)) > MAX_SESSION_JSON_BYTES:
+            raise ValueError("session payload too large")
+        args: list[Any] = [SESSION_TTL_SEC, len(pairs), hist_mode, _HIST_FIELD]
+        for k, v in pairs.items():
+            args += [k, v]
+        args += entries
+        return args, pairs, hist_mode
+
+    def _note_merged(self, sid: str, pairs: dict[str, str], hist_mode: str) -> None:
+        prev = self._synced.get(sid)
+        if prev is None:
+            return
+        if hist_mode:
+            # The list was replaced; the next save re-syncs it in full.
+            self._remember_synced(sid, None)
+            return
+        prev.size += _fields_size(pairs) - _fields_size(
+            {k: prev.fields[k] for k in pairs if k in prev.fields}
+        )
+        prev.fields.update(pairs)
+
     def exists(self, call_sid: str) -> bool:
         sid = normalize_call_sid(call_sid)
         if not sid:
             return False
         return bool(self._redis.exists(self._session_key(sid)))
 
-    def get(self, call_sid: str) -> Optional[dict[str, Any]]:
-        sid = normalize_call_sid(call_sid)
-        if not sid:
-            return None
+    def _get_legacy(self, sid: str) -> Optional[dict[str, Any]]:
+        self._remember_synced(sid, None)
         key = self._session_key(sid)
         raw = self._redis.get(key)
         if not raw:
@@ -328,14 +765,31 @@ class RedisCallSessionStore(CallSessionStore):
         self._touch(key)
         return _loads_session(raw)
 
+    def get(self, call_sid: str) -> Optional[dict[str, Any]]:
+        sid = normalize_call_sid(call_sid)
+        if not sid:
+            return None
+        pipe = self._redis.pipeline(transaction=False)
+        self._read_pipeline(pipe, sid)
+        try:
+            fields, hist, _, _ = pipe.execute()
+        except Exception as e:
+            if "WRONGTYPE" not in str(e):
+                raise
+            return self._get_legacy(sid)
+        return self._decode_and_remember(sid, fields, hist)
+
     def create(self, call_sid: str, data: dict[str, Any]) -> None:
         sid = normalize_call_sid(call_sid)
         _reject_invalid_call_sid(sid)
-        payload = json.dumps(data)
-        if len(payload.encode("utf-8")) > MAX_SESSION_JSON_BYTES:
-            raise ValueError("session payload too large")
-        key = self._session_key(sid)
-        self._redis.set(key, payload, ex=SESSION_TTL_SEC)
+        keys = [self._session_key(sid), self._hist_key(sid)]
+        args, state = self._plan_save(sid, data)
+        if not self._save_script(keys=keys, args=args):
+            # Another worker moved the history on, or the key expired or is legacy.
+            self._remember_synced(sid, None)
+            args, state = self._plan_save(sid, data)
+            self._save_script(keys=keys, args=args)
+        self._remember_synced(sid, state)
 
     def save(self, call_sid: str, data: dict[str, Any]) -> None:
         self.create(call_sid, data)
@@ -344,22 +798,31 @@ class RedisCallSessionStore(CallSessionStore):
         sid = normalize_call_sid(call_sid)
         if not sid or not updates:
             return False
-        session = self.get(sid)
-        if session is None:
-            return False
-        session.update(updates)
-        self.save(sid, session)
-        return True
+        args, pairs, hist_mode = self._plan_merge(updates)
+        res = int(self._merge_script(keys=[self._session_key(sid), self._hist_key(sid)], args=args))
+        if res == -1:
+            session = self._get_legacy(sid)
+            if session is None:
+                return False
+            session.update(updates)
+            self.save(sid, session)
+            return True
+        if res == 1:
+            self._note_merged(sid, pairs, hist_mode)
+        return res == 1
 
     def delete(self, call_sid: str) -> None:
         sid = normalize_call_sid(call_sid)
         if not sid:
             return
+        self._remember_synced(sid, None)
         self._redis.delete(
             self._session_key(sid),
+            self._hist_key(sid),
             self._resp_key(sid),
             self._lock_key(sid),
             self._mgen_key(sid),
+            self._resp_ready_key(sid),
         )
 
     def list_call_sids(self) -> list[str]:
@@ -377,17 +840,22 @@ class RedisCallSessionStore(CallSessionStore):
                 break
         return out
 
+    def _note_mgen(self, sid: str, g: int, mirrored: int) -> bool:
+        """Record a generation bump; False when a legacy session still needs it merged."""
+        if mirrored:
+            self._note_merged(sid, {"media_stream_gen": str(g)}, "")
+        return bool(mirrored) or g == 0
+
     def incr_media_stream_gen(self, call_sid: str) -> int:
         sid = normalize_call_sid(call_sid)
-        if not sid or not self.exists(sid):
+        if not sid:
             return 0
-        mgen_key = self._mgen_key(sid)
-        g = int(self._redis.incr(mgen_key))
-        self._redis.expire(mgen_key, SESSION_TTL_SEC)
-        session = self.get(sid)
-        if session is not None:
-            session["media_stream_gen"] = g
-            self.save(sid, session)
+        g, mirrored = self._incr_mgen_script(
+            keys=[self._session_key(sid), self._mgen_key(sid)], args=[SESSION_TTL_SEC]
+        )
+        g = int(g)
+        if not self._note_mgen(sid, g, int(mirrored)):
+            self.merge_session(sid, {"media_stream_gen": g})
         return g
 
     def get_media_stream_max_gen(self, call_sid: str) -> int:
@@ -414,14 +882,29 @@ class RedisCallSessionStore(CallSessionStore):
         self._touch(key)
         return _loads_session(raw)
 
-    def set_response_status(self, call_sid: str, status: dict[str, Any]) -> None:
+    def _response_status_payload(self, call_sid: str, status: dict[str, Any]) -> tuple[str, str]:
         sid = normalize_call_sid(call_sid)
         _reject_invalid_call_sid(sid)
-        key = self._resp_key(sid)
         payload = json.dumps(status)
         if len(payload.encode("utf-8")) > MAX_SESSION_JSON_BYTES:
             raise ValueError("response status payload too large")
-        self._redis.set(key, payload, ex=SESSION_TTL_SEC)
+        return sid, payload
+
+    def _queue_response_status(self, pipe: Any, sid: str, payload: str, settled: bool) -> None:
+        pipe.set(self._resp_key(sid), payload, ex=SESSION_TTL_SEC)
+        if settled:
+            # Wake a waiter on any worker: one token on the per-call ready list (BLPOP'd
+            # by wait_response_status), replacing any stale one.
+            ready_key = self._resp_ready_key(sid)
+            pipe.delete(ready_key)
+            pipe.rpush(ready_key, "1")
+            pipe.expire(ready_key, SESSION_TTL_SEC)
+
+    def set_response_status(self, call_sid: str, status: dict[str, Any]) -> None:
+        sid, payload = self._response_status_payload(call_sid, status)
+        pipe = self._redis.pipeline()
+        self._queue_response_status(pipe, sid, payload, status.get("status") in SETTLED_RESPONSE_STATUSES)
+        pipe.execute()
 
     def pop_response_status(self, call_sid: str) -> Optional[dict[str, Any]]:
         sid = normalize_call_sid(call_sid)
@@ -430,12 +913,156 @@ class RedisCallSessionStore(CallSessionStore):
         key = self._resp_key(sid)
         pipe = self._redis.pipeline()
         pipe.get(key)
-        pipe.delete(key)
+        pipe.delete(key, self._resp_ready_key(sid))
         raw, _ = pipe.execute()
         if not raw:
             return None
         return _loads_session(raw)
 
+    async def aexists(self, call_sid: str) -> bool:
+        sid = normalize_call_sid(call_sid)
+        if not sid:
+            return False
+        return bool(await self._async_client().exists(self._session_key(sid)))
+
+    async def _aget_legacy(self, sid: str) -> Optional[dict[str, Any]]:
+        self._remember_synced(sid, None)
+        key = self._session_key(sid)
+        pipe = self._async_client().pipeline(transaction=False)
+        pipe.get(key)
+        pipe.expire(key, SESSION_TTL_SEC)
+        raw, _ = await pipe.execute()
+        if not raw:
+            return None
+        return _loads_session(raw)
+
+    async def aget(self, call_sid: str) -> Optional[dict[str, Any]]:
+        sid = normalize_call_sid(call_sid)
+        if not sid:
+            return None
+        pipe = self._async_client().pipeline(transaction=False)
+        self._read_pipeline(pipe, sid)
+        try:
+            fields, hist, _, _ = await pipe.execute()
+        except Exception as e:
+            if "WRONGTYPE" not in str(e):
+                raise
+            return await self._aget_legacy(sid)
+        return self._decode_and_remember(sid, fields, hist)
+
+    async def asave(self, call_sid: str, data: dict[str, Any]) -> None:
+        sid = normalize_call_sid(call_sid)
+        _reject_invalid_call_sid(sid)
+        self._async_client()
+        save_script = self._async_scripts[0]
+        keys = [self._session_key(sid), self._hist_key(sid)]
+        args, state = self._plan_save(sid, data)
+        if not await save_script(keys=keys, args=args):
+            self._remember_synced(sid, None)
+            args, state = self._plan_save(sid, data)
+            await save_script(keys=keys, args=args)
+        self._remember_synced(sid, state)
+
+    async def amerge_session(self, call_sid: str, updates: dict[str, Any]) -> bool:
+        sid = normalize_call_sid(call_sid)
+        if not sid or not updates:
+            return False
+        self._async_client()
+        args, pairs, hist_mode = self._plan_merge(updates)
+        res = int(
+            await self._async_scripts[1](keys=[self._session_key(sid), self._hist_key(sid)], args=args)
+        )
+        if res == -1:
+            session = await self._aget_legacy(sid)
+            if session is None:
+                return False
+            session.update(updates)
+            await self.asave(sid, session)
+            return True
+        if res == 1:
+            self._note_merged(sid, pairs, hist_mode)
+        return res == 1
+
+    async def aincr_media_stream_gen(self, call_sid: str) -> int:
+        sid = normalize_call_sid(call_sid)
+        if not sid:
+            return 0
+        self._async_client()
+        g, mirrored = await self._async_scripts[2](
+            keys=[self._session_key(sid), self._mgen_key(sid)], args=[SESSION_TTL_SEC]
+        )
+        g = int(g)
+        if not self._note_mgen(sid, g, int(mirrored)):
+            await self.amerge_session(sid, {"media_stream_gen": g})
+        return g
+
+    async def aget_media_stream_max_gen(self, call_sid: str) -> int:
+        sid = normalize_call_sid(call_sid)
+        if not sid:
+            return 0
+        raw = await self._async_client().get(self._mgen_key(sid))
+        if raw is not None:
+            try:
+                return max(0, int(raw))
+            except (TypeError, ValueError):
+                pass
+        session = await self.aget(sid)
+        return int((session or {}).get("media_stream_gen") or 0)
+
+    async def aget_response_status(self, call_sid: str) -> Optional[dict[str, Any]]:
+        sid = normalize_call_sid(call_sid)
+        if not sid:
+            return None
+        key = self._resp_key(sid)
+        pipe = self._async_client().pipeline(transaction=False)
+        pipe.get(key)
+        pipe.expire(key, SESSION_TTL_SEC)
+        raw, _ = await pipe.execute()
+        if not raw:
+            return None
+        return _loads_session(raw)
+
+    async def aset_response_status(self, call_sid: str, status: dict[str, Any]) -> None:
+        sid, payload = self._response_status_payload(call_sid, status)
+        pipe = self._async_client().pipeline()
+        self._queue_response_status(pipe, sid, payload, status.get("status") in SETTLED_RESPONSE_STATUSES)
+        await pipe.execute()
+
+    async def apop_response_status(self, call_sid: str) -> Optional[dict[str, Any]]:
+        sid = normalize_call_sid(call_sid)
+        if not sid:
+            return None
+        key = self._resp_key(sid)
+        pipe = self._async_client().pipeline()
+        pipe.get(key)
+        pipe.delete(key, self._resp_ready_key(sid))
+        raw, _ = await pipe.execute()
+        if not raw:
+            return None
+        return _loads_session(raw)
+
+    async def wait_response_status(
+        self,
+        call_sid: str,
+        timeout: float,
+        statuses: frozenset[str] = SETTLED_RESPONSE_STATUSES,
+    ) -> Optional[dict[str, Any]]:
+        sid = normalize_call_sid(call_sid)
+        if not sid:
+            return None
+        deadline = time.monotonic() + max(0.0, timeout)
+        ready_key = self._resp_ready_key(sid)
+        while True:
+            st = await self.aget_response_status(sid)
+            if st and st.get("status") in statuses:
+                return st
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            # The token outlives a BLPOP that starts after the write, so there is no lost
+            # wake-up; a stale token only costs one extra status read.
+            await self._async_client().blpop([ready_key], timeout=min(remaining, _REDIS_WAIT_SLICE_SEC))
+
     def cleanup_call(self, call_sid: str) -> None:
         self.delete(call_sid)
         sid = normalize_call_sid(call_sid)
@@ -450,8 +1077,9 @@ class RedisCallSessionStore(CallSessionStore):
         deadline = time.monotonic() + 5.0
         acquired = False
         lock_key = self._lock_key(sid)
+        client = self._async_client()
         while time.monotonic() < deadline:
-            if self._redis.set(lock_key, "1", nx=True, ex=UTTERANCE_LOCK_TTL_SEC):
+            if await client.set(lock_key, "1", nx=True, ex=UTTERANCE_LOCK_TTL_SEC):
                 acquired = True
                 break
             await asyncio.sleep(0.05)
@@ -461,7 +1089,7 @@ class RedisCallSessionStore(CallSessionStore):
         try:
             yield
         finally:
-            self._redis.delete(lock_key)
+            await client.delete(lock_key)
 
 
 _store: Optional[CallSessionStore] = None
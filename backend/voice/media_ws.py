@@ -230,7 +230,7 @@ async def handle_phone_media_websocket(websocket: WebSocket, twilio_client: Any)
                 import runtime
 
                 row = m.active_calls.get(call_sid) or {}
-                max_gen = runtime.call_store.get_media_stream_max_gen(call_sid)
+                max_gen = await runtime.call_store.aget_media_stream_max_gen(call_sid)
                 if max_gen < 1:
                     max_gen = int(row.get("media_stream_gen") or 0)
                 tok_gen = token_stream_generation(token)
@@ -281,7 +281,7 @@ async def handle_phone_media_websocket(websocket: WebSocket, twilio_client: Any)
                     await websocket.close(code=4400)
                     return
                 if base_source == "env" and not session_has_base:
-                    runtime.call_store.merge_session(
+                    await runtime.call_store.amerge_session(
                         call_sid, {"twilio_public_base_url": base_url}
                     )
                 voice_info(
@@ -12,6 +12,14 @@ Crucially it REUSES the existing brain untouched:
     effects (the moat). We just stream that text instead of turning it into a <Play> URL.
 
 Gated by config_service.voice_streaming_enabled() (VOICE_STREAMING_TTS); off = untouched.
+
+Within this path the reply itself is streamed too (VOICE_STREAMING_LLM, default on): each
+turn opens a voice.reply_stream for the call, generate_response_async streams the model
+and pushes sentence-sized chunks that are safe to say early, and they are synthesized
+back-to-back while the rest generates. The final ai_text still comes from the full reply
+(directives parsed, substitutions applied); only its unsaid remainder is spoken after.
+Turns whose reply post-processing may replace (a booking in progress, a pending detail
+change, the no-transfer line) release nothing early, and nothing is ever said twice.
 """
 from __future__ import annotations
 
@@ -19,6 +27,7 @@ import asyncio
 import base64
 import json
 import logging
+import queue
 import threading
 import time
 from typing import Any, Optional
@@ -35,8 +44,11 @@ from voice.deepgram_bridge import (
     parse_deepgram_transcript_message,
 )
 from voice.media_token import token_stream_generation, verify_pending_media_stream_token
+from voice.reply_stream import ReplyStream, close_reply_stream, open_reply_stream
+from voice.sentence_audio_cache import iter_reply_ulaw_frames
 from voice.stt_config import utterance_finalize_debounce_ms
 from voice.streaming_tts import stream_tts_ulaw_frames
+from voice.tts_cache import get_cached_ulaw, iter_frames
 from voice.twilio_call import safe_twilio_call_update
 from voice.twilio_media import parse_twilio_media_message, twilio_media_payload_bytes, twilio_start_meta
 from voice.utterance import apply_caller_utterance
@@ -49,6 +61,7 @@ _FRAME_SEC = 0.02  # 20 ms of audio per mulaw frame.
 # `clear` flushes Twilio's buffer regardless of how far ahead we've sent.
 _SEND_LEAD_SEC = 0.6
 _REPLY_WAIT_SEC = 25.0  # max wait for the brain to produce ai_text before giving up the turn.
+_REPLY_STATUSES = frozenset({"ready", "forward"})
 _HANDSHAKE_SEC = 25.0
 # Half-duplex: stop feeding caller audio to STT while the AI is speaking (+ this guard after
 # playback ends) so the AI's own voice — echoed back on speakerphone / the inbound track —
@@ -88,6 +101,7 @@ class _BidiSession:
         self._interim = ""
         self._conf = 0.0
         self._commit_task: Optional[asyncio.Task[None]] = None
+        self._stream_replies = config_service.voice_streaming_llm_enabled()
 
     # ---- outbound websocket messages (Twilio bidirectional protocol) ----
     async def _send(self, obj: dict) -> None:
@@ -117,31 +131,76 @@ class _BidiSession:
         text = (text or "").strip()
         if not text or self._closing:
             return
-        self.speaking = True
+        chunks: "queue.Queue[Optional[str]]" = queue.Queue()
+        chunks.put(text)
+        chunks.put(None)
+        await self._speak_chunks(chunks)
+
+    async def _speak_chunks(self, chunks: "queue.Queue[Optional[str]]") -> None:
+        """Synthesize and send each text chunk from `chunks` back-to-back until None.
+
+        Chunks may still be arriving (a streamed reply): the first frame goes out as soon
+        as the first chunk is synthesized, and later chunks continue on the same pacing
+        clock so there is no gap beyond the time it takes to generate them.
+        """
+        if self._closing:
+            return
         self.interrupt.clear()
         self._barge_cleared = False
         self._reply_mark = asyncio.Event()
-        # Drop any half-accumulated transcript so echo captured at the edge of the last turn
-        # can't commit as a phantom utterance.
-        self._finals, self._interim, self._conf = [], "", 0.0
-        if self._commit_task and not self._commit_task.done():
-            self._commit_task.cancel()
         loop = asyncio.get_running_loop()
         frame_q: "asyncio.Queue[Optional[bytes]]" = asyncio.Queue()
 
+        tenant = str((self._call_data or {}).get("client_id") or "default")
+
         def producer() -> None:
             try:
-                for fr in stream_tts_ulaw_frames(text, self.voice, model="tts-1", speed=self.speed):
-                    if self.interrupt.is_set():
+                while not self.interrupt.is_set() and not self._closing:
+                    try:
+                        text = chunks.get(timeout=0.25)
+                    except queue.Empty:
+                        continue
+                    if text is None:
                         break
-                    loop.call_soon_threadsafe(frame_q.put_nowait, fr)
+                    # Sentences already synthesized on an earlier turn or call replay from the
+                    # sentence cache; new ones stream from OpenAI and are cached when complete.
+                    frames = iter_reply_ulaw_frames(
+                        text,
+                        stream_tts_ulaw_frames,
+                        voice=self.voice,
+                        speed=self.speed,
+                        model="tts-1",
+                        tenant=tenant,
+                    )
+                    for fr in frames:
+                        if self.interrupt.is_set():
+                            break
+                        loop.call_soon_threadsafe(frame_q.put_nowait, fr)
             except Exception:
                 _log.exception("bidi_tts_producer_failed call_sid=%s", self.call_sid)
             finally:
                 loop.call_soon_threadsafe(frame_q.put_nowait, None)
 
         threading.Thread(target=producer, daemon=True).start()
-        start = loop.time()
+        await self._play_frames(frame_q)
+
+    async def _speak_clip(self, clip: memoryview) -> None:
+        """Send a pre-framed μ-law clip (tts_cache) with the same pacing and barge-in
+        handling as a synthesized reply — no provider call, so frame 1 goes out at once."""
+        if self._closing or not clip:
+            return
+        self.interrupt.clear()
+        self._barge_cleared = False
+        self._reply_mark = asyncio.Event()
+        frame_q: "asyncio.Queue[Optional[bytes]]" = asyncio.Queue()
+        for fr in iter_frames(clip):
+            frame_q.put_nowait(fr)
+        frame_q.put_nowait(None)
+        await self._play_frames(frame_q)
+
+    async def _play_frames(self, frame_q: "asyncio.Queue[Optional[bytes]]") -> None:
+        loop = asyncio.get_running_loop()
+        play_end = 0.0  # loop time at which Twilio finishes playing what we've sent
         sent = 0
         interrupted = False
         while True:
@@ -151,15 +210,25 @@ class _BidiSession:
             if self.interrupt.is_set():
                 interrupted = True
                 break
+            if sent == 0:
+                self.speaking = True
+                # Drop any half-accumulated transcript so echo captured at the edge of the
+                # last turn can't commit as a phantom utterance.
+                self._finals, self._interim, self._conf = [], "", 0.0
+                if self._commit_task and not self._commit_task.done():
+                    self._commit_task.cancel()
             await self._send_media(fr)
             sent += 1
             # Pace against an absolute clock (not a per-frame sleep, which drifts slow): send
-            # frame `sent` up to _SEND_LEAD_SEC before its play time, so Twilio keeps a cushion
-            # and never underruns. If we've fallen behind (target<=now) we don't sleep — catch up.
-            target = start + sent * _FRAME_SEC - _SEND_LEAD_SEC
-            delay = target - loop.time()
+            # each frame up to _SEND_LEAD_SEC before its play time, so Twilio keeps a cushion
+            # and never underruns. If we've fallen behind — including a gap while the next
+            # chunk was still generating — playback restarts from now and we don't sleep.
+            play_end = max(play_end, loop.time()) + _FRAME_SEC
+            delay = play_end - _SEND_LEAD_SEC - loop.time()
             if delay > 0:
                 await asyncio.sleep(delay)
+        if sent == 0 and not interrupted:
+            return
         if interrupted:
             if not self._barge_cleared:
                 await self._send_clear()
@@ -171,7 +240,7 @@ class _BidiSession:
         # keep `speaking` True (STT stays gated) until Twilio echoes the mark or the remaining
         # audio would have finished — so we don't transcribe the tail as caller speech.
         await self._send_mark("reply_end")
-        remaining = max(0.0, sent * _FRAME_SEC - (loop.time() - start))
+        remaining = max(0.0, play_end - loop.time())
         try:
             await asyncio.wait_for(self._reply_mark.wait(), timeout=remaining + 2.0)
         except asyncio.TimeoutError:
@@ -222,20 +291,33 @@ class _BidiSession:
             await self.utterance_q.put((text, conf))
 
     # ---- turn: reuse the existing brain, then stream the reply ----
-    async def _await_reply(self) -> Optional[str]:
-        deadline = time.monotonic() + _REPLY_WAIT_SEC
-        while time.monotonic() < deadline:
-            st = runtime.call_store.response_status.get(self.call_sid or "", {})
-            status = st.get("status")
-            if status == "ready":
-                return (st.get("ai_text") or "").strip()
-            if status == "forward":
-                return None
-            await asyncio.sleep(0.05)
-        return ""
+    async def _await_reply(self) -> dict:
+        """The settled response status ({} on timeout). Woken by the status write itself
+        (no polling), so the reply starts the moment generate_response_async marks it ready."""
+        st = await runtime.call_store.wait_response_status(
+            self.call_sid or "", _REPLY_WAIT_SEC, statuses=_REPLY_STATUSES
+        )
+        return st or {}
+
+    @staticmethod
+    async def _relay_reply_stream(stream: ReplyStream, chunks: "queue.Queue[Optional[str]]") -> None:
+        """Move chunks the brain released for early speech onto the TTS queue."""
+        while True:
+            chunk = await stream.queue.get()
+            if chunk is None:
+                return
+            chunks.put(chunk)
 
     async def _run_turn(self, text: str, conf: float) -> None:
         voice_transcript("caller_said", call_sid=self.call_sid, text=text)
+        stream = open_reply_stream(self.call_sid or "") if self._stream_replies else None
+        try:
+            await self._run_turn_inner(text, conf, stream)
+        finally:
+            if stream is not None:
+                close_reply_stream(self.call_sid or "", stream)
+
+    async def _run_turn_inner(self, text: str, conf: float, stream: Optional[ReplyStream]) -> None:
         result = await apply_caller_utterance(self.call_sid or "", text, conf, self.base_url)
         # Forward / limits / lost-session / language-record all come back as a full TwiML doc:
         # REST-replace the call with it (that supersedes the <Connect> stream and ends the WS).
@@ -246,11 +328,23 @@ class _BidiSession:
             self._closing = True
             await self._close()
             return
-        ai_text = await self._await_reply()
-        st = runtime.call_store.response_status.get(self.call_sid or "", {})
+        chunks: "queue.Queue[Optional[str]]" = queue.Queue()
+        speak_task: "Optional[asyncio.Task[None]]" = None
+        relay: "Optional[asyncio.Task[None]]" = None
+        if stream is not None:
+            # Start speaking the first chunk the moment it exists; the rest follows on the
+            # same TTS queue.
+            speak_task = asyncio.create_task(self._speak_chunks(chunks))
+            relay = asyncio.create_task(self._relay_reply_stream(stream, chunks))
+        st = await self._await_reply()
+        ai_text = (st.get("ai_text") or "").strip()
         if st.get("status") == "forward":
+            if speak_task is not None:
+                relay.cancel()
+                chunks.put(None)
+                await speak_task
             fp = st.get("forwarding_phone")
-            runtime.call_store.response_status.pop(self.call_sid or "", None)
+            await runtime.call_store.apop_response_status(self.call_sid or "")
             if fp:
                 import main as m
                 xml = str(m.forward_call_to_business(fp, self.base_url, "English"))
@@ -258,9 +352,26 @@ class _BidiSession:
             self._closing = True
             await self._close()
             return
-        runtime.call_store.response_status.pop(self.call_sid or "", None)
-        if ai_text:
-            await self._speak(ai_text)
+        await runtime.call_store.apop_response_status(self.call_sid or "")
+        if speak_task is None:
+            if ai_text:
+                await self._speak(ai_text)
+            return
+        # The brain closes the stream before marking the reply ready; closing here covers a
+        # turn that failed before it started streaming.
+        stream.close()
+        await relay
+        rest = stream.remainder(ai_text or "")
+        if rest is None:
+            # Post-processing replaced the reply after part of it was said. Turns that can
+            # be substituted stream nothing early, so this is the rare leftover (e.g. a
+            # directive nobody saw coming): say only the sentences not already spoken.
+            voice_info("bidi_stream_reply_substituted", call_sid=self.call_sid, early_chunks=len(stream.pushed))
+            rest = stream.unsaid(ai_text or "")
+        if rest:
+            chunks.put(rest)
+        chunks.put(None)
+        await speak_task
 
     async def _drive_turns(self) -> None:
         while not self._closing:
@@ -332,24 +443,28 @@ class _BidiSession:
         cid = str((self._call_data or {}).get("client_id") or "").strip()
         if cid:
             database.set_request_client_id(cid)
+        # A prewarmed greeting clip starts playing before Deepgram is even connected; the
+        # caller hears nothing from STT setup. Without one, synthesize once STT is up.
+        greeting_clip, greeting_text = self._greeting(cid)
+        greeting_task = (
+            asyncio.create_task(self._speak_clip(greeting_clip)) if greeting_clip is not None else None
+        )
         try:
             self.dg_ws = await connect_deepgram_listen()
             voice_info("deepgram_connect_ok", call_sid=self.call_sid, model=DEEPGRAM_MODEL)
         except Exception as e:
             voice_warning("bidi_deepgram_connect_failed", call_sid=self.call_sid, detail=str(e)[:200])
+            self._closing = True
+            if greeting_task is not None:
+                greeting_task.cancel()
             await self._close()
             return
 
         self._dg_task = asyncio.create_task(self._pump_deepgram())
         turn_task = asyncio.create_task(self._drive_turns())
         # Greeting first (interruptible like any reply).
-        try:
-            import voice_service
-            payload = voice_service.build_phone_greeting_payload(config_service.get_business_info())
-            self.voice = payload.get("voice") or self.voice
-            asyncio.create_task(self._speak(payload.get("spoken_text") or ""))
-        except Exception:
-            _log.exception("bidi_greeting_failed call_sid=%s", self.call_sid)
+        if greeting_task is None and greeting_text:
+            asyncio.create_task(self._speak(greeting_text))
 
         try:
             await self._inbound_loop()
@@ -364,6 +479,26 @@ class _BidiSession:
                 pass
             await self._close()
 
+    def _greeting(self, cid: str) -> "tuple[Optional[memoryview], str]":
+        """(prewarmed μ-law greeting clip or None, greeting text); sets the call's voice."""
+        try:
+            import voice_service
+            payload = voice_service.build_phone_greeting_payload(config_service.get_business_info())
+            self.voice = payload.get("voice") or self.voice
+            text = (payload.get("spoken_text") or "").strip()
+        except Exception:
+            _log.exception("bidi_greeting_failed call_sid=%s", self.call_sid)
+            return None, ""
+        clip = None
+        if cid and cid != "default":
+            try:
+                key = voice_service._greeting_audio_cache_key(cid)
+                clip = get_cached_ulaw(voice_service.PROJECT_ROOT, "greeting", key)
+            except Exception:
+                _log.exception("bidi_greeting_cache_failed call_sid=%s", self.call_sid)
+        voice_info("bidi_greeting", call_sid=self.call_sid, cached=clip is not None)
+        return clip, text
+
     async def _handshake(self) -> bool:
         deadline = time.monotonic() + _HANDSHAKE_SEC
         while time.monotonic() < deadline:
@@ -380,18 +515,18 @@ class _BidiSession:
             if not ev:
                 continue
             if ev.get("event") == "start":
-                return self._accept_start(ev)
+                return await self._accept_start(ev)
             # ignore 'connected' and any pre-start media
         return False
 
-    def _accept_start(self, ev: dict) -> bool:
+    async def _accept_start(self, ev: dict) -> bool:
         import main as m
         call_sid, stream_sid, cp = twilio_start_meta(ev)
         token = (cp or {}).get("token") or ""
         self.call_sid = call_sid
         self.stream_sid = stream_sid
         row = m.active_calls.get(call_sid or "") or {}
-        max_gen = runtime.call_store.get_media_stream_max_gen(call_sid or "")
+        max_gen = await runtime.call_store.aget_media_stream_max_gen(call_sid or "")
         if max_gen < 1:
             max_gen = int(row.get("media_stream_gen") or 0)
         voice_info(
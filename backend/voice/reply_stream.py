@@ -0,0 +1,82 @@
+"""Per-call handoff of speakable reply chunks from the brain to the bidirectional stream.
+
+The bidi media session opens a stream for its call before handing the caller's turn
+to apply_caller_utterance(); generate_response_async() finds it here, streams the LLM
+reply, and pushes each chunk that is safe to say early. The session speaks those
+while the rest is still generating, then reconciles them against the final ai_text
+(which is still parsed for BOOKING:/TRANSFER_TO:/MESSAGE: from the full reply).
+
+In-process only: the session and the generate task it schedules share an event loop.
+No stream registered (the Gather / batch <Play> paths) = the old non-streaming reply.
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Dict, List, Optional
+
+from voice.speech_segmenter import split_sentences
+
+_streams: Dict[str, "ReplyStream"] = {}
+
+
+def _normalize(text: str) -> str:
+    return " ".join((text or "").split())
+
+
+class ReplyStream:
+    """Chunks the brain released for early speech, in order; None on the queue = done."""
+
+    def __init__(self) -> None:
+        self.queue: "asyncio.Queue[Optional[str]]" = asyncio.Queue()
+        self.pushed: List[str] = []
+        self.closed = False
+
+    def push(self, chunk: str) -> None:
+        chunk = (chunk or "").strip()
+        if not chunk or self.closed:
+            return
+        self.pushed.append(chunk)
+        self.queue.put_nowait(chunk)
+
+    def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self.queue.put_nowait(None)
+
+    def remainder(self, final_text: str) -> Optional[str]:
+        """What of `final_text` is still unsaid, or None if it no longer starts with
+        what was already pushed (post-processing substituted the reply)."""
+        said = _normalize(" ".join(self.pushed))
+        final = _normalize(final_text)
+        if not said:
+            return final
+        if not final.startswith(said):
+            return None
+        return final[len(said):].strip()
+
+    def unsaid(self, final_text: str) -> str:
+        """The sentences of a substituted `final_text` that were not already spoken, so a
+        replaced reply never repeats what the caller just heard."""
+        said = {_normalize(x).lower() for x in split_sentences(" ".join(self.pushed))}
+        return " ".join(x for x in split_sentences(final_text) if _normalize(x).lower() not in said)
+
+
+def open_reply_stream(call_sid: str) -> ReplyStream:
+    stream = ReplyStream()
+    _streams[call_sid] = stream
+    return stream
+
+
+def get_reply_stream(call_sid: str) -> Optional[ReplyStream]:
+    return _streams.get(call_sid or "")
+
+
+def close_reply_stream(call_sid: str, stream: Optional[ReplyStream] = None) -> None:
+    """Unregister (only `stream`, if given, so a newer turn's stream survives) and close."""
+    cur = _streams.get(call_sid or "")
+    if cur is None or (stream is not None and cur is not stream):
+        if stream is not None:
+            stream.close()
+        return
+    _streams.pop(call_sid, None)
+    cur.close()
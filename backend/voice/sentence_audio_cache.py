@@ -0,0 +1,288 @@
+"""Sentence-granular TTS audio cache shared by the Gather <Play> and bidirectional paths.
+
+Receptionist replies repeat whole sentences across calls and tenants ("What time works
+best for you?"), while the full reply is almost always new. So replies are cut into
+sentences (speech_segmenter.split_sentences) and each sentence's audio is cached under
+(normalized sentence, voice, speed, model, instructions hash): a reply is assembled from
+cached sentences and only the novel ones are synthesized.
+
+An entry holds up to two renderings of the same sentence, each filled by the path that
+needs it: mp3 for /api/phone/tts-audio, and μ-law/8000 pre-framed into 160-byte frames
+for the bidirectional stream. Process-local, LRU-bounded by total bytes
+(SENTENCE_AUDIO_CACHE_MB). Per-tenant hit/miss counters show what it saves.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
+
+from voice.speech_segmenter import split_sentences
+from voice.streaming_audio import MULAW_FRAME_BYTES
+
+SentenceKey = Tuple[str, str, float, str, str]
+
+_MAX_BYTES = int(float((os.getenv("SENTENCE_AUDIO_CACHE_MB") or "64").strip() or 64) * 1024 * 1024)
+# Longer "sentences" are effectively unique; synthesize them but don't spend cache on them.
+_MAX_CACHED_SENTENCE_CHARS = 240
+_SYNTH_WORKERS = 4
+
+
+class _Entry:
+    __slots__ = ("mp3", "ulaw")
+
+    def __init__(self) -> None:
+        self.mp3: Optional[bytes] = None
+        self.ulaw: Optional[bytes] = None
+
+    def size(self) -> int:
+        return len(self.mp3 or b"") + len(self.ulaw or b"")
+
+
+_cache: "OrderedDict[SentenceKey, _Entry]" = OrderedDict()
+_cache_bytes = 0
+_evictions = 0
+_lock = threading.Lock()
+# tenant -> {"hits", "misses", "hit_chars", "miss_chars", "hit_bytes"}
+_stats: Dict[str, Dict[str, int]] = {}
+
+
+def normalize_sentence(text: str) -> str:
+    return " ".join((text or "").split())
+
+
+def sentence_key(
+    sentence: str, voice: str, speed: float, model: str, instructions: str = ""
+) -> SentenceKey:
+    instr = hashlib.sha256(instructions.encode("utf-8")).hexdigest()[:16] if instructions else ""
+    return (normalize_sentence(sentence), voice, round(float(speed), 2), model, instr)
+
+
+def _get(key: SentenceKey, fmt: str) -> Optional[bytes]:
+    with _lock:
+        entry = _cache.get(key)
+        data = getattr(entry, fmt) if entry is not None else None
+        if data is not None:
+            _cache.move_to_end(key)
+        return data
+
+
+def _put(key: SentenceKey, fmt: str, data: bytes) -> None:
+    global _cache_bytes, _evictions
+    if not data or len(key[0]) > _MAX_CACHED_SENTENCE_CHARS or len(data) > _MAX_BYTES:
+        return
+    with _lock:
+        entry = _cache.get(key)
+        if entry is None:
+            entry = _cache[key] = _Entry()
+        _cache_bytes -= entry.size()
+        setattr(entry, fmt, data)
+        _cache_bytes += entry.size()
+        _cache.move_to_end(key)
+        while _cache_bytes > _MAX_BYTES and _cache:
+            _, old = _cache.popitem(last=False)
+            _cache_bytes -= old.size()
+            _evictions += 1
+
+
+def _record(tenant: str, hit: bool, chars: int, nbytes: int = 0) -> None:
+    with _lock:
+        st = _stats.setdefault(
+            tenant or "default",
+            {"hits": 0, "misses": 0, "hit_chars": 0, "miss_chars": 0, "hit_bytes": 0},
+        )
+        if hit:
+            st["hits"] += 1
+            st["hit_chars"] += chars
+            st["hit_bytes"] += nbytes
+        else:
+            st["misses"] += 1
+            st["miss_chars"] += chars
+
+
+def get_mp3(key: SentenceKey) -> Optional[bytes]:
+    return _get(key, "mp3")
+
+
+def put_mp3(key: SentenceKey, data: bytes) -> None:
+    _put(key, "mp3", data)
+
+
+def get_ulaw(key: SentenceKey) -> Optional[bytes]:
+    return _get(key, "ulaw")
+
+
+def put_ulaw(key: SentenceKey, data: bytes) -> None:
+    _put(key, "ulaw", data)
+
+
+def _id3_tag_len(head: bytes) -> Optional[int]:
+    """Length of the ID3v2 tag `head` starts with (needs 10 bytes), or None if it has none."""
+    if len(head) < 10 or head[:3] != b"ID3":
+        return None
+    size = 0
+    for b in head[6:10]:
+        if b & 0x80:
+            return None  # not a valid syncsafe size; leave the bytes alone
+        size = (size << 7) | b
+    return 10 + size + (10 if head[5] & 0x10 else 0)
+
+
+def _strip_id3(data: bytes) -> bytes:
+    """Drop a leading ID3v2 tag so per-sentence mp3s concatenate into one stream."""
+    end = _id3_tag_len(data)
+    return data[end:] if end is not None and end < len(data) else data
+
+
+def reply_mp3(
+    text: str,
+    synth: Callable[[str], bytes],
+    *,
+    voice: str,
+    speed: float,
+    model: str,
+    instructions: str = "",
+    tenant: str = "",
+) -> Tuple[bytes, int, int]:
+    """mp3 for a whole reply, from cached sentences plus `synth(sentence)` for the rest
+    (run in parallel). Returns (audio, hits, misses)."""
+    sentences = split_sentences(text) or [normalize_sentence(text)]
+    keys = [sentence_key(s, voice, speed, model, instructions) for s in sentences]
+    parts: List[Optional[bytes]] = [get_mp3(k) for k in keys]
+    missing = [i for i, p in enumerate(parts) if p is None]
+    for i, p in enumerate(parts):
+        if p is not None:
+            _record(tenant, True, len(sentences[i]), len(p))
+    if missing:
+        if len(missing) == 1:
+            rendered = [synth(sentences[missing[0]])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(_SYNTH_WORKERS, len(missing))) as pool:
+                rendered = list(pool.map(synth, [sentences[i] for i in missing]))
+        for i, data in zip(missing, rendered):
+            parts[i] = data
+            put_mp3(keys[i], data)
+            _record(tenant, False, len(sentences[i]))
+    audio = b"".join(p if i == 0 else _strip_id3(p) for i, p in enumerate(parts) if p)
+    return audio, len(sentences) - len(missing), len(missing)
+
+
+class _Id3Skipper:
+    """_strip_id3 for a streamed mp3: drops a leading ID3v2 tag that may span several
+    chunks, then passes bytes through."""
+
+    def __init__(self) -> None:
+        self.head = bytearray()  # bytes held until the first 10 are in
+        self._skip: Optional[int] = None  # tag bytes still to drop, once known
+
+    def feed(self, chunk: bytes) -> bytes:
+        if self._skip is None:
+            self.head += chunk
+            if len(self.head) < 10:
+                return b""
+            chunk, self.head = bytes(self.head), bytearray()
+            self._skip = _id3_tag_len(chunk) or 0
+        if self._skip:
+            dropped = min(self._skip, len(chunk))
+            self._skip -= dropped
+            chunk = chunk[dropped:]
+        return bytes(chunk)
+
+
+async def aiter_reply_mp3(
+    text: str,
+    astream: Callable[[str], AsyncIterator[bytes]],
+    *,
+    voice: str,
+    speed: float,
+    model: str,
+    instructions: str = "",
+    tenant: str = "",
+) -> AsyncIterator[bytes]:
+    """reply_mp3 as a stream: cached sentences are sent whole, novel ones are relayed from
+    `astream(sentence)` as they arrive and cached once complete. Inner ID3 tags are dropped
+    so the concatenation is one playable mp3."""
+    sentences = split_sentences(text) or [normalize_sentence(text)]
+    for i, sentence in enumerate(sentences):
+        key = sentence_key(sentence, voice, speed, model, instructions)
+        cached = get_mp3(key)
+        if cached is not None:
+            _record(tenant, True, len(sentence), len(cached))
+            yield cached if i == 0 else _strip_id3(cached)
+            continue
+        _record(tenant, False, len(sentence))
+        skipper = _Id3Skipper() if i else None
+        buf = bytearray()
+        async for chunk in astream(sentence):
+            if not chunk:
+                continue
+            buf += chunk
+            out = skipper.feed(chunk) if skipper else chunk
+            if out:
+                yield out
+        if skipper and skipper.head:
+            yield bytes(skipper.head)  # a clip shorter than an ID3 header
+        put_mp3(key, bytes(buf))
+
+
+def iter_reply_ulaw_frames(
+    text: str,
+    stream_frames: Callable[..., Iterator[bytes]],
+    *,
+    voice: str,
+    speed: float,
+    model: str,
+    tenant: str = "",
+) -> Iterator[bytes]:
+    """160-byte μ-law frames for `text`, sentence by sentence: cached sentences are
+    replayed, novel ones streamed from `stream_frames(sentence, voice, model=, speed=)`
+    and cached once they finish (a sentence cut short by barge-in is not cached)."""
+    for sentence in split_sentences(text):
+        key = sentence_key(sentence, voice, speed, model)
+        cached = get_ulaw(key)
+        if cached is not None:
+            _record(tenant, True, len(sentence), len(cached))
+            mv = memoryview(cached)
+            for i in range(0, len(cached), MULAW_FRAME_BYTES):
+                yield bytes(mv[i : i + MULAW_FRAME_BYTES])
+            continue
+        _record(tenant, False, len(sentence))
+        buf = bytearray()
+        for frame in stream_frames(sentence, voice, model=model, speed=speed):
+            buf += frame
+            yield frame
+        put_ulaw(key, bytes(buf))
+
+
+def sentence_cache_stats() -> dict:
+    """Totals plus per-tenant hit rates, for the admin ops self-check."""
+    with _lock:
+        tenants = {}
+        for tenant, st in _stats.items():
+            total = st["hits"] + st["misses"]
+            chars = st["hit_chars"] + st["miss_chars"]
+            tenants[tenant] = {
+                **st,
+                "hit_rate": round(st["hits"] / total, 3) if total else 0.0,
+                # TTS is billed per input character, so this is the share of spend saved.
+                "char_hit_rate": round(st["hit_chars"] / chars, 3) if chars else 0.0,
+            }
+        return {
+            "entries": len(_cache),
+            "bytes": _cache_bytes,
+            "max_bytes": _MAX_BYTES,
+            "evictions": _evictions,
+            "tenants": tenants,
+        }
+
+
+def clear_sentence_cache() -> None:
+    global _cache_bytes, _evictions
+    with _lock:
+        _cache.clear()
+        _stats.clear()
+        _cache_bytes = 0
+        _evictions = 0
@@ -0,0 +1,96 @@
+"""Cut a streamed LLM reply into speakable chunks for streaming TTS.
+
+Tokens arrive a few characters at a time; TTS wants whole phrases (a clip per token
+sounds robotic, and each request has its own start-up cost). This buffers deltas and
+emits a chunk as soon as a sentence is complete — or, for the very first chunk, as
+soon as a reasonably long clause is, so the caller hears something quickly.
+
+Pure and dependency-free (like streaming_audio.py): no runtime, no I/O.
+"""
+from __future__ import annotations
+
+import re
+from typing import List
+
+# Sentence end: terminal punctuation (plus any closing quotes/brackets) then whitespace.
+_SENTENCE_END_RE = re.compile(r"[.!?]+[\"')\]]*\s+|\n+")
+# Clause break, used for the first chunk and to cap run-on sentences.
+_CLAUSE_END_RE = re.compile(r"[,;—]\s+|\s+-\s+")
+# "Dr. Lee" / "9 a.m. tomorrow" are not sentence ends.
+_ABBREVIATIONS = frozenset({"mr", "mrs", "ms", "dr", "st", "jr", "sr", "vs", "a.m", "p.m", "e.g", "i.e"})
+
+FIRST_CLAUSE_MIN_CHARS = 24
+MAX_CHUNK_CHARS = 220
+
+
+def _is_abbreviation(text: str, end: int) -> bool:
+    """True when the '.' just before `end` closes a known abbreviation."""
+    head = text[:end].rstrip()
+    if not head.endswith("."):
+        return False
+    word = head[:-1].rsplit(None, 1)[-1].lower() if head[:-1].strip() else ""
+    return word in _ABBREVIATIONS
+
+
+class SpeechSegmenter:
+    """feed() deltas, get back zero or more complete chunks; flush() the rest at the end."""
+
+    def __init__(
+        self,
+        first_clause_min_chars: int = FIRST_CLAUSE_MIN_CHARS,
+        max_chunk_chars: int = MAX_CHUNK_CHARS,
+    ) -> None:
+        self._buf = ""
+        self._emitted = 0
+        self._first_clause_min = first_clause_min_chars
+        self._max_chunk = max_chunk_chars
+
+    def feed(self, delta: str) -> List[str]:
+        if delta:
+            self._buf += delta
+        out: List[str] = []
+        while True:
+            cut = self._next_cut()
+            if cut <= 0:
+                break
+            chunk = self._buf[:cut].strip()
+            self._buf = self._buf[cut:]
+            if chunk:
+                out.append(chunk)
+                self._emitted += 1
+        return out
+
+    def flush(self) -> List[str]:
+        chunk = self._buf.strip()
+        self._buf = ""
+        if not chunk:
+            return []
+        self._emitted += 1
+        return [chunk]
+
+    def _next_cut(self) -> int:
+        buf = self._buf
+        for m in _SENTENCE_END_RE.finditer(buf):
+            if m.group(0)[0] in ".!?" and _is_abbreviation(buf, m.start() + 1):
+                continue
+            return m.end()
+        if self._emitted == 0 and len(buf) >= self._first_clause_min:
+            m = _CLAUSE_END_RE.search(buf, self._first_clause_min - 1)
+            if m:
+                return m.end()
+        if len(buf) >= self._max_chunk:
+            last = None
+            for m in _CLAUSE_END_RE.finditer(buf, 0, self._max_chunk):
+                last = m
+            if last is not None:
+                return last.end()
+            space = buf.rfind(" ", 0, self._max_chunk)
+            return space + 1 if space > 0 else self._max_chunk
+        return 0
+
+
+def split_sentences(text: str, max_chunk_chars: int = MAX_CHUNK_CHARS) -> List[str]:
+    """A finished reply as whole sentences (run-ons capped like streamed chunks) — the
+    unit the sentence audio cache keys on."""
+    seg = SpeechSegmenter(first_clause_min_chars=max_chunk_chars + 1, max_chunk_chars=max_chunk_chars)
+    return seg.feed(text or "") + seg.flush()
@@ -9,12 +9,26 @@ Deliberately dependency-free: the `audioop` module (lin2ulaw/ratecv) was removed
 Python 3.13, so it can't be relied on across versions or unit-tested on 3.13+. These
 routines are the standard G.711 algorithm and a 3:1 averaging decimator, verifiable on
 any Python.
+
+The hot path runs per streamed chunk on the TTS producer thread, so it avoids per-sample
+Python work where it can: PCM is decoded with array('h'), the FIR is one generated
+expression per output sample, and μ-law comes from a 16K-entry table. NumPy, when
+installed, evaluates the filter for a whole chunk at once. Both paths add the taps in the
+same order as the reference loop, so the output is byte-identical either way.
 """
 from __future__ import annotations
 
 import math
+import sys
+from array import array
+from itertools import repeat
 from typing import List
 
+try:
+    import numpy as _np
+except ImportError:  # pragma: no cover
+    _np = None  # type: ignore[assignment]
+
 # Twilio telephony frame: 8000 Hz * 20 ms = 160 μ-law bytes per frame.
 MULAW_FRAME_BYTES = 160
 
@@ -82,6 +96,48 @@ def _design_lowpass(num_taps: int, fc_hz: float, fs_hz: float) -> List[float]:
 _LPF = _design_lowpass(23, 3600.0, 24000.0)
 _LPF_N = len(_LPF)
 
+# μ-law only depends on sample >> 2 (14 bits), so one byte per 14-bit value covers every
+# input; samples outside int16 clip to the same codes as the table's end entries.
+_ULAW_14 = bytes(linear16_to_ulaw(v << 2) for v in range(-8192, 8192))
+_ULAW_14_MIN, _ULAW_14_MAX = -8192, 8191
+
+
+def _build_fir_ulaw():
+    """One output sample: FIR over buf[j : j+N] then μ-law, as a single expression.
+
+    Written out term by term (left to right, like the reference `acc += t*w` loop) instead
+    of summed, because sum() of floats is compensated on Python 3.12+ and could round
+    differently.
+    """
+    expr = " + ".join(f"{t!r} * b[j + {k}]" if k else f"{t!r} * b[j]" for k, t in enumerate(_LPF))
+    src = (
+        "def _fir_ulaw(b, j, _t=_ULAW_14, _lo=_ULAW_14_MIN, _hi=_ULAW_14_MAX):\n"
+        f"    s = round({expr}) >> 2\n"
+        "    if s > _hi:\n"
+        "        s = _hi\n"
+        "    elif s < _lo:\n"
+        "        s = _lo\n"
+        "    return _t[s - _lo]\n"
+    )
+    scope = {"_ULAW_14": _ULAW_14, "_ULAW_14_MIN": _ULAW_14_MIN, "_ULAW_14_MAX": _ULAW_14_MAX}
+    exec(compile(src, "<streaming_audio fir>", "exec"), scope)
+    return scope["_fir_ulaw"]
+
+
+_fir_ulaw = _build_fir_ulaw()
+
+if _np is not None:
+    _NP_LPF = [float(t) for t in _LPF]
+    _NP_ULAW_14 = _np.frombuffer(_ULAW_14, dtype=_np.uint8)
+
+
+def _decode_pcm16(data: bytes) -> array:
+    samples = array("h")
+    samples.frombytes(data)
+    if sys.byteorder == "big":  # pragma: no cover
+        samples.byteswap()
+    return samples
+
 
 class Pcm24kToMulaw8k:
     """Streaming transcoder: feed arbitrary 24 kHz/16-bit/mono PCM byte chunks, get back
@@ -90,36 +146,39 @@ class Pcm24kToMulaw8k:
     identical regardless of how the PCM stream is split.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, *, use_numpy: bool = True) -> None:
         self._byte_rem = b""             # leftover odd byte across chunks
         self._hist: List[int] = [0] * (_LPF_N - 1)  # last N-1 input samples (zero-primed)
         self._pos = 0                    # absolute input-sample counter (for decimation phase)
+        self._numpy = use_numpy and _np is not None
 
     def feed(self, pcm: bytes) -> bytes:
-        data = self._byte_rem + pcm
+        data = self._byte_rem + pcm if self._byte_rem else pcm
         ns = len(data) // 2
         if ns == 0:
-            self._byte_rem = data
+            self._byte_rem = bytes(data)
             return b""
-        new = [int.from_bytes(data[2 * i : 2 * i + 2], "little", signed=True) for i in range(ns)]
-        self._byte_rem = data[2 * ns :]
-        buf = self._hist + new           # buf index = hlen + i  ->  input sample `new[i]`
-        hlen = len(self._hist)
-        taps = _LPF
+        self._byte_rem = bytes(data[2 * ns :])
+        new = _decode_pcm16(data[: 2 * ns])
         n = _LPF_N
-        out = bytearray()
-        base = self._pos
-        for i in range(ns):
-            if (base + i) % _DECIMATION == 0:
-                bi = hlen + i            # current sample's index in buf; window = buf[bi-n+1 .. bi]
-                acc = 0.0
-                w = buf[bi - n + 1 : bi + 1]
-                for k in range(n):
-                    acc += taps[k] * w[k]
-                out.append(linear16_to_ulaw(int(round(acc))))
-        self._pos = base + ns
+        # buf[hlen + i] is input sample new[i]; the output for input position p filters the
+        # window buf[p - n + 1 .. p], so output windows start at p - n + 1.
+        first = (-self._pos) % _DECIMATION
+        self._pos += ns
+        if self._numpy:
+            buf = _np.concatenate((_np.asarray(self._hist, dtype=_np.float64), _np.asarray(new, dtype=_np.float64)))
+            self._hist = [int(v) for v in buf[-(n - 1) :]]
+            starts = _np.arange(first, ns, _DECIMATION)
+            if not len(starts):
+                return b""
+            acc = _np.zeros(len(starts))
+            for k, t in enumerate(_NP_LPF):
+                acc += t * buf[starts + k]
+            idx = _np.clip(_np.rint(acc).astype(_np.int64) >> 2, _ULAW_14_MIN, _ULAW_14_MAX) - _ULAW_14_MIN
+            return _NP_ULAW_14[idx].tobytes()
+        buf = self._hist + new.tolist()
         self._hist = buf[-(n - 1) :]
-        return bytes(out)
+        return bytes(map(_fir_ulaw, repeat(buf), range(first, ns, _DECIMATION)))
 
     def flush(self) -> bytes:
         """Trailing ≤2 samples not landing on a decimation position are inaudible; drop them."""
@@ -135,10 +194,11 @@ def frame_mulaw(data: bytes, carry: bytearray, *, flush: bool = False) -> List[b
     """
     if data:
         carry.extend(data)
-    frames: List[bytes] = []
-    while len(carry) >= MULAW_FRAME_BYTES:
-        frames.append(bytes(carry[:MULAW_FRAME_BYTES]))
-        del carry[:MULAW_FRAME_BYTES]
+    full = len(carry) - len(carry) % MULAW_FRAME_BYTES
+    with memoryview(carry) as mv:
+        frames: List[bytes] = [bytes(mv[i : i + MULAW_FRAME_BYTES]) for i in range(0, full, MULAW_FRAME_BYTES)]
+    if full:
+        del carry[:full]
     if flush and carry:
         pad = MULAW_FRAME_BYTES - len(carry)
         frames.append(bytes(carry) + b"\xff" * pad)
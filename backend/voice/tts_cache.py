@@ -1,24 +1,61 @@
-"""Persistent + in-memory cache for fixed voice clips (greeting, got-it filler)."""
+"""Persistent + in-memory cache for fixed voice clips (greeting, got-it filler).
+
+Each clip has an mp3 form for the <Play> path and, for the bidirectional media stream, a
+μ-law/8000 form stored as whole 160-byte (20 ms) frames in one file. The μ-law file is
+memory-mapped and handed out as a memoryview, so sending a frame is a zero-copy slice
+and every call of a tenant shares the same pages.
+
+Storage is one content-addressed store per project root (`voice_cache/`):
+
+* blobs/<render-hash>.<ext> — the audio, named by everything that determines it (text,
+  voice, speed, model/steering suffix) but not the tenant, so two tenants rendering the
+  same phrase share one file;
+* index.json — the manifest: per blob its size and last use, and which (tenant, kind)
+  entries reference it. Lookups and invalidation go through it, never a directory scan.
+
+Memory holds hot blobs under one global byte budget with true LRU (VOICE_CLIP_CACHE_MB);
+disk is capped too (VOICE_CLIP_DISK_MB), least recently used blobs collected first. A
+blob is deleted once no tenant references it. Clips written by the previous per-tenant
+layout (clients/<id>/voice_cache/) are moved into the store on first lookup.
+"""
 
 from __future__ import annotations
 
+import atexit
 import hashlib
 import json
 import logging
+import mmap
+import os
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Iterator, Literal, Optional, Union
+
+from voice.streaming_audio import MULAW_FRAME_BYTES
 
 _log = logging.getLogger("nuvatra")
 
 ClipKind = Literal["greeting", "got_it", "one_moment", "filler"]
+Clip = Union[bytes, memoryview]
+
+_MEMORY_BUDGET_BYTES = int(float((os.getenv("VOICE_CLIP_CACHE_MB") or "32").strip() or 32) * 1024 * 1024)
+_DISK_BUDGET_BYTES = int(float((os.getenv("VOICE_CLIP_DISK_MB") or "512").strip() or 512) * 1024 * 1024)
+_ULAW_SILENCE = 0xFF  # μ-law encoding of 0, used to pad the last frame
+_INDEX_VERSION = 1
+# index.json is rewritten at most this often, on a timer thread, never by a lookup or
+# write on the audio path; pending changes are flushed at exit.
+_INDEX_SAVE_DELAY_SEC = 2.0
 
-_MEMORY: dict[ClipKind, dict[tuple, bytes]] = {
-    "greeting": {},
-    "got_it": {},
-    "one_moment": {},
-    "filler": {},
+_STATS = {
+    "memory_hits": 0,
+    "disk_hits": 0,
+    "shared_hits": 0,  # served from a blob another tenant rendered
+    "misses": 0,
+    "memory_evictions": 0,
+    "disk_evictions": 0,
 }
-_MAX_MEMORY_ENTRIES_PER_KIND = 200
 
 
 def _hash_key(cache_key: tuple) -> str:
@@ -26,72 +63,359 @@ def _hash_key(cache_key: tuple) -> str:
     return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:24]
 
 
-def cache_dir_for_client(project_root: Path, client_id: str) -> Path:
-    root = project_root / "clients" / client_id / "voice_cache"
-    root.mkdir(parents=True, exist_ok=True)
-    return root
+def _blob_name(cache_key: tuple, ext: str) -> str:
+    # Everything but the tenant (cache_key[0]) decides the audio.
+    return f"{_hash_key(tuple(cache_key[1:]))}.{ext}"
+
+
+def _ref_id(kind: str, cache_key: tuple, ext: str) -> str:
+    return _hash_key((kind, ext) + tuple(cache_key))
+
+
+def _legacy_path(project_root: Path, kind: str, cache_key: tuple, ext: str) -> Path:
+    """Where the per-tenant layout kept this clip."""
+    return project_root / "clients" / str(cache_key[0]) / "voice_cache" / f"{kind}_{_hash_key(cache_key)}.{ext}"
+
+
+def _map_file(path: Path) -> Optional[memoryview]:
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        # The mapping outlives the descriptor; it is unmapped once the last view is dropped.
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+class _MemoryLRU:
+    """Blob path → audio, bounded by total bytes (shared by every store in the process)."""
+
+    def __init__(self, budget: int) -> None:
+        self.budget = budget
+        self.bytes = 0
+        self._data: "OrderedDict[Path, Clip]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path: Path) -> Optional[Clip]:
+        with self._lock:
+            clip = self._data.get(path)
+            if clip is not None:
+                self._data.move_to_end(path)
+            return clip
+
+    def put(self, path: Path, clip: Clip) -> None:
+        if len(clip) > self.budget:
+            return
+        with self._lock:
+            old = self._data.pop(path, None)
+            if old is not None:
+                self.bytes -= len(old)
+            self._data[path] = clip
+            self.bytes += len(clip)
+            while self.bytes > self.budget:
+                _, evicted = self._data.popitem(last=False)
+                self.bytes -= len(evicted)
+                _STATS["memory_evictions"] += 1
+
+    def drop(self, path: Path) -> None:
+        with self._lock:
+            old = self._data.pop(path, None)
+            if old is not None:
+                self.bytes -= len(old)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+_MEMORY = _MemoryLRU(_MEMORY_BUDGET_BYTES)
+
+
+class _ClipStore:
+    """The content-addressed disk store and its manifest under one project root."""
+
+    def __init__(self, project_root: Path) -> None:
+        self.root = project_root / "voice_cache"
+        self.blob_dir = self.root / "blobs"
+        self.index_path = self.root / "index.json"
+        self.lock = threading.RLock()
+        # blob name -> {"size": int, "used": float, "refs": {ref_id: client_id}}
+        self.blobs: dict[str, dict] = {}
+        self.disk_bytes = 0
+        self._save_timer: Optional[threading.Timer] = None
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            raw = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            # A corrupt manifest only costs re-synthesis; unindexed blobs are overwritten.
+            _log.warning("[VOICE] tts_cache index unreadable, starting empty: %s", e)
+            return
+        if raw.get("version") != _INDEX_VERSION:
+            return
+        for name, meta in (raw.get("blobs") or {}).items():
+            if (self.blob_dir / name).is_file():
+                self.blobs[name] = {
+                    "size": int(meta.get("size") or 0),
+                    "used": float(meta.get("used") or 0.0),
+                    "refs": dict(meta.get("refs") or {}),
+                }
+        self.disk_bytes = sum(m["size"] for m in self.blobs.values())
+
+    def _save(self) -> None:
+        """Schedule an index write (caller holds the lock); changes within the delay share it."""
+        if self._save_timer is None:
+            self._save_timer = threading.Timer(_INDEX_SAVE_DELAY_SEC, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def flush(self) -> None:
+        """Write index.json now if a change is pending."""
+        with self.lock:
+            if self._save_timer is None:
+                return
+            self._save_timer.cancel()
+            self._save_timer = None
+            text = json.dumps({"version": _INDEX_VERSION, "blobs": self.blobs}, separators=(",", ":"))
+        tmp = self.index_path.with_name(self.index_path.name + ".tmp")
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(text, encoding="utf-8")
+            os.replace(tmp, self.index_path)
+        except OSError as e:
+            _log.warning("[VOICE] tts_cache index write failed: %s", e)
+
+    def lookup(self, name: str, ref: str, client_id: str) -> bool:
+        """Mark a blob used by this entry. False when the store doesn't have it."""
+        with self.lock:
+            meta = self.blobs.get(name)
+            if meta is None:
+                return False
+            meta["used"] = time.time()  # in memory only; persisted with the next change
+            if ref not in meta["refs"]:
+                # Rendered for another tenant (or kind): share the blob and record the reference
+                # so invalidating that tenant doesn't delete audio this one is using.
+                _STATS["shared_hits"] += 1
+                meta["refs"][ref] = client_id
+                self._save()
+            return True
+
+    def write(self, name: str, ref: str, client_id: str, data: bytes) -> None:
+        with self.lock:
+            meta = self.blobs.get(name)
+            if meta is None or meta["size"] != len(data):
+                path = self.blob_dir / name
+                tmp = path.with_name(name + ".tmp")
+                try:
+                    self.blob_dir.mkdir(parents=True, exist_ok=True)
+                    # Write-then-rename: a call mapping the old file keeps reading intact audio.
+                    tmp.write_bytes(data)
+                    os.replace(tmp, path)
+                except OSError as e:
+                    _log.warning("[VOICE] tts_cache write failed blob=%s: %s", name, e)
+                    return
+                self.disk_bytes += len(data) - (meta["size"] if meta else 0)
+                meta = self.blobs[name] = {"size": len(data), "used": 0.0, "refs": (meta or {}).get("refs", {})}
+            meta["used"] = time.time()
+            meta["refs"][ref] = client_id
+            self._collect(keep=name)
+            self._save()
 
+    def discard(self, name: str) -> None:
+        """Forget a blob that could not be read, so the next write puts the file back."""
+        with self.lock:
+            if name in self.blobs:
+                self._delete_blob(name)
+                self._save()
 
-def _disk_path(project_root: Path, kind: ClipKind, cache_key: tuple) -> Path:
+    def _delete_blob(self, name: str) -> None:
+        meta = self.blobs.pop(name, None)
+        if meta is None:
+            return
+        self.disk_bytes -= meta["size"]
+        _MEMORY.drop(self.blob_dir / name)
+        try:
+            (self.blob_dir / name).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            _log.warning("[VOICE] tts_cache delete failed blob=%s: %s", name, e)
+
+    def _collect(self, keep: str = "") -> None:
+        """Delete least recently used blobs until the store fits its disk budget."""
+        while self.disk_bytes > _DISK_BUDGET_BYTES and len(self.blobs) > 1:
+            victim = min((n for n in self.blobs if n != keep), key=lambda n: self.blobs[n]["used"])
+            self._delete_blob(victim)
+            _STATS["disk_evictions"] += 1
+
+    def invalidate_client(self, client_id: str) -> None:
+        with self.lock:
+            changed = False
+            for name, meta in list(self.blobs.items()):
+                refs = meta["refs"]
+                mine = [r for r, cid in refs.items() if cid == client_id]
+                if not mine:
+                    continue
+                changed = True
+                for r in mine:
+                    refs.pop(r, None)
+                if not refs:
+                    self._delete_blob(name)
+            if changed:
+                self._save()
+
+    def clear(self) -> None:
+        with self.lock:
+            for name in list(self.blobs):
+                self._delete_blob(name)
+            self._save()
+
+
+_STORES: dict[Path, _ClipStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def flush_indexes() -> None:
+    """Write every store's pending index changes (at exit, and for tests)."""
+    with _STORES_LOCK:
+        stores = list(_STORES.values())
+    for store in stores:
+        store.flush()
+
+
+atexit.register(flush_indexes)
+
+
+def _store(project_root: Path) -> _ClipStore:
+    root = Path(project_root)
+    with _STORES_LOCK:
+        store = _STORES.get(root)
+        if store is None:
+            store = _STORES[root] = _ClipStore(root)
+        return store
+
+
+def _get(project_root: Path, kind: str, cache_key: tuple, ext: str) -> Optional[Clip]:
+    store = _store(project_root)
+    name = _blob_name(cache_key, ext)
+    ref = _ref_id(kind, cache_key, ext)
     client_id = str(cache_key[0])
-    return cache_dir_for_client(project_root, client_id) / f"{kind}_{_hash_key(cache_key)}.mp3"
+    path = store.blob_dir / name
+    clip = _MEMORY.get(path)
+    if clip is not None and store.lookup(name, ref, client_id):
+        _STATS["memory_hits"] += 1
+        return clip
+    if store.lookup(name, ref, client_id):
+        try:
+            clip = _map_file(path) if ext == "ulaw" else path.read_bytes()
+        except (OSError, ValueError) as e:
+            _log.warning("[VOICE] tts_cache read failed kind=%s: %s", kind, e)
+            clip = None
+        if clip:
+            _MEMORY.put(path, clip)
+            _STATS["disk_hits"] += 1
+            return clip
+        store.discard(name)
+    legacy = _legacy_path(project_root, kind, cache_key, ext)
+    if legacy.is_file():
+        try:
+            data = legacy.read_bytes()
+            legacy.unlink()
+        except OSError as e:
+            _log.warning("[VOICE] tts_cache legacy read failed kind=%s: %s", kind, e)
+            data = b""
+        if data and (ext != "ulaw" or len(data) % MULAW_FRAME_BYTES == 0):
+            _STATS["disk_hits"] += 1
+            return _put(project_root, kind, cache_key, ext, data)
+    _STATS["misses"] += 1
+    return None
+
+
+def _put(project_root: Path, kind: str, cache_key: tuple, ext: str, data: bytes) -> Clip:
+    store = _store(project_root)
+    name = _blob_name(cache_key, ext)
+    store.write(name, _ref_id(kind, cache_key, ext), str(cache_key[0]), data)
+    clip: Clip = data
+    if ext == "ulaw" and name in store.blobs:
+        try:
+            clip = _map_file(store.blob_dir / name) or data
+        except (OSError, ValueError) as e:
+            _log.warning("[VOICE] tts_cache ulaw map failed kind=%s: %s", kind, e)
+    _MEMORY.put(store.blob_dir / name, clip)
+    return clip
 
 
 def get_cached(project_root: Path, kind: ClipKind, cache_key: tuple) -> Optional[bytes]:
-    # setdefault so a caller passing a not-yet-registered kind degrades to a cache
-    # miss instead of crashing the voice turn with a KeyError.
-    mem = _MEMORY.setdefault(kind, {}).get(cache_key)
-    if mem:
-        return mem
-    path = _disk_path(project_root, kind, cache_key)
-    if not path.is_file():
-        return None
-    try:
-        data = path.read_bytes()
-        if data:
-            _MEMORY[kind][cache_key] = data
-            return data
-    except OSError as e:
-        _log.warning("[VOICE] tts_cache read failed kind=%s: %s", kind, e)
-    return None
+    clip = _get(project_root, kind, cache_key, "mp3")
+    return bytes(clip) if clip else None
 
 
 def put_cached(project_root: Path, kind: ClipKind, cache_key: tuple, data: bytes) -> None:
     if not data:
         return
-    bucket = _MEMORY.setdefault(kind, {})
-    if len(bucket) >= _MAX_MEMORY_ENTRIES_PER_KIND:
-        # FIFO-style eviction based on insertion order.
-        oldest_key = next(iter(bucket.keys()), None)
-        if oldest_key is not None:
-            bucket.pop(oldest_key, None)
-    bucket[cache_key] = data
-    path = _disk_path(project_root, kind, cache_key)
-    try:
-        path.write_bytes(data)
-    except OSError as e:
-        _log.warning("[VOICE] tts_cache write failed kind=%s: %s", kind, e)
+    _put(project_root, kind, cache_key, "mp3", bytes(data))
+
+
+def get_cached_ulaw(project_root: Path, kind: ClipKind, cache_key: tuple) -> Optional[memoryview]:
+    """The clip as μ-law/8000 whole frames (len is a multiple of 160), or None."""
+    clip = _get(project_root, kind, cache_key, "ulaw")
+    if not clip or len(clip) % MULAW_FRAME_BYTES:
+        return None
+    return clip if isinstance(clip, memoryview) else memoryview(clip)
+
+
+def put_cached_ulaw(project_root: Path, kind: ClipKind, cache_key: tuple, ulaw: bytes) -> None:
+    """Store μ-law/8000 audio, padding the last frame with silence."""
+    if not ulaw:
+        return
+    tail = len(ulaw) % MULAW_FRAME_BYTES
+    if tail:
+        ulaw = bytes(ulaw) + bytes([_ULAW_SILENCE]) * (MULAW_FRAME_BYTES - tail)
+    _put(project_root, kind, cache_key, "ulaw", bytes(ulaw))
+
+
+def iter_frames(clip: memoryview) -> Iterator[memoryview]:
+    """Zero-copy 20 ms frame slices of a clip from get_cached_ulaw."""
+    for i in range(0, len(clip), MULAW_FRAME_BYTES):
+        yield clip[i : i + MULAW_FRAME_BYTES]
 
 
 def invalidate_client(project_root: Path, client_id: str) -> None:
+    """Drop a tenant's clips; audio still referenced by another tenant is kept for them."""
     cid = (client_id or "").strip()
     if not cid:
         return
-    for kind in ("greeting", "got_it", "one_moment", "filler"):
-        for key in list(_MEMORY[kind].keys()):
-            if isinstance(key, tuple) and key and key[0] == cid:
-                _MEMORY[kind].pop(key, None)
-    root = project_root / "clients" / cid / "voice_cache"
-    if root.is_dir():
-        for path in root.glob("*.mp3"):
-            try:
-                path.unlink()
-            except OSError as e:
-                _log.warning("[VOICE] tts_cache delete failed path=%s: %s", path, e)
+    _store(project_root).invalidate_client(cid)
+
+
+def invalidate_all(project_root: Path) -> None:
+    _store(project_root).clear()
+    _MEMORY.clear()
 
 
 def clear_all_memory() -> None:
-    _MEMORY["greeting"].clear()
-    _MEMORY["got_it"].clear()
-    _MEMORY["one_moment"].clear()
-    _MEMORY["filler"].clear()
+    _MEMORY.clear()
+
+
+def tts_cache_stats(project_root: Path) -> dict:
+    """Hit/miss/evict counters and memory/disk usage, for the admin ops self-check."""
+    store = _store(project_root)
+    with store.lock:
+        blobs, refs, disk_bytes = len(store.blobs), sum(len(m["refs"]) for m in store.blobs.values()), store.disk_bytes
+    lookups = _STATS["memory_hits"] + _STATS["disk_hits"] + _STATS["misses"]
+    return {
+        **_STATS,
+        "hit_rate": round((lookups - _STATS["misses"]) / lookups, 3) if lookups else 0.0,
+        "memory_entries": len(_MEMORY),
+        "memory_bytes": _MEMORY.bytes,
+        "memory_budget_bytes": _MEMORY.budget,
+        "disk_blobs": blobs,
+        "disk_refs": refs,
+        "disk_bytes": disk_bytes,
+        "disk_budget_bytes": _DISK_BUDGET_BYTES,
+    }
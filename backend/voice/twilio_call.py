@@ -38,7 +38,7 @@ async def safe_twilio_call_update(
     if require_active_session:
         import runtime
 
-        if not runtime.call_store.exists(call_sid):
+        if not await runtime.call_store.aexists(call_sid):
             voice_info(
                 "twilio_calls_update_skipped",
                 call_sid=call_sid,
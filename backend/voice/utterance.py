@@ -67,7 +67,7 @@ async def apply_caller_utterance(
         voice_warning("utterance_lock_contention", call_sid=call_sid)
         import main as m
 
-        if call_sid and m.response_status.get(call_sid):
+        if call_sid and await runtime.call_store.aget_response_status(call_sid):
             bu = base_url.rstrip("/")
             poll = m.VoiceResponse()
             poll.redirect(f"{bu}/api/phone/respond?CallSid={call_sid}", method="POST")
@@ -91,7 +91,7 @@ async def _apply_caller_utterance_locked(
     """Process utterance while holding the per-call lock."""
     import main as m
 
-    if not call_sid or not runtime.call_store.exists(call_sid):
+    if not call_sid or not await runtime.call_store.aexists(call_sid):
         forwarding_phone = m.get_business_info().get("forwarding_phone")
         if forwarding_phone:
             voice_forward(
@@ -106,7 +106,9 @@ async def _apply_caller_utterance_locked(
         lost_twiml.say("I'm sorry, I lost track of our conversation. Please call back.", voice="alice")
         return UtteranceResult(mode="replace_call_twiml", replacement_twiml=str(lost_twiml))
 
-    call_data = m.active_calls[call_sid]
+    call_data = await runtime.call_store.aget(call_sid)
+    if call_data is None:
+        raise KeyError(call_sid)  # removed between the exists check and the read
 
     # Bind the tenant context for THIS asyncio task. The Deepgram media-stream path runs in
     # its own context where the HTTP middleware never set client_id, so get_business_info()
@@ -134,7 +136,7 @@ async def _apply_caller_utterance_locked(
                 call_sid=call_sid,
                 attempt=n,
             )
-            m._persist_call_session(call_sid, call_data)
+            await m._apersist_call_session(call_sid, call_data)
             return UtteranceResult(mode="replace_call_twiml", replacement_twiml=str(goodbye_twiml))
         use_deepgram = deepgram_stt_active(
             twilio_available=bool(m.TWILIO_AVAILABLE),
@@ -147,7 +149,7 @@ async def _apply_caller_utterance_locked(
             call_sid=call_sid,
             call_state=call_data,
         )
-        m._persist_call_session(call_sid, call_data)
+        await m._apersist_call_session(call_sid, call_data)
         return UtteranceResult(mode="replace_call_twiml", replacement_twiml=xml)
 
     # Per-call hard ceiling: a real (non-empty) utterance counts as a turn. If the call
@@ -177,7 +179,7 @@ async def _apply_caller_utterance_locked(
                 voice="alice",
             )
             wrap_twiml.hangup()
-        m._persist_call_session(call_sid, call_data)
+        await m._apersist_call_session(call_sid, call_data)
         return UtteranceResult(mode="replace_call_twiml", replacement_twiml=str(wrap_twiml))
 
     # Plainly-Latin speech is always treated as English downstream (see the force-English
@@ -220,7 +222,7 @@ async def _apply_caller_utterance_locked(
                 finish_on_key="#",
                 recording_status_callback=f"{base_url}/api/phone/recording-status",
             )
-            m._persist_call_session(call_sid, call_data)
+            await m._apersist_call_session(call_sid, call_data)
             return UtteranceResult(mode="replace_call_twiml", replacement_twiml=str(record_twiml))
 
     if m._text_looks_latin(speech_result):
@@ -282,18 +284,16 @@ async def _apply_caller_utterance_locked(
             call_data["outcome"] = "forwarded"
             m.call_log_set_outcome(call_sid, "forwarded")
             xml = str(m.forward_call_to_business(forwarding_phone, base_url, detected_lang))
-            m._persist_call_session(call_sid, call_data)
+            await m._apersist_call_session(call_sid, call_data)
             return UtteranceResult(mode="replace_call_twiml", replacement_twiml=xml)
         # Caller asked for a human but no transfer number is configured — flag it so the
         # generated reply is an honest "take a message" line, never a fake-human response.
         call_data["forward_unavailable"] = True
 
-    m.response_status[call_sid] = {
-        "status": "pending",
-        "audio_url": None,
-        "ai_text": None,
-    }
-    m._persist_call_session(call_sid, call_data)
+    await runtime.call_store.aset_response_status(
+        call_sid, {"status": "pending", "audio_url": None, "ai_text": None}
+    )
+    await m._apersist_call_session(call_sid, call_data)
     m.create_tracked_task(
         m.generate_response_async(call_sid, call_data, detected_lang, base_url),
         name=f"generate_response:{call_sid}",
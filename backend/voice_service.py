@@ -326,9 +326,11 @@ def _synthesize_tts_clip(
     speed: float,
     model: Optional[str] = None,
     instructions: Optional[str] = None,
+    response_format: Optional[str] = None,
 ) -> bytes:
     """Synthesize an mp3 clip. Defaults to the configured TTS model; `instructions` steers
-    delivery on gpt-4o TTS models and is omitted for tts-1/tts-1-hd (which reject it)."""
+    delivery on gpt-4o TTS models and is omitted for tts-1/tts-1-hd (which reject it).
+    `response_format="pcm"` returns raw 24 kHz signed-16 PCM instead of mp3."""
     runtime._ensure_openai_client()
     model = (model or config_service.get_tts_model()).strip()
     apply_instructions = bool(instructions) and model.startswith("gpt-")
@@ -340,6 +342,8 @@ def _synthesize_tts_clip(
     )
     if apply_instructions:
         kwargs["instructions"] = instructions
+    if response_format:
+        kwargs["response_format"] = response_format
     _synth_start = time.perf_counter()
     try:
         resp = runtime.client.audio.speech.create(**kwargs)
@@ -369,6 +373,24 @@ def _synthesize_tts_clip(
     return data
 
 
+def _synthesize_ulaw_clip(
+    text: str,
+    *,
+    voice: str,
+    speed: float,
+    instructions: Optional[str] = None,
+) -> bytes:
+    """Synthesize a clip as μ-law/8000 for the bidirectional media stream (same model and
+    steering as the mp3 clip, so both forms sound alike)."""
+    from voice.streaming_audio import Pcm24kToMulaw8k
+
+    pcm = _synthesize_tts_clip(
+        text, voice=voice, speed=speed, instructions=instructions, response_format="pcm"
+    )
+    transcoder = Pcm24kToMulaw8k()
+    return transcoder.feed(pcm) + transcoder.flush()
+
+
 def _tts_variant_suffix() -> tuple:
     """Model + instructions fingerprint appended to clip cache keys so switching the TTS
     model or steering style bypasses stale clips on disk instead of serving them."""
@@ -454,14 +476,51 @@ def _warm_auxiliary_voice_cache(client_id: str) -> None:
         )
 
 
+def _warm_streaming_voice_cache(client_id: str) -> None:
+    """Pre-generate μ-law greeting, got-it, and one-moment clips for the bidirectional
+    media stream, so it can open with the greeting without a TTS round-trip."""
+    from voice.tts_cache import get_cached_ulaw, put_cached_ulaw
+
+    cid = (client_id or "").strip()
+    if not cid or cid == "default":
+        return
+    database.set_request_client_id(cid)
+    payload = build_phone_greeting_payload(config_service.get_business_info(), _tenant_for_call_recording())
+    clips = (
+        ("greeting", _greeting_audio_cache_key(cid), payload["spoken_text"]),
+        ("got_it", _got_it_cache_key(cid), GOT_IT_PHRASE),
+        ("one_moment", _one_moment_cache_key(cid), ONE_MOMENT_PHRASE),
+    )
+    for kind, key, text in clips:
+        if get_cached_ulaw(PROJECT_ROOT, kind, key) is not None:
+            continue
+        data = _synthesize_ulaw_clip(
+            text,
+            voice=key[2],
+            speed=key[3],
+            instructions=config_service.get_tts_instructions(),
+        )
+        put_cached_ulaw(PROJECT_ROOT, kind, key, data)
+        voice_info(
+            "ulaw_audio_prewarmed",
+            kind=kind,
+            client_id_prefix=cid[:12],
+            voice=key[2],
+            frames=len(data) // 160,
+        )
+
+
 def warm_client_voice_cache(client_id: str) -> None:
-    """Pre-generate greeting, got-it, and one-moment clips for a tenant."""
+    """Pre-generate greeting, got-it, and one-moment clips for a tenant (plus their μ-law
+    forms when the bidirectional stream is enabled)."""
     cid = (client_id or "").strip()
     if not cid or cid == "default":
         return
     try:
         _ensure_greeting_audio_cached(cid)
         _warm_auxiliary_voice_cache(cid)
+        if config_service.voice_streaming_enabled():
+            _warm_streaming_voice_cache(cid)
     except Exception as e:
         voice_warning(
             "voice_cache_prewarm_failed",
@@ -627,6 +686,18 @@ def _persist_call_session(call_sid: str, data: Optional[dict] = None) -> None:
         runtime.call_store.save(sid, payload)
 
 
+async def _apersist_call_session(call_sid: str, data: Optional[dict] = None) -> None:
+    """_persist_call_session for event-loop callers: the Redis round trips are awaited."""
+    if isinstance(runtime.call_store, MemoryCallSessionStore):
+        return
+    sid = (call_sid or "").strip()
+    if not sid or not await runtime.call_store.aexists(sid):
+        return
+    payload = data if data is not None else await runtime.call_store.aget(sid)
+    if payload is not None:
+        await runtime.call_store.asave(sid, payload)
+
+
 def _merge_call_session(call_sid: str, updates: dict[str, Any]) -> None:
     """Persist partial session updates (safe on Redis and memory)."""
     if not call_sid or not updates:
@@ -665,10 +736,10 @@ async def persist_generated_session_locked(call_sid: str, call_data: dict) -> No
         return
     try:
         async with runtime.call_store.utterance_lock(sid):
-            latest = runtime.call_store.get(sid)
+            latest = await runtime.call_store.aget(sid)
             if latest is None:
-                if runtime.call_store.exists(sid):
-                    runtime.call_store.save(sid, call_data)
+                if await runtime.call_store.aexists(sid):
+                    await runtime.call_store.asave(sid, call_data)
                 return
             snap_len = len(call_data.get("conversation_history") or [])
             latest_len = len(latest.get("conversation_history") or [])
@@ -684,18 +755,18 @@ async def persist_generated_session_locked(call_sid: str, call_data: dict) -> No
                 merged_len=merged_len,
                 rescued_turn=bool(merged_len > snap_len),
             )
-            runtime.call_store.save(sid, call_data)
+            await runtime.call_store.asave(sid, call_data)
     except UtteranceLockError:
         # Lock contended past timeout: still merge best-effort rather than drop the turn.
         try:
-            latest = runtime.call_store.get(sid)
+            latest = await runtime.call_store.aget(sid)
             if latest is not None:
                 _merge_history_into(latest, call_data)
         except Exception:
             pass
-        _persist_call_session(call_sid, call_data)
+        await _apersist_call_session(call_sid, call_data)
     except Exception:
-        _persist_call_session(call_sid, call_data)
+        await _apersist_call_session(call_sid, call_data)
 
 
 def _call_sid_from_form(form_data: Any) -> str:
@@ -1346,18 +1417,9 @@ Respond with just the language name, nothing else."""
 
 def invalidate_voice_cache(client_id: Optional[str] = None) -> None:
     """Clear greeting/got-it audio cache when voice, speed, greeting, name, or receptionist changes."""
-    from voice.tts_cache import invalidate_client
+    from voice.tts_cache import invalidate_all, invalidate_client
 
     if client_id:
         invalidate_client(PROJECT_ROOT, client_id)
     else:
-        for d in (PROJECT_ROOT / "clients").glob("*/voice_cache"):
-            if d.is_dir():
-                for p in d.glob("*.mp3"):
-                    try:
-                        p.unlink()
-                    except OSError:
-                        pass
-        from voice.tts_cache import clear_all_memory
-
-        clear_all_memory()
+        invalidate_all(PROJECT_ROOT)